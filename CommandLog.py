@@ -0,0 +1,205 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   CommandLog.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to record the commands of a session, with their responses and
+#    timing, to an append-only binary log that bench/scpi_replay.py can
+#    replay against a server.
+#
+#    A log starts with a header of COMMAND_LOG_HEADER, then has one
+#    COMMAND_LOG_RECORD per command followed by the command and response
+#    bytes. All integers are little endian.
+#
+###############################################################################
+
+from ParseUtils import CommandTableEntry as Cmnd
+import struct
+import time
+import ParseUtils
+
+# Identifies a command log, and its format version.
+COMMAND_LOG_MAGIC = b"SCPILOG\x01"
+
+# magic, wall clock start time (seconds since the epoch), session ID,
+# session type (ie. b"TCP"), flags.
+COMMAND_LOG_HEADER = struct.Struct("<8sdI4sI")
+
+# Microseconds from the start of the log to the command being received,
+# microseconds to handle the command and send the response, length of the
+# command, length of the response (0 if none was sent).
+COMMAND_LOG_RECORD = struct.Struct("<QIII")
+
+# Header flags.
+COMMAND_LOG_AUTOLOGIN = 0x0001  # The session was logged in by autologin
+
+# File each session is recorded to, in the record directory, with the start
+# time, session type and session ID.
+COMMAND_LOG_FILE = "scpirec_%s_%s%d.bin"
+
+# Kinds of command recorded without their parameters, as the parameters are
+# passwords.
+MASKED_LOGIN             = 1    # LOGIN <user> <password>
+MASKED_AUTOLOGIN_DETAILS = 2    # SYSTem:AUTOLOGIN:DETails <user> <password>
+
+# Commands of the command tree that are recorded without their parameters.
+# The callback of each is its kind of mask. They must be the same commands
+# as the ScpiSystem table, so they match all of the same short and long
+# forms. LOGIN isn't in a command tree, ScpiEngine matches it by its header.
+maskedCommandTable = [
+    Cmnd(b"SYSTem:AUTOLOGIN:DETails",   MASKED_AUTOLOGIN_DETAILS),
+]
+
+maskedCommandTreeRoot = []
+ParseUtils.processCommandTableIntoTree(maskedCommandTable, maskedCommandTreeRoot)
+
+
+def maskedCommandType(command):
+    '''Returns the kind of mask of a command, or None if it is recorded
+    unchanged. The command is parsed and matched the same way the engine
+    matches it, so any whitespace separator and any valid form of the
+    command is masked.
+
+    Returns:
+        tuple: (int, bytes) of MASKED_LOGIN or MASKED_AUTOLOGIN_DETAILS and
+               the command's parameters, or (None, b"").
+    '''
+    parsedCommand = ParseUtils.preParseCommand(command)
+    if parsedCommand[0].head.upper().startswith(b"LOGIN"):
+        return (MASKED_LOGIN, parsedCommand[0].tail)
+    maskType, parameters = ParseUtils.searchCommandTree(parsedCommand,
+                                                        maskedCommandTreeRoot)
+    return (maskType, parameters)
+
+
+def maskCommand(command):
+    '''Returns the command without its parameters if they hold a password,
+    otherwise the command unchanged.
+    '''
+    maskType, parameters = maskedCommandType(command)
+    if maskType is None:
+        return command
+    return command[:len(command) - len(parameters)].rstrip()
+
+
+class CommandRecord(object):
+    '''This class is one command read from a log.
+    '''
+    __slots__ = ("offset", "duration", "command", "response")
+
+    def __init__(self, offset, duration, command, response):
+        self.offset   = offset      # Microseconds from the start of the log
+        self.duration = duration    # Microseconds to handle and respond
+        self.command  = command
+        self.response = response    # b"" if no response was sent
+
+
+class CommandLogHeader(object):
+    '''This class is the header read from a log.
+    '''
+    __slots__ = ("startTime", "sessionId", "sessionType", "flags")
+
+    def __init__(self, startTime, sessionId, sessionType, flags):
+        self.startTime   = startTime    # Seconds since the epoch
+        self.sessionId   = sessionId
+        self.sessionType = sessionType
+        self.flags       = flags
+
+
+class CommandRecorder(object):
+    '''This class writes the commands of one session to a log file in
+    directory. Each command is flushed to the file as it is recorded, so an
+    idle session, or a server that is killed, doesn't lose any of its log.
+
+    Args:
+        directory (string): Directory to write the log file to.
+        sessionType (bytes): The type of socket (ie b"TCP", b"SSL", etc).
+        sessionId (int): The ID number assiged to the socket.
+        flags (int): Header flags, ie. COMMAND_LOG_AUTOLOGIN.
+    '''
+
+    def __init__(self, directory, sessionType, sessionId, flags = 0):
+        self.startTime = time.time()
+        self.startNs   = time.perf_counter_ns()
+        self.fileName  = "%s/%s" % (directory, COMMAND_LOG_FILE %
+                                    (time.strftime("%Y%m%d-%H%M%S",
+                                                   time.localtime(self.startTime)),
+                                     sessionType.decode(), sessionId))
+        self.file = open(self.fileName, "ab")
+        self.file.write(COMMAND_LOG_HEADER.pack(COMMAND_LOG_MAGIC,
+                                                self.startTime, sessionId,
+                                                sessionType, flags))
+
+    def record(self, startNs, command, response):
+        '''Adds a command, received at startNs (a perf_counter_ns() time), and
+        its response, that has just been sent. response is None or b"" if
+        there was no response.
+        '''
+        if self.file is None:
+            return
+        now = time.perf_counter_ns()
+        command = maskCommand(command)
+        response = response or b""
+        try:
+            self.file.write(COMMAND_LOG_RECORD.pack((startNs - self.startNs) // 1000,
+                                                    (now - startNs) // 1000,
+                                                    len(command), len(response)))
+            self.file.write(command)
+            self.file.write(response)
+            self.file.flush()
+        except OSError as error:
+            # A full or read-only disk mustn't stop the command handling.
+            self.close()
+
+    def close(self):
+        '''Flushes and closes the log. Later commands aren't recorded.
+        '''
+        if self.file is None:
+            return
+        try:
+            self.file.close()
+        except OSError as error:
+            pass
+        self.file = None
+
+
+def readCommandLog(fileName):
+    '''Reads a log written by CommandRecorder. A partly written last command,
+    ie. from a crash, is left out.
+
+    Returns:
+        (CommandLogHeader, list): Tuple of the header and the CommandRecord
+                                  of each command.
+
+    Raises:
+        ValueError: The file isn't a command log.
+    '''
+    with open(fileName, "rb") as f:
+        data = f.read()
+    if (len(data) < COMMAND_LOG_HEADER.size) or \
+       (not data.startswith(COMMAND_LOG_MAGIC)):
+        raise ValueError("%s isn't a command log" % fileName)
+    magic, startTime, sessionId, sessionType, flags = \
+        COMMAND_LOG_HEADER.unpack_from(data, 0)
+    header = CommandLogHeader(startTime, sessionId, sessionType.rstrip(b"\0"), flags)
+
+    records = []
+    position = COMMAND_LOG_HEADER.size
+    while position + COMMAND_LOG_RECORD.size <= len(data):
+        offset, duration, commandLen, responseLen = \
+            COMMAND_LOG_RECORD.unpack_from(data, position)
+        position += COMMAND_LOG_RECORD.size
+        end = position + commandLen + responseLen
+        if end > len(data):
+            break
+        records.append(CommandRecord(offset, duration,
+                                     data[position:position + commandLen],
+                                     data[position + commandLen:end]))
+        position = end
+    return header, records
@@ -0,0 +1,246 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   ConnectionPool.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to keep logged in chassis connections of the process after LOGOUT
+#    so the next LOGIN of the same user can lease one instead of connecting
+#    and logging in to the protobuf server again.
+#
+###############################################################################
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+import veexlib
+from SessionGlobals import autoLoginCache
+
+# Idle connections kept for each (ipAddress, user). 0 turns the pool off.
+POOL_MAX_IDLE = 2
+
+# Seconds an idle connection is kept before it is disconnected. Each idle
+# connection is a logged in user on the server, and can be leased with the
+# password it logged in with even if that has since been changed, so this
+# is only long enough for a client that logs in again straight away.
+POOL_IDLE_TIMEOUT = 10.0
+
+# Connections made at startup for the autologin user.
+POOL_WARM_CONNECTIONS = 2
+
+
+class ChassisLease(object):
+    '''This class is a chassis connection leased by one session. Only a salted
+    hash of the password is kept, to check the password of a later LOGIN
+    that would reuse the connection.
+    '''
+    __slots__ = ("chassis", "ipAddress", "userName", "salt", "passwordHash",
+                 "reused", "idleSince")
+
+    def __init__(self, chassis, ipAddress, userName, password, reused = False):
+        self.chassis      = chassis     # veexlib chassis object
+        self.ipAddress    = ipAddress
+        self.userName     = userName
+        self.salt         = os.urandom(16)
+        self.passwordHash = _hashPassword(self.salt, password)
+        self.reused       = reused      # True if it was leased from the pool
+        self.idleSince    = None        # time.monotonic() of the release
+
+    def checkPassword(self, password):
+        '''Returns True if password is the one the connection logged in with.
+        '''
+        return hmac.compare_digest(self.passwordHash,
+                                   _hashPassword(self.salt, password))
+
+
+def _hashPassword(salt, password):
+    return hashlib.sha256(salt + password.encode()).digest()
+
+
+def _disconnect(chassis):
+    # The connection is being dropped so a failure doesn't matter.
+    try:
+        chassis.disconnect()
+    except Exception as e:
+        pass
+
+
+class ConnectionPool(object):
+    '''This class keeps the idle chassis connections of the process, by
+    (ipAddress, user). A connection is leased by one session at a time, from
+    LOGIN to LOGOUT, so the INST selection, locks and settings of sessions
+    are never shared. LOGOUT selects INST NONE before the connection is
+    released, so it doesn't keep a test unit locked while idle.
+
+    veexlib can't check a password without logging in again, so a password
+    changed on the chassis is found when the user next logs in with the new
+    one, which drops the user's idle connections of the old password. Until
+    then the old password still leases them, for POOL_IDLE_TIMEOUT at most
+    as an expired connection is never leased, even before it is reaped.
+    '''
+
+    def __init__(self, maxIdle = POOL_MAX_IDLE, idleTimeout = POOL_IDLE_TIMEOUT):
+        self.maxIdle     = maxIdle
+        self.idleTimeout = idleTimeout
+        self.lock        = threading.Lock()
+        self.idle        = {}   # [ChassisLease] by (ipAddress, userName)
+        self.hits        = 0    # Leases of idle connections
+        self.misses      = 0    # Leases that connected
+        self.reaper      = None
+
+    def lease(self, ipAddress, userName, password):
+        '''Returns a ChassisLease of an idle connection of the user, if its
+        password matches and it still answers, or of a new connection.
+
+        Raises:
+            The veexlib.connect() exceptions, ie. veexlib.LoginFailed.
+        '''
+        key = (ipAddress, userName)
+        while True:
+            with self.lock:
+                entries = self.idle.get(key, [])
+                expired = self._popExpired(entries, time.monotonic())
+                lease = None
+                for index, entry in enumerate(entries):
+                    if entry.checkPassword(password):
+                        lease = entries.pop(index)
+                        break
+            for entry in expired:
+                _disconnect(entry.chassis)
+            if lease is None:
+                break
+            try:
+                # A cheap query to check the connection wasn't dropped, ie.
+                # by a restart of the protobuf server.
+                lease.chassis.getScpiRespAlways()
+            except Exception as e:
+                _disconnect(lease.chassis)
+                continue
+            lease.reused = True
+            lease.idleSince = None
+            self.hits += 1
+            return lease
+
+        self.misses += 1
+        lease = ChassisLease(self._connect(ipAddress, userName, password),
+                             ipAddress, userName, password)
+        self._dropOtherPasswords(lease, password)
+        return lease
+
+    def _dropOtherPasswords(self, lease, password):
+        # The server just accepted password, so idle connections of the
+        # user that logged in with another password have one that was
+        # changed. Drop them so the old password can't lease them.
+        key = (lease.ipAddress, lease.userName)
+        with self.lock:
+            entries = self.idle.get(key, [])
+            stale = [entry for entry in entries if not entry.checkPassword(password)]
+            if stale:
+                self.idle[key] = [entry for entry in entries if entry not in stale]
+        for entry in stale:
+            _disconnect(entry.chassis)
+
+    def _connect(self, ipAddress, userName, password):
+        try:
+            return veexlib.connect(ipAddress, userName, password)
+        except veexlib.ServerException as serverExcept:
+            # Idle connections count as logged in users, so drop them and
+            # try again if that is why the login failed.
+            if (serverExcept.reason != veexlib.EXCEPT_ADMIN_REACHED_MAX_LOGGEDIN_USERS) or \
+               (self.clear() == 0):
+                raise
+            return veexlib.connect(ipAddress, userName, password)
+
+    def release(self, lease, reuse = True):
+        '''Returns a leased connection to the pool, or disconnects it if reuse
+        is False or the user already has maxIdle idle connections.
+        '''
+        if lease is None:
+            return
+        if reuse and (self.maxIdle > 0):
+            key = (lease.ipAddress, lease.userName)
+            with self.lock:
+                entries = self.idle.setdefault(key, [])
+                if len(entries) < self.maxIdle:
+                    lease.idleSince = time.monotonic()
+                    entries.append(lease)
+                    self._startReaper()
+                    return
+        _disconnect(lease.chassis)
+
+    def clear(self):
+        '''Disconnects all of the idle connections.
+
+        Returns:
+            int: The number of connections disconnected.
+        '''
+        with self.lock:
+            leases = [lease for entries in self.idle.values() for lease in entries]
+            self.idle = {}
+        for lease in leases:
+            _disconnect(lease.chassis)
+        return len(leases)
+
+    def warm(self, ipAddress, userName, password, count = POOL_WARM_CONNECTIONS):
+        '''Connects count connections of the user in the background and adds
+        them to the pool, ie. for the autologin user at startup.
+        '''
+        def connectAll():
+            for num in range(min(count, self.maxIdle)):
+                try:
+                    chassis = self._connect(ipAddress, userName, password)
+                except Exception as e:
+                    print("Can't warm chassis connection,", e)
+                    return
+                self.release(ChassisLease(chassis, ipAddress, userName, password))
+        thread = threading.Thread(target = connectAll)
+        thread.daemon = True
+        thread.start()
+
+    def _startReaper(self):
+        # Must be called with the lock held.
+        if self.reaper is None:
+            self.reaper = threading.Thread(target = self._reap)
+            self.reaper.daemon = True
+            self.reaper.start()
+
+    def _popExpired(self, entries, now):
+        # Removes and returns the leases of entries idle for longer than
+        # idleTimeout. Must be called with the lock held.
+        expired = [lease for lease in entries
+                   if now - lease.idleSince >= self.idleTimeout]
+        for lease in expired:
+            entries.remove(lease)
+        return expired
+
+    def _reap(self):
+        # Disconnect connections idle for longer than idleTimeout.
+        while True:
+            time.sleep(min(self.idleTimeout, 1.0))
+            expired = []
+            now = time.monotonic()
+            with self.lock:
+                for key, entries in self.idle.items():
+                    expired.extend(self._popExpired(entries, now))
+            for lease in expired:
+                _disconnect(lease.chassis)
+
+
+def warmForAutoLogin(ipAddress):
+    '''Warms the pool for the autologin user, if autologin is enabled.
+    '''
+    autoLogin = autoLoginCache.get()
+    if autoLogin.enabled:
+        connectionPool.warm(ipAddress, autoLogin.username.decode(),
+                            autoLogin.password.decode())
+
+
+# The one pool of the process.
+connectionPool = ConnectionPool()
@@ -0,0 +1,193 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   DdmSampler.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to sample the module DDM (digital diagnostic monitoring) readings
+#    and threshold alarms of the MLD PHY PP in the background into a fixed
+#    size history.
+#
+###############################################################################
+
+from collections import deque
+import threading
+import time
+
+# Most samples kept in the history, one hour at the default rate.
+DDM_MAX_SAMPLES = 3600
+
+# Default and allowed seconds between samples.
+DDM_DEFAULT_PERIOD = 1.0
+DDM_MIN_PERIOD     = 0.1
+DDM_MAX_PERIOD     = 3600.0
+
+# Power readings at or below this are "No Module", "No Measurement", etc.
+# markers instead of real readings.
+DDM_POWER_INVALID = -99.0
+
+# Module threshold alarms sampled, as (RES:AL name, stats field, allowed
+# settings field of the lane count). Fields without a lane count are one
+# result for the module, the others are arrays with one result per lane.
+# The PHY stats only have the RX power readings, the temperature, VCC, TX
+# bias and TX power of the module are only reported by these thresholds.
+DDM_THRESHOLDS = (
+    (b"TEMPHIALARM",   "tempHighAlarmThreshold",     None),
+    (b"TEMPHIWARN",    "tempHighWarningThreshold",   None),
+    (b"TEMPLOALARM",   "tempLowAlarmThreshold",      None),
+    (b"TEMPLOWARN",    "tempLowWarningThreshold",    None),
+    (b"VCCHIALARM",    "vccHighAlarmThreshold",      None),
+    (b"VCCHIWARN",     "vccHighWarningThreshold",    None),
+    (b"VCCLOALARM",    "vccLowAlarmThreshold",       None),
+    (b"VCCLOWARN",     "vccLowWarningThreshold",     None),
+    (b"TXBIASHIALARM", "txBiasHighAlarmThreshold",   "txOpticalLaneCount"),
+    (b"TXBIASHIWARN",  "txBiasHighWarningThreshold", "txOpticalLaneCount"),
+    (b"TXBIASLOALARM", "txBiasLowAlarmThreshold",    "txOpticalLaneCount"),
+    (b"TXBIASLOWARN",  "txBiasLowWarningThreshold",  "txOpticalLaneCount"),
+    (b"TXPWRHIALARM",  "txPowerHighAlarmThreshold",  "txOpticalLaneCount"),
+    (b"TXPWRHIWARN",   "txPowerHighWarningThreshold", "txOpticalLaneCount"),
+    (b"TXPWRLOALARM",  "txPowerLowAlarmThreshold",   "txOpticalLaneCount"),
+    (b"TXPWRLOWARN",   "txPowerLowWarningThreshold", "txOpticalLaneCount"),
+    (b"RXPWRHIALARM",  "rxPowerHighAlarmThreshold",  "rxOpticalLaneCount"),
+    (b"RXPWRHIWARN",   "rxPowerHighWarningThreshold", "rxOpticalLaneCount"),
+    (b"RXPWRLOALARM",  "rxPowerLowAlarmThreshold",   "rxOpticalLaneCount"),
+    (b"RXPWRLOWARN",   "rxPowerLowWarningThreshold", "rxOpticalLaneCount"),
+    )
+
+
+class DdmSample(object):
+    '''One set of DDM readings. Per-lane readings are tuples indexed by lane.
+    '''
+    __slots__ = ("time", "rxPower", "alarms")
+
+    def __init__(self, time, rxPower, alarms):
+        self.time    = time     # time.monotonic() of the sample
+        self.rxPower = rxPower  # RX optical power per lane, dBm
+        self.alarms  = alarms   # Thresholds that were red, ie. b"TXBIASHIALARM-2"
+
+
+class DdmSampler(object):
+    '''This class reads the DDM readings of the session's PHY PP every
+    period seconds from a daemon thread and keeps the last DDM_MAX_SAMPLES
+    of them. MODULE:DDM:HISTory? then reports the min, max and average of
+    each reading without the client polling every reading every second.
+
+    The thread holds the session's PP lock while it reads the PP so it never
+    runs at the same time as a SCPI command of the session.
+    '''
+
+    def __init__(self):
+        self.samples  = deque(maxlen=DDM_MAX_SAMPLES)
+        self.period   = DDM_DEFAULT_PERIOD
+        self.pp       = None    # veexapi object the samples were read from
+        self.failures = 0       # Failed reads since the sampling started
+        self.thread   = None
+        self.stopEvent = threading.Event()
+
+    def isRunning(self):
+        '''Returns True if the sampling thread is running.
+        '''
+        return (self.thread is not None) and self.thread.is_alive()
+
+    def start(self, globals, period):
+        '''Starts, or restarts with a new period, sampling the PHY PP of a
+        session.
+
+        Args:
+            globals (SessionGlobals): The session to read veexPhy from.
+            period (float): Seconds between samples.
+        '''
+        self.stop()
+        self.period = period
+        self.failures = 0
+        self.stopEvent = threading.Event()
+        self.thread = threading.Thread(target=self._run,
+                                       args=(globals, self.stopEvent))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        '''Stops the sampling thread. The history is kept.
+        '''
+        self.stopEvent.set()
+        self.thread = None
+
+    def clear(self):
+        '''Drops all of the samples.
+        '''
+        self.samples.clear()
+
+    def _run(self, globals, stopEvent):
+        # Sample on a fixed schedule from the start time so the period
+        # doesn't drift by the time taken to read the PP.
+        nextTime = time.monotonic()
+        failed = False
+        while not stopEvent.is_set():
+            with globals.ppLock:
+                pp = globals.veexPhy
+                if pp is not None:
+                    try:
+                        self._readSample(pp)
+                        failed = False
+                    except Exception as e:
+                        # Don't let a failed read end the sampling, the PP
+                        # may be busy or being reconfigured. Only the first
+                        # of a run of failures is printed.
+                        if not failed:
+                            print("DDM sample failed,", e)
+                        failed = True
+                        self.failures += 1
+            nextTime += self.period
+            delay = nextTime - time.monotonic()
+            if delay < 0:
+                # Fell behind, skip the missed samples.
+                nextTime = time.monotonic()
+                delay = 0
+            stopEvent.wait(delay)
+
+    def _readSample(self, pp):
+        '''Reads one sample from the PP and adds it to the history.
+        '''
+        if pp is not self.pp:
+            # INSTrument selected a different PP, the old samples are not of
+            # this module.
+            self.samples.clear()
+            self.pp = pp
+
+        pp.update()
+        stats = pp.stats
+        alarms = []
+        for name, field, laneCountField in DDM_THRESHOLDS:
+            if laneCountField is None:
+                if getattr(stats, field).led.isRed:
+                    alarms.append(name)
+            else:
+                results = getattr(stats, field)
+                for lane in range(getattr(pp.allowedSets, laneCountField)):
+                    if results[lane].led.isRed:
+                        alarms.append(b"%s-%d" % (name, lane))
+        lanes = range(max(stats.rxHostLaneCount, 0))
+        self.samples.append(DdmSample(time.monotonic(),
+                                      tuple(stats.rxLanePower[lane] for lane in lanes),
+                                      tuple(alarms)))
+
+    def history(self, seconds=None):
+        '''Returns the samples of the last seconds, or all of them. Must be
+        called with the session's PP lock held, as SCPI commands are.
+
+        Args:
+            seconds (float): Age of the oldest sample to return, None for all.
+
+        Returns:
+            list: DdmSample objects, oldest first.
+        '''
+        samples = list(self.samples)
+        if seconds is not None:
+            oldest = time.monotonic() - seconds
+            samples = [sample for sample in samples if sample.time >= oldest]
+        return samples
@@ -0,0 +1,121 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   EnumCodec.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to convert between veexlib enums and SCPI text using lookup tables
+#    built once at import.
+#
+###############################################################################
+
+import veexlib
+
+
+class EnumCodec(object):
+    '''This class converts between veexlib enums and SCPI text in both
+    directions. Both lookups are dictionaries built when the codec is
+    created, so a query is one lookup instead of an if/elif ladder.
+
+    Args:
+        pairs (list of tuples): (enum, text) pairs. When an enum or text is
+            listed more than once the first pair is used, the same as the
+            first matching branch of a ladder.
+    '''
+
+    def __init__(self, pairs):
+        self.toText   = {}
+        self.fromText = {}
+        for enum, text in pairs:
+            self.toText.setdefault(enum, text)
+            self.fromText.setdefault(text.upper(), enum)
+
+        # Text lengths to try when decoding, longest first so that BITS/SETS
+        # is found before BITS.
+        self.lengths = sorted({len(text) for text in self.fromText}, reverse=True)
+
+    def encode(self, enum, default=None):
+        '''Returns the SCPI text for enum, or default if there is none.
+        '''
+        return self.toText.get(enum, default)
+
+    def decode(self, text, default=None):
+        '''Returns the enum whose SCPI text starts the parameter text, like
+        the startswith() checks of the setters, or default if there is none.
+        '''
+        text = text.upper()
+        for length in self.lengths:
+            if length <= len(text):
+                enum = self.fromText.get(text[:length])
+                if enum is not None:
+                    return enum
+        return default
+
+
+# TX:CLOCK reference source, shared by the MLD, OTN and SONET/SDH handlers.
+ClockTypeCodec = EnumCodec([
+    (veexlib.CLOCK_INTERNAL,  b"INT"),
+    (veexlib.CLOCK_RECOVERED, b"LOOP"),
+    (veexlib.CLOCK_BITS_SETS, b"BITS/SETS"),
+    (veexlib.CLOCK_BITS,      b"BITS"),
+    (veexlib.CLOCK_SETS,      b"SETS"),
+    (veexlib.CLOCK_EXT_8KHZ,  b"EXT8KHZ"),
+    (veexlib.CLOCK_EXT_BITS,  b"EXT1_5MHZ"),
+    (veexlib.CLOCK_EXT_SETS,  b"EXT2MHZ"),
+    (veexlib.CLOCK_EXT_10MHZ, b"EXT10MHZ"),
+    (veexlib.CLOCK_SYNC,      b"SYNC"),
+    ])
+
+# SCPI PP names by (protocolType, cardType). The MPM10G card doesn't have an
+# MLD in SCPI and the PHY, PCS and OTL PPs all become MLD.
+PpNameCodec = EnumCodec([
+    ((veexlib.PROTO_PHY, veexlib.CARD_MPM100G),             b"MPM100MLD"),
+    ((veexlib.PROTO_PHY, veexlib.CARD_MPM100AR),            b"MPM100MLD"),
+    ((veexlib.PROTO_PHY, veexlib.CARD_MPM400G),             b"MPM400GMLD"),
+    ((veexlib.PROTO_PHY, veexlib.CARD_MPM400AR),            b"MPM400MLD"),
+    ((veexlib.PROTO_PHY, veexlib.CARD_MPM400DCO),           b"MPM400MLD"),
+    ((veexlib.PROTO_PHY, veexlib.CARD_MPM600G),             b"MPM600MLD"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM10G),              b"OTN"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM100G),             b"MPM100OTN"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM100AR),            b"MPM100OTN"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM400G),             b"MPM400GOTN"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM400AR),            b"MPM400OTN"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM400DCO),           b"MPM400OTN"),
+    ((veexlib.PROTO_OTN, veexlib.CARD_MPM600G),             b"MPM600OTN"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM10G),        b"SONETSDH"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM100G),       b"MPM100SONETSDH"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM100AR),      b"MPM100SONETSDH"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM400G),       b"MPM400GSONETSDH"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM400AR),      b"MPM400SONETSDH"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM400DCO),     b"MPM400SONETSDH"),
+    ((veexlib.PROTO_SONET_SDH, veexlib.CARD_MPM600G),       b"MPM600SONETSDH"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM10G),         b"PACKET"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM100G),        b"MPM100PACKET"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM100AR),       b"MPM100PACKET"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM400G),        b"MPM400GPACKET"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM400AR),       b"MPM400PACKET"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM400DCO),      b"MPM400PACKET"),
+    ((veexlib.PROTO_ETHERNET, veexlib.CARD_MPM600G),        b"MPM600PACKET"),
+    ])
+
+# Card names used by GET:PARTnumbers?, GET:SERialnumbers? and GET:VERsion?.
+CardNameCodec = EnumCodec([
+    (veexlib.CARD_OSA_PMD,   b"OSA"),
+    (veexlib.CARD_IM_100,    b"IM-100"),
+    (veexlib.CARD_OTDR,      b"OTDR"),
+    (veexlib.CARD_OP_SWITCH, b"OPSW"),
+    (veexlib.CARD_SCM210,    b"SCM-210"),
+    (veexlib.CARD_MPM10G,    b"MPM-10G"),
+    (veexlib.CARD_MPM100G,   b"MPM-100G"),
+    (veexlib.CARD_MPM100AR,  b"MPM-100AR"),
+    (veexlib.CARD_MPM400G,   b"MPM-400G"),
+    (veexlib.CARD_MPM400AR,  b"MPM-400AR"),
+    (veexlib.CARD_MPM400DCO, b"MPM-400DCO"),
+    (veexlib.CARD_MPM600G,   b"MPM-600G"),
+    (veexlib.CARD_SCM220,    b"SCM-220"),
+    ])
@@ -0,0 +1,194 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   ErrorScheduler.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to apply a schedule of TX error injection settings from a
+#    background thread at set times, for TX:ERRor:SCHEDule.
+#
+###############################################################################
+
+from ErrorCodes import ScpiErrorCode
+from ErrorCodes import errorResponse
+import ParseUtils
+import threading
+import time
+
+# Most steps in one schedule.
+ERROR_SCHEDULE_MAX_STEPS = 1000
+
+
+class ErrorScheduler(object):
+    '''This class applies the steps of an error injection schedule, each at
+    its time from the start of the schedule, from a daemon thread. The times
+    are kept on a monotonic clock from the start so they don't drift by the
+    time taken to apply each step, and the time each step was actually
+    applied is logged for RES:ERRor:SCHEDule?.
+
+    Each step calls a TX:ERRor setting handler, so the settings are checked
+    and applied the same as if a client sent them. The thread holds the
+    session's PP lock while it applies a step so it never runs at the same
+    time as a SCPI command of the session.
+    '''
+
+    def __init__(self):
+        self.steps  = []    # (offset, setting, handler, value) in time order
+        self.log    = []    # (step, setting, offset, applied, errorCode)
+        self.thread = None
+        self.stopEvent = threading.Event()
+
+    def isRunning(self):
+        '''Returns True if the schedule thread is running.
+        '''
+        return (self.thread is not None) and self.thread.is_alive()
+
+    def parse(self, parameters, handlers):
+        '''Parses the steps of TX:ERRor:SCHEDule, each
+        <seconds>,<setting>,<value> separated by ;. Seconds are from the start
+        of the schedule and can't go backwards.
+
+        Args:
+            parameters (bytes): The step list.
+            handlers (dict): Setting handler function by setting name.
+
+        Returns:
+            list: (offset, setting, handler, value) tuples, or an
+                  ScpiErrorCode.
+        '''
+        records = ParseUtils.preParseRecords(parameters)
+        if records is None:
+            return ScpiErrorCode.DATA_TYPE_ERR
+        if len(records) == 0:
+            return ScpiErrorCode.MISSING_PARAM
+        if len(records) > ERROR_SCHEDULE_MAX_STEPS:
+            return ScpiErrorCode.DATA_OUT_OF_RANGE
+
+        steps = []
+        lastOffset = 0.0
+        for record in records:
+            if (len(record) < 3) or (len(record[2]) == 0):
+                return ScpiErrorCode.MISSING_PARAM
+            if not ParseUtils.isFloatSdh(record[0]):
+                return ScpiErrorCode.NUMERIC_DATA_ERR
+            offset = float(record[0])
+            if offset < lastOffset:
+                return ScpiErrorCode.DATA_OUT_OF_RANGE
+            lastOffset = offset
+
+            for setting, handler in handlers.items():
+                if record[1].upper().startswith(setting):
+                    break
+            else:
+                return ScpiErrorCode.ILLEGAL_PARAM_VALUE
+
+            # Any fields after the setting are its parameters, such as the
+            # lane and rate of an MLD RATE.
+            steps.append((offset, setting, handler, b" ".join(record[2:])))
+        return steps
+
+    def scheduleCommand(self, globals, parameters, handlers):
+        '''Handles the TX:ERRor:SCHEDule <steps>|OFF parameters for the MLD
+        and OTN handlers, starting or stopping the schedule.
+
+        Args:
+            globals (SessionGlobals): The session, for error responses and
+                                      the PP lock to hold.
+            parameters (bytes): The parameters of the command.
+            handlers (dict): Setting handler function by setting name.
+
+        Returns:
+            bytes: None, or an error response.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        if len(paramList) == 0:
+            return errorResponse(ScpiErrorCode.MISSING_PARAM, globals)
+        if (len(paramList) == 1) and paramList[0].head.upper().startswith(b"OFF"):
+            self.stop()
+            return None
+
+        steps = self.parse(parameters, handlers)
+        if isinstance(steps, ScpiErrorCode):
+            return errorResponse(steps, globals)
+        self.start(globals, steps)
+        return None
+
+    def start(self, globals, steps):
+        '''Starts a schedule, stopping any schedule already running.
+
+        Args:
+            globals (SessionGlobals): The session with the PP lock to hold.
+            steps (list): Steps returned by parse().
+        '''
+        self.stop()
+        self.steps = steps
+        self.log = []
+        self.stopEvent = threading.Event()
+        self.thread = threading.Thread(target=self._run,
+                                       args=(globals, steps, self.log,
+                                             self.stopEvent))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        '''Stops the schedule. Steps already applied are kept in the log.
+        '''
+        self.stopEvent.set()
+        self.thread = None
+
+    def _run(self, globals, steps, log, stopEvent):
+        startTime = time.monotonic()
+        for step, (offset, setting, handler, value) in enumerate(steps):
+            # Event.wait() can return a little early, wait again for the
+            # rest of the time.
+            target = startTime + offset
+            delay = target - time.monotonic()
+            while (delay > 0) and not stopEvent.is_set():
+                stopEvent.wait(delay)
+                delay = target - time.monotonic()
+
+            with globals.ppLock:
+                if stopEvent.is_set():
+                    return
+                applied = time.monotonic() - startTime
+                try:
+                    response = handler(value)
+                    if response:
+                        # The error text starts with the code.
+                        errorCode = int(response.split(b",")[0])
+                    else:
+                        errorCode = ScpiErrorCode.DLI_NO_ERROR
+                except Exception as e:
+                    # The PP may have gone, INST NONE or logout.
+                    errorCode = ScpiErrorCode.EXECUTION_ERR
+                log.append((step + 1, setting, offset, applied, errorCode))
+
+    def status(self):
+        '''Returns the TX:ERRor:SCHEDule? response,
+        <IDLE|RUNNING|DONE|STOPPED>,<steps applied>,<steps>.
+        '''
+        if self.isRunning():
+            state = b"RUNNING"
+        elif len(self.steps) == 0:
+            state = b"IDLE"
+        elif len(self.log) == len(self.steps):
+            state = b"DONE"
+        else:
+            state = b"STOPPED"
+        return b"%s,%d,%d" % (state, len(self.log), len(self.steps))
+
+    def report(self):
+        '''Returns the RES:ERRor:SCHEDule? response, the count of steps
+        applied followed by one
+        ";<step>,<setting>,<scheduled seconds>,<applied seconds>,<error code>"
+        per step applied. The error code is 0 if the setting was accepted.
+        '''
+        response = [b"%d" % len(self.log)]
+        for entry in list(self.log):
+            response.append(b"%d,%s,%.3f,%.6f,%d" % entry)
+        return b";".join(response)
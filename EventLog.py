@@ -0,0 +1,182 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   EventLog.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to keep a session copy of a PP event log for cursor based reads.
+#
+###############################################################################
+
+from ErrorCodes import ScpiErrorCode
+from ErrorCodes import errorResponse
+import ParseUtils
+
+# Most records the PP returns for one event log read.
+EVENTLOG_PP_MAX_RECORDS = 64
+
+# Most entries returned by one FETC:EVENTLOG? query.
+EVENTLOG_MAX_ENTRIES = 1024
+
+# Entries kept by the session. Older entries are dropped once reported.
+EVENTLOG_MAX_KEPT = 4096
+
+# Event ID of an entry that stands for records lost before they were read,
+# its count is the number lost. Reported as LOST.
+EVENTLOG_LOST = None
+
+
+class EventLog(object):
+    '''This class keeps the event log entries read from a PP, each tagged
+    with a sequence number, so FETC:EVENTLOG? can return only the entries
+    after a client's cursor. The PP is only asked for records that haven't
+    been read yet and entries are found by their position in the list, so
+    the cost of a query depends on the number of new entries, not the size
+    of the log.
+
+    Sequence numbers start at 1 and keep increasing when the PP log is
+    cleared by a test restart or INSTrument selects another PP, so a client
+    cursor never goes backwards. Records the PP dropped before they were
+    read, and entries the session dropped before the client read them, are
+    reported as one LOST entry with the number lost, so a client can tell
+    that it missed events.
+    '''
+
+    def __init__(self):
+        self.pp         = None  # veexapi object the entries were read from
+        self.entries    = []    # (sequence, eventId, count, time, duration)
+        self.firstSeq   = 1     # Sequence number of entries[0]
+        self.nextRecord = 0     # Next PP record number to read
+        self.seqBase    = 1     # Sequence number of PP record 0
+
+    def clear(self):
+        '''Drops all kept entries and starts reading the PP log from its
+        first record. Sequence numbers carry on after the last one given.
+        '''
+        self.seqBase   += self.nextRecord
+        self.nextRecord = 0
+        self.entries    = []
+        self.firstSeq   = self.seqBase
+
+    def _readNewRecords(self, pp):
+        '''Reads the records added to the PP event log since the last read.
+
+        Args:
+            pp (veexapi object): The PP with the event log to read.
+        '''
+        if pp is not self.pp:
+            # INSTrument selected a different PP, the old entries are not
+            # from this log.
+            self.clear()
+            self.pp = pp
+
+        while True:
+            eventLog = pp.getEventLog(self.nextRecord)
+            if eventLog.totalRecs < self.nextRecord:
+                # The PP log was cleared. Carry on numbering after the
+                # entries already seen.
+                self.seqBase += self.nextRecord
+                self.nextRecord = 0
+                continue
+
+            # Records the PP no longer stores are lost. They are replaced by
+            # one LOST entry, so the sequence numbers stay consecutive.
+            oldestRecord = eventLog.totalRecs - eventLog.storedCount
+            if self.nextRecord < oldestRecord:
+                lost = oldestRecord - self.nextRecord
+                self.entries.append((self.seqBase + self.nextRecord,
+                                     EVENTLOG_LOST, lost, 0, 0))
+                self.seqBase -= lost - 1
+                self.nextRecord = oldestRecord
+                continue
+
+            for record in eventLog.records[:eventLog.recCount]:
+                self.entries.append((self.seqBase + self.nextRecord,
+                                     record.eventId,
+                                     record.count,
+                                     record.timeStamp,
+                                     record.duration))
+                self.nextRecord += 1
+
+            if (eventLog.recCount == 0) or \
+               (self.nextRecord >= eventLog.totalRecs):
+                break
+
+        # Trim in one step once well over the limit instead of on every
+        # entry added.
+        if len(self.entries) > 2 * EVENTLOG_MAX_KEPT:
+            drop = len(self.entries) - EVENTLOG_MAX_KEPT
+            del self.entries[:drop]
+            self.firstSeq += drop
+        if len(self.entries) == 0:
+            self.firstSeq = self.seqBase + self.nextRecord
+
+    def fetch(self, pp, sinceId, maxEntries):
+        '''Returns the entries after sinceId for FETC:EVENTLOG?.
+
+        Args:
+            pp (veexapi object): The PP with the event log to read.
+            sinceId (int): Sequence number of the last entry the client has,
+                           0 for all kept entries.
+            maxEntries (int): Most entries to return.
+
+        Returns:
+            bytes: "<last id>,<entry count>" followed by one
+                   ";<id>,<event id>,<count>,<time>,<duration>" per entry.
+                   The last id is the sinceId to use for the next query.
+                   Lost entries are ";<id>,LOST,<number lost>,0,0".
+        '''
+        self._readNewRecords(pp)
+
+        selected = []
+        if (sinceId != 0) and (sinceId + 1 < self.firstSeq):
+            # The session dropped entries the client hadn't read.
+            selected.append((self.firstSeq - 1, EVENTLOG_LOST,
+                             self.firstSeq - 1 - sinceId, 0, 0))
+
+        # Sequence numbers are consecutive, so the position in the list is
+        # found directly.
+        start = max(sinceId + 1 - self.firstSeq, 0)
+        selected.extend(self.entries[start:start + maxEntries - len(selected)])
+        if selected:
+            lastId = selected[-1][0]
+        else:
+            lastId = max(sinceId, self.firstSeq - 1)
+
+        response = [b"%d,%d" % (lastId, len(selected))]
+        for entry in selected:
+            if entry[1] is EVENTLOG_LOST:
+                response.append(b"%d,LOST,%d,0,0" % (entry[0], entry[2]))
+            else:
+                response.append(b"%d,%d,%d,%d,%d" % entry)
+        return b";".join(response)
+
+    def fetchQuery(self, globals, pp, parameters):
+        '''Handles the FETC:EVENTLOG? <SinceId>,<Max> parameters for the MLD,
+        OTN and Packet handlers.
+
+        Args:
+            globals (SessionGlobals): The session, for error responses.
+            pp (veexapi object): The PP with the event log to read.
+            parameters (bytes): The parameters of the command.
+
+        Returns:
+            bytes: The fetch() response or an error response.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        if len(paramList) < 2:
+            return errorResponse(ScpiErrorCode.MISSING_PARAM, globals)
+
+        sinceId = ParseUtils.checkNumeric(paramList[0].head)
+        maxEntries = ParseUtils.checkNumeric(paramList[1].head)
+        if (sinceId < 0) or (maxEntries < 0):
+            return errorResponse(ScpiErrorCode.NUMERIC_DATA_ERR, globals)
+        if (maxEntries == 0) or (maxEntries > EVENTLOG_MAX_ENTRIES):
+            return errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE, globals)
+
+        return self.fetch(pp, sinceId, maxEntries)
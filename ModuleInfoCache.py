@@ -0,0 +1,95 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   ModuleInfoCache.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to keep the decoded SFP/QSFP EEPROM fields of each port so the
+#    MODULE:INFO queries don't read and decode them on every query.
+#
+###############################################################################
+
+import time
+
+# Seconds a port's cached fields are used before the PP stats are read again
+# to check whether the module was removed or swapped.
+MODULE_INFO_CHECK_SECS = 1.0
+
+
+class ModuleInfoCache(object):
+    '''This class keeps the decoded module EEPROM fields for the port (PP)
+    selected by a session. The fields only change when a module is plugged
+    in, removed or swapped, so they are decoded once per module. The PP stats
+    are only read to check for a change after MODULE_INFO_CHECK_SECS, so an
+    inventory sweep of the MODULE:INFO field queries costs one stats read.
+    A live lookup always reads the stats, for MODULE:INFO:PRESENT? and
+    MODULE:INFO:ALL?.
+
+    A swap is found by comparing the module's ID, vendor name, part number,
+    serial number and date code with those of the cached module.
+    '''
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        '''Drops the cached fields of all ports.
+        '''
+        # (slotId, portId): [check time, signature, modulePresent, fields]
+        self.ports = {}
+
+    def prune(self, pp):
+        '''Drops the cached fields of all ports but the one of pp, ie. after
+        an INSTrument command. pp is None to drop them all.
+        '''
+        if pp is None:
+            self.clear()
+        else:
+            key = (pp.slotId, pp.portId)
+            self.ports = {port: entry for port, entry in self.ports.items()
+                          if port == key}
+
+    def lookup(self, pp, decode, live = False):
+        '''Returns the decoded fields of the module plugged into a port.
+
+        Args:
+            pp (veexapi object): The PP with the stats.sfpI2cInfo to read.
+            decode (function): Called with stats.sfpI2cInfo when the module
+                               changed. Returns a list of (name, text) tuples.
+            live (bool): True to read the stats even if the cached fields
+                         were checked less than MODULE_INFO_CHECK_SECS ago.
+
+        Returns:
+            (int, dict): Tuple of the modulePresent value and a dictionary of
+                         text by field name, or None if the module isn't
+                         present and ready (modulePresent isn't 1).
+        '''
+        now = time.monotonic()
+        key = (pp.slotId, pp.portId)
+        entry = self.ports.get(key)
+        if (not live) and (entry is not None) and \
+           (now - entry[0] < MODULE_INFO_CHECK_SECS):
+            return (entry[2], entry[3])
+
+        pp.stats.update()
+        info = pp.stats.sfpI2cInfo
+        if info.modulePresent == 1:
+            signature = (info.moduleId, info.vendorName, info.vendorPartNum,
+                         info.vendorSerialNum, info.dateCode)
+        else:
+            signature = None
+
+        if signature is None:
+            fields = None
+        elif (entry is not None) and (entry[1] == signature):
+            fields = entry[3]
+        else:
+            fields = dict(decode(info))
+
+        self.ports[key] = [now, signature, info.modulePresent, fields]
+        return (info.modulePresent, fields)
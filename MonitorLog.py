@@ -0,0 +1,141 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   MonitorLog.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to send the SCPI monitor entries (the commands and responses
+#    shown in the GUI) to the chassis from a background thread, instead of
+#    an addScpiMonitorData() round trip in the handling of each command.
+#
+###############################################################################
+
+import threading
+import time
+
+# Seconds between sends of the queued entries.
+MONITOR_FLUSH_PERIOD = 0.05
+
+# Most entries queued for all sessions. Entries added while the queue is
+# full are dropped and counted, and the count is sent in their place.
+MONITOR_MAX_PENDING = 2000
+
+
+class MonitorQueue(object):
+    '''This class queues the SCPI monitor entries of all sessions of the
+    process and sends them from a daemon thread every MONITOR_FLUSH_PERIOD
+    seconds, one addScpiMonitorData() call per entry as the GUI shows them.
+    The entries of each session are sent over its own chassis connection,
+    in order, with the session's PP lock held so they never use the
+    connection at the same time as a SCPI command of the session.
+
+    The thread doesn't wait for the PP lock. The entries of a session that
+    is running a command are left queued for the next period, so a slow
+    command of one session doesn't hold up the entries of the others.
+
+    The thread is started by the first entry added.
+    '''
+
+    def __init__(self, period = MONITOR_FLUSH_PERIOD, maxPending = MONITOR_MAX_PENDING):
+        self.period     = period
+        self.maxPending = maxPending
+        self.lock       = threading.Lock()
+        self.pending    = {}    # [entry] by SessionGlobals
+        self.dropped    = {}    # Dropped entries by SessionGlobals
+        self.count      = 0     # Entries in pending
+        self.sent       = 0     # addScpiMonitorData() calls made
+        self.thread     = None
+
+    def add(self, globals, text):
+        '''Queues an entry to send over the chassis connection of a session.
+
+        Args:
+            globals (SessionGlobals): The session the entry is of.
+            text (string): The entry, ie. "RCV(TCP1): *IDN?".
+        '''
+        with self.lock:
+            if self.count >= self.maxPending:
+                self.dropped[globals] = self.dropped.get(globals, 0) + 1
+                return
+            entries = self.pending.get(globals)
+            if entries is None:
+                entries = self.pending[globals] = []
+            entries.append(text)
+            self.count += 1
+            if self.thread is None:
+                self.thread = threading.Thread(target = self._run)
+                self.thread.daemon = True
+                self.thread.start()
+
+    def flush(self, globals = None):
+        '''Sends the queued entries of a session now, waiting for its PP
+        lock. Called before a session disconnects from the chassis. Without
+        a session, sends the entries of each session that isn't running a
+        command.
+        '''
+        with self.lock:
+            if globals is None:
+                sessions = list(self.pending) + \
+                           [session for session in self.dropped
+                            if session not in self.pending]
+            else:
+                sessions = [globals]
+            batches = []
+            for session in sessions:
+                entries = self.pending.pop(session, [])
+                self.count -= len(entries)
+                dropped = self.dropped.pop(session, 0)
+                if dropped:
+                    entries.append("RCV(%s%d): <%d monitor entries dropped>" % \
+                                   (session.sessionType.decode(),
+                                    session.sessionId, dropped))
+                if entries:
+                    batches.append((session, entries))
+
+        for session, entries in batches:
+            if not self._send(session, entries, wait = globals is not None):
+                self._requeue(session, entries)
+
+    def _requeue(self, globals, entries):
+        '''Puts back entries that weren't sent ahead of any added since.
+        '''
+        with self.lock:
+            self.pending[globals] = entries + self.pending.get(globals, [])
+            self.count += len(entries)
+
+    def _send(self, globals, entries, wait):
+        '''Sends entries over the connection of a session. Returns False
+        without sending if wait is False and the PP lock is held.
+        '''
+        if not globals.ppLock.acquire(blocking = wait):
+            return False
+        try:
+            chassis = globals.veexChassis
+            if chassis is None:
+                # Logged out, there is no connection to send them over.
+                return True
+            for entry in entries:
+                try:
+                    chassis.addScpiMonitorData(entry)
+                    self.sent += 1
+                except Exception as e:
+                    # The monitor is only for display, a failed send mustn't
+                    # stop the thread.
+                    pass
+        finally:
+            globals.ppLock.release()
+        return True
+
+    def _run(self):
+        while True:
+            time.sleep(self.period)
+            self.flush()
+
+
+# The one queue of the process.
+monitorQueue = MonitorQueue()
@@ -14,6 +14,16 @@
 ###############################################################################
 
 from typing import NamedTuple
+import functools
+
+# Placeholder for a number in a command table command (ie. RES:TCM<n>:BEI?)
+# so one entry and handler cover a family of numbered commands. The number
+# is passed to the handler as its index argument.
+INDEX_PLACEHOLDER = b"<n>"
+
+# The placeholder as it is kept in the command tree, upper case like the
+# rest of the tree.
+INDEX_NODE = b"<N>"
 
 
 class SubCommand(NamedTuple):
@@ -30,6 +40,7 @@ class CommandTableEntry(NamedTuple):
     '''
     command: bytes       # Command or query
     callback: bytes      # Function to handle the command returns bytes
+    indexes: range = None  # Numbers allowed for a <n> placeholder, None is any
 
 
 class CommandTreeEntry(NamedTuple):
@@ -39,6 +50,7 @@ class CommandTreeEntry(NamedTuple):
     subCommand: bytes    # Part of a command or query
     branch: list         # Next branch of the tree if subCommand matches
     callback: bytes      # Function to handle the command that returns bytes
+    indexes: range = None  # Numbers allowed for a <n> placeholder, None is any
 
 
 def preParse(buffer, separators = None):
@@ -121,6 +133,61 @@ def preParseParameters(parameters):
         return response
 
 
+def preParseRecords(parameters):
+    '''This parses the text parameters into records separated by ; of fields
+    separated by , (ie. OTU,"A B",C;TCM1,D,E). A field may be a "" quoted
+    string, with "" for a " in the string, so it can contain the separators.
+    Space around unquoted fields is removed.
+
+    Args:
+        parameters (bytes): the string to parse.
+
+    Returns:
+        List of lists of bytes fields, or None if a quote isn't closed.
+    '''
+    records = []
+    fields = []
+    field = b""
+    quoted = False      # Inside a quoted string
+    wasQuoted = False   # The field is a quoted string, keep it as is
+    i = 0
+    while i < len(parameters):
+        char = parameters[i:i + 1]
+        if quoted:
+            if char != b'"':
+                field += char
+            elif parameters[i + 1:i + 2] == b'"':
+                # A doubled quote is a quote in the string.
+                field += char
+                i += 1
+            else:
+                quoted = False
+        elif char in (b',', b';'):
+            fields.append(field if wasQuoted else field.strip())
+            field = b""
+            wasQuoted = False
+            if char == b';':
+                records.append(fields)
+                fields = []
+        elif char == b'"':
+            # Anything before the quote is only space.
+            field = b""
+            quoted = True
+            wasQuoted = True
+        elif not wasQuoted:
+            # Anything after the closing quote is ignored.
+            field += char
+        i += 1
+
+    if quoted:
+        return None
+    fields.append(field if wasQuoted else field.strip())
+    records.append(fields)
+    if records == [[b""]]:
+        return []
+    return records
+
+
 def parseCommand(buffer):
     '''This parses the text buffer in the stricter internal command format
     into parts. Each part is separated by a colon and any lower case letters
@@ -142,6 +209,8 @@ def parseCommand(buffer):
     #print(rawSplit)
 
     for word in rawSplit:
+        # The placeholder is lower case but isn't an optional part.
+        word = word.replace(INDEX_PLACEHOLDER, INDEX_NODE)
         if word.isupper():
             # All the letters are uppercase, just copy into results.
             results.append(word)
@@ -194,7 +263,8 @@ def processCommandTableIntoTree(commandTable, commandTreeRoot):
                 if subCommand is subCommandList[-1]:
                     # This is the last subCommand in the list. Create a new
                     # node with the callback.
-                    foundNode = CommandTreeEntry (subCommand, [], tableEntry.callback)
+                    foundNode = CommandTreeEntry (subCommand, [], tableEntry.callback,
+                                                  tableEntry.indexes)
 #                    print("Added terminal node", subCommand)
                 else:
                     # This is NOT the last subCommand in the list. Create a new
@@ -208,6 +278,50 @@ def processCommandTableIntoTree(commandTable, commandTreeRoot):
 
 #    print(commandTreeRoot)
 
+def matchSubCommand(nodeText, text):
+    '''Matches one subcommand of a command against a command tree node. The
+    text only needs to start with the node text. A <n> placeholder in the
+    node matches a number.
+
+    Args:
+        nodeText (bytes): The subCommand of the tree node, without any ?.
+        text (bytes): The upper case subcommand to match, without any ?.
+
+    Returns:
+        (bool, int): Tuple of whether it matched and the number matched by
+                     a placeholder, None if there isn't one.
+    '''
+    placeholder = nodeText.find(INDEX_NODE)
+    if placeholder < 0:
+        return (text.startswith(nodeText), None)
+
+    # Match the text before the placeholder, the number and then the text
+    # after it.
+    if not text.startswith(nodeText[:placeholder]):
+        return (False, None)
+    start = placeholder
+    end = start
+    while (end < len(text)) and text[end:end + 1].isdigit():
+        end += 1
+    if end == start:
+        return (False, None)
+    if not text[end:].startswith(nodeText[placeholder + len(INDEX_NODE):]):
+        return (False, None)
+    return (True, int(text[start:end]))
+
+
+def commandCallback(node, index):
+    '''Returns the callback of a matched command. If the command had a <n>
+    placeholder the number is bound as the callback's index argument, or
+    None is returned if the number isn't allowed.
+    '''
+    if index is None:
+        return node.callback
+    if (node.indexes is not None) and (index not in node.indexes):
+        return None
+    return functools.partial(node.callback, index = index)
+
+
 def searchCommandTree(parsedCommand, commandTreeRoot):
     '''Searches the command tree for a command.
 
@@ -224,6 +338,7 @@ def searchCommandTree(parsedCommand, commandTreeRoot):
     '''
     treeNode = commandTreeRoot
     foundNode = None
+    index = None
 #    print("  command", parsedCommand)
 
     # Loop through all the subcommands
@@ -235,7 +350,9 @@ def searchCommandTree(parsedCommand, commandTreeRoot):
             if node.subCommand.endswith(b'?') and subCommand.head.endswith(b'?'):
                 # Matching with a query with a query. Know the ? at end matchs,
                 # just need to match the previous text.
-                if subCommand.head[:-1].upper().startswith(node.subCommand[:-1]):
+                matched, nodeIndex = matchSubCommand(node.subCommand[:-1],
+                                                     subCommand.head[:-1].upper())
+                if matched:
                     # Found a match so this subCommand is in the tree.
                     foundNode = node
 #                    print("MATCH")
@@ -245,18 +362,23 @@ def searchCommandTree(parsedCommand, commandTreeRoot):
                 pass
             else:
                 # Matching non-query to non-query. Match the entire text.
-                if subCommand.head.upper().startswith(node.subCommand):
+                matched, nodeIndex = matchSubCommand(node.subCommand,
+                                                     subCommand.head.upper())
+                if matched:
                     # Found a match so this subCommand is in the tree.
                     foundNode = node
 #                    print("MATCH")
                     break
 
         if foundNode:
+            if nodeIndex is not None:
+                index = nodeIndex
+
             # Match was found, either return the callback function or follow
             # the branch if the callback is None.
             if foundNode.callback:
 #                print("returning A", foundNode.callback, subCommand.tail)
-                return (foundNode.callback, subCommand.tail)
+                return (commandCallback(foundNode, index), subCommand.tail)
             else:
 #                print("branch", foundNode.branch)
                 treeNode = foundNode.branch
@@ -269,8 +391,8 @@ def searchCommandTree(parsedCommand, commandTreeRoot):
     # Return the handler function for this command and an empty parameter
     # string. If the command is not complete then this will return None.
 #    print("returning B", foundNode.callback, b"")
-    if foundNode:
-        return (foundNode.callback, b"")
+    if foundNode and foundNode.callback:
+        return (commandCallback(foundNode, index), b"")
     else:
         return (None, b"")
 
@@ -0,0 +1,208 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   PerfStats.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to keep per command latency histograms of a session, split by
+#    the phases of handling a command, for SYSTem:PERF?.
+#
+###############################################################################
+
+import time
+
+# Phases of handling a command, in the order they happen. VEEX is the time
+# of the handler's veexlib round trips, taken out of HANDLER. It is only
+# measured while SYSTem:PERF:VEEXlib:TRACE is ON, otherwise it is 0 and
+# HANDLER includes the round trips. SEND is timed by the session thread
+# after the response is returned and isn't part of TOTAL.
+PERF_PARSE   = 0
+PERF_SEARCH  = 1
+PERF_HANDLER = 2
+PERF_VEEX    = 3
+PERF_LOG     = 4
+PERF_SEND    = 5
+PERF_TOTAL   = 6
+PERF_PHASE_NAMES = [b"PARSE", b"SEARCH", b"HANDLER", b"VEEX", b"LOG", b"SEND", b"TOTAL"]
+
+# Histogram buckets are linear within each power of two microseconds, with
+# 2^PERF_SUB_BUCKET_BITS buckets per power of two. 3 bits keeps each bucket
+# within 12.5% of its value.
+PERF_SUB_BUCKET_BITS = 3
+
+# Commands reported by SYSTem:PERF? when no count is given.
+PERF_DEFAULT_REPORT = 20
+
+# File written by the periodic dump, with the session type and ID.
+PERF_DUMP_FILE = "scpiperf_%s%d.txt"
+
+
+class LatencyHistogram(object):
+    '''This class counts latencies, in microseconds, in log-linear buckets so
+    percentiles can be found with a bounded error using a few hundred
+    buckets at most, however many latencies are added.
+    '''
+    __slots__ = ("buckets", "count", "total", "maximum")
+
+    def __init__(self):
+        self.buckets = {}   # count by bucket index
+        self.count   = 0
+        self.total   = 0    # Sum of the latencies, microseconds
+        self.maximum = 0
+
+    def add(self, micros):
+        '''Adds one latency in microseconds.
+        '''
+        if micros < (1 << PERF_SUB_BUCKET_BITS):
+            index = micros
+        else:
+            shift = micros.bit_length() - 1 - PERF_SUB_BUCKET_BITS
+            index = ((shift + 1) << PERF_SUB_BUCKET_BITS) + \
+                    ((micros >> shift) & ((1 << PERF_SUB_BUCKET_BITS) - 1))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += micros
+        if micros > self.maximum:
+            self.maximum = micros
+
+    def percentile(self, percent):
+        '''Returns the latency, in microseconds, that percent of the latencies
+        are at or below. This is the upper end of the bucket, limited to the
+        largest latency added.
+        '''
+        if self.count == 0:
+            return 0
+        rank = self.count * percent / 100.0
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                break
+        if index < (1 << PERF_SUB_BUCKET_BITS):
+            return index
+        shift = (index >> PERF_SUB_BUCKET_BITS) - 1
+        base = (1 << PERF_SUB_BUCKET_BITS) + \
+               (index & ((1 << PERF_SUB_BUCKET_BITS) - 1))
+        return min(((base + 1) << shift) - 1, self.maximum)
+
+
+class PerfStats(object):
+    '''This class times each command a session handles. The command handling
+    calls begin() at the start, lap() at the end of each phase and finish()
+    with the handler that was used. Each handler is one command table entry,
+    so the times are kept for each command pattern (ie.
+    ScpiOtn.tcmBeiAvgErrRate for RES:TCM<n>:BEI:AVE?).
+
+    Timing a command is a few perf_counter_ns() calls and histogram bucket
+    increments so it is always on.
+    '''
+
+    def __init__(self):
+        self.dumpPeriod = None  # Seconds between dumps, None for off
+        self.phases     = [0] * PERF_TOTAL  # Nanoseconds of each phase
+        self.reset()
+        self.begin()
+
+    def reset(self):
+        '''Drops all of the times. The command being timed is still added
+        when it finishes.
+        '''
+        self.commands  = {}     # [histogram per phase] by command name
+        self.startTime = time.monotonic()
+        self.lastDump  = self.startTime
+        self.lastName  = None
+
+    def begin(self):
+        '''Starts timing a command.
+        '''
+        self.phases[:] = [0] * PERF_TOTAL
+        self.handler = None
+        self.first = self.last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        '''Adds the time since the last lap (or begin) to a phase. A phase
+        may be lapped more than once, ie. SEARCH of the INST handler and then
+        the system handler.
+        '''
+        now = time.perf_counter_ns()
+        self.phases[phase] += now - self.last
+        self.last = now
+
+    def setHandler(self, handler):
+        '''Records the handler function found for the command.
+        '''
+        self.handler = handler
+
+    def finish(self, name = None, veexNanoSecs = 0):
+        '''Ends timing the command and adds its phase times to the histograms
+        of its handler, or of name if given (ie. LOGIN). veexNanoSecs is the
+        time of the veexlib round trips, which is moved from HANDLER to VEEX.
+        '''
+        if name is None:
+            if self.handler is None:
+                name = "UNKNOWN"
+            else:
+                # <n> commands are functools.partial objects.
+                handler = getattr(self.handler, "func", self.handler)
+                name = handler.__qualname__
+        histograms = self.commands.get(name)
+        if histograms is None:
+            histograms = [LatencyHistogram() for phase in PERF_PHASE_NAMES]
+            self.commands[name] = histograms
+        veex = min(veexNanoSecs, self.phases[PERF_HANDLER])
+        self.phases[PERF_HANDLER] -= veex
+        self.phases[PERF_VEEX] = veex
+        for phase in (PERF_PARSE, PERF_SEARCH, PERF_HANDLER, PERF_VEEX, PERF_LOG):
+            histograms[phase].add(self.phases[phase] // 1000)
+        histograms[PERF_TOTAL].add((self.last - self.first) // 1000)
+        self.lastName = name
+
+    def addSend(self, nanoSecs):
+        '''Adds the time taken to send the response of the last command.
+        '''
+        if self.lastName is not None:
+            self.commands[self.lastName][PERF_SEND].add(nanoSecs // 1000)
+
+    def report(self, count = PERF_DEFAULT_REPORT):
+        '''Returns the SYSTem:PERF? response, <seconds since reset>,<commands>
+        followed by the count commands with the most total time, each
+        ;<name>,<count>,<total ms>,<phase>:<p50>:<p99>:<max>,... with the
+        times of each phase in microseconds.
+        '''
+        ordered = sorted(self.commands.items(),
+                         key = lambda item: item[1][PERF_TOTAL].total,
+                         reverse = True)
+        rows = [b"%.3f,%d" % (time.monotonic() - self.startTime, len(ordered))]
+        for name, histograms in ordered[:count]:
+            total = histograms[PERF_TOTAL]
+            row = [name.encode(), b"%d" % total.count, b"%.3f" % (total.total / 1000.0)]
+            for phase, histogram in zip(PERF_PHASE_NAMES, histograms):
+                row.append(b"%s:%d:%d:%d" % (phase,
+                                             histogram.percentile(50),
+                                             histogram.percentile(99),
+                                             histogram.maximum))
+            rows.append(b",".join(row))
+        return b";".join(rows)
+
+    def dumpIfDue(self, sessionType, sessionId):
+        '''Writes all of the commands to the dump file if the dump period
+        has passed since the last dump.
+        '''
+        if self.dumpPeriod is None:
+            return
+        now = time.monotonic()
+        if now - self.lastDump < self.dumpPeriod:
+            return
+        self.lastDump = now
+        try:
+            with open(PERF_DUMP_FILE % (sessionType.decode(), sessionId), "wb") as f:
+                f.write(self.report(len(self.commands)).replace(b";", b"\n"))
+                f.write(b"\n")
+        except OSError as error:
+            # A full or read-only disk mustn't stop the command handling.
+            self.dumpPeriod = None
@@ -21,30 +21,71 @@ sys.path.insert(0, '../PythonAPI')
 sys.path.insert(0, '../PythonAPI/veexlib')
 sys.path.insert(0, '../PythonAPI/veexlib/ProtoBuf')
 
+import argparse
+import ConnectionPool
 import TcpipServer
 import time
 
 
 # If a command line parameter is given then it is the IP address of the
-# protobufServer. Default to localhost if not given.
-if len(sys.argv) > 1:
-    ipAddress = sys.argv[1]
+# protobufServer. Default to localhost if not given. --record DIR records
+# every session to a log file in DIR. --pool N keeps N logged in chassis
+# connections of each user after LOGOUT for the next LOGIN. --workers N
+# runs the sessions in N processes that share the ports.
+parser = argparse.ArgumentParser(description = "SCPI server.")
+parser.add_argument("--record", metavar = "DIR", default = None,
+                    help = "record the commands of each session to DIR for "
+                           "bench/scpi_replay.py")
+parser.add_argument("--pool", metavar = "N", type = int,
+                    default = ConnectionPool.POOL_MAX_IDLE,
+                    help = "idle chassis connections kept for each user, 0 "
+                           "to connect for every LOGIN")
+parser.add_argument("--pool-idle", metavar = "SECONDS", type = float,
+                    default = ConnectionPool.POOL_IDLE_TIMEOUT,
+                    help = "seconds an idle chassis connection is kept, the "
+                           "old password of a user can lease it until then")
+parser.add_argument("--workers", metavar = "N", type = int, default = 1,
+                    help = "worker processes sharing the ports, 1 to run "
+                           "all the sessions in this process")
+parser.add_argument("ipAddress", nargs = "?", default = "localhost",
+                    help = "address of the protobufServer")
+args = parser.parse_args()
+ipAddress = args.ipAddress
+TcpipServer.recordDir = args.record
+ConnectionPool.connectionPool.maxIdle = args.pool
+ConnectionPool.connectionPool.idleTimeout = args.pool_idle
+
+
+def runServer(workerIndex):
+    '''Listens for connections and handles their sessions until the program
+    is forced to exit. Called in each worker process with --workers.
+    '''
+    reusePort = args.workers > 1
+
+    # Call TCP/IP server functions, which create a task and return immediately.
+    try:
+        TcpipServer.tcpipPortListen(port = 8090, ipAddress = ipAddress, reusePort = reusePort)
+    except OSError:
+        # port 8090 is in use by C++ SCPI so use port 8092 for debugging in
+        # parallel with that.
+        TcpipServer.tcpipPortListen(port = 8092, ipAddress = ipAddress, reusePort = reusePort)
+    TcpipServer.tcpipPortListen(port = 8091, ipAddress = ipAddress, useSsl = True, reusePort = reusePort)
+
+    # Have connections ready for the first sessions if autologin is enabled.
+    ConnectionPool.warmForAutoLogin(ipAddress)
+
+    # Wait until program is forced to exit.
+    try:
+        while True:
+            time.sleep(2.0)
+    except TcpipServer.TcpipServerExit:
+        pass
+
+
+# The autologin settings are read from the same file by every worker, and
+# the other settings are from the command line, so workers need nothing
+# else shared.
+if args.workers > 1:
+    TcpipServer.runWorkers(args.workers, runServer)
 else:
-    ipAddress = "localhost"
-
-
-# Call TCP/IP server functions, which create a task and return immediately.
-try:
-    TcpipServer.tcpipPortListen(port = 8090, ipAddress = ipAddress)
-except OSError:
-    # port 8090 is in use by C++ SCPI so use port 8092 for debugging in
-    # parallel with that.
-    TcpipServer.tcpipPortListen(port = 8092, ipAddress = ipAddress)
-TcpipServer.tcpipPortListen(port = 8091, ipAddress = ipAddress, useSsl = True)
-
-# Wait until program is forced to exit.
-try:
-    while True:
-        time.sleep(2.0)
-except TcpipServer.TcpipServerExit:
-    pass
+    runServer(0)
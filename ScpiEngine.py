@@ -13,16 +13,20 @@
 #
 ###############################################################################
 
+from ConnectionPool import connectionPool
 from ErrorCodes import ScpiErrorCode
 from ErrorCodes import errorResponse
 from ErrorCodes import TcpipServerExit
+from MonitorLog import monitorQueue
+from PerfStats import PERF_LOG
+from PerfStats import PERF_PARSE
 from ScpiMld import ScpiMld
 from ScpiOtn import ScpiOtn
 from ScpiSonetSdh import ScpiSonetSdh
 from ScpiPacket import ScpiPacket
 from ScpiSystem import ScpiSystem
 from SessionGlobals import SessionGlobals
-import pickle
+from SessionGlobals import autoLoginCache
 import ParseUtils
 import traceback
 import veexlib
@@ -57,6 +61,36 @@ class ScpiEngine(object):
 
 
     def _processCommands(self, parsedCommand):
+        '''Processes a preparsed command that isn't login or logout, holding
+        the PP lock so it doesn't run at the same time as one of the session's
+        background threads (ie. the DDM sampler).
+
+        Args:
+            parsedCommand (List of SubCommand named tuples): The command that needs to be processed.
+
+        Returns:
+            Bytes: Response string to send back to user.
+        '''
+        with self.globals.ppLock:
+            instCount = self.globals.instCount
+            response = self._processPpCommands(parsedCommand)
+            if self.globals.instCount != instCount:
+                self._clearPpState()
+            return response
+
+    def _clearPpState(self):
+        '''Drops the state the session keeps for the previously selected PP,
+        after an INSTrument command selected a PP or NONE. The background
+        threads that use the PP are stopped, as the session no longer holds it.
+        '''
+        self.globals.errorSchedule.stop()
+        self.globals.ddmSampler.stop()
+        self.globals.moduleInfo.prune(self.globals.veexProtocol)
+        self.scpiMld.clearPpState()
+        self.scpiOtn.clearPpState()
+        self.scpiPacket.clearPpState()
+
+    def _processPpCommands(self, parsedCommand):
         '''Processes a preparsed command that isn't login or logout. Calls the
         INSTrument specific handler.
 
@@ -166,12 +200,14 @@ class ScpiEngine(object):
 
     def logCommand(self, command):
         '''Adds the command to the SCPI monitor FIFO for display in the GUI.
+        The monitor queue sends it to the chassis in the background, unless
+        SYSTem:MONitor is OFF.
 
         Args:
             command (bytes): The command that needs to be logged.
         '''
-        if self.globals.veexChassis:
-            self.globals.veexChassis.addScpiMonitorData("RCV(%s%d): %s" % \
+        if self.globals.veexChassis and self.globals.monitorLog:
+            monitorQueue.add(self.globals, "RCV(%s%d): %s" % \
                             (self.globals.sessionType.decode(), \
                              self.globals.sessionId, \
                              command.decode()))
@@ -182,11 +218,18 @@ class ScpiEngine(object):
         Args:
             response (bytes): The response that needs to be logged.
         '''
-        if self.globals.veexChassis:
-            self.globals.veexChassis.addScpiMonitorData("RCV(%s%d): %s" % \
+        if self.globals.veexChassis and self.globals.monitorLog and response:
+            if response.startswith(b"#") and response[1:2].isdigit():
+                # Binary blocks aren't text, only log the block header.
+                headerLength = 2 + int(response[1:2])
+                text = "%s<%d bytes>" % (response[:headerLength].decode(), \
+                                         len(response) - headerLength)
+            else:
+                text = response.decode()
+            monitorQueue.add(self.globals, "RCV(%s%d): %s" % \
                             (self.globals.sessionType.decode(), \
                             self.globals.sessionId, \
-                            response.decode()))
+                            text))
 
     def processCommand(self, command):
         '''The main function of this module. It is called from the I/O front
@@ -198,14 +241,23 @@ class ScpiEngine(object):
         Returns:
             Bytes: Response string to send back to user.
         '''
+        # Time each phase of handling the command for SYSTem:PERF?.
+        perf = self.globals.perf
+        perf.begin()
+        self.globals.veexTrace.begin()
+        perfName = None
+
         # Log the command to SCPI monitor FIFO for display in GUI.
         self.logCommand(command)
+        perf.lap(PERF_LOG)
         parsedCommand = ParseUtils.preParseCommand(command)
+        perf.lap(PERF_PARSE)
         #print (parsedCommand)
         response = command
 
         # Login and logout are handled as special cases.
         if parsedCommand[0].head.upper().startswith(b"LOGIN"):
+            perfName = "LOGIN"
             if self.globals.veexChassis:
                 response = self._errorResponse(ScpiErrorCode.DLI_ADMIN_USER_ALREADY_LOGGED_IN)
             else:
@@ -216,8 +268,10 @@ class ScpiEngine(object):
 
                     # Login with the username and password
                     try:
-                        # Connect and login to the server on the chassis.
-                        self.globals.veexChassis = veexlib.connect(self.globals.ipAddress, userName, userPassword)
+                        # Connect and login to the server on the chassis, or
+                        # lease a connection of the user from the pool.
+                        self.globals.chassisLease = connectionPool.lease(self.globals.ipAddress, userName, userPassword)
+                        self.globals.veexChassis = self.globals.chassisLease.chassis
                         self.globals.userName = parsedCommand[1].head
 
                         # Read the default response always setting from the server.
@@ -226,16 +280,8 @@ class ScpiEngine(object):
                         # Read the default lock forced setting from the server.
                         self.globals.forceLock = self.globals.veexChassis.getScpiLockForcedOn()
 
-                        # Read the autoLogin settings from a file.
-                        try:
-                            with open('autologin.pickle', 'rb') as f:
-                                self.globals.autoLogin = pickle.load(f)
-                        except FileNotFoundError as error:
-                            # If file doesn't exist then use defaults already set.
-                            pass
-                        except pickle.UnpicklingError as error:
-                            # If unpickle fails then use defaults already set.
-                            pass
+                        # Get the autoLogin settings, cached from the file.
+                        self.globals.autoLogin = autoLoginCache.get()
 
                         # Log the login command to SCPI monitor FIFO for
                         # display in GUI. Previous attempt failed due to
@@ -269,11 +315,12 @@ class ScpiEngine(object):
 
         elif parsedCommand[0].head.upper().startswith(b"LOGOUT") or \
              parsedCommand[0].head.upper().startswith(b"CLOSE"):
+            perfName = "LOGOUT"
             if self.globals.veexChassis:
                 # Cleanup before dropping connection. These will need to be
                 # set this way for any following login.
                 parsedCommand = ParseUtils.preParseCommand(b"INST NONE")
-                response = self._processCommands(parsedCommand)
+                instResponse = self._processCommands(parsedCommand)
                 parsedCommand = ParseUtils.preParseCommand(b"SYST:LOCK:FORCED OFF")
                 response = self._processCommands(parsedCommand)
 
@@ -283,7 +330,21 @@ class ScpiEngine(object):
                 response = b"Logout successful, SID %d" % self.globals.sessionId;
                 self.logResponse(response)
 
-                self.globals.veexChassis = self.globals.veexChassis.disconnect()
+                # Stop background threads that use the PPs of this login.
+                self.globals.ddmSampler.stop()
+                self.globals.errorSchedule.stop()
+                self.scpiPacket.clearPpState()
+
+                # Send the queued monitor entries while still connected.
+                monitorQueue.flush(self.globals)
+
+                # Return the connection to the pool for the next login. If
+                # INST NONE failed then it may still own a lock so it is
+                # disconnected instead.
+                connectionPool.release(self.globals.chassisLease,
+                                       reuse = not instResponse)
+                self.globals.chassisLease = None
+                self.globals.veexChassis = None
                 self.globals.userName = b""
             else:
                 response = self._errorResponse(ScpiErrorCode.DLI_ADMIN_USER_NOT_LOGGED_IN)
@@ -301,6 +362,10 @@ class ScpiEngine(object):
 
         # Log the response to SCPI monitor FIFO for display in GUI.
         self.logResponse(response)
+        perf.lap(PERF_LOG)
+        perf.finish(perfName, self.globals.veexTrace.nanoSecs)
+        self.globals.veexTrace.finish(perf.lastName)
+        perf.dumpIfDue(self.globals.sessionType, self.globals.sessionId)
 
         return response
 
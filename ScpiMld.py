@@ -13,17 +13,35 @@
 #
 ###############################################################################
 
+from DdmSampler import DDM_MAX_PERIOD
+from DdmSampler import DDM_MIN_PERIOD
+from DdmSampler import DDM_POWER_INVALID
+from EnumCodec import ClockTypeCodec
+from EnumCodec import EnumCodec
 from ErrorCodes import ScpiErrorCode
 from ErrorCodes import errorResponse
 from ParseUtils import CommandTableEntry as Cmnd
+from PerfStats import PERF_HANDLER
+from PerfStats import PERF_SEARCH
 from SessionGlobals import SessionGlobals
 import ParseUtils
 #import SessionGlobals
+from collections import deque
 import veexlib
+import array
+import itertools
 import math
+import struct
+import time
 #from builtins import False, True
 #from locale import atof
 
+# Number of FEC symbol error bins, codewords with 1 to 15 corrected symbols.
+FECANALYSIS_BINS = 15
+
+# Most RES:FECANALYSIS:DISTribution? snapshots kept for the rolling window.
+FECANALYSIS_MAX_SNAPSHOTS = 3600
+
 
 class ScpiMld(object):
     #'''This class processes text MLD SCPI commands and returns a text response.
@@ -69,6 +87,61 @@ class ScpiMld(object):
         veexlib.PCS_OTL_ERR_RS_FEC_ALIGN_MARKER_PAD          : b"FECALMARKPAD",
         }
 
+    # Codec to convert between ProtoBuf enum and SCPI text for TX Pre-Emphasis in dB.
+    MldTxPreEmphCodec = EnumCodec([
+        (veexlib.PHY_TX_PRE_EMPH_DEFAULT, b"DEFAULT"),
+        (veexlib.PHY_TX_PRE_EMPH_0_00,    b"0.0"),
+        (veexlib.PHY_TX_PRE_EMPH_0_22,    b"0.22"),
+        (veexlib.PHY_TX_PRE_EMPH_0_45,    b"0.45"),
+        (veexlib.PHY_TX_PRE_EMPH_0_68,    b"0.68"),
+        (veexlib.PHY_TX_PRE_EMPH_0_92,    b"0.92"),
+        (veexlib.PHY_TX_PRE_EMPH_1_16,    b"1.16"),
+        (veexlib.PHY_TX_PRE_EMPH_1_41,    b"1.41"),
+        (veexlib.PHY_TX_PRE_EMPH_1_67,    b"1.67"),
+        (veexlib.PHY_TX_PRE_EMPH_1_94,    b"1.94"),
+        (veexlib.PHY_TX_PRE_EMPH_2_21,    b"2.21"),
+        (veexlib.PHY_TX_PRE_EMPH_2_50,    b"2.5"),
+        (veexlib.PHY_TX_PRE_EMPH_2_79,    b"2.79"),
+        (veexlib.PHY_TX_PRE_EMPH_3_10,    b"3.1"),
+        (veexlib.PHY_TX_PRE_EMPH_3_41,    b"3.41"),
+        (veexlib.PHY_TX_PRE_EMPH_3_74,    b"3.74"),
+        (veexlib.PHY_TX_PRE_EMPH_4_08,    b"4.08"),
+        (veexlib.PHY_TX_PRE_EMPH_4_44,    b"4.44"),
+        (veexlib.PHY_TX_PRE_EMPH_4_81,    b"4.81"),
+        (veexlib.PHY_TX_PRE_EMPH_5_19,    b"5.19"),
+        (veexlib.PHY_TX_PRE_EMPH_5_60,    b"5.6"),
+        (veexlib.PHY_TX_PRE_EMPH_6_02,    b"6.02"),
+        (veexlib.PHY_TX_PRE_EMPH_6_47,    b"6.47"),
+        (veexlib.PHY_TX_PRE_EMPH_6_94,    b"6.94"),
+        (veexlib.PHY_TX_PRE_EMPH_7_43,    b"7.43"),
+        (veexlib.PHY_TX_PRE_EMPH_7_96,    b"7.96"),
+        (veexlib.PHY_TX_PRE_EMPH_8_52,    b"8.52"),
+        (veexlib.PHY_TX_PRE_EMPH_9_12,    b"9.12"),
+        (veexlib.PHY_TX_PRE_EMPH_9_76,    b"9.76"),
+        (veexlib.PHY_TX_PRE_EMPH_10_46,   b"10.46"),
+        (veexlib.PHY_TX_PRE_EMPH_11_21,   b"11.21"),
+        (veexlib.PHY_TX_PRE_EMPH_12_04,   b"12.04"),
+        (veexlib.PHY_TX_PRE_EMPH_12_96,   b"12.96"),
+        ])
+
+    # Per-lane results for RES:LANE:MATRix?. Each entry is (PP, stats lane
+    # count, stats array, field of the array entry). LANESUM is 1 when the
+    # lane summary LED is on, like RES:AL:LANESUM?.
+    MldLaneMetricTable = {
+        b"BIP8"      : ("veexPcs", "rxVirtLaneCount", "bip8",                     "count"),
+        b"ALMARK"    : ("veexPcs", "rxVirtLaneCount", "alignMark",                "count"),
+        b"SYNCHDR"   : ("veexPcs", "rxVirtLaneCount", "syncHdr",                  "count"),
+        b"BIT"       : ("veexPhy", "rxVirtLaneCount", "bit",                      "count"),
+        b"FECCORBIT" : ("veexPcs", "rxVirtLaneCount", "fecCorrectableBitLane",    "count"),
+        b"FECCORSYM" : ("veexPcs", "rxVirtLaneCount", "fecCorrectableSymbolLane", "count"),
+        b"BLKLOC"    : ("veexPcs", "rxVirtLaneCount", "blockLockLoss",            "secs"),
+        b"LOALM"     : ("veexPcs", "rxVirtLaneCount", "alignMarkLoss",            "secs"),
+        b"SKEW"      : ("veexPcs", "rxVirtLaneCount", "laneSkew",                 "secs"),
+        b"LOAMPS"    : ("veexPcs", "rxFecLaneCount",  "fecAlignMarkLossLane",     "secs"),
+        b"LOS"       : ("veexPhy", "rxNetLaneCount",  "los",                      "secs"),
+        b"LANESUM"   : ("veexPcs", "rxVirtLaneCount", "summaryLaneLed",           None),
+        }
+
     # Dictionary to convert between ProtoBuf enum and SPCI text for TX/RX interface type. 
     # TBD - a lot of members will be added later   
     MldInterfaceTable = {
@@ -117,6 +190,16 @@ class ScpiMld(object):
 
     def __init__(self, globals):
         self.globals = globals
+        self.laneSnapshots = {}   # RES:LANE:DELTA? values by metric
+        self.fecSnapshots  = deque(maxlen=FECANALYSIS_MAX_SNAPSHOTS)
+
+
+    def clearPpState(self):
+        '''Drops the RES:LANE:DELTA? and RES:FECANALYSIS:DISTribution?
+        snapshots, as they were read from the previously selected PP.
+        '''
+        self.laneSnapshots = {}
+        self.fecSnapshots.clear()
 
 
     def _errorResponse(self, errorCode):
@@ -146,10 +229,16 @@ class ScpiMld(object):
         # Search for the command.
         callback, parameters = ParseUtils.searchCommandTree(parsedCommand, \
                                                             commandTreeRoot)
+        self.globals.perf.lap(PERF_SEARCH)
 
         # If the command was found then call the handler function.
         if callback:
-            response = callback(self, parameters)
+            self.globals.perf.setHandler(callback)
+            try:
+                response = callback(self, parameters)
+            finally:
+                # A handler that raises is still timed as HANDLER.
+                self.globals.perf.lap(PERF_HANDLER)
             foundCommand = True
 
         # return the results.
@@ -371,27 +460,8 @@ class ScpiMld(object):
         Query the TX clock reference source.
         '''
         self.globals.veexPhy.sets.update()
-        if self.globals.veexPhy.sets.clockType == veexlib.CLOCK_INTERNAL:
-            response = b"INT"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_RECOVERED:
-            response = b"LOOP"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_BITS_SETS:
-            response = b"BITS/SETS"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_BITS:
-            response = b"BITS"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_SETS:
-            response = b"SETS"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_EXT_8KHZ:
-            response = b"EXT8KHZ"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_EXT_BITS:
-            response = b"EXT1_5MHZ"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_EXT_SETS:
-            response = b"EXT2MHZ"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_EXT_10MHZ:
-            response = b"EXT10MHZ"
-        elif self.globals.veexPhy.sets.clockType == veexlib.CLOCK_SYNC:
-            response = b"SYNC"
-        else:
+        response = ClockTypeCodec.encode(self.globals.veexPhy.sets.clockType)
+        if response is None:
             response = self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
         return response
 
@@ -402,26 +472,9 @@ class ScpiMld(object):
         paramList = ParseUtils.preParseParameters(parameters)
         response = None
         if len(paramList) >= 1:
-            if paramList[0].head.upper().startswith(b"INT"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_INTERNAL
-            elif paramList[0].head.upper().startswith(b"LOOP"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_RECOVERED
-            elif paramList[0].head.upper().startswith(b"BITS/SETS"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_BITS_SETS
-            elif paramList[0].head.upper().startswith(b"BITS"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_BITS
-            elif paramList[0].head.upper().startswith(b"SETS"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_SETS
-            elif paramList[0].head.upper().startswith(b"EXT8KHZ"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_EXT_8KHZ
-            elif paramList[0].head.upper().startswith(b"EXT1_5MHZ"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_EXT_BITS
-            elif paramList[0].head.upper().startswith(b"EXT2MHZ"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_EXT_SETS
-            elif paramList[0].head.upper().startswith(b"EXT10MHZ"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_EXT_10MHZ
-            elif paramList[0].head.upper().startswith(b"SYNC"):
-                self.globals.veexPhy.sets.clockType = veexlib.CLOCK_SYNC
+            clockType = ClockTypeCodec.decode(paramList[0].head)
+            if clockType is not None:
+                self.globals.veexPhy.sets.clockType = clockType
             else:
                 response = self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
         else:
@@ -717,6 +770,41 @@ class ScpiMld(object):
             response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
         return response  
 
+    def _errorScheduleHandlers(self):
+        '''Returns the TX:ERRor setting handlers a TX:ERRor:SCHEDule step can
+        apply, by setting name.
+        '''
+        return {b"BURSTPERIOD": self.setTxErrBurst,
+                b"BURSTSIZE":   self.setTxErrBurstSize,
+                b"RATE":        self.setTxErrRate,
+                b"TYPE":        self.setTxErrType}
+
+    def getTxErrSchedule(self, parameters):
+        '''**TX:ERRor:SCHEDule?** -
+        Query the error injection schedule state,
+        <IDLE|RUNNING|DONE|STOPPED>,<steps applied>,<steps>.
+        '''
+        return self.globals.errorSchedule.status()
+
+    def setTxErrSchedule(self, parameters):
+        '''**TX:ERRor:SCHEDule <seconds>,<setting>,<value>[;...]|OFF** -
+        Start a schedule of TX:ERRor settings applied by the server, each at
+        its seconds from the start, ie. 0,RATE,ALL,1e-9;10,RATE,ALL,1e-6;20,RATE,ALL,0.
+        The settings are BURSTPERIOD, BURSTSIZE, RATE and TYPE, with the
+        parameters of that command. A new schedule replaces a running one,
+        OFF stops it. See RES:ERRor:SCHEDule? for when each step was applied.
+        '''
+        return self.globals.errorSchedule.scheduleCommand(self.globals, parameters,
+                                                          self._errorScheduleHandlers())
+
+    def getResErrSchedule(self, parameters):
+        '''**RES:ERRor:SCHEDule?** -
+        Query the steps of the error injection schedule applied so far,
+        <count>;<step>,<setting>,<scheduled secs>,<applied secs>,<error code>;...
+        The error code is 0 for a setting that was accepted.
+        '''
+        return self.globals.errorSchedule.report()
+
     def getEyeClockSource(self, parameters):
         '''**TX:EYECLOCK?** -
         Query the Port value for the transmit Eye Clock Source setting.
@@ -1472,83 +1560,18 @@ class ScpiMld(object):
         '''
         self.globals.veexPhy.sets.update()
         self.globals.veexPhy.allowedSets.update()
-        response = b""
-        if self.globals.veexPhy.allowedSets.txPhysicalLaneCount <= 0:
-            response += b"No Lanes"
-        else:
-            for lane in range(self.globals.veexPhy.allowedSets.txPhysicalLaneCount):
-                if len(response) != 0:
-                    response += b", "
-                if self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_DEFAULT:
-                    response += b"DEFAULT"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_0_00:
-                    response += b"0.0"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_0_22:
-                    response += b"0.22"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_0_45:
-                    response += b"0.45"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_0_68:
-                    response += b"0.68"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_0_92:
-                    response += b"0.92"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_1_16:
-                    response += b"1.16"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_1_41:
-                    response += b"1.41"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_1_67:
-                    response += b"1.67"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_1_94:
-                    response += b"1.94"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_2_21:
-                    response += b"2.21"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_2_50:
-                    response += b"2.5"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_2_79:
-                    response += b"2.79"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_3_10:
-                    response += b"3.1"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_3_41:
-                    response += b"3.41"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_3_74:
-                    response += b"3.74"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_4_08:
-                    response += b"4.08"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_4_44:
-                    response += b"4.44"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_4_81:
-                    response += b"4.81"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_5_19:
-                    response += b"5.19"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_5_60:
-                    response += b"5.6"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_6_02:
-                    response += b"6.02"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_6_47:
-                    response += b"6.47"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_6_94:
-                    response += b"6.94"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_7_43:
-                    response += b"7.43"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_7_96:
-                    response += b"7.96"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_8_52:
-                    response += b"8.52"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_9_12:
-                    response += b"9.12"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_9_76:
-                    response += b"9.76"
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_10_46:
-                    response += b"10.46"                
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_11_21:
-                    response += b"11.21"                
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_12_04:
-                    response += b"12.04"                
-                elif self.globals.veexPhy.sets.txLanePreEmph[lane] == veexlib.PHY_TX_PRE_EMPH_12_96:
-                    response += b"12.96"                
-                else:
-                    response = self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
-                    break;
-        return response
+        laneCount = self.globals.veexPhy.allowedSets.txPhysicalLaneCount
+        if laneCount <= 0:
+            return b"No Lanes"
+
+        txLanePreEmph = self.globals.veexPhy.sets.txLanePreEmph
+        lanes = []
+        for lane in range(laneCount):
+            text = ScpiMld.MldTxPreEmphCodec.encode(txLanePreEmph[lane])
+            if text is None:
+                return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
+            lanes.append(text)
+        return b", ".join(lanes)
 
     def setTxPreEmph(self, parameters):
         '''**TX:PREEMPH:<lane> <value>** -
@@ -1560,73 +1583,8 @@ class ScpiMld(object):
         if self.globals.veexPhy.sets.txInterface == veexlib.PHY_INTERFACE_OFF:
             response = self._errorResponse(ScpiErrorCode.INVALID_SETTINGS)
         elif len(paramList) >= 2:
-            if paramList[1].head.upper().startswith(b"DEFAULT"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_DEFAULT
-            elif paramList[1].head.upper().startswith(b"0.0"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_0_00
-            elif paramList[1].head.upper().startswith(b"0.22"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_0_22
-            elif paramList[1].head.upper().startswith(b"0.45"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_0_45
-            elif paramList[1].head.upper().startswith(b"0.68"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_0_68
-            elif paramList[1].head.upper().startswith(b"0.92"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_0_92
-            elif paramList[1].head.upper().startswith(b"1.16"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_1_16
-            elif paramList[1].head.upper().startswith(b"1.41"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_1_41
-            elif paramList[1].head.upper().startswith(b"1.67"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_1_67
-            elif paramList[1].head.upper().startswith(b"1.94"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_1_94
-            elif paramList[1].head.upper().startswith(b"2.21"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_2_21
-            elif paramList[1].head.upper().startswith(b"2.5"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_2_50
-            elif paramList[1].head.upper().startswith(b"2.79"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_2_79
-            elif paramList[1].head.upper().startswith(b"3.1"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_3_10
-            elif paramList[1].head.upper().startswith(b"3.41"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_3_41
-            elif paramList[1].head.upper().startswith(b"3.74"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_3_74
-            elif paramList[1].head.upper().startswith(b"4.08"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_4_08
-            elif paramList[1].head.upper().startswith(b"4.44"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_4_44
-            elif paramList[1].head.upper().startswith(b"4.81"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_4_81
-            elif paramList[1].head.upper().startswith(b"5.19"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_5_19
-            elif paramList[1].head.upper().startswith(b"5.6"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_5_60
-            elif paramList[1].head.upper().startswith(b"6.02"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_6_02
-            elif paramList[1].head.upper().startswith(b"6.47"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_6_47
-            elif paramList[1].head.upper().startswith(b"6.94"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_6_94
-            elif paramList[1].head.upper().startswith(b"7.43"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_7_43
-            elif paramList[1].head.upper().startswith(b"7.96"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_7_96
-            elif paramList[1].head.upper().startswith(b"8.52"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_8_52
-            elif paramList[1].head.upper().startswith(b"9.12"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_9_12
-            elif paramList[1].head.upper().startswith(b"9.76"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_9_76
-            elif paramList[1].head.upper().startswith(b"10.46"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_10_46
-            elif paramList[1].head.upper().startswith(b"11.21"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_11_21
-            elif paramList[1].head.upper().startswith(b"12.04"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_12_04
-            elif paramList[1].head.upper().startswith(b"12.96"):
-                idlPreEmph = veexlib.PHY_TX_PRE_EMPH_12_96
-            else:
+            idlPreEmph = ScpiMld.MldTxPreEmphCodec.decode(paramList[1].head)
+            if idlPreEmph is None:
                 response = self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
             if response == None:
                 value = ParseUtils.checkNumeric(paramList[0].head)
@@ -3439,6 +3397,17 @@ class ScpiMld(object):
         # TBD -- Event log is not implemented now.
         self.globals.veexPhy.stats.update()
 
+    def fetchEventLog(self, parameters):
+        '''**FETC:EVENTLOG? <SinceId>,<Max>** -
+        Queries the event log entries after sequence number <SinceId>, up to
+        <Max> entries. Response is "<last id>,<count>" then
+        ";<id>,<event id>,<count>,<time>,<duration>" for each entry. Use the
+        last id as <SinceId> of the next query to get only new entries. Events
+        lost before they were read are one ";<id>,LOST,<number lost>,0,0" entry.
+        '''
+        return self.globals.eventLog.fetchQuery(self.globals, self.globals.veexPhy,
+                                                parameters)
+
     def resFecAlignMarkPadAvg(self,parameters):
         '''**RES:FECALMARKPAD:AVE?** -
         Queries the FEC Alignment Marker Pad Errors average error rate.
@@ -3487,9 +3456,7 @@ class ScpiMld(object):
         if len(paramList) >= 1:
             symbolN = ParseUtils.checkNumeric(paramList[0].head)
             if symbolN >= 1 and symbolN <= 15:
-                totalSymCount = 0
-                for lane in range(15):
-                    totalSymCount += self.globals.veexPcs.stats.fecCorrectableSymbolN[lane]
+                totalSymCount = sum(self.globals.veexPcs.stats.fecCorrectableSymbolN[:15])
                 if totalSymCount == 0:
                     response = b"%02.06f" % totalSymCount
                 else:
@@ -3500,6 +3467,69 @@ class ScpiMld(object):
             response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
         return response
 
+    def resFecCorSymDistribution(self, parameters):
+        '''**RES:FECANALYSIS:DISTribution? [<Window secs>]** -
+        Queries the whole FEC Analysis symbol error distribution from one
+        stats read. Returns four groups of 15 values, for 1 to 15 corrected
+        symbols per codeword, separated by semicolons: counts, percentages,
+        cumulative percentages (n or fewer symbols) and tail probabilities
+        (n or more symbols). Each query is kept by the session, so with a
+        <Window secs> the distribution is of the codewords counted since the
+        newest query at least that many seconds ago, for trending pre-FEC
+        errors. A fifth group then gives the seconds since that query, or is
+        NOBASELINE if there wasn't one and the counts are since the results
+        were started.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        window = None
+        if len(paramList) >= 1:
+            window = ParseUtils.checkNumeric(paramList[0].head)
+            if window < 0:
+                return self._errorResponse(ScpiErrorCode.NUMERIC_DATA_ERR)
+
+        self.globals.veexPcs.stats.update()
+        now = time.monotonic()
+        counts = tuple(self.globals.veexPcs.stats.fecCorrectableSymbolN[:FECANALYSIS_BINS])
+
+        # Drop the snapshots from before a results restart.
+        if self.fecSnapshots and \
+           any(count < last for count, last in zip(counts, self.fecSnapshots[-1][1])):
+            self.fecSnapshots.clear()
+
+        # The baseline is the newest snapshot from at least window seconds
+        # ago, so the counts cover the whole window.
+        baseline = None
+        if window:
+            for snapshotTime, snapshot in reversed(self.fecSnapshots):
+                if now - snapshotTime >= window:
+                    baseline = (snapshotTime, snapshot)
+                    break
+        self.fecSnapshots.append((now, counts))
+
+        if baseline:
+            counts = tuple(count - old for count, old in zip(counts, baseline[1]))
+
+        # Running totals give the cumulative and tail values in one pass.
+        running = list(itertools.accumulate(counts))
+        total = running[-1]
+        if total == 0:
+            percents = cumulative = tails = [0.0] * FECANALYSIS_BINS
+        else:
+            percents = [count * 100.0 / total for count in counts]
+            cumulative = [below * 100.0 / total for below in running]
+            tails = [(total - below) / total for below in [0] + running[:-1]]
+
+        groups = [b",".join(b"%d" % count for count in counts),
+                  b",".join(b"%02.06f" % percent for percent in percents),
+                  b",".join(b"%02.06f" % percent for percent in cumulative),
+                  b",".join(b"%.3e" % tail for tail in tails)]
+        if window:
+            if baseline:
+                groups.append(b"%.1f" % (now - baseline[0]))
+            else:
+                groups.append(b"NOBASELINE")
+        return b";".join(groups)
+
     def resFecTranscodeAvg(self,parameters):
         '''**RES:FECCODE:AVE?** -
         Queries the FEC Correctable Transcoded Errors average error rate.
@@ -4138,6 +4168,213 @@ class ScpiMld(object):
             response += b"%d" % self.globals.veexPhy.stats.los[lane].secs
         return response
 
+    def _laneMetricFields(self, paramList):
+        '''Returns the MldLaneMetricTable keys named in paramList, or all of
+        them if none are named. Returns None if a name isn't in the table.
+        '''
+        if len(paramList) == 0:
+            return list(ScpiMld.MldLaneMetricTable.keys())
+        fields = []
+        for param in paramList:
+            field = param.head.upper()
+            if field not in ScpiMld.MldLaneMetricTable:
+                return None
+            fields.append(field)
+        return fields
+
+    def _laneMetricColumns(self, fields):
+        '''Reads the per-lane values of each field. The stats of each PP are
+        updated once, however many fields use them.
+
+        Returns:
+            list: One list of lane values per field.
+        '''
+        statsByPp = {}
+        columns = []
+        for field in fields:
+            ppName, countName, arrayName, valueName = ScpiMld.MldLaneMetricTable[field]
+            if ppName not in statsByPp:
+                statsByPp[ppName] = getattr(self.globals, ppName).stats
+                statsByPp[ppName].update()
+            stats = statsByPp[ppName]
+            laneCount = max(getattr(stats, countName), 0)
+            array = getattr(stats, arrayName)
+            if valueName:
+                column = [getattr(array[lane], valueName) for lane in range(laneCount)]
+            else:
+                rxLaneMap = stats.rxLaneMap
+                column = [int((rxLaneMap[lane] > 20) or array[lane].led.isRed)
+                          for lane in range(laneCount)]
+            columns.append(column)
+        return columns
+
+    def resLaneMatrix(self, parameters):
+        '''**RES:LANE:MATRix? [<field>,...][,BINary]** -
+        Queries per-lane results for all lanes in one response. Fields are
+        BIP8, ALMARK, SYNCHDR, BIT, FECCORBIT, FECCORSYM, BLKLOC, LOALM, SKEW,
+        LOAMPS, LOS and LANESUM, all of them if none are given. The response
+        is a "LANE,<field>,..." header then one "<lane>,<value>,..." row per
+        lane, with rows separated by semicolons. Lanes a field doesn't have
+        are left empty. With BINary the response is an IEEE 488.2 block of
+        little-endian 64 bit integers: lane count, field count, then the
+        values row by row with -1 for missing lanes.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        binary = False
+        if (len(paramList) > 0) and paramList[-1].head.upper().startswith(b"BIN"):
+            binary = True
+            paramList = paramList[:-1]
+        fields = self._laneMetricFields(paramList)
+        if fields is None:
+            return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+
+        columns = self._laneMetricColumns(fields)
+        laneCount = max(len(column) for column in columns)
+        if binary:
+            values = [laneCount, len(fields)]
+            for lane in range(laneCount):
+                for column in columns:
+                    values.append(column[lane] if lane < len(column) else -1)
+            data = struct.pack("<%dq" % len(values), *values)
+            length = b"%d" % len(data)
+            return b"#%d%s%s" % (len(length), length, data)
+
+        if laneCount == 0:
+            return b"No Lanes"
+        rows = [b"LANE," + b",".join(fields)]
+        for lane in range(laneCount):
+            rows.append(b"%d," % lane + b",".join(
+                b"%d" % column[lane] if lane < len(column) else b""
+                for column in columns))
+        return b";".join(rows)
+
+    def resLaneDelta(self, parameters):
+        '''**RES:LANE:DELTA? <field>** -
+        Queries how much each lane's value of a RES:LANE:MATRix? field changed
+        since the last RES:LANE:DELTA? of that field in this session. Only
+        changed lanes are returned, as "<lane>=<change>" separated by commas,
+        or NONE if no lane changed. The first query reports the change from
+        zero. A count that went down (results were restarted) reports the
+        new count.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        if len(paramList) < 1:
+            return self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        fields = self._laneMetricFields(paramList[:1])
+        if fields is None:
+            return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+
+        current = array.array("q", self._laneMetricColumns(fields)[0])
+        previous = self.laneSnapshots.get(fields[0])
+        if (previous is None) or (len(previous) != len(current)):
+            # First read, or the lane count changed with the interface.
+            previous = array.array("q", bytes(8 * len(current)))
+        self.laneSnapshots[fields[0]] = current
+
+        changes = []
+        for lane, value in enumerate(current):
+            if value != previous[lane]:
+                if value > previous[lane]:
+                    value -= previous[lane]
+                changes.append(b"%d=%d" % (lane, value))
+        if len(changes) == 0:
+            return b"NONE"
+        return b",".join(changes)
+
+    def getModuleDdmRate(self, parameters):
+        '''**MODULE:DDM:RATE?** -
+        Queries the seconds between the background samples of the module DDM readings,
+        or OFF if they aren't being sampled.
+        '''
+        if not self.globals.ddmSampler.isRunning():
+            return b"OFF"
+        return b"%.1f" % self.globals.ddmSampler.period
+
+    def setModuleDdmRate(self, parameters):
+        '''**MODULE:DDM:RATE <seconds>|OFF** -
+        Starts sampling the per lane RX power and the module threshold alarms (ie.
+        TXBIASHIALARM) in the background every <seconds>, or stops the sampling with OFF.
+        The last samples are kept for MODULE:DDM:HISTory?.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) >= 1:
+            if paramList[0].head.upper() == b"OFF":
+                self.globals.ddmSampler.stop()
+            elif ParseUtils.isFloatSdh(paramList[0].head):
+                period = float(paramList[0].head)
+                if (period < DDM_MIN_PERIOD) or (period > DDM_MAX_PERIOD):
+                    response = self._errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE)
+                else:
+                    self.globals.ddmSampler.start(self.globals, period)
+            else:
+                response = self._errorResponse(ScpiErrorCode.DATA_TYPE_ERR)
+        else:
+            response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        return response
+
+    def getModuleDdmFailures(self, parameters):
+        '''**MODULE:DDM:FAILures?** -
+        Queries the number of background DDM samples that couldn't be read since
+        the sampling was started by MODULE:DDM:RATE.
+        '''
+        return b"%d" % self.globals.ddmSampler.failures
+
+    def doModuleDdmClear(self, parameters):
+        '''**MODULE:DDM:CLEar** -
+        Drops all of the module DDM samples kept for MODULE:DDM:HISTory?.
+        '''
+        self.globals.ddmSampler.clear()
+        return None
+
+    def _ddmAggregate(self, name, values, isPower = False):
+        '''Returns "<name>,<min>,<max>,<avg>" of the DDM readings in values.
+        Power readings that are markers (ie. No Module) instead of real
+        readings are left out.
+        '''
+        if isPower:
+            values = [value for value in values if value > DDM_POWER_INVALID]
+        if len(values) == 0:
+            return b"%s,N/A,N/A,N/A" % name
+        return b"%s,%.2f,%.2f,%.2f" % (name, min(values), max(values),
+                                       sum(values) / len(values))
+
+    def getModuleDdmHistory(self, parameters):
+        '''**MODULE:DDM:HISTory? [<seconds>]** -
+        Queries the min, max and average of each module DDM reading sampled in the last
+        <seconds>, or of all kept samples. Returns the number of samples followed by
+        ";RXPWR-<lane>,<min>,<max>,<avg>" for each lane's RX power (dBm), N/A if a lane has
+        no valid samples, and then ";<alarm>,<samples>" for each threshold alarm that was
+        on in any of the samples, with the number of samples it was on in. The alarms are
+        named as RES:AL, with -<lane> for the per lane ones (ie. TXPWRLOWARN-1).
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        seconds = None
+        if len(paramList) >= 1:
+            if not ParseUtils.isFloatSdh(paramList[0].head):
+                return self._errorResponse(ScpiErrorCode.DATA_TYPE_ERR)
+            seconds = float(paramList[0].head)
+            if seconds <= 0:
+                return self._errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE)
+
+        samples = self.globals.ddmSampler.history(seconds)
+        response = [b"%d" % len(samples)]
+        if len(samples) == 0:
+            return response[0]
+
+        # The lane count can change with the interface, only use the samples
+        # that have the lane.
+        laneCount = max(len(sample.rxPower) for sample in samples)
+        for lane in range(laneCount):
+            response.append(self._ddmAggregate(b"RXPWR-%d" % lane, [sample.rxPower[lane] for sample in samples if lane < len(sample.rxPower)], True))
+        alarmCounts = {}
+        for sample in samples:
+            for alarm in sample.alarms:
+                alarmCounts[alarm] = alarmCounts.get(alarm, 0) + 1
+        for alarm, count in alarmCounts.items():
+            response.append(b"%s,%d" % (alarm, count))
+        return b";".join(response)
+
     def resModuleRxPowerHighAlarmSecs(self,parameters):
         '''**RES:MODULE:RXPWR:HIALARM:Secs?** -
         Queries the number of RX Power High Alarm seconds for all Optical lanes.
@@ -5006,6 +5243,8 @@ commandTable = [
     Cmnd(b"TX:ERRor:BURSTPERIOD",      ScpiMld.setTxErrBurst),
     Cmnd(b"TX:ERRor:BURSTSIZE?",       ScpiMld.getTxErrBurstSize),
     Cmnd(b"TX:ERRor:BURSTSIZE",        ScpiMld.setTxErrBurstSize),
+    Cmnd(b"TX:ERRor:SCHEDule?",        ScpiMld.getTxErrSchedule),
+    Cmnd(b"TX:ERRor:SCHEDule",         ScpiMld.setTxErrSchedule),
     Cmnd(b"TX:ERRor:RATE?",            ScpiMld.getTxErrRate),
     Cmnd(b"TX:ERRor:RATE",             ScpiMld.setTxErrRate),    
     Cmnd(b"TX:ERRor:TYPE?",            ScpiMld.getTxErrType),
@@ -5172,11 +5411,14 @@ commandTable = [
     Cmnd(b"RES:CPPOWERLOSS:Secs?",     ScpiMld.resPowerSecs),
     Cmnd(b"RES:DEGSER:Secs?",          ScpiMld.resDegSerSecs),
     
+    Cmnd(b"RES:ERRor:SCHEDule?",       ScpiMld.getResErrSchedule),
     Cmnd(b"RES:EVENTLOG?",             ScpiMld.getEventLog),
+    Cmnd(b"FETC:EVENTLOG?",            ScpiMld.fetchEventLog),
     Cmnd(b"RES:FECALMARKPAD:AVE?",     ScpiMld.resFecAlignMarkPadAvg),
     Cmnd(b"RES:FECALMARKPAD:COUNt?",   ScpiMld.resFecAlignMarkPadCount),
     Cmnd(b"RES:FECALMARKPAD:RATe?",    ScpiMld.resFecAlignMarkPadRate),
     Cmnd(b"RES:FECANALYSIS:COUNt?",    ScpiMld.resFecCorSymCountCount),
+    Cmnd(b"RES:FECANALYSIS:DISTribution?", ScpiMld.resFecCorSymDistribution),
     Cmnd(b"RES:FECANALYSIS:PERCENT?",  ScpiMld.resFecCorSymCountPct),
     Cmnd(b"RES:FECCODE:AVE?",          ScpiMld.resFecTranscodeAvg),
     Cmnd(b"RES:FECCODE:COUNt?",        ScpiMld.resFecTranscodeCount),
@@ -5257,12 +5499,19 @@ commandTable = [
     Cmnd(b"RES:FREQWIDE:Secs?",        ScpiMld.resFreqwideSecs),
     Cmnd(b"RES:HIBER:Secs?",           ScpiMld.resHiBerSecs),
     Cmnd(b"RES:HISER:Secs?",           ScpiMld.resHiSerSecs),
+    Cmnd(b"RES:LANE:DELTA?",           ScpiMld.resLaneDelta),
+    Cmnd(b"RES:LANE:MATRix?",          ScpiMld.resLaneMatrix),
     Cmnd(b"RES:LOA:Secs?",             ScpiMld.resLoaSecs),
     Cmnd(b"RES:LOALM:Secs?",           ScpiMld.resLoAlmSecs),
     Cmnd(b"RES:LOAMPS:Secs?",          ScpiMld.resFecLoampsSecs),
     #Cmnd(b"RES:LOF:Secs?",             ScpiMld.resLofSecs),
     #Cmnd(b"RES:LOR:Secs?",             ScpiMld.resLorSecs),
     Cmnd(b"RES:LOS:Secs?",             ScpiMld.resLosSecs),
+    Cmnd(b"MODULE:DDM:CLEar",          ScpiMld.doModuleDdmClear),
+    Cmnd(b"MODULE:DDM:FAILures?",      ScpiMld.getModuleDdmFailures),
+    Cmnd(b"MODULE:DDM:HISTory?",       ScpiMld.getModuleDdmHistory),
+    Cmnd(b"MODULE:DDM:RATE?",          ScpiMld.getModuleDdmRate),
+    Cmnd(b"MODULE:DDM:RATE",           ScpiMld.setModuleDdmRate),
     Cmnd(b"RES:MODULE:RXPWR:HIALARM:Secs?",    ScpiMld.resModuleRxPowerHighAlarmSecs),
     Cmnd(b"RES:MODULE:RXPWR:HIWARN:Secs?",     ScpiMld.resModuleRxPowerHighWarningSecs),
     Cmnd(b"RES:MODULE:RXPWR:LOALARM:Secs?",    ScpiMld.resModuleRxPowerLowAlarmSecs),
@@ -16,12 +16,374 @@
 from ErrorCodes import ScpiErrorCode
 from ErrorCodes import errorResponse
 from ParseUtils import CommandTableEntry as Cmnd
+from PerfStats import PERF_HANDLER
+from PerfStats import PERF_SEARCH
 from SessionGlobals import SessionGlobals
+from collections import deque
+import csv
+import json
+import math
+import os
+import struct
+import threading
+import time
+import traceback
 import ParseUtils
 #import SessionGlobals
 import veexlib
 
 
+# Range limits for stream settings, carried over from the C++ SCPI.
+STRMSETBW_LOWERLIMIT            = 1
+STRMSETBW_UPPERLIMIT            = 100
+STRMSETFRAMELENGTH_LOWERLIMIT   = 60
+STRMSETFRAMELENGTH_UPPERLIMIT   = 9220
+STRMSETSRCMAC_LOWERLIMIT        = 0
+STRMSETSRCMAC_UPPERLIMIT        = 0xff
+STRMSETSRCIP_LOWERLIMIT         = 0
+STRMSETSRCIP_UPPERLIMIT         = 0xff
+STRMSETSRCPORT_LOWERLIMIT       = 0
+STRMSETSRCPORT_UPPERLIMIT       = 65535
+STRMSETDESTMAC_LOWERLIMIT       = 0
+STRMSETDESTMAC_UPPERLIMIT       = 0xff
+STRMSETDESTIP_LOWERLIMIT        = 0
+STRMSETDESTIP_UPPERLIMIT        = 0xff
+STRMSETDESTPORT_LOWERLIMIT      = 0
+STRMSETDESTPORT_UPPERLIMIT      = 65535
+STRMSETVLANID_LOWERLIMIT        = 0
+STRMSETVLANID_UPPERLIMIT        = 4095
+STRMSETVLANQOS_LOWERLIMIT       = 0
+STRMSETVLANQOS_UPPERLIMIT       = 7
+STRMSETIPTOS_LOWERLIMIT         = 0
+STRMSETIPTOS_UPPERLIMIT         = 255
+STRMSETIPTTL_LOWERLIMIT         = 0
+STRMSETIPTTL_UPPERLIMIT         = 255
+
+# Stream settings reference of a write that changes more than one stream.
+STREAM_REF_MULTIPLE             = 0xFF
+
+# Directory, relative to the working directory, that STRM:LOAD and STRM:SAVE
+# read and write profiles in. Profile names can't hold a path.
+STREAM_PROFILE_DIR              = "streamprofiles"
+
+# Directory, relative to the working directory, that RFC:RESults:EXPort
+# writes to. File names can't hold a path.
+RFC_RESULTS_DIR                 = "rfcresults"
+
+# Most frames returned by one CAPTure:DATA? query.
+CAPTURE_DATA_MAX_FRAMES         = 256
+
+
+class RfcResultsCollector(threading.Thread):
+    '''This thread class gathers RFC 2544 trial results from the Packet PP
+    while a test runs. Each trial (one frame size for throughput and
+    back-to-back, one frame size and rate for frame loss) is added to a table
+    once it completes, so a client can read only the new trials with
+    RFC:RESults? instead of polling every per-iteration value.
+
+    Args:
+        globals (SessionGlobals object): Data class of session variables.
+    '''
+
+    # Seconds between reads of the PP statistics while collecting.
+    pollInterval = 1.0
+
+    # Columns of the results table, in the order they are reported.
+    columns = ("TRIAL", "TEST", "FRAMESIZE", "RATE", "LOSS", "LATENCY")
+
+    # Test of each rfcState that runs one. Latency is measured with the
+    # throughput trials.
+    stateTests = {
+        veexlib.PACKET_RFC_THROUGHPUT_ACTIVE   : "THRU",
+        veexlib.PACKET_RFC_LATENCY_ACTIVE      : "THRU",
+        veexlib.PACKET_RFC_FRAME_LOSS_ACTIVE   : "LOSS",
+        veexlib.PACKET_RFC_BACK_TO_BACK_ACTIVE : "B2B",
+        }
+
+    def __init__(self, globals):
+        threading.Thread.__init__(self)
+        self.globals   = globals
+        self.lock      = threading.Lock()
+        self.stopEvent = threading.Event()
+        self.trials    = []     # List of tuples in the order of columns
+        self.recorded  = set()  # (test, frameIndex, rateIndex) in this run
+        self.seenTests = set()  # Tests whose rfcState was seen in this run
+        self.lastState = None
+
+        # Setting this as daemon means this thread will be killed if the
+        # main thread exits.
+        self.daemon = True
+
+    def isRunning(self):
+        '''Returns True if the thread is collecting.'''
+        return self.is_alive() and not self.stopEvent.is_set()
+
+    def stop(self):
+        '''Stops collecting. The thread exits at its next poll, without
+        reading the PP again.
+        '''
+        self.stopEvent.set()
+
+    def clear(self):
+        '''Empties the results table and restarts trial numbering.'''
+        with self.lock:
+            self.trials = []
+            self.recorded.clear()
+
+    def resultsSince(self, sinceTrial):
+        '''Returns the list of trials with a trial number above sinceTrial.'''
+        with self.lock:
+            # Trial numbers start at 1 and match the table index + 1.
+            return self.trials[max(sinceTrial, 0):]
+
+    def _latencyMicroSecs(self, value, latencyValid):
+        '''Scales a raw latency to microseconds the same as RFC:THRU:AVG?.'''
+        if latencyValid == veexlib.PACKET_LATENCY_VALID_1_NANOSEC:
+            return value / 1000.0
+        elif latencyValid == veexlib.PACKET_LATENCY_VALID_10_NANOSEC:
+            return value / 100.0
+        elif latencyValid == veexlib.PACKET_LATENCY_VALID_100_NANOSEC:
+            return value / 10.0
+        return float(value)
+
+    def _addTrial(self, key, frameSize, rate, loss, latency):
+        '''Appends one completed trial to the table, once per run. Must be
+        called with the lock held.
+        '''
+        if key in self.recorded:
+            return
+        self.recorded.add(key)
+        self.trials.append((len(self.trials) + 1, key[0], frameSize,
+                            rate, loss, latency))
+
+    def _lossPercent(self, txCount, rxCount):
+        if (txCount == 0) or (rxCount >= txCount):
+            return 0.0
+        return (txCount - rxCount) * 100.0 / txCount
+
+    def poll(self):
+        '''Reads the PP statistics once and records the trials that are
+        complete. The PP has no per trial state, so a trial is complete once
+        a later trial of the same test has results, once rfcState has moved
+        on from its test or once the test has stopped.
+        '''
+        pp = self.globals.veexEthernet
+        if not pp:
+            return
+        pp.stats.update()
+        stats = pp.stats
+        state = stats.rfcState
+
+        if state == veexlib.PACKET_RFC_STOPPED:
+            if self.lastState in (None, veexlib.PACKET_RFC_STOPPED):
+                self.lastState = state
+                return
+        elif self.lastState == veexlib.PACKET_RFC_STOPPED:
+            # New run, the same frame sizes are tested again.
+            with self.lock:
+                self.recorded.clear()
+                self.seenTests.clear()
+        self.lastState = state
+        activeTest = RfcResultsCollector.stateTests.get(state)
+        if activeTest:
+            self.seenTests.add(activeTest)
+
+        pp.sets.update()
+        pp.allowedSets.update()
+        frameSizes = pp.sets.rfcPacketSize
+        latencyValid = pp.allowedSets.rfcLatencyValid
+
+        # Trials of each test in the order they are run, (key, txCount, result).
+        tests = {"THRU": [], "LOSS": [], "B2B": []}
+        for frameIndex in range(len(stats.rfcThroughputTxCount)):
+            txCount = stats.rfcThroughputTxCount[frameIndex]
+            rxCount = stats.rfcThroughputRxCount[frameIndex]
+            tests["THRU"].append((("THRU", frameIndex, 0), txCount,
+                                  (stats.rfcThroughputPassingRate[frameIndex] / 100.0,
+                                   self._lossPercent(txCount, rxCount),
+                                   self._latencyMicroSecs(stats.rfcLatencyAvg[frameIndex], latencyValid))))
+        for frameIndex in range(len(stats.rfcLossTxCount)):
+            for rateIndex in range(len(stats.rfcLossTxCount[frameIndex])):
+                txCount = stats.rfcLossTxCount[frameIndex][rateIndex]
+                rxCount = stats.rfcLossRxCount[frameIndex][rateIndex]
+                tests["LOSS"].append((("LOSS", frameIndex, rateIndex), txCount,
+                                      (stats.rfcLossTxRate[rateIndex] / 100.0,
+                                       self._lossPercent(txCount, rxCount),
+                                       0.0)))
+        # Back-to-back bursts are sent at the rate ceiling, in 0.01%.
+        b2bRate = pp.sets.rfcRateCeiling / 100.0
+        for frameIndex in range(len(stats.rfcB2BAvgMeasured)):
+            measured = stats.rfcB2BAvgMeasured[frameIndex]
+            possible = stats.rfcB2BMaxPossible[frameIndex]
+            tests["B2B"].append((("B2B", frameIndex, 0), measured,
+                                 (b2bRate, self._lossPercent(possible, measured), 0.0)))
+
+        # RFC:RESults:CLEar can empty the table from the session's thread.
+        with self.lock:
+            for test, trials in tests.items():
+                finished = (state == veexlib.PACKET_RFC_STOPPED) or \
+                           ((test in self.seenTests) and (test != activeTest))
+                started = [trial for trial in trials if trial[1] != 0]
+                if not finished:
+                    # The last trial with results may still be running.
+                    started = started[:-1]
+                for key, txCount, result in started:
+                    frameSize = frameSizes[key[1]] if key[1] < len(frameSizes) else 0
+                    self._addTrial(key, frameSize, *result)
+
+    def run(self):
+        '''This is the task function. It polls until stopped.'''
+        while not self.stopEvent.is_set():
+            try:
+                # The session's commands use the same chassis connection.
+                with self.globals.ppLock:
+                    if self.stopEvent.is_set():
+                        break
+                    self.poll()
+            except Exception:
+                # A PP that has gone is skipped by poll(), so this is a
+                # real failure. Report it and stop collecting.
+                print(traceback.format_exc())
+                self.stopEvent.set()
+                break
+            self.stopEvent.wait(RfcResultsCollector.pollInterval)
+
+    def formatTrial(self, trial):
+        '''Returns one table row as comma separated bytes.'''
+        return b"%d,%s,%d,%.2f,%.7f,%.3f" % (trial[0], trial[1].encode(),
+                                             trial[2], trial[3], trial[4], trial[5])
+
+
+class PingHistory(object):
+    '''This class keeps the round trip time of every ping reply in a ring
+    buffer. The Packet PP only holds the last few replies, so each stats read
+    moves any replies not seen before into the buffer. That lets PING:HIST?
+    and PING:SUMMary? return everything from one stats read.
+
+    The stats are read every period seconds from a daemon thread, started
+    by PING:HISTory:RATE, so replies are kept even when the client doesn't
+    query them before the PP drops them. The thread holds the session's PP
+    lock while it reads the PP so it never runs at the same time as a SCPI
+    command of the session.
+    '''
+
+    # Number of replies kept, the oldest are dropped first.
+    maxReplies = 4096
+
+    # Default and allowed seconds between reads. The PP holds 10 replies so
+    # the default keeps up with a ping a second.
+    defaultPeriod = 1.0
+    minPeriod     = 0.1
+    maxPeriod     = 60.0
+
+    # Dictionary to convert between ProtoBuf enum and SCPI text for ping reply.
+    PingReplyTable = {
+        veexlib.PACKET_PING_REPLY_NONE        : b"NONE",
+        veexlib.PACKET_PING_REPLY_SUCCESS     : b"SUCCESS",
+        veexlib.PACKET_PING_REPLY_TIMEOUT     : b"TIMEOUT",
+        veexlib.PACKET_PING_REPLY_UNREACHABLE : b"UNREACHABLE",
+        veexlib.PACKET_PING_REPLY_QUENCH      : b"QUENCH",
+        veexlib.PACKET_PING_REPLY_NOFRAG      : b"NOFRAG",
+        veexlib.PACKET_PING_REPLY_UNKNOWN     : b"UNKNOWN",
+        veexlib.PACKET_PING_REPLY_LIFETIME    : b"LIFETIME",
+        }
+
+    def __init__(self):
+        self.replies = deque([], PingHistory.maxReplies)  # (seq, reply, rtt, bytes, ttl)
+        self.lastSeq = -1
+        self.period  = PingHistory.defaultPeriod
+        self.thread  = None
+        self.stopEvent = threading.Event()
+
+    def isRunning(self):
+        '''Returns True if the sampling thread is running.'''
+        return (self.thread is not None) and self.thread.is_alive()
+
+    def start(self, globals, period):
+        '''Starts, or restarts with a new period, reading the replies of
+        the session's Packet PP.
+
+        Args:
+            globals (SessionGlobals): The session to read veexEthernet from.
+            period (float): Seconds between reads.
+        '''
+        self.stop()
+        self.period = period
+        self.stopEvent = threading.Event()
+        self.thread = threading.Thread(target=self._run,
+                                       args=(globals, self.stopEvent))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        '''Stops the sampling thread. The replies are kept.'''
+        self.stopEvent.set()
+        self.thread = None
+
+    def clear(self):
+        '''Drops all of the replies.'''
+        self.replies.clear()
+        self.lastSeq = -1
+
+    def _run(self, globals, stopEvent):
+        failed = False
+        while not stopEvent.is_set():
+            with globals.ppLock:
+                pp = globals.veexEthernet
+                if (pp is not None) and not stopEvent.is_set():
+                    try:
+                        pp.stats.update()
+                        self.update(pp.stats)
+                        failed = False
+                    except Exception as e:
+                        # The PP may be busy or being reconfigured, only the
+                        # first of a run of failures is printed.
+                        if not failed:
+                            print("Ping sample failed,", e)
+                        failed = True
+            stopEvent.wait(self.period)
+
+    def update(self, stats):
+        '''Adds the replies in an already updated stats object that are newer
+        than the last one added. A sequence number lower than the last one
+        means a new ping was started, so the old replies are dropped.
+        '''
+        newReplies = []
+        for i in range(len(stats.pingSeqNumber)):
+            if stats.pingResponse[i] == veexlib.PACKET_PING_REPLY_NONE:
+                continue
+            newReplies.append((stats.pingSeqNumber[i], stats.pingResponse[i],
+                               stats.pingResponseTime[i], stats.pingBytesReceived[i],
+                               stats.pingTTL[i]))
+        newReplies.sort()
+
+        if newReplies and (newReplies[-1][0] < self.lastSeq):
+            self.replies.clear()
+            self.lastSeq = -1
+
+        for reply in newReplies:
+            if reply[0] > self.lastSeq:
+                self.replies.append(reply)
+                self.lastSeq = reply[0]
+
+    def since(self, sinceSeq):
+        '''Returns the list of replies with a sequence number above sinceSeq.'''
+        result = []
+        for reply in reversed(self.replies):
+            if reply[0] <= sinceSeq:
+                break
+            result.append(reply)
+        result.reverse()
+        return result
+
+    def percentile(self, sortedTimes, percent):
+        '''Nearest-rank percentile of an already sorted list.'''
+        if len(sortedTimes) == 0:
+            return 0
+        rank = int(math.ceil(percent / 100.0 * len(sortedTimes)))
+        return sortedTimes[max(rank, 1) - 1]
+
+
 class ScpiPacket(object):
     #'''This class processes text Packet SCPI commands and returns a text response.
     #
@@ -29,8 +391,46 @@ class ScpiPacket(object):
     #    globals (SessionGlobals object): Data class of session variables.
     #'''
 
+    # Fields of a stream profile used by STRM:LOAD and STRM:SAVE. The key is
+    # the profile column name, which is the matching STRM: keyword. The value
+    # is a tuple of the streamSet attribute, the number of octets (0 for a
+    # plain integer, 6 for a MAC address, 4 for an IP address) and the lower
+    # and upper limit of each value.
+    StreamProfileFieldTable = {
+        "FRAMESIZE"  : ("length",        0, STRMSETFRAMELENGTH_LOWERLIMIT, STRMSETFRAMELENGTH_UPPERLIMIT),
+        "BW"         : ("traffic",       0, STRMSETBW_LOWERLIMIT,          STRMSETBW_UPPERLIMIT),
+        "MACSOURCE"  : ("srcMacAddress", 6, STRMSETSRCMAC_LOWERLIMIT,      STRMSETSRCMAC_UPPERLIMIT),
+        "MACDEST"    : ("dstMacAddress", 6, STRMSETDESTMAC_LOWERLIMIT,     STRMSETDESTMAC_UPPERLIMIT),
+        "IPSOURCE"   : ("srcIpAddress",  4, STRMSETSRCIP_LOWERLIMIT,       STRMSETSRCIP_UPPERLIMIT),
+        "IPDEST"     : ("dstIpAddress",  4, STRMSETDESTIP_LOWERLIMIT,      STRMSETDESTIP_UPPERLIMIT),
+        "PORTSOURCE" : ("srcUdpPort",    0, STRMSETSRCPORT_LOWERLIMIT,     STRMSETSRCPORT_UPPERLIMIT),
+        "PORTDEST"   : ("dstUdpPort",    0, STRMSETDESTPORT_LOWERLIMIT,    STRMSETDESTPORT_UPPERLIMIT),
+        "VLANID1"    : ("vlanId",        0, STRMSETVLANID_LOWERLIMIT,      STRMSETVLANID_UPPERLIMIT),
+        "VLANID2"    : ("vlan2Id",       0, STRMSETVLANID_LOWERLIMIT,      STRMSETVLANID_UPPERLIMIT),
+        "VLANID3"    : ("vlan3Id",       0, STRMSETVLANID_LOWERLIMIT,      STRMSETVLANID_UPPERLIMIT),
+        "VLANID4"    : ("vlan4Id",       0, STRMSETVLANID_LOWERLIMIT,      STRMSETVLANID_UPPERLIMIT),
+        "VLANQOS1"   : ("vlanQos",       0, STRMSETVLANQOS_LOWERLIMIT,     STRMSETVLANQOS_UPPERLIMIT),
+        "VLANQOS2"   : ("vlan2Qos",      0, STRMSETVLANQOS_LOWERLIMIT,     STRMSETVLANQOS_UPPERLIMIT),
+        "IPTOS"      : ("ipTos",         0, STRMSETIPTOS_LOWERLIMIT,       STRMSETIPTOS_UPPERLIMIT),
+        "IPTTL"      : ("ipTtl",         0, STRMSETIPTTL_LOWERLIMIT,       STRMSETIPTTL_UPPERLIMIT),
+        }
+
+
     def __init__(self, globals):
         self.globals = globals
+        self.rfcResults = None   # RfcResultsCollector, made by RFC:RES:COLL
+        self.pingHistory = PingHistory()
+
+
+    def clearPpState(self):
+        '''Stops the RFC:RESults:COLLect and PING:HISTory:RATE threads, as
+        they read the previously selected PP. The RFC table is kept for
+        RFC:RESults?, the ping replies are dropped.
+        '''
+        if self.rfcResults:
+            self.rfcResults.stop()
+        self.pingHistory.stop()
+        self.pingHistory.clear()
 
 
     def _errorResponse(self, errorCode):
@@ -60,10 +460,16 @@ class ScpiPacket(object):
         # Search for the command.
         callback, parameters = ParseUtils.searchCommandTree(parsedCommand, \
                                                             commandTreeRoot)
+        self.globals.perf.lap(PERF_SEARCH)
 
         # If the command was found then call the handler function.
         if callback:
-            response = callback(self, parameters)
+            self.globals.perf.setHandler(callback)
+            try:
+                response = callback(self, parameters)
+            finally:
+                # A handler that raises is still timed as HANDLER.
+                self.globals.perf.lap(PERF_HANDLER)
             foundCommand = True
 
         # return the results.
@@ -1042,6 +1448,17 @@ class ScpiPacket(object):
         # TODO: Implement event log query logic
         return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
 
+    def fetchEventLog(self, parameters):
+        '''**FETC:EVENTLOG? <SinceId>,<Max>** -
+        Queries the event log entries after sequence number <SinceId>, up to
+        <Max> entries. Response is "<last id>,<count>" then
+        ";<id>,<event id>,<count>,<time>,<duration>" for each entry. Use the
+        last id as <SinceId> of the next query to get only new entries. Events
+        lost before they were read are one ";<id>,LOST,<number lost>,0,0" entry.
+        '''
+        return self.globals.eventLog.fetchQuery(self.globals, self.globals.veexEthernet,
+                                                parameters)
+
     def doResRfLevel(self, parameters):
         """**RES:RF** - Process remote fault level commands.
         
@@ -1656,36 +2073,551 @@ class ScpiPacket(object):
         return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
 
     def getCaptureStatus(self, parameters):
-        """**RES:CAPSTATUS?** - Query packet capture status.
-        
-        C++ Implementation Details:
-        - Queries packet capture system status
-        - Returns capture state (running, stopped, etc.)
-        - No parameters required
-        
-        Python TODO:
-        - Call packet capture status method
-        - Return capture status as bytes
-        """
-        response = None
-        # TODO: Implement query logic
-        return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
+        '''**RES:CAPSTATUS?** -
+        Query the packet capture state as STOPPED, ARMED or DONE.
+        '''
+        self.globals.veexEthernet.stats.update()
+        captureState = self.globals.veexEthernet.stats.captureState
+        if captureState == veexlib.PACKET_CAPTURE_STOPPED:
+            return b"STOPPED"
+        elif captureState == veexlib.PACKET_CAPTURE_ARMED:
+            return b"ARMED"
+        elif captureState == veexlib.PACKET_CAPTURE_COMPLETE:
+            return b"DONE"
+        else:
+            # Overhead capture states are not packet results.
+            return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
 
     def getCaptureCount(self, parameters):
-        """**RES:CAPCOUNT?** - Query packet capture count.
-        
-        C++ Implementation Details:
-        - Queries number of packets captured
-        - Returns capture count
-        - No parameters required
-        
-        Python TODO:
-        - Call packet capture count method
-        - Return capture count as bytes
-        """
+        '''**RES:CAPCOUNT?** -
+        Query the number of captured frames.
+        '''
+        stats = self.globals.veexEthernet.stats
+        stats.update()
+        if stats.captureState == veexlib.PACKET_CAPTURE_STOPPED:
+            return b"0"
+        elif (stats.captureState == veexlib.PACKET_CAPTURE_ARMED) or \
+             (stats.captureState == veexlib.PACKET_CAPTURE_COMPLETE):
+            return b"%d" % self._capturedFrameCount(stats)
+        else:
+            return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
+
+    def _parseStreamProfileValue(self, field, text):
+        '''Converts one value of a stream profile to the form stored in the
+        streamSet and checks it against the range limits of the field.
+
+        Args:
+            field (string): Key of StreamProfileFieldTable.
+            text (string): Value as read from the profile file.
+
+        Returns:
+            (value, int): Tuple of the converted value (int or list of int)
+                          and a ScpiErrorCode, DLI_NO_ERROR on success.
+        '''
+        attribute, octets, lowerLimit, upperLimit = ScpiPacket.StreamProfileFieldTable[field]
+        text = str(text).strip()
+        if octets == 0:
+            parts = [text]
+        elif octets == 6:
+            parts = text.replace("-", ":").split(":")
+        else:
+            parts = text.split(".")
+        if len(parts) != max(octets, 1):
+            return (None, ScpiErrorCode.DATA_TYPE_ERR)
+
+        values = []
+        for part in parts:
+            try:
+                if octets == 6:
+                    value = int(part, base = 16)
+                else:
+                    value = int(part)
+            except ValueError:
+                return (None, ScpiErrorCode.NUMERIC_DATA_ERR)
+            if (value < lowerLimit) or (value > upperLimit):
+                return (None, ScpiErrorCode.DATA_OUT_OF_RANGE)
+            values.append(value)
+
+        if octets == 0:
+            return (values[0], ScpiErrorCode.DLI_NO_ERROR)
+        return (values, ScpiErrorCode.DLI_NO_ERROR)
+
+    def _formatStreamProfileValue(self, field, value):
+        '''Converts one streamSet value to the text written to a stream
+        profile. This is the reverse of _parseStreamProfileValue().
+        '''
+        octets = ScpiPacket.StreamProfileFieldTable[field][1]
+        if octets == 0:
+            return int(value)
+        elif octets == 6:
+            return ":".join("%02x" % (octet & 0xff) for octet in value[:octets])
+        else:
+            return ".".join("%d" % octet for octet in value[:octets])
+
+    def _plainFilePath(self, directory, name):
+        '''Returns the path of a file in directory, or None if name isn't a
+        plain file name (ie. it holds / or ..).
+        '''
+        name = name.strip('"\'')
+        if (not name) or ("/" in name) or ("\\" in name) or (".." in name):
+            return None
+        return os.path.join(directory, name)
+
+    def _readStreamProfile(self, fileName):
+        '''Reads a JSON or CSV stream profile. JSON files hold a list of
+        objects (or an object with a "streams" list), CSV files have a header
+        row. Every row must have a STREAM column with the 1 based stream number
+        and any of the columns in StreamProfileFieldTable.
+
+        Returns:
+            (list, int): Tuple of the list of row dictionaries and a
+                         ScpiErrorCode, DLI_NO_ERROR on success.
+        '''
+        try:
+            with open(fileName, 'r', newline = '') as f:
+                if fileName.lower().endswith('.csv'):
+                    rows = list(csv.DictReader(f))
+                else:
+                    rows = json.load(f)
+                    if isinstance(rows, dict):
+                        rows = rows.get("streams", [])
+        except FileNotFoundError:
+            return ([], ScpiErrorCode.FILE_NOT_FOUND)
+        except OSError:
+            return ([], ScpiErrorCode.DLI_FILE_IO_FAIL)
+        except (ValueError, csv.Error):
+            return ([], ScpiErrorCode.DATA_TYPE_ERR)
+
+        if not isinstance(rows, list) or \
+           not all(isinstance(row, dict) for row in rows):
+            return ([], ScpiErrorCode.DATA_TYPE_ERR)
+        return (rows, ScpiErrorCode.DLI_NO_ERROR)
+
+    def loadStreamProfile(self, parameters):
+        '''**STRM:LOAD <file>** -
+        Provision any number of streams from a JSON or CSV profile in
+        STREAM_PROFILE_DIR. The whole profile is checked before anything is
+        written, then all the streams are written to the PP with a single
+        settings write.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
         response = None
-        # TODO: Implement query logic
-        return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
+        if len(paramList) < 1:
+            return self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        fileName = self._plainFilePath(STREAM_PROFILE_DIR, paramList[0].head.decode())
+        if fileName is None:
+            return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+
+        rows, errorCode = self._readStreamProfile(fileName)
+        if errorCode != ScpiErrorCode.DLI_NO_ERROR:
+            return self._errorResponse(errorCode)
+
+        streamSets = self.globals.veexEthernet.streamSets
+        streamSets.update()
+        streamSet = streamSets.streamSet
+
+        # Validate everything first so a bad row leaves the PP untouched.
+        changes = []
+        for row in rows:
+            row = {str(key).strip().upper(): value for key, value in row.items()}
+            if "STREAM" not in row:
+                return self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+            try:
+                streamNum = int(str(row.pop("STREAM")).strip()) - 1
+            except ValueError:
+                return self._errorResponse(ScpiErrorCode.NUMERIC_DATA_ERR)
+            if (streamNum < 0) or (streamNum >= len(streamSet)):
+                return self._errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE)
+            for field, text in row.items():
+                if field not in ScpiPacket.StreamProfileFieldTable:
+                    return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+                if (text is None) or (str(text).strip() == ""):
+                    # Empty CSV cell, leave the setting as it is.
+                    continue
+                value, errorCode = self._parseStreamProfileValue(field, text)
+                if errorCode != ScpiErrorCode.DLI_NO_ERROR:
+                    return self._errorResponse(errorCode)
+                changes.append((streamNum, ScpiPacket.StreamProfileFieldTable[field][0], value))
+
+        # Like STRM:TXENABLE, each changed stream is marked with what changed
+        # and the write references all the streams if more than one changed.
+        changed = set()
+        for streamNum, attribute, value in changes:
+            setattr(streamSet[streamNum], attribute, value)
+            streamSet[streamNum].reference = veexlib.PACKET_STREAM_REF_ALL
+            changed.add(streamNum)
+        if not changed:
+            return response
+        if len(changed) > 1:
+            streamSets.reference = STREAM_REF_MULTIPLE
+        else:
+            streamSets.reference = changed.pop()
+        streamSets.streamSet = streamSet
+        return response
+
+    def saveStreamProfile(self, parameters):
+        '''**STRM:SAVE <file>** -
+        Save the settings of every stream to a JSON or CSV profile in
+        STREAM_PROFILE_DIR that can be loaded again with STRM:LOAD.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) < 1:
+            return self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        fileName = self._plainFilePath(STREAM_PROFILE_DIR, paramList[0].head.decode())
+        if fileName is None:
+            return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+
+        streamSets = self.globals.veexEthernet.streamSets
+        streamSets.update()
+        rows = []
+        for streamNum, stream in enumerate(streamSets.streamSet):
+            row = {"STREAM": streamNum + 1}
+            for field, fieldInfo in ScpiPacket.StreamProfileFieldTable.items():
+                row[field] = self._formatStreamProfileValue(field, getattr(stream, fieldInfo[0]))
+            rows.append(row)
+
+        try:
+            os.makedirs(STREAM_PROFILE_DIR, exist_ok = True)
+            with open(fileName, 'w', newline = '') as f:
+                if fileName.lower().endswith('.csv'):
+                    writer = csv.DictWriter(f, fieldnames = ["STREAM"] + list(ScpiPacket.StreamProfileFieldTable))
+                    writer.writeheader()
+                    writer.writerows(rows)
+                else:
+                    json.dump({"streams": rows}, f, indent = 1)
+        except OSError:
+            response = self._errorResponse(ScpiErrorCode.DLI_FILE_IO_FAIL)
+        return response
+
+    def setRfcResultsCollect(self, parameters):
+        '''**RFC:RESults:COLLect <ON|OFF>** -
+        Start or stop gathering RFC 2544 trial results on the server.
+        Starting does not clear results from earlier runs.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) >= 1:
+            if paramList[0].head.upper().startswith(b"ON"):
+                if not (self.rfcResults and self.rfcResults.isRunning()):
+                    # A stopped thread may not have exited yet, but it won't
+                    # poll again, so a new one is started.
+                    previous = self.rfcResults
+                    self.rfcResults = RfcResultsCollector(self.globals)
+                    if previous:
+                        # Keep the table and trial numbers of the stopped
+                        # one, and what it recorded of a run still going.
+                        self.rfcResults.trials = previous.trials
+                        self.rfcResults.recorded = previous.recorded
+                    self.rfcResults.start()
+            elif paramList[0].head.upper().startswith(b"OFF"):
+                if self.rfcResults:
+                    self.rfcResults.stop()
+            else:
+                response = self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+        else:
+            response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        return response
+
+    def getRfcResultsCollect(self, parameters):
+        '''**RFC:RESults:COLLect?** -
+        Query if RFC 2544 trial results are being gathered.
+        '''
+        if self.rfcResults and self.rfcResults.isRunning():
+            return b"ON"
+        return b"OFF"
+
+    def getRfcResults(self, parameters):
+        '''**RFC:RESults? [<since-trial>]** -
+        Query the RFC 2544 trials completed after the given trial number (all
+        trials if not given). Each trial is "trial,test,frame size,rate %,
+        loss %,latency us" and trials are separated by semicolons. Returns
+        NONE if there are no new trials.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        sinceTrial = 0
+        if len(paramList) >= 1:
+            sinceTrial = ParseUtils.checkNumeric(paramList[0].head)
+            if sinceTrial < 0:
+                return self._errorResponse(ScpiErrorCode.NUMERIC_DATA_ERR)
+        if not self.rfcResults:
+            return b"NONE"
+        trials = self.rfcResults.resultsSince(sinceTrial)
+        if len(trials) == 0:
+            return b"NONE"
+        return b";".join(self.rfcResults.formatTrial(trial) for trial in trials)
+
+    def getRfcResultsCount(self, parameters):
+        '''**RFC:RESults:COUNt?** -
+        Query the number of trials in the RFC 2544 results table.
+        '''
+        if not self.rfcResults:
+            return b"0"
+        return b"%d" % len(self.rfcResults.resultsSince(0))
+
+    def clearRfcResults(self, parameters):
+        '''**RFC:RESults:CLEar** -
+        Empty the RFC 2544 results table and restart trial numbering.
+        '''
+        if self.rfcResults:
+            self.rfcResults.clear()
+        return None
+
+    def exportRfcResults(self, parameters):
+        '''**RFC:RESults:EXPort <file>** -
+        Save the RFC 2544 results table to a CSV file in RFC_RESULTS_DIR.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) < 1:
+            return self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        fileName = self._plainFilePath(RFC_RESULTS_DIR, paramList[0].head.decode())
+        if fileName is None:
+            return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+        trials = []
+        if self.rfcResults:
+            trials = self.rfcResults.resultsSince(0)
+        try:
+            os.makedirs(RFC_RESULTS_DIR, exist_ok = True)
+            with open(fileName, 'w', newline = '') as f:
+                writer = csv.writer(f)
+                writer.writerow(RfcResultsCollector.columns)
+                for trial in trials:
+                    writer.writerow(["%d" % trial[0], trial[1], "%d" % trial[2],
+                                     "%.2f" % trial[3], "%.7f" % trial[4],
+                                     "%.3f" % trial[5]])
+        except OSError:
+            response = self._errorResponse(ScpiErrorCode.DLI_FILE_IO_FAIL)
+        return response
+
+    def getPingHistory(self, parameters):
+        '''**PING:HISTory? [<since-seq>]** -
+        Query every ping reply with a sequence number above the one given (all
+        kept replies if not given). Each reply is "seq,reply,rtt ms,bytes,ttl"
+        and replies are separated by semicolons. Returns NONE if there are no
+        new replies.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        sinceSeq = -1
+        if len(paramList) >= 1:
+            sinceSeq = ParseUtils.checkNumeric(paramList[0].head)
+            if sinceSeq < 0:
+                return self._errorResponse(ScpiErrorCode.NUMERIC_DATA_ERR)
+        self.globals.veexEthernet.stats.update()
+        self.pingHistory.update(self.globals.veexEthernet.stats)
+        replies = self.pingHistory.since(sinceSeq)
+        if len(replies) == 0:
+            return b"NONE"
+        return b";".join(b"%d,%s,%d,%d,%d" % (seq, PingHistory.PingReplyTable.get(reply, b"UNKNOWN"),
+                                              rtt, rxBytes, ttl)
+                         for seq, reply, rtt, rxBytes, ttl in replies)
+
+    def getPingHistoryRate(self, parameters):
+        '''**PING:HISTory:RATE?** -
+        Query the seconds between the background reads of the ping replies, or
+        OFF if they aren't being read.
+        '''
+        if not self.pingHistory.isRunning():
+            return b"OFF"
+        return b"%.1f" % self.pingHistory.period
+
+    def setPingHistoryRate(self, parameters):
+        '''**PING:HISTory:RATE <seconds>|OFF** -
+        Start reading the ping replies into the PING:HISTory? buffer in the
+        background every <seconds>, or stop the reads with OFF.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) >= 1:
+            if paramList[0].head.upper() == b"OFF":
+                self.pingHistory.stop()
+            elif ParseUtils.isFloatSdh(paramList[0].head):
+                period = float(paramList[0].head)
+                if (period < PingHistory.minPeriod) or (period > PingHistory.maxPeriod):
+                    response = self._errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE)
+                else:
+                    self.pingHistory.start(self.globals, period)
+            else:
+                response = self._errorResponse(ScpiErrorCode.DATA_TYPE_ERR)
+        else:
+            response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        return response
+
+    def getPingSummary(self, parameters):
+        '''**PING:SUMMary?** -
+        Query the ping results from one stats read as "tx,rx,loss %,min,avg,
+        max,p50,p90,p99", with the round trip times in ms. The percentiles
+        are from the successful replies kept by PING:HISTory?.
+        '''
+        stats = self.globals.veexEthernet.stats
+        stats.update()
+        self.pingHistory.update(stats)
+        times = sorted(reply[2] for reply in self.pingHistory.replies
+                       if reply[1] == veexlib.PACKET_PING_REPLY_SUCCESS)
+        return b"%d,%d,%.2f,%d,%d,%d,%d,%d,%d" % (
+            stats.pingNumberPacketsTransmitted,
+            stats.pingNumberPacketsReceived,
+            stats.pingPercentPacketLoss / 100.0,
+            stats.pingRoundTripDelayMin,
+            stats.pingRoundTripDelayAvg,
+            stats.pingRoundTripDelayMax,
+            self.pingHistory.percentile(times, 50),
+            self.pingHistory.percentile(times, 90),
+            self.pingHistory.percentile(times, 99))
+
+    def _capturedFrameCount(self, stats):
+        '''Returns the number of frames in the capture buffer.'''
+        if stats.firstCapturedFrame <= stats.lastCapturedFrame:
+            return stats.lastCapturedFrame - stats.firstCapturedFrame + 1
+        return 0
+
+    def _downloadCapturedFrame(self, frame, buffer):
+        '''Reads all the slices of one captured frame from the PP and appends
+        the frame data to buffer, like downloadCapturedPacket() in the C++.
+
+        Returns:
+            tuple: (timestamp, packetSize, captureSize) of the frame, or None
+                   if any slice could not be read. Nothing is appended to
+                   buffer on failure.
+        '''
+        captureSlice = self.globals.veexEthernet.readCaptureSlice(frame, 0)
+        if not captureSlice:
+            return None
+
+        # Grow the buffer once and copy each slice into place through a
+        # memoryview, rather than joining the slices into new bytes objects.
+        start = len(buffer)
+        captureSize = captureSlice.captureSize
+        buffer.extend(bytes(captureSize))
+        view = memoryview(buffer)
+        size = 0
+        try:
+            for sliceNumber in range(captureSlice.sliceCount):
+                if sliceNumber != 0:
+                    captureSlice = self.globals.veexEthernet.readCaptureSlice(frame, sliceNumber)
+                    if not captureSlice:
+                        break
+                sliceSize = captureSlice.sliceSize
+                if size + sliceSize > captureSize:
+                    break
+                view[start + size:start + size + sliceSize] = \
+                    memoryview(captureSlice.packetSlice)[:sliceSize]
+                size += sliceSize
+        finally:
+            view.release()
+
+        if size != captureSize:
+            # Reading of slices failed, drop the partial frame.
+            del buffer[start:]
+            return None
+        return (captureSlice.timestamp, captureSlice.packetSize, captureSize)
+
+    def getCaptureData(self, parameters):
+        '''**CAPTure:DATA? <start>,<count>[,PCAP|NANOPCAP|PCAPNG]** -
+        Query captured frames as an IEEE 488.2 definite length block holding
+        a pcap (default), nanosecond pcap or pcapng capture. Start is the
+        index of the first frame in the capture buffer, starting at 0. At
+        most CAPTURE_DATA_MAX_FRAMES frames are returned, and fewer at the
+        end of the buffer, so large captures are read in pages. Only the page
+        that starts at frame 0 has the file header, so the pages can be
+        joined in order to make one file.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        if len(paramList) < 2:
+            return self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+
+        start = ParseUtils.checkNumeric(paramList[0].head)
+        count = ParseUtils.checkNumeric(paramList[1].head)
+        if (start < 0) or (count < 0):
+            return self._errorResponse(ScpiErrorCode.NUMERIC_DATA_ERR)
+        if (count == 0) or (count > CAPTURE_DATA_MAX_FRAMES):
+            return self._errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE)
+
+        captureFormat = b"PCAP"
+        if len(paramList) > 2:
+            captureFormat = paramList[2].head.upper()
+            if captureFormat.startswith(b"PCAPNG"):
+                captureFormat = b"PCAPNG"
+            elif captureFormat.startswith(b"NANOPCAP"):
+                captureFormat = b"NANOPCAP"
+            elif captureFormat.startswith(b"PCAP"):
+                captureFormat = b"PCAP"
+            else:
+                return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+
+        self.globals.veexEthernet.sets.update()
+        captureSize = self.globals.veexEthernet.sets.captureSize
+        if captureSize == veexlib.PACKET_CAPTURE_SIZE_64_BYTES:
+            snapLen = 64
+        elif captureSize == veexlib.PACKET_CAPTURE_SIZE_128_BYTES:
+            snapLen = 128
+        elif captureSize == veexlib.PACKET_CAPTURE_SIZE_FULL_FRAME:
+            snapLen = 16000
+        else:
+            return self._errorResponse(ScpiErrorCode.INVALID_SETTINGS)
+
+        stats = self.globals.veexEthernet.stats
+        stats.update()
+        if (stats.captureState != veexlib.PACKET_CAPTURE_ARMED) and \
+           (stats.captureState != veexlib.PACKET_CAPTURE_COMPLETE):
+            return self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
+        frameCount = self._capturedFrameCount(stats)
+        if start >= frameCount:
+            return self._errorResponse(ScpiErrorCode.DATA_OUT_OF_RANGE)
+        count = min(count, frameCount - start)
+        timestampOffset = stats.captureTimestampOffset
+
+        # The block is built in one bytearray. Each record header is packed
+        # in place ahead of its frame data once the frame has been read.
+        data = bytearray()
+        if start == 0:
+            if captureFormat == b"PCAPNG":
+                # Section header block.
+                data += struct.pack("<IIIHHqI", 0x0A0D0D0A, 28, 0x1A2B3C4D,
+                                    1, 0, -1, 28)
+                # Interface description block, Ethernet link type with an
+                # if_tsresol option of 10^-9 seconds.
+                data += struct.pack("<IIHHIHHBxxxHHI", 0x00000001, 32, 1, 0,
+                                    snapLen, 9, 1, 9, 0, 0, 32)
+            else:
+                if captureFormat == b"NANOPCAP":
+                    magic = 0xA1B23C4D
+                else:
+                    magic = 0xA1B2C3D4
+                data += struct.pack("<IHHiIII", magic, 2, 4, 0, 0, snapLen, 1)
+
+        for frame in range(start, start + count):
+            recordStart = len(data)
+            if captureFormat == b"PCAPNG":
+                data += bytes(28)
+            else:
+                data += bytes(16)
+            frameInfo = self._downloadCapturedFrame(frame, data)
+            if not frameInfo:
+                # Frames that can't be read are left out, as the file save does.
+                del data[recordStart:]
+                continue
+
+            timestamp, packetSize, frameSize = frameInfo
+            nanoSecs = timestampOffset * 1000000000 + timestamp
+            if captureFormat == b"PCAPNG":
+                # Enhanced packet block, padded to 32 bits.
+                padding = -frameSize % 4
+                data += bytes(padding)
+                blockLength = 32 + frameSize + padding
+                struct.pack_into("<IIIIIII", data, recordStart, 0x00000006,
+                                 blockLength, 0, nanoSecs >> 32,
+                                 nanoSecs & 0xFFFFFFFF, frameSize, packetSize)
+                data += struct.pack("<I", blockLength)
+            else:
+                seconds, fraction = divmod(nanoSecs, 1000000000)
+                if captureFormat == b"PCAP":
+                    fraction //= 1000
+                struct.pack_into("<IIII", data, recordStart, seconds, fraction,
+                                 frameSize, packetSize)
+
+        length = b"%d" % len(data)
+        return b"#%d%s%s" % (len(length), length, data)
 
 # This table contains all the system SCPI commands. Note that queries must
 # come before the matching setting commands. Also if two commands start with
@@ -14315,6 +15247,7 @@ commandTable = [
     Cmnd(b"ARP:MACSRC?", ScpiPacket.getMACSrc),
     Cmnd(b"ARP:SUBNET", ScpiPacket.setSubnetAddr),
     Cmnd(b"ARP:SUBNET?", ScpiPacket.getSubnetAddr),
+    Cmnd(b"CAPTure:DATA?", ScpiPacket.getCaptureData),
     Cmnd(b"FETC:AL:CPP?", ScpiPacket.getResCpPowerLossState),
     Cmnd(b"FETC:AL:HDRMM?", ScpiPacket.getResHdrMMState),
     Cmnd(b"FETC:AL:LFD?", ScpiPacket.getResLfdState),
@@ -14356,6 +15289,7 @@ commandTable = [
     Cmnd(b"FETC:EHEC:COUNT?", ScpiPacket.getResCorrEHecCount),
     Cmnd(b"FETC:EHEC:CURRATE?", ScpiPacket.getResCorrEHecCurRate),
     Cmnd(b"FETC:EHEC:ES?", ScpiPacket.getResCorrEHecES),
+    Cmnd(b"FETC:EVENTLOG?", ScpiPacket.fetchEventLog),
     Cmnd(b"FETC:EVENTLOG", ScpiPacket.getEventLog),
     Cmnd(b"FETC:FABRICLOGIN?", ScpiPacket.getFabricLoginStatus),
     Cmnd(b"FETC:FCALIGN:AVGRATE?", ScpiPacket.getResFcAlignAvgRate),
@@ -14836,6 +15770,9 @@ commandTable = [
     Cmnd(b"PING:DESTMAC?", ScpiPacket.getDestMAC),
     Cmnd(b"PING:GATEWAY", ScpiPacket.setGatewayAddr),
     Cmnd(b"PING:GATEWAY?", ScpiPacket.getGatewayAddr),
+    Cmnd(b"PING:HISTory?", ScpiPacket.getPingHistory),
+    Cmnd(b"PING:HISTory:RATE?", ScpiPacket.getPingHistoryRate),
+    Cmnd(b"PING:HISTory:RATE", ScpiPacket.setPingHistoryRate),
     Cmnd(b"PING:IPDEST", ScpiPacket.setIPDest),
     Cmnd(b"PING:IPDEST?", ScpiPacket.getIPDest),
     Cmnd(b"PING:IPSRC", ScpiPacket.setIPSrc),
@@ -14859,6 +15796,7 @@ commandTable = [
     Cmnd(b"PING:STOP", ScpiPacket.setStop),
     Cmnd(b"PING:SUBNET", ScpiPacket.setSubnetAddr),
     Cmnd(b"PING:SUBNET?", ScpiPacket.getSubnetAddr),
+    Cmnd(b"PING:SUMMary?", ScpiPacket.getPingSummary),
     Cmnd(b"PING:TIMEOUT", ScpiPacket.setTimeOut),
     Cmnd(b"PING:TIMEOUT?", ScpiPacket.getTimeOut),
     Cmnd(b"PING:TTL", ScpiPacket.setTTL),
@@ -15399,6 +16337,12 @@ commandTable = [
     Cmnd(b"RFC:FRAME:RATE?", ScpiPacket.rfcGetFrameRate),
     Cmnd(b"RFC:FRAME:RX?", ScpiPacket.rfcGetFrameRx),
     Cmnd(b"RFC:FRAME:TX?", ScpiPacket.rfcGetFrameTx),
+    Cmnd(b"RFC:RESults:CLEar", ScpiPacket.clearRfcResults),
+    Cmnd(b"RFC:RESults:COLLect", ScpiPacket.setRfcResultsCollect),
+    Cmnd(b"RFC:RESults:COLLect?", ScpiPacket.getRfcResultsCollect),
+    Cmnd(b"RFC:RESults:COUNt?", ScpiPacket.getRfcResultsCount),
+    Cmnd(b"RFC:RESults:EXPort", ScpiPacket.exportRfcResults),
+    Cmnd(b"RFC:RESults?", ScpiPacket.getRfcResults),
     Cmnd(b"RFC:STATE?", ScpiPacket.rfcGetState),
     Cmnd(b"RFC:TEST:DEFAULT", ScpiPacket.rfcSetFactoryDeflt),
     Cmnd(b"RFC:TEST:DEST", ScpiPacket.rfcSetDestination),
@@ -15699,6 +16643,7 @@ commandTable = [
     Cmnd(b"STRM:LOSS:COUNTPS?", ScpiPacket.getStreamLossPerSec),
     Cmnd(b"STRM:LOSS:CURRATE?", ScpiPacket.getStreamLossCurRate),
     Cmnd(b"STRM:LOSS:ES?", ScpiPacket.getStreamLossES),
+    Cmnd(b"STRM:LOAD", ScpiPacket.loadStreamProfile),
     Cmnd(b"STRM:MACDEST", ScpiPacket.setMacdest),
     Cmnd(b"STRM:MACDEST?", ScpiPacket.getMacdest),
     Cmnd(b"STRM:MACSOURCE", ScpiPacket.setMacsource),
@@ -15749,6 +16694,7 @@ commandTable = [
     Cmnd(b"STRM:RXBYTES?", ScpiPacket.getRxStreamBytes),
     Cmnd(b"STRM:RXLOSS?", ScpiPacket.getRxStreamLoss),
     Cmnd(b"STRM:RXPACKETS?", ScpiPacket.getRxStreamPackets),
+    Cmnd(b"STRM:SAVE", ScpiPacket.saveStreamProfile),
     Cmnd(b"STRM:SEQ:AVGRATE?", ScpiPacket.getStreamSeqAvgRate),
     Cmnd(b"STRM:SEQ:COUNT?", ScpiPacket.getStreamSeqCount),
     Cmnd(b"STRM:SEQ:CURRATE?", ScpiPacket.getStreamSeqCurRate),
@@ -13,9 +13,12 @@
 #
 ###############################################################################
 
+from EnumCodec import ClockTypeCodec
 from ErrorCodes import ScpiErrorCode
 from ErrorCodes import errorResponse
 from ParseUtils import CommandTableEntry as Cmnd
+from PerfStats import PERF_HANDLER
+from PerfStats import PERF_SEARCH
 from SessionGlobals import SessionGlobals
 import ParseUtils
 #import SessionGlobals
@@ -61,10 +64,16 @@ class ScpiSonetSdh(object):
         # Search for the command.
         callback, parameters = ParseUtils.searchCommandTree(parsedCommand, \
                                                             commandTreeRoot)
+        self.globals.perf.lap(PERF_SEARCH)
 
         # If the command was found then call the handler function.
         if callback:
-            response = callback(self, parameters)
+            self.globals.perf.setHandler(callback)
+            try:
+                response = callback(self, parameters)
+            finally:
+                # A handler that raises is still timed as HANDLER.
+                self.globals.perf.lap(PERF_HANDLER)
             foundCommand = True
 
         # return the results.
@@ -137,27 +146,8 @@ class ScpiSonetSdh(object):
         Query the TX clock reference source.
         '''
         self.globals.veexSonetSdh.sets.update()
-        if self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_INTERNAL:
-            response = b"INT"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_RECOVERED:
-            response = b"LOOP"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_BITS_SETS:
-            response = b"BITS/SETS"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_BITS:
-            response = b"BITS"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_SETS:
-            response = b"SETS"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_EXT_8KHZ:
-            response = b"EXT8KHZ"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_EXT_BITS:
-            response = b"EXT1_5MHZ"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_EXT_SETS:
-            response = b"EXT2MHZ"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_EXT_10MHZ:
-            response = b"EXT10MHZ"
-        elif self.globals.veexSonetSdh.sets.clockType == veexlib.CLOCK_SYNC:
-            response = b"SYNC"
-        else:
+        response = ClockTypeCodec.encode(self.globals.veexSonetSdh.sets.clockType)
+        if response is None:
             response = self._errorResponse(ScpiErrorCode.INVALID_RESULTS)
         return response
 
@@ -168,26 +158,9 @@ class ScpiSonetSdh(object):
         paramList = ParseUtils.preParseParameters(parameters)
         response = None
         if len(paramList) >= 1:
-            if paramList[0].head.upper().startswith(b"INT"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_INTERNAL
-            elif paramList[0].head.upper().startswith(b"LOOP"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_RECOVERED
-            elif paramList[0].head.upper().startswith(b"BITS/SETS"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_BITS_SETS
-            elif paramList[0].head.upper().startswith(b"BITS"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_BITS
-            elif paramList[0].head.upper().startswith(b"SETS"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_SETS
-            elif paramList[0].head.upper().startswith(b"EXT8KHZ"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_EXT_8KHZ
-            elif paramList[0].head.upper().startswith(b"EXT1_5MHZ"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_EXT_BITS
-            elif paramList[0].head.upper().startswith(b"EXT2MHZ"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_EXT_SETS
-            elif paramList[0].head.upper().startswith(b"EXT10MHZ"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_EXT_10MHZ
-            elif paramList[0].head.upper().startswith(b"SYNC"):
-                self.globals.veexSonetSdh.sets.clockType = veexlib.CLOCK_SYNC
+            clockType = ClockTypeCodec.decode(paramList[0].head)
+            if clockType is not None:
+                self.globals.veexSonetSdh.sets.clockType = clockType
             else:
                 response = self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
         else:
@@ -14,11 +14,15 @@
 #
 ###############################################################################
 
+from EnumCodec import CardNameCodec
+from EnumCodec import PpNameCodec
 from ErrorCodes import ScpiErrorCode
 from ErrorCodes import errorResponse
 from ParseUtils import CommandTableEntry as Cmnd
+from PerfStats import PERF_HANDLER
+from PerfStats import PERF_SEARCH
 from SessionGlobals import SessionGlobals
-import pickle
+from SessionGlobals import autoLoginCache
 import time
 import ParseUtils
 #import SessionGlobals
@@ -63,10 +67,16 @@ class ScpiSystem(object):
         # Search for the command.
         callback, parameters = ParseUtils.searchCommandTree(parsedCommand, \
                                                             commandTreeRoot)
+        self.globals.perf.lap(PERF_SEARCH)
 
         # If the command was found then call the handler function.
         if callback:
-            response = callback(self, parameters)
+            self.globals.perf.setHandler(callback)
+            try:
+                response = callback(self, parameters)
+            finally:
+                # A handler that raises is still timed as HANDLER.
+                self.globals.perf.lap(PERF_HANDLER)
             foundCommand = True
 
         # return the results.
@@ -257,34 +267,7 @@ class ScpiSystem(object):
         '''
         result = b""
         for cp in self.globals.veexChassis.cards:
-            if cp.cardType == veexlib.CARD_OSA_PMD:
-                cpName = b"OSA="
-            elif cp.cardType == veexlib.CARD_IM_100:
-                cpName = b"IM-100="
-            elif cp.cardType == veexlib.CARD_OTDR:
-                cpName = b"OTDR="
-            elif cp.cardType == veexlib.CARD_OP_SWITCH:
-                cpName = b"OPSW="
-            elif cp.cardType == veexlib.CARD_SCM210:
-                cpName = b"SCM-210="
-            elif cp.cardType == veexlib.CARD_MPM10G:
-                cpName = b"MPM-10G="
-            elif cp.cardType == veexlib.CARD_MPM100G:
-                cpName = b"MPM-100G="
-            elif cp.cardType == veexlib.CARD_MPM100AR:
-                cpName = b"MPM-100AR="
-            elif cp.cardType == veexlib.CARD_MPM400G:
-                cpName = b"MPM-400G="
-            elif cp.cardType == veexlib.CARD_MPM400AR:
-                cpName = b"MPM-400AR="
-            elif cp.cardType == veexlib.CARD_MPM400DCO:
-                cpName = b"MPM-400DCO="
-            elif cp.cardType == veexlib.CARD_MPM600G:
-                cpName = b"MPM-600G="
-            elif cp.cardType == veexlib.CARD_SCM220:
-                cpName = b"SCM-220="
-            else:
-                cpName = b"<unknown>="
+            cpName = CardNameCodec.encode(cp.cardType, b"<unknown>") + b"="
 
             # Add card name and part number to result with comma when needed.
             if len(result) > 0:
@@ -305,62 +288,7 @@ class ScpiSystem(object):
         '''
         result = b""
         for pp in self.globals.veexChassis.protocols:
-            ppName = b""
-            if pp.protocolType == veexlib.PROTO_PHY:
-                # MPM10G card doesn't have an MLD in SCPI
-                if (pp.cardType == veexlib.CARD_MPM100G) or \
-                   (pp.cardType == veexlib.CARD_MPM100AR):
-                    ppName = b"MPM100MLD"
-                elif pp.cardType == veexlib.CARD_MPM400G:
-                    ppName = b"MPM400GMLD"
-                elif pp.cardType == veexlib.CARD_MPM400AR:
-                    ppName = b"MPM400MLD"
-                elif pp.cardType == veexlib.CARD_MPM400DCO:
-                    ppName = b"MPM400MLD"
-                elif pp.cardType == veexlib.CARD_MPM600G:
-                    ppName = b"MPM600MLD"
-            elif pp.protocolType == veexlib.PROTO_OTN:
-                if pp.cardType == veexlib.CARD_MPM10G:
-                    ppName = b"OTN"
-                elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                     (pp.cardType == veexlib.CARD_MPM100AR):
-                    ppName = b"MPM100OTN"
-                elif pp.cardType == veexlib.CARD_MPM400G:
-                    ppName = b"MPM400GOTN"
-                elif pp.cardType == veexlib.CARD_MPM400AR:
-                    ppName = b"MPM400OTN"
-                elif pp.cardType == veexlib.CARD_MPM400DCO:
-                    ppName = b"MPM400OTN"
-                elif pp.cardType == veexlib.CARD_MPM600G:
-                    ppName = b"MPM600OTN"
-            elif pp.protocolType == veexlib.PROTO_SONET_SDH:
-                if pp.cardType == veexlib.CARD_MPM10G:
-                    ppName = b"SONETSDH"
-                elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                     (pp.cardType == veexlib.CARD_MPM100AR):
-                    ppName = b"MPM100SONETSDH"
-                elif pp.cardType == veexlib.CARD_MPM400G:
-                    ppName = b"MPM400GSONETSDH"
-                elif pp.cardType == veexlib.CARD_MPM400AR:
-                    ppName = b"MPM400SONETSDH"
-                elif pp.cardType == veexlib.CARD_MPM400DCO:
-                    ppName = b"MPM400SONETSDH"
-                elif pp.cardType == veexlib.CARD_MPM600G:
-                    ppName = b"MPM600SONETSDH"
-            elif pp.protocolType == veexlib.PROTO_ETHERNET:
-                if pp.cardType == veexlib.CARD_MPM10G:
-                    ppName = b"PACKET"
-                elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                     (pp.cardType == veexlib.CARD_MPM100AR):
-                    ppName = b"MPM100PACKET"
-                elif pp.cardType == veexlib.CARD_MPM400G:
-                    ppName = b"MPM400GPACKET"
-                elif pp.cardType == veexlib.CARD_MPM400AR:
-                    ppName = b"MPM400PACKET"
-                elif pp.cardType == veexlib.CARD_MPM400DCO:
-                    ppName = b"MPM400PACKET"
-                elif pp.cardType == veexlib.CARD_MPM600G:
-                    ppName = b"MPM600PACKET"
+            ppName = PpNameCodec.encode((pp.protocolType, pp.cardType), b"")
 
             # Not every protocol has a SCPI counterpart (ie. PHY, OCS, and OTL
             # become just MLD in SCPI).
@@ -375,34 +303,7 @@ class ScpiSystem(object):
         '''
         result = b""
         for cp in self.globals.veexChassis.cards:
-            if cp.cardType == veexlib.CARD_OSA_PMD:
-                cpName = b"OSA="
-            elif cp.cardType == veexlib.CARD_IM_100:
-                cpName = b"IM-100="
-            elif cp.cardType == veexlib.CARD_OTDR:
-                cpName = b"OTDR="
-            elif cp.cardType == veexlib.CARD_OP_SWITCH:
-                cpName = b"OPSW="
-            elif cp.cardType == veexlib.CARD_SCM210:
-                cpName = b"SCM-210="
-            elif cp.cardType == veexlib.CARD_MPM10G:
-                cpName = b"MPM-10G="
-            elif cp.cardType == veexlib.CARD_MPM100G:
-                cpName = b"MPM-100G="
-            elif cp.cardType == veexlib.CARD_MPM100AR:
-                cpName = b"MPM-100AR="
-            elif cp.cardType == veexlib.CARD_MPM400G:
-                cpName = b"MPM-400G="
-            elif cp.cardType == veexlib.CARD_MPM400AR:
-                cpName = b"MPM-400AR="
-            elif cp.cardType == veexlib.CARD_MPM400DCO:
-                cpName = b"MPM-400DCO="
-            elif cp.cardType == veexlib.CARD_MPM600G:
-                cpName = b"MPM-600G="
-            elif cp.cardType == veexlib.CARD_SCM220:
-                cpName = b"SCM-220="
-            else:
-                cpName = b"<unknown>="
+            cpName = CardNameCodec.encode(cp.cardType, b"<unknown>") + b"="
 
             # Add card name and part number to result with comma when needed.
             if len(result) > 0:
@@ -424,34 +325,7 @@ class ScpiSystem(object):
         '''
         result = b""
         for cp in self.globals.veexChassis.cards:
-            if cp.cardType == veexlib.CARD_OSA_PMD:
-                cpName = b"OSA="
-            elif cp.cardType == veexlib.CARD_IM_100:
-                cpName = b"IM-100="
-            elif cp.cardType == veexlib.CARD_OTDR:
-                cpName = b"OTDR="
-            elif cp.cardType == veexlib.CARD_OP_SWITCH:
-                cpName = b"OPSW="
-            elif cp.cardType == veexlib.CARD_SCM210:
-                cpName = b"SCM-210="
-            elif cp.cardType == veexlib.CARD_MPM10G:
-                cpName = b"MPM-10G="
-            elif cp.cardType == veexlib.CARD_MPM100G:
-                cpName = b"MPM-100G="
-            elif cp.cardType == veexlib.CARD_MPM100AR:
-                cpName = b"MPM-100AR="
-            elif cp.cardType == veexlib.CARD_MPM400G:
-                cpName = b"MPM-400G="
-            elif cp.cardType == veexlib.CARD_MPM400AR:
-                cpName = b"MPM-400AR="
-            elif cp.cardType == veexlib.CARD_MPM400DCO:
-                cpName = b"MPM-400DCO="
-            elif cp.cardType == veexlib.CARD_MPM600G:
-                cpName = b"MPM-600G="
-            elif cp.cardType == veexlib.CARD_SCM220:
-                cpName = b"SCM-220="
-            else:
-                cpName = b"<unknown>="
+            cpName = CardNameCodec.encode(cp.cardType, b"<unknown>") + b"="
 
             # Add card name and part number to result with comma when needed.
             if len(result) > 0:
@@ -527,63 +401,16 @@ class ScpiSystem(object):
         ppName = b""
         if self.globals.protocolType == veexlib.PROTO_PHY:
             pp = self.globals.veexPhy
-            # MPM10G card doesn't have an MLD in SCPI
-            if (pp.cardType == veexlib.CARD_MPM100G) or \
-               (pp.cardType == veexlib.CARD_MPM100AR):
-                ppName = b"MPM100MLD"
-            elif pp.cardType == veexlib.CARD_MPM400G:
-                ppName = b"MPM400GMLD"
-            elif pp.cardType == veexlib.CARD_MPM400AR:
-                ppName = b"MPM400MLD"
-            elif pp.cardType == veexlib.CARD_MPM400DCO:
-                ppName = b"MPM400MLD"
-            elif pp.cardType == veexlib.CARD_MPM600G:
-                ppName = b"MPM600MLD"
         elif self.globals.protocolType == veexlib.PROTO_OTN:
             pp = self.globals.veexOtn
-            if pp.cardType == veexlib.CARD_MPM10G:
-                ppName = b"OTN"
-            elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                 (pp.cardType == veexlib.CARD_MPM100AR):
-                ppName = b"MPM100OTN"
-            elif pp.cardType == veexlib.CARD_MPM400G:
-                ppName = b"MPM400GOTN"
-            elif pp.cardType == veexlib.CARD_MPM400AR:
-                ppName = b"MPM400OTN"
-            elif pp.cardType == veexlib.CARD_MPM400DCO:
-                ppName = b"MPM400OTN"
-            elif pp.cardType == veexlib.CARD_MPM600G:
-                ppName = b"MPM600OTN"
         elif self.globals.protocolType == veexlib.PROTO_SONET_SDH:
             pp = self.globals.veexSonetSdh
-            if pp.cardType == veexlib.CARD_MPM10G:
-                ppName = b"SONETSDH"
-            elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                 (pp.cardType == veexlib.CARD_MPM100AR):
-                ppName = b"MPM100SONETSDH"
-            elif pp.cardType == veexlib.CARD_MPM400G:
-                ppName = b"MPM400GSONETSDH"
-            elif pp.cardType == veexlib.CARD_MPM400AR:
-                ppName = b"MPM400SONETSDH"
-            elif pp.cardType == veexlib.CARD_MPM400DCO:
-                ppName = b"MPM400SONETSDH"
-            elif pp.cardType == veexlib.CARD_MPM600G:
-                ppName = b"MPM600SONETSDH"
         elif self.globals.protocolType == veexlib.PROTO_ETHERNET:
             pp = self.globals.veexEthernet
-            if pp.cardType == veexlib.CARD_MPM10G:
-                ppName = b"PACKET"
-            elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                 (pp.cardType == veexlib.CARD_MPM100AR):
-                ppName = b"MPM100PACKET"
-            elif pp.cardType == veexlib.CARD_MPM400G:
-                ppName = b"MPM400GPACKET"
-            elif pp.cardType == veexlib.CARD_MPM400AR:
-                ppName = b"MPM400PACKET"
-            elif pp.cardType == veexlib.CARD_MPM400DCO:
-                ppName = b"MPM400PACKET"
-            elif pp.cardType == veexlib.CARD_MPM600G:
-                ppName = b"MPM600PACKET"
+        else:
+            pp = None
+        if pp:
+            ppName = PpNameCodec.encode((self.globals.protocolType, pp.cardType), b"")
 
         # Not every protocol has a SCPI counterpart (ie. PHY, OCS, and OTL
         # become just MLD in SCPI).
@@ -600,6 +427,7 @@ class ScpiSystem(object):
         previousPp = self.globals.veexProtocol
         errorCode = self.setInstCommon(parameters, self.globals)
         if not errorCode or errorCode == ScpiErrorCode.DLI_NO_ERROR:
+            self.globals.instCount += 1
             # the INST is selected, need to try and get the lock.
 
             # New PP is selected (or NONE), unlock the previous PP.
@@ -635,6 +463,7 @@ class ScpiSystem(object):
         previousPp = self.globals.veexProtocol
         errorCode = self.setInstCommon(parameters, self.globals)
         if not errorCode or errorCode == ScpiErrorCode.DLI_NO_ERROR:
+            self.globals.instCount += 1
             # Setting inst succeeded, unlock previous PP and return special
             # response.
             if previousPp:
@@ -1181,14 +1010,8 @@ class ScpiSystem(object):
         paramList = ParseUtils.preParseParameters(parameters)
         response = None
         if len(paramList) >= 2:
-            self.globals.autoLogin.username = paramList[0].head
-            self.globals.autoLogin.password = paramList[1].head
-            try:
-                with open('autologin.pickle', 'wb') as f:
-                    pickle.dump(self.globals.autoLogin, f)
-            except OSError as error:
-                # If file can't be opened then not much we can do.
-                pass
+            self.globals.autoLogin = autoLoginCache.update(username = paramList[0].head,
+                                                           password = paramList[1].head)
         else:
             response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
         return response
@@ -1217,21 +1040,9 @@ class ScpiSystem(object):
         response = None
         if len(paramList) >= 1:
             if paramList[0].head.upper().startswith(b"TRUE"):
-                self.globals.autoLogin.enabled = True
-                try:
-                    with open('autologin.pickle', 'wb') as f:
-                        pickle.dump(self.globals.autoLogin, f)
-                except OSError as error:
-                    # If file can't be opened then not much we can do.
-                    pass
+                self.globals.autoLogin = autoLoginCache.update(enabled = True)
             elif paramList[0].head.upper().startswith(b"FALSE"):
-                self.globals.autoLogin.enabled = False
-                try:
-                    with open('autologin.pickle', 'wb') as f:
-                        pickle.dump(self.globals.autoLogin, f)
-                except OSError as error:
-                    # If file can't be opened then not much we can do.
-                    pass
+                self.globals.autoLogin = autoLoginCache.update(enabled = False)
             else:
                 response = self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
         else:
@@ -1554,62 +1365,7 @@ class ScpiSystem(object):
 
             ppResult = b""
             for pp in tu.protocols:
-                ppName = b""
-                if pp.protocolType == veexlib.PROTO_PHY:
-                    # MPM10G card doesn't have an MLD in SCPI
-                    if (pp.cardType == veexlib.CARD_MPM100G) or \
-                       (pp.cardType == veexlib.CARD_MPM100AR):
-                        ppName = b"MPM100MLD"
-                    elif pp.cardType == veexlib.CARD_MPM400G:
-                        ppName = b"MPM400GMLD"
-                    elif pp.cardType == veexlib.CARD_MPM400AR:
-                        ppName = b"MPM400MLD"
-                    elif pp.cardType == veexlib.CARD_MPM400DCO:
-                        ppName = b"MPM400MLD"
-                    elif pp.cardType == veexlib.CARD_MPM600G:
-                        ppName = b"MPM600MLD"
-                elif pp.protocolType == veexlib.PROTO_OTN:
-                    if pp.cardType == veexlib.CARD_MPM10G:
-                        ppName = b"OTN"
-                    elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                         (pp.cardType == veexlib.CARD_MPM100AR):
-                        ppName = b"MPM100OTN"
-                    elif pp.cardType == veexlib.CARD_MPM400G:
-                        ppName = b"MPM400GOTN"
-                    elif pp.cardType == veexlib.CARD_MPM400AR:
-                        ppName = b"MPM400OTN"
-                    elif pp.cardType == veexlib.CARD_MPM400DCO:
-                        ppName = b"MPM400OTN"
-                    elif pp.cardType == veexlib.CARD_MPM600G:
-                        ppName = b"MPM600OTN"
-                elif pp.protocolType == veexlib.PROTO_SONET_SDH:
-                    if pp.cardType == veexlib.CARD_MPM10G:
-                        ppName = b"SONETSDH"
-                    elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                         (pp.cardType == veexlib.CARD_MPM100AR):
-                        ppName = b"MPM100SONETSDH"
-                    elif pp.cardType == veexlib.CARD_MPM400G:
-                        ppName = b"MPM400GSONETSDH"
-                    elif pp.cardType == veexlib.CARD_MPM400AR:
-                        ppName = b"MPM400SONETSDH"
-                    elif pp.cardType == veexlib.CARD_MPM400DCO:
-                        ppName = b"MPM400SONETSDH"
-                    elif pp.cardType == veexlib.CARD_MPM600G:
-                        ppName = b"MPM600SONETSDH"
-                elif pp.protocolType == veexlib.PROTO_ETHERNET:
-                    if pp.cardType == veexlib.CARD_MPM10G:
-                        ppName = b"PACKET"
-                    elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                         (pp.cardType == veexlib.CARD_MPM100AR):
-                        ppName = b"MPM100PACKET"
-                    elif pp.cardType == veexlib.CARD_MPM400G:
-                        ppName = b"MPM400GPACKET"
-                    elif pp.cardType == veexlib.CARD_MPM400AR:
-                        ppName = b"MPM400PACKET"
-                    elif pp.cardType == veexlib.CARD_MPM400DCO:
-                        ppName = b"MPM400PACKET"
-                    elif pp.cardType == veexlib.CARD_MPM600G:
-                        ppName = b"MPM600PACKET"
+                ppName = PpNameCodec.encode((pp.protocolType, pp.cardType), b"")
 
                 # Not every protocol has a SCPI counterpart (ie. PHY, OCS, and OTL
                 # become just MLD in SCPI).
@@ -1725,62 +1481,7 @@ class ScpiSystem(object):
             userName = bytes(self.globals.veexChassis.getUserName(userId), encoding='utf-8')
             if (not tu.isNotLocked()) and (len(userName) > 0):
                 for pp in tu.protocols:
-                    ppName = b""
-                    if pp.protocolType == veexlib.PROTO_PHY:
-                        # MPM10G card doesn't have an MLD in SCPI
-                        if (pp.cardType == veexlib.CARD_MPM100G) or \
-                           (pp.cardType == veexlib.CARD_MPM100AR):
-                            ppName = b"MPM100MLD"
-                        elif pp.cardType == veexlib.CARD_MPM400G:
-                            ppName = b"MPM400GMLD"
-                        elif pp.cardType == veexlib.CARD_MPM400AR:
-                            ppName = b"MPM400MLD"
-                        elif pp.cardType == veexlib.CARD_MPM400DCO:
-                            ppName = b"MPM400MLD"
-                        elif pp.cardType == veexlib.CARD_MPM600G:
-                            ppName = b"MPM600MLD"
-                    elif pp.protocolType == veexlib.PROTO_OTN:
-                        if pp.cardType == veexlib.CARD_MPM10G:
-                            ppName = b"OTN"
-                        elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                             (pp.cardType == veexlib.CARD_MPM100AR):
-                            ppName = b"MPM100OTN"
-                        elif pp.cardType == veexlib.CARD_MPM400G:
-                            ppName = b"MPM400GOTN"
-                        elif pp.cardType == veexlib.CARD_MPM400AR:
-                            ppName = b"MPM400OTN"
-                        elif pp.cardType == veexlib.CARD_MPM400DCO:
-                            ppName = b"MPM400OTN"
-                        elif pp.cardType == veexlib.CARD_MPM600G:
-                            ppName = b"MPM600OTN"
-                    elif pp.protocolType == veexlib.PROTO_SONET_SDH:
-                        if pp.cardType == veexlib.CARD_MPM10G:
-                            ppName = b"SONETSDH"
-                        elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                             (pp.cardType == veexlib.CARD_MPM100AR):
-                            ppName = b"MPM100SONETSDH"
-                        elif pp.cardType == veexlib.CARD_MPM400G:
-                            ppName = b"MPM400GSONETSDH"
-                        elif pp.cardType == veexlib.CARD_MPM400AR:
-                            ppName = b"MPM400SONETSDH"
-                        elif pp.cardType == veexlib.CARD_MPM400DCO:
-                            ppName = b"MPM400SONETSDH"
-                        elif pp.cardType == veexlib.CARD_MPM600G:
-                            ppName = b"MPM600SONETSDH"
-                    elif pp.protocolType == veexlib.PROTO_ETHERNET:
-                        if pp.cardType == veexlib.CARD_MPM10G:
-                            ppName = b"PACKET"
-                        elif (pp.cardType == veexlib.CARD_MPM100G) or \
-                             (pp.cardType == veexlib.CARD_MPM100AR):
-                            ppName = b"MPM100PACKET"
-                        elif pp.cardType == veexlib.CARD_MPM400G:
-                            ppName = b"MPM400GPACKET"
-                        elif pp.cardType == veexlib.CARD_MPM400AR:
-                            ppName = b"MPM400PACKET"
-                        elif pp.cardType == veexlib.CARD_MPM400DCO:
-                            ppName = b"MPM400PACKET"
-                        elif pp.cardType == veexlib.CARD_MPM600G:
-                            ppName = b"MPM600PACKET"
+                    ppName = PpNameCodec.encode((pp.protocolType, pp.cardType), b"")
 
                     # Not every protocol has a SCPI counterpart (ie. PHY, OCS, and OTL
                     # become just MLD in SCPI).
@@ -1844,6 +1545,35 @@ class ScpiSystem(object):
             else:
                 return b"Unknown"
 
+    def getMonitor(self, parameters):
+        '''**SYSTem:MONitor?** -
+        Query if the commands and responses of this session are shown in the
+        GUI's SCPI monitor.
+        '''
+        if self.globals.monitorLog:
+            return b"ON"
+        else:
+            return b"OFF"
+
+    def setMonitor(self, parameters):
+        '''**SYSTem:MONitor <ON|OFF>** -
+        Show the commands and responses of this session in the GUI's SCPI
+        monitor. Default is ON. They are sent to the chassis in batches in the
+        background, so OFF mostly saves CPU for high rate sessions.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) >= 1:
+            if paramList[0].head.upper().startswith(b"ON"):
+                self.globals.monitorLog = True
+            elif paramList[0].head.upper().startswith(b"OFF"):
+                self.globals.monitorLog = False
+            else:
+                response = self._errorResponse(ScpiErrorCode.DATA_TYPE_ERR)
+        else:
+            response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        return response
+
     def getOsVersion(self, parameters):
         '''**SYST:OSVERSion?** -
         Query the operating system version. This is a VeEX assigned number and
@@ -1851,6 +1581,113 @@ class ScpiSystem(object):
         '''
         return bytes(self.globals.veexChassis.osVersion, encoding='utf-8')
 
+    def getPerf(self, parameters):
+        '''**SYSTem:PERF? [<count>]** -
+        Query the command latencies of this session, for the count commands
+        (default 20) with the most total time. Returns
+        <seconds since reset>,<commands> then for each command
+        ;<handler>,<count>,<total ms>,<phase>:<p50>:<p99>:<max>,... with the
+        PARSE, SEARCH, HANDLER, VEEX, LOG, SEND and TOTAL phase times in
+        microseconds. VEEX, the veexlib round trips of the handler, is only
+        measured while SYSTem:PERF:VEEXlib:TRACE is ON.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        if len(paramList) >= 1:
+            count = ParseUtils.checkNumeric(paramList[0].head)
+            if count <= 0:
+                return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+            return self.globals.perf.report(count)
+        return self.globals.perf.report()
+
+    def doPerfReset(self, parameters):
+        '''**SYSTem:PERF:RESet** -
+        Clear the command latencies and veexlib counts of this session.
+        '''
+        self.globals.perf.reset()
+        self.globals.veexTrace.reset()
+        return None
+
+    def getPerfDump(self, parameters):
+        '''**SYSTem:PERF:DUMP?** -
+        Query the seconds between writes of the command latencies to the
+        scpiperf_<session>.txt file, or OFF.
+        '''
+        if self.globals.perf.dumpPeriod is None:
+            return b"OFF"
+        return b"%g" % self.globals.perf.dumpPeriod
+
+    def setPerfDump(self, parameters):
+        '''**SYSTem:PERF:DUMP <seconds|OFF>** -
+        Write all the command latencies of this session to the
+        scpiperf_<session>.txt file, in the working directory, at most every
+        seconds while commands are handled. seconds may have a fraction, ie.
+        0.5. Default is OFF.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) >= 1:
+            if paramList[0].head.upper().startswith(b"OFF"):
+                self.globals.perf.dumpPeriod = None
+            else:
+                if ParseUtils.isFloatSdh(paramList[0].head):
+                    seconds = float(paramList[0].head)
+                else:
+                    seconds = 0
+                if seconds > 0:
+                    self.globals.perf.dumpPeriod = seconds
+                else:
+                    response = self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+        else:
+            response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        return response
+
+    def getPerfVeexlib(self, parameters):
+        '''**SYSTem:PERF:VEEXlib? [<count>]** -
+        Query the veexlib calls of this session, counted while
+        SYSTem:PERF:VEEXlib:TRACE is ON, for the count commands (default 20)
+        with the most total veexlib time. Returns
+        <seconds since reset>,<commands> then for each command
+        ;<handler>,<count>,<updates>,<calls>,<writes>,<most>,<total ms> with
+        the update() calls, other calls and attribute writes per command, the
+        most veexlib accesses of one command and the total milliseconds.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        if len(paramList) >= 1:
+            count = ParseUtils.checkNumeric(paramList[0].head)
+            if count <= 0:
+                return self._errorResponse(ScpiErrorCode.ILLEGAL_PARAM_VALUE)
+            return self.globals.veexTrace.report(count)
+        return self.globals.veexTrace.report()
+
+    def getPerfVeexlibTrace(self, parameters):
+        '''**SYSTem:PERF:VEEXlib:TRACE?** -
+        Query if the veexlib calls are being counted.
+        '''
+        if self.globals.veexTrace.enabled:
+            return b"ON"
+        else:
+            return b"OFF"
+
+    def setPerfVeexlibTrace(self, parameters):
+        '''**SYSTem:PERF:VEEXlib:TRACE <ON|OFF>** -
+        Count the veexlib update() calls, other calls and attribute writes of
+        each command, and the time taken by them, for SYSTem:PERF:VEEXlib?.
+        Default is OFF. The chassis and PP objects are wrapped while ON, which
+        adds a few microseconds to each veexlib access.
+        '''
+        paramList = ParseUtils.preParseParameters(parameters)
+        response = None
+        if len(paramList) >= 1:
+            if paramList[0].head.upper().startswith(b"ON"):
+                self.globals.veexTrace.setEnabled(True, self.globals)
+            elif paramList[0].head.upper().startswith(b"OFF"):
+                self.globals.veexTrace.setEnabled(False, self.globals)
+            else:
+                response = self._errorResponse(ScpiErrorCode.DATA_TYPE_ERR)
+        else:
+            response = self._errorResponse(ScpiErrorCode.MISSING_PARAM)
+        return response
+
     def doReboot(self, parameters):
         '''**SYSTem:REBOOT** -
         Do an operating system reboot of the chassis. If any of the
@@ -2037,7 +1874,16 @@ commandTable = [
     Cmnd(b"SYSTem:MCHADDR?",            ScpiSystem.getMchIpAddress),
     Cmnd(b"SYSTem:MCHADDR",             ScpiSystem.setMchIpAddress),
     Cmnd(b"SYSTem:MCHSTATUS?",          ScpiSystem.getMchClockStatus),
+    Cmnd(b"SYSTem:MONitor?",            ScpiSystem.getMonitor),
+    Cmnd(b"SYSTem:MONitor",             ScpiSystem.setMonitor),
     Cmnd(b"SYSTem:OSVERSion?",          ScpiSystem.getOsVersion),
+    Cmnd(b"SYSTem:PERF?",               ScpiSystem.getPerf),
+    Cmnd(b"SYSTem:PERF:DUMP?",          ScpiSystem.getPerfDump),
+    Cmnd(b"SYSTem:PERF:DUMP",           ScpiSystem.setPerfDump),
+    Cmnd(b"SYSTem:PERF:RESet",          ScpiSystem.doPerfReset),
+    Cmnd(b"SYSTem:PERF:VEEXlib?",       ScpiSystem.getPerfVeexlib),
+    Cmnd(b"SYSTem:PERF:VEEXlib:TRACE?", ScpiSystem.getPerfVeexlibTrace),
+    Cmnd(b"SYSTem:PERF:VEEXlib:TRACE",  ScpiSystem.setPerfVeexlibTrace),
     Cmnd(b"SYSTem:REBOOT",              ScpiSystem.doReboot),
     Cmnd(b"SYSTem:RESPonse?",           ScpiSystem.getResponse),
     Cmnd(b"SYSTem:RESPonse",            ScpiSystem.setResponse),
@@ -13,7 +13,24 @@
 #
 ###############################################################################
 
+from DdmSampler import DdmSampler
 from ErrorCodes import ErrorQueue
+from ErrorScheduler import ErrorScheduler
+from EventLog import EventLog
+from ModuleInfoCache import ModuleInfoCache
+from PerfStats import PerfStats
+from VeexTrace import VEEX_TRACED_OBJECTS
+from VeexTrace import VeexTracer
+import os
+import pickle
+import threading
+import time
+
+# File the autologin settings are pickled to, in the working directory.
+AUTOLOGIN_FILE = "autologin.pickle"
+
+# Most seconds before a change to the file by another process is seen.
+AUTOLOGIN_CHECK_PERIOD = 1.0
 
 class AutoLoginSettings(object):
     '''This class contains the autologin settings. pickle is then used to 
@@ -26,6 +43,83 @@ class AutoLoginSettings(object):
         self.password = b""    # Password if enabled
 
 
+class AutoLoginCache(object):
+    '''This class keeps the autologin settings of the process. The file is
+    only read again when its modification time or size changes, and that is
+    checked at most every AUTOLOGIN_CHECK_PERIOD seconds, so a new
+    connection or login normally doesn't touch the file system.
+
+    The settings object returned by get() is shared by all sessions and
+    mustn't be changed, update() makes a new one.
+    '''
+
+    def __init__(self):
+        self.lock      = threading.Lock()
+        self.settings  = AutoLoginSettings()
+        self.fileKey   = None   # (mtime, size) of the file read, None if none
+        self.nextCheck = 0.0    # time.monotonic() of the next file check
+
+    def get(self):
+        '''Returns the current AutoLoginSettings.
+        '''
+        if time.monotonic() >= self.nextCheck:
+            with self.lock:
+                if time.monotonic() >= self.nextCheck:
+                    self._reload()
+        return self.settings
+
+    def _reload(self):
+        # Must be called with the lock held.
+        self.nextCheck = time.monotonic() + AUTOLOGIN_CHECK_PERIOD
+        try:
+            stat = os.stat(AUTOLOGIN_FILE)
+        except OSError as error:
+            # If file doesn't exist then autoLogin is disabled.
+            if self.fileKey is not None:
+                self.settings = AutoLoginSettings()
+                self.fileKey = None
+            return
+        fileKey = (stat.st_mtime_ns, stat.st_size)
+        if fileKey == self.fileKey:
+            return
+        try:
+            with open(AUTOLOGIN_FILE, 'rb') as f:
+                settings = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError) as error:
+            # If unpickle fails then autoLogin is disabled. A file being
+            # written is read again when the write changes its size or time.
+            settings = AutoLoginSettings()
+        self.settings = settings
+        self.fileKey = fileKey
+
+    def update(self, enabled = None, username = None, password = None):
+        '''Changes the settings given, writes them to the file and returns
+        the new AutoLoginSettings.
+        '''
+        with self.lock:
+            self._reload()
+            settings = AutoLoginSettings()
+            settings.enabled  = self.settings.enabled  if enabled  is None else enabled
+            settings.username = self.settings.username if username is None else username
+            settings.password = self.settings.password if password is None else password
+            try:
+                with open(AUTOLOGIN_FILE, 'wb') as f:
+                    pickle.dump(settings, f)
+                stat = os.stat(AUTOLOGIN_FILE)
+                self.fileKey = (stat.st_mtime_ns, stat.st_size)
+            except OSError as error:
+                # If file can't be opened then not much we can do, the
+                # settings are still used by this process.
+                pass
+            self.settings = settings
+        return settings
+
+
+# The autologin settings of the process.
+autoLoginCache = AutoLoginCache()
+
+
+
 class SessionGlobals(object):
     '''This class contains session specific global variables.
     '''
@@ -35,7 +129,9 @@ class SessionGlobals(object):
         self.sessionId      = sessionId   # ID number of this session
         self.ipAddress      = ipAddress   # TCP/IP address of protobufServer
         self.userName       = b""    # user name that was logged in.
+        self.veexTrace      = VeexTracer()  # SYSTem:PERF:VEEXlib? counts
         self.veexChassis    = None   # veexapi object from login
+        self.chassisLease   = None   # ConnectionPool lease of veexChassis
         self.veexProtocol   = None   # veexapi object set by INST command
         self.veexPhy        = None   # veexapi object set by INST command
         self.veexPcs        = None   # veexapi object set by INST command
@@ -46,11 +142,19 @@ class SessionGlobals(object):
         self.veexEthernet   = None   # veexapi object set by INST command
         self.veexFibreChan  = None   # veexapi object set by INST command
         self.protocolType   = None   # Which SCPI branch selected by INST
+        self.instCount      = 0      # INST commands that selected a PP or NONE
         self.respondAlways  = False  # Setting of SYST:RESP <ALWAYS|STANDARD>
         self.forceLock      = False  # Setting of SYST:LOCK:FORCED <ON|OFF>
         self.legacyResponse = False  # Setting of SYST:LEGACYR <TRUE|FALSE>
+        self.monitorLog     = True   # Setting of SYST:MON <ON|OFF>
         self.autoLogin      = AutoLoginSettings()  # object from above
         self.errorQueue     = ErrorQueue()         # FIFO queue object
+        self.eventLog       = EventLog()           # FETC:EVENTLOG? cursor
+        self.moduleInfo     = ModuleInfoCache()    # MODULE:INFO fields
+        self.ddmSampler     = DdmSampler()         # MODULE:DDM history
+        self.errorSchedule  = ErrorScheduler()     # TX:ERRor:SCHEDule steps
+        self.perf           = PerfStats()          # SYSTem:PERF? latencies
+        self.ppLock         = threading.RLock()    # Held while using the PPs
         self.chassisIpAddress   = b""   # Used when setting chassis network
         self.chassisSubnetMask  = b""   # Used when setting chassis network
         self.chassisDefRouter   = b""   # Used when setting chassis network
@@ -58,3 +162,10 @@ class SessionGlobals(object):
         self.chassisDnsAddress2 = b""   # Used when setting chassis network
         #self.ppMode         = None   # C++ SCPI enum ePpMode g_ppMode;
 
+    def __setattr__(self, name, value):
+        # The veexlib objects are wrapped while SYSTem:PERF:VEEXlib:TRACE
+        # is on, wherever they are set.
+        if name in VEEX_TRACED_OBJECTS:
+            value = self.veexTrace.wrap(value)
+        object.__setattr__(self, name, value)
+
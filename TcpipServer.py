@@ -13,14 +13,18 @@
 #
 ###############################################################################
 
-import pickle
+import os
 import signal
 import socket
 import ssl
 import threading
 import time
+import traceback
+from CommandLog import COMMAND_LOG_AUTOLOGIN
+from CommandLog import CommandRecorder
 from ErrorCodes import TcpipServerExit
 from ScpiEngine import ScpiEngine
+from SessionGlobals import autoLoginCache
 
 
 # If echoTest is True then act as an echo server instead of a SCPI server.
@@ -28,7 +32,25 @@ from ScpiEngine import ScpiEngine
 echoTest = False
 
 # Each connaction is assigned a session ID that is an incremeting integer.
+# Worker processes step by the number of workers from their own start so
+# that no two workers give out the same ID.
 nextSessionId = 1
+sessionIdStep = 1
+sessionIdLock = threading.Lock()
+
+# Session IDs each run of a worker process gives out before it could repeat
+# the IDs of its next restart. Each restart of a worker starts this many
+# steps above the previous run.
+WORKER_SESSION_IDS = 100000
+
+# A worker that exits sooner than this many seconds after it was started
+# isn't restarted, ie. it couldn't listen on the port.
+WORKER_MIN_UPTIME = 5.0
+
+# If recordDir is set then the commands of each session, with their responses
+# and timing, are recorded to a log file in that directory for
+# bench/scpi_replay.py. None means don't record.
+recordDir = None
 
 # Simple exception to handle signals.
 #class TcpipServerExit(Exception):
@@ -91,22 +113,25 @@ class TcpipSessionThread(threading.Thread):
         # command is the string up to, but not including, the end-of-line.
         command = b""
 
-        # Read the autoLogin settings from a file.
-        try:
-            with open('autologin.pickle', 'rb') as f:
-                autoLogin = pickle.load(f)
-            if autoLogin.enabled:
-                print('autologin')
-                self.scpiEngine.processCommand(b'LOGIN %s %s' % \
-                                              (autoLogin.username, \
-                                               autoLogin.password))
-        except FileNotFoundError as error:
-            # If file doesn't exist then autoLogin is disabled.
-            pass
-        except pickle.UnpicklingError as error:
-            # If unpickle fails then autoLogin is disabled.
-            pass
-
+        # Get the autoLogin settings, cached from the file.
+        recordFlags = 0
+        autoLogin = autoLoginCache.get()
+        if autoLogin.enabled:
+            print('autologin')
+            self.scpiEngine.processCommand(b'LOGIN %s %s' % \
+                                          (autoLogin.username, \
+                                           autoLogin.password))
+            recordFlags = COMMAND_LOG_AUTOLOGIN
+
+        # Start recording the commands if asked to. The autologin isn't a
+        # command from the user so it is only a flag in the log.
+        recorder = None
+        if recordDir is not None:
+            try:
+                recorder = CommandRecorder(recordDir, self.sessionType,
+                                           self.sessionId, recordFlags)
+            except OSError as error:
+                print("Can't record session", self.sessionId, error)
 
         # Loop until CLOSE sets exitTask to True.
         exitTask = False
@@ -128,6 +153,8 @@ class TcpipSessionThread(threading.Thread):
 
                     # Logout the user if one is logged in.
                     self.scpiEngine.processCommand(b'LOGOUT')
+                    if recorder:
+                        recorder.close()
 
                     # Close the connection with the client and end the thread
                     self.sessionSocket.shutdown(socket.SHUT_RDWR)
@@ -140,6 +167,8 @@ class TcpipSessionThread(threading.Thread):
 
                         # Logout the user if one is logged in.
                         self.scpiEngine.processCommand(b'LOGOUT')
+                        if recorder:
+                            recorder.close()
 
                         # Close the connection with the client and end the thread
                         self.sessionSocket.shutdown(socket.SHUT_RDWR)
@@ -188,6 +217,7 @@ class TcpipSessionThread(threading.Thread):
                 command = command.lstrip(b" \t:").rstrip()
                 if len(command) != 0:
                     # There is a real command.
+                    commandStart = time.perf_counter_ns()
                     if echoTest:
                         # Upper case and return command as an echo server.
                         response = command.upper()
@@ -198,8 +228,14 @@ class TcpipSessionThread(threading.Thread):
                         response = self.scpiEngine.processCommand(command)
 
                     # Send the response, if there is one, back to the user.
+                    # sendall() is needed as binary block responses can be
+                    # larger than one send.
                     if response and (len(response) != 0):
-                        self.sessionSocket.send(response + b'\r\n')
+                        sendStart = time.perf_counter_ns()
+                        self.sessionSocket.sendall(response + b'\r\n')
+                        self.scpiEngine.globals.perf.addSend(time.perf_counter_ns() - sendStart)
+                    if recorder:
+                        recorder.record(commandStart, command, response)
 
                     # If this was a CLOSE command then done. The logging
                     # out of the protobuf server was done as part of SCPI
@@ -210,6 +246,9 @@ class TcpipSessionThread(threading.Thread):
                     # Done, empty for the next command.
                     command = b""
 
+        if recorder:
+            recorder.close()
+
         # Debug code.
         if echoTest:
             self.sessionSocket.send(b'Thank you for exiting\n\r')
@@ -261,8 +300,9 @@ class TcpipServerThread(threading.Thread):
                     print (e)
                     raise TcpipServerExit
                 else:
-                    sessionId = nextSessionId
-                    nextSessionId += 1
+                    with sessionIdLock:
+                        sessionId = nextSessionId
+                        nextSessionId += sessionIdStep
 
                     print ('Opened TCP/IP connection from', addr, "sessionId:", sessionId)
 
@@ -281,7 +321,7 @@ class TcpipServerThread(threading.Thread):
             return
 
 
-def tcpipPortListen(port, ipAddress, useSsl = False):
+def tcpipPortListen(port, ipAddress, useSsl = False, reusePort = False):
     '''Opens a server socket at the given port (8090 for SCPI) and creates a
     task to listen for connections.
 
@@ -289,6 +329,9 @@ def tcpipPortListen(port, ipAddress, useSsl = False):
         port (int): The TCP/IP port of the server socket to listen on.
         ipAddress (string): The IP address of the protobuf server to connect to.
         useSsl (bool): True if this is an SSL/TLS socket, otherwise a normal socket.
+        reusePort (bool): True to set SO_REUSEPORT so each worker process can
+                          listen on the port, and the kernel shares the
+                          connections between them.
     '''
 
     if useSsl:
@@ -298,6 +341,8 @@ def tcpipPortListen(port, ipAddress, useSsl = False):
 
     # Create a socket object.
     serverSocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if reusePort:
+        serverSocket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
 
     # Bind to the port.
     serverSocket.bind(('', port))
@@ -321,6 +366,70 @@ def tcpipPortListen(port, ipAddress, useSsl = False):
     tcpipThread.start()
 
 
+def runWorkers(count, workerMain):
+    '''Forks count worker processes that each call workerMain(index), with
+    index 0 to count - 1, and restarts a worker that exits until a signal
+    ends the program. workerMain must listen with reusePort set. Each
+    worker has its own session IDs, veexlib connections and GIL, so the
+    sessions are spread over the CPU cores. Linux only.
+
+    Args:
+        count (int): The number of worker processes.
+        workerMain (function): Called in each worker, returns when the
+                               worker is to exit.
+    '''
+    workers = {}    # (index, start time) by process ID
+    restarts = [0] * count  # Times each worker was restarted
+
+    def startWorker(index):
+        global nextSessionId, sessionIdStep
+        pid = os.fork()
+        if pid == 0:
+            exitCode = 0
+            try:
+                # A restarted worker mustn't give out the IDs of sessions
+                # of its earlier runs, which may still be in logs and files.
+                nextSessionId = index + 1 + \
+                                restarts[index] * WORKER_SESSION_IDS * count
+                sessionIdStep = count
+                workerMain(index)
+            except TcpipServerExit:
+                pass
+            except BaseException as e:
+                print(traceback.format_exc())
+                exitCode = 1
+            finally:
+                os._exit(exitCode)
+        print("Started worker", index, "pid:", pid)
+        workers[pid] = (index, time.monotonic())
+
+    try:
+        for index in range(count):
+            startWorker(index)
+        while workers:
+            pid, status = os.wait()
+            if pid not in workers:
+                continue
+            index, startTime = workers.pop(pid)
+            print("Worker", index, "pid:", pid, "exited with status", status)
+            if time.monotonic() - startTime >= WORKER_MIN_UPTIME:
+                restarts[index] += 1
+                startWorker(index)
+    except TcpipServerExit:
+        pass
+    finally:
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in workers:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+
 if __name__ == "__main__":
     # Do an echo server test, listening to port 8090.
     echoTest = True
@@ -0,0 +1,189 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   VeexTrace.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module to count and time the veexlib calls made by each SCPI command of
+#    a session, for SYSTem:PERF:VEEXlib?.
+#
+###############################################################################
+
+import threading
+import time
+
+# SessionGlobals attributes holding veexlib objects that are wrapped while
+# tracing is on.
+VEEX_TRACED_OBJECTS = ("veexChassis", "veexProtocol", "veexPhy", "veexPcs",
+                       "veexOtl", "veexOtn", "veexSonetSdh", "veexGfp",
+                       "veexEthernet", "veexFibreChan", "veexPacket")
+
+# Attributes of the veexlib objects that are themselves settings or stats
+# objects with an update(), and are wrapped too.
+VEEX_TRACED_CHILDREN = ("sets", "stats", "allowedSets")
+
+# Kinds of veexlib access that are counted.
+VEEX_UPDATE = 0     # update() of sets, stats or allowedSets
+VEEX_CALL   = 1     # Any other method call, ie. setOduTcmTtiSapi()
+VEEX_WRITE  = 2     # Attribute write, ie. sets.errorGenRate = x
+VEEX_KINDS  = 3
+
+# Commands reported by SYSTem:PERF:VEEXlib? when no count is given.
+VEEX_DEFAULT_REPORT = 20
+
+
+class TracedObject(object):
+    '''This class wraps a veexlib object and passes everything through to it,
+    counting and timing each method call and attribute write with the
+    tracer. Attribute reads are passed through without counting since they
+    read what the last update() returned.
+    '''
+    __slots__ = ("_target", "_tracer", "_children")
+
+    def __init__(self, target, tracer):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_tracer", tracer)
+        object.__setattr__(self, "_children", {})
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if name in VEEX_TRACED_CHILDREN:
+            # Keep one wrapper per child while it is the same object.
+            child = self._children.get(name)
+            if (child is None) or (child._target is not value):
+                child = TracedObject(value, self._tracer)
+                self._children[name] = child
+            return child
+        if callable(value):
+            kind = VEEX_UPDATE if name == "update" else VEEX_CALL
+            tracer = self._tracer
+            def tracedCall(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return value(*args, **kwargs)
+                finally:
+                    tracer.add(kind, time.perf_counter_ns() - start)
+            return tracedCall
+        return value
+
+    def __setattr__(self, name, value):
+        start = time.perf_counter_ns()
+        try:
+            setattr(self._target, name, value)
+        finally:
+            self._tracer.add(VEEX_WRITE, time.perf_counter_ns() - start)
+
+    def __bool__(self):
+        return bool(self._target)
+
+    def __repr__(self):
+        return "TracedObject(%r)" % (self._target,)
+
+
+class VeexTracer(object):
+    '''This class counts the veexlib update() calls, other method calls and
+    attribute writes of each command, and the time spent in them, while
+    tracing is on. The command handling calls begin() at the start of each
+    command and finish() with the name PerfStats gave it, so the counts are
+    kept for the same command patterns as SYSTem:PERF?. The SCPI monitor
+    logging of each command is counted with it.
+
+    Only calls from the thread that called begin() are counted, so DDM
+    samples and error schedule steps taken between commands aren't counted
+    against the next command.
+
+    Tracing wraps the veexlib objects so it is off by default.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+        self.begin()
+
+    def reset(self):
+        '''Drops all of the counts.
+        '''
+        self.commands  = {}     # [count, updates, calls, writes, most calls,
+                                #  nanoseconds] by command name
+        self.startTime = time.monotonic()
+
+    def wrap(self, value):
+        '''Returns the veexlib object to keep in SessionGlobals, wrapped if
+        tracing is on and unwrapped if not.
+        '''
+        if isinstance(value, TracedObject):
+            if self.enabled:
+                return value
+            return value._target
+        if (value is None) or not self.enabled:
+            return value
+        return TracedObject(value, self)
+
+    def setEnabled(self, enabled, globals):
+        '''Turns tracing on or off and wraps or unwraps the veexlib objects
+        already in globals.
+        '''
+        self.enabled = enabled
+        for name in VEEX_TRACED_OBJECTS:
+            if name in globals.__dict__:
+                setattr(globals, name, getattr(globals, name))
+
+    def begin(self):
+        '''Starts counting a command.
+        '''
+        self.counts   = [0] * VEEX_KINDS
+        self.nanoSecs = 0
+        self.threadId = threading.get_ident()
+
+    def add(self, kind, nanoSecs):
+        '''Counts one veexlib access that took nanoSecs.
+        '''
+        if threading.get_ident() == self.threadId:
+            self.counts[kind] += 1
+            self.nanoSecs += nanoSecs
+
+    def finish(self, name):
+        '''Ends counting the command and adds its counts to name.
+        '''
+        self.threadId = None
+        if not self.enabled:
+            return
+        totals = self.commands.get(name)
+        if totals is None:
+            totals = [0] * 6
+            self.commands[name] = totals
+        calls = sum(self.counts)
+        totals[0] += 1
+        totals[1] += self.counts[VEEX_UPDATE]
+        totals[2] += self.counts[VEEX_CALL]
+        totals[3] += self.counts[VEEX_WRITE]
+        totals[4] = max(totals[4], calls)
+        totals[5] += self.nanoSecs
+
+    def report(self, count = VEEX_DEFAULT_REPORT):
+        '''Returns the SYSTem:PERF:VEEXlib? response,
+        <seconds since reset>,<commands> followed by the count commands with
+        the most total veexlib time, each
+        ;<name>,<count>,<updates>,<calls>,<writes>,<most>,<total ms> with
+        the updates, other calls and writes per command, the most veexlib
+        accesses made by one command and the total milliseconds in veexlib.
+        '''
+        ordered = sorted(self.commands.items(),
+                         key = lambda item: item[1][5],
+                         reverse = True)
+        rows = [b"%.3f,%d" % (time.monotonic() - self.startTime, len(ordered))]
+        for name, totals in ordered[:count]:
+            commands = totals[0]
+            rows.append(b"%s,%d,%.2f,%.2f,%.2f,%d,%.3f" % (name.encode(),
+                                                           commands,
+                                                           totals[1] / commands,
+                                                           totals[2] / commands,
+                                                           totals[3] / commands,
+                                                           totals[4],
+                                                           totals[5] / 1000000.0))
+        return b";".join(rows)
@@ -0,0 +1,105 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   import_cost.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Script to measure the import time and memory of the SCPI handler modules.
+#    Run it on the controller, from the PySCPI directory, before and after a
+#    change to a handler module:
+#
+#        python3 bench/import_cost.py [--repeat N] [--cold] [module ...]
+#
+###############################################################################
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Handler modules measured when none are given.
+DEFAULT_MODULES = ["ScpiMld", "ScpiOtn", "ScpiPacket", "ScpiSonetSdh",
+                   "ScpiSystem"]
+
+# Run in a new interpreter for each import so that no module is already
+# imported and the resident memory is of that module only. veexlib is
+# imported first so its cost isn't counted against the handler module.
+CHILD_SCRIPT = '''
+import resource, sys, time, tracemalloc
+sys.path.insert(0, sys.argv[2])
+import veexlib
+rssBefore = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+tracemalloc.start()
+start = time.perf_counter()
+__import__(sys.argv[1])
+seconds = time.perf_counter() - start
+current, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+rssAfter = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(seconds, current, peak, rssAfter - rssBefore, rssAfter)
+'''
+
+
+def measureImport(module, directory, cold):
+    '''Imports module in a new interpreter and returns its costs. If cold
+    the module is compiled from source instead of loaded from its .pyc, as
+    on the first start after an update.
+
+    Returns:
+        (float, int, int, int, int): Tuple of the import seconds, bytes
+            allocated and kept, peak bytes allocated, KB of maximum resident
+            memory added and KB of maximum resident memory of the process.
+    '''
+    command = [sys.executable]
+    if cold:
+        # Look for .pyc files in an empty directory and don't write any.
+        command += ["-B", "-X", "pycache_prefix=" + tempfile.mkdtemp()]
+    output = subprocess.check_output(command + ["-c", CHILD_SCRIPT, module,
+                                                directory])
+    fields = output.split()
+    return (float(fields[0]), int(fields[1]), int(fields[2]), int(fields[3]),
+            int(fields[4]))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the import time and memory of SCPI modules.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="imports of each module, the median is reported")
+    parser.add_argument("--directory",
+                        default=os.path.dirname(os.path.dirname(
+                                                os.path.abspath(__file__))),
+                        help="PySCPI directory with the modules")
+    parser.add_argument("--cold", action="store_true",
+                        help="compile the modules instead of using .pyc files")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    args = parser.parse_args()
+
+    print("%-14s %9s %9s %11s %11s %9s %9s" %
+          ("module", "size KB", "import ms", "kept KB", "peak KB",
+           "+RSS KB", "RSS KB"))
+    for module in args.modules:
+        results = [measureImport(module, args.directory, args.cold)
+                   for i in range(args.repeat)]
+        size = os.path.getsize(os.path.join(args.directory, module + ".py"))
+        print("%-14s %9d %9.1f %11d %11d %9d %9d" %
+              (module,
+               size // 1024,
+               statistics.median(r[0] for r in results) * 1000,
+               statistics.median(r[1] for r in results) // 1024,
+               statistics.median(r[2] for r in results) // 1024,
+               statistics.median(r[3] for r in results),
+               statistics.median(r[4] for r in results)))
+
+    print("python %s, %s" % (sys.version.split()[0], sys.platform))
+
+
+if __name__ == "__main__":
+    main()
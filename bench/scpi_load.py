@@ -0,0 +1,561 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   scpi_load.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Load generator and soak benchmark for the SCPI server. Opens a number of
+#    TCP/IP or SSL sessions, each replaying a command mix as fast as the server
+#    answers (or at a set rate), and reports throughput, p50/p99/p999 latency
+#    and the CPU and resident memory of the server over time:
+#
+#        python3 bench/scpi_load.py --sessions 8 --duration 60 --mix fetc,oh
+#        python3 bench/scpi_load.py --simulator --latency 1 --sessions 16
+#
+#    --simulator starts the server on the veexlib simulator, so no chassis is
+#    needed. Otherwise give the server with --host and --port and, to see its
+#    CPU and memory, its process ID with --server-pid.
+#
+###############################################################################
+
+import argparse
+import array
+import json
+import os
+import random
+import socket
+import ssl
+import subprocess
+import sys
+import threading
+import time
+
+# Command mixes. Each is the PP to select and (weight, command) pairs. The
+# server is set to SYSTem:RESPonse ALWAYS so every command has a response
+# to time. {session} is replaced by the session number, so sessions don't
+# share files.
+MIXES = {
+    # Automation polling the results of a packet test.
+    "fetc": (b"MPM100PACKET", [
+        (4, b"FETC:AL:LOS?"),
+        (4, b"FETC:AL:LINK?"),
+        (2, b"FETC:AL:LOC?"),
+        (2, b"FETC:AL:LFD?"),
+        (4, b"FETC:CRC:COUNT?"),
+        (2, b"FETC:CRC:AVGRATE?"),
+        (2, b"FETC:COLLISION:COUNT?"),
+        (1, b"FETC:CAPSTATUS?"),
+        (1, b"FETC:CAPCOUNT?"),
+        (1, b"ELAPSEdtime?"),
+        ]),
+    # Overhead configuration storm on an OTN PP.
+    "oh": (b"MPM100OTN", [
+        (2, b'TX:OH:TTI:ALL OTU,"SAPI-OTU","DAPI-OTU";ODU,"SAPI-ODU","DAPI-ODU"'),
+        (2, b"TX:OH:TTI:ALL? OTU,ODU,TCM1,TCM2,TCM3"),
+        (1, b'RX:OH:TTI:ALL TCM1,"EXP-SAPI","EXP-DAPI";TCM2,"EXP-SAPI","EXP-DAPI"'),
+        (1, b"RX:OH:TTI:ALL? TCM1,TCM2"),
+        (2, b"TX:OH:ODU:EXP1 #H5A"),
+        (2, b"TX:OH:ODU:EXP1?"),
+        (2, b"TX:OH:OTU:RES1 0"),
+        (2, b"TX:OH:INTRusive:FAS NO"),
+        (2, b"TX:OH:INTRusive:FAS?"),
+        (1, b"RX:CAP:BYTE OTUMFAS"),
+        (1, b"RES:OHCAPture:STATe?"),
+        ]),
+    # Stream provisioning on a packet PP.
+    "strm": (b"MPM100PACKET", [
+        (1, b"STRM:SAVE /tmp/scpi_load_{session}.json"),
+        (4, b"STRM:LOAD /tmp/scpi_load_{session}.json"),
+        (2, b"STRM:ARP?"),
+        (2, b"STRM:TXENABLE?"),
+        (2, b"STRM:FRAMESIZE?"),
+        ]),
+    }
+
+# Commands that set up each session before the mix starts.
+SETUP_COMMANDS = [b"SYSTem:RESPonse ALWAYS"]
+
+# Seconds to wait for the server started by --simulator to listen.
+SIMULATOR_START_TIMEOUT = 30.0
+
+
+class ResponseReader(object):
+    '''This class reads responses from a session socket. A response ends in
+    CR LF, except an IEEE 488.2 definite length block (#<n><length><data>),
+    whose data can hold CR LF.
+    '''
+
+    def __init__(self, sock):
+        self.sock   = sock
+        self.buffer = bytearray()
+
+    def _fill(self):
+        data = self.sock.recv(65536)
+        if not data:
+            raise ConnectionError("server closed the session")
+        self.buffer += data
+
+    def read(self):
+        '''Returns the next response without the CR LF.
+        '''
+        while True:
+            if (len(self.buffer) >= 2) and (self.buffer[0:1] == b"#") and \
+               self.buffer[1:2].isdigit():
+                digits = int(self.buffer[1:2])
+                while len(self.buffer) < 2 + digits:
+                    self._fill()
+                end = 2 + digits + int(self.buffer[2:2 + digits] or b"0")
+                while len(self.buffer) < end + 2:
+                    self._fill()
+                response = bytes(self.buffer[:end])
+                del self.buffer[:end + 2]
+                return response
+            endOfLine = self.buffer.find(b"\r\n")
+            if endOfLine >= 0:
+                response = bytes(self.buffer[:endOfLine])
+                del self.buffer[:endOfLine + 2]
+                return response
+            self._fill()
+
+
+def isErrorResponse(response):
+    '''Returns True if response is a SCPI error, ie. -100, "Command error".
+    '''
+    return (response[:1] == b"-") and response[1:2].isdigit() and \
+           (b"," in response[:8])
+
+
+def percentile(samples, percent):
+    '''Returns the nearest rank percentile of sorted samples, 0 if empty.
+    '''
+    if not samples:
+        return 0
+    rank = int(len(samples) * percent / 100.0 + 0.999999) - 1
+    return samples[min(max(rank, 0), len(samples) - 1)]
+
+
+class Session(threading.Thread):
+    '''This thread is one client session replaying a command mix.
+
+    Args:
+        sessionNum (int): Number of the session, also seeds its mix.
+        mixName (string): Key of the mix in mixes.
+        mixes (dict): (ppName, [(weight, command), ...]) by mix name.
+        args (Namespace): Command line arguments.
+        stopEvent (Event): Set to end the session.
+    '''
+
+    def __init__(self, sessionNum, mixName, mixes, args, stopEvent):
+        threading.Thread.__init__(self)
+        self.sessionNum = sessionNum
+        self.mixName    = mixName
+        self.ppName     = mixes[mixName][0]
+        self.commands   = [command.replace(b"{session}", b"%d" % sessionNum)
+                           for weight, command in mixes[mixName][1]]
+        self.weights    = [weight for weight, command in mixes[mixName][1]]
+        self.args       = args
+        self.stopEvent  = stopEvent
+        self.random     = random.Random(args.seed + sessionNum)
+        self.lock       = threading.Lock()
+        self.samples    = array.array("q")  # Nanoseconds, since last take()
+        self.commandNs  = {}                # [nanoseconds] by command
+        self.commandErr = {}                # Error responses by command
+        self.errors     = 0
+        self.failure    = None
+        self.daemon     = True
+
+    def take(self):
+        '''Returns the latencies since the last take() and the errors.
+        '''
+        with self.lock:
+            samples, self.samples = self.samples, array.array("q")
+            errors, self.errors = self.errors, 0
+        return samples, errors
+
+    def _connect(self):
+        sock = socket.create_connection((self.args.host, self.args.port),
+                                        timeout = self.args.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.args.ssl:
+            # The controller has a self signed certificate.
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            sock = context.wrap_socket(sock)
+        return sock
+
+    def _command(self, sock, reader, command):
+        sock.sendall(command + b"\n")
+        return reader.read()
+
+    def run(self):
+        try:
+            sock = self._connect()
+        except OSError as error:
+            self.failure = "connect: %s" % error
+            return
+        reader = ResponseReader(sock)
+        try:
+            login = b"LOGIN %s %s" % (self.args.user.encode(),
+                                      self.args.password.encode())
+            response = self._command(sock, reader, login)
+            if not response.startswith(b"Login successful"):
+                self.failure = "login: %s" % response.decode(errors = "replace")
+                return
+            for command in SETUP_COMMANDS:
+                self._command(sock, reader, command)
+            inst = b"INS_" if self.args.no_lock else b"INST"
+            self._command(sock, reader, inst + b" " + self.ppName)
+
+            interval = (1.0 / self.args.rate) if self.args.rate > 0 else 0.0
+            nextSend = time.perf_counter()
+            perCommand = self.args.per_command
+            while not self.stopEvent.is_set():
+                if interval:
+                    delay = nextSend - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    nextSend += interval
+                command = self.random.choices(self.commands, self.weights)[0]
+                start = time.perf_counter_ns()
+                response = self._command(sock, reader, command)
+                elapsed = time.perf_counter_ns() - start
+                error = isErrorResponse(response)
+                with self.lock:
+                    self.samples.append(elapsed)
+                    if error:
+                        self.errors += 1
+                if perCommand:
+                    self.commandNs.setdefault(command, array.array("q")).append(elapsed)
+                    if error:
+                        self.commandErr[command] = self.commandErr.get(command, 0) + 1
+
+            self._command(sock, reader, b"LOGOUT")
+        except (OSError, ConnectionError) as error:
+            self.failure = "session: %s" % error
+        finally:
+            sock.close()
+
+
+class ServerUsage(object):
+    '''This class reads the CPU time and resident memory of the server
+    processes, and their child processes (ie. SCPI.py --workers), from
+    /proc, so it only works on Linux.
+
+    Args:
+        pids (list): Process IDs of the server.
+    '''
+
+    def __init__(self, pids):
+        self.pids      = pids
+        self.ticks     = os.sysconf("SC_CLK_TCK")
+        self.lastCpu   = self._cpuSeconds()
+        self.lastTime  = time.monotonic()
+
+    def _allPids(self):
+        pids = []
+        for pid in self.pids:
+            pids.append(pid)
+            try:
+                with open("/proc/%d/task/%d/children" % (pid, pid)) as f:
+                    pids += [int(child) for child in f.read().split()]
+            except (OSError, ValueError):
+                pass
+        return pids
+
+    def _cpuSeconds(self):
+        # A worker that exited takes its CPU time with it, so the CPU of an
+        # interval with a worker restart is low.
+        total = 0.0
+        for pid in self._allPids():
+            try:
+                with open("/proc/%d/stat" % pid) as f:
+                    # The process name can hold spaces, the fields after it
+                    # can't.
+                    fields = f.read().rsplit(")", 1)[1].split()
+                total += (int(fields[11]) + int(fields[12])) / self.ticks
+            except (OSError, IndexError, ValueError):
+                pass
+        return total
+
+    def _rssMb(self):
+        total = 0
+        for pid in self._allPids():
+            try:
+                with open("/proc/%d/status" % pid) as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total += int(line.split()[1])
+                            break
+            except OSError:
+                pass
+        return total / 1024.0
+
+    def sample(self):
+        '''Returns (CPU percent of one core since the last sample, RSS MB).
+        '''
+        cpu = self._cpuSeconds()
+        now = time.monotonic()
+        percent = 100.0 * (cpu - self.lastCpu) / max(now - self.lastTime, 1e-9)
+        self.lastCpu, self.lastTime = cpu, now
+        return percent, self._rssMb()
+
+
+def readMixFile(fileName):
+    '''Reads a mix from a file. The first line that isn't blank or a #
+    comment is the PP to INSTrument, ie. MPM100OTN. Each following line is
+    a command, optionally after a weight, ie. "3 FETC:AL:LOS?".
+
+    Returns:
+        (bytes, list): Tuple of the PP name and (weight, command) pairs.
+    '''
+    ppName = None
+    commands = []
+    with open(fileName, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if (not line) or line.startswith(b"#"):
+                continue
+            if ppName is None:
+                ppName = line
+                continue
+            weight, _, rest = line.partition(b" ")
+            if weight.isdigit() and rest.strip():
+                commands.append((int(weight), rest.strip()))
+            else:
+                commands.append((1, line))
+    if (ppName is None) or (not commands):
+        raise ValueError("%s has no PP or no commands" % fileName)
+    return ppName, commands
+
+
+def startSimulator(args):
+    '''Starts the SCPI server on the veexlib simulator and waits for it to
+    listen.
+
+    Returns:
+        Popen: The server process.
+    '''
+    scpiDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, "-m", "veexsim",
+               "--latency", str(args.latency), "--jitter", str(args.jitter),
+               "--port", str(args.port)]
+    for card in args.card or []:
+        command += ["--card", card]
+    if getattr(args, "workers", 1) > 1:
+        command += ["--workers", str(args.workers)]
+    process = subprocess.Popen(command, cwd = scpiDir,
+                               stdout = subprocess.DEVNULL)
+    deadline = time.monotonic() + SIMULATOR_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("simulator exited with %d" % process.returncode)
+        try:
+            socket.create_connection((args.host, args.port), timeout = 1.0).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("simulator didn't listen on port %d" % args.port)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load test the SCPI server with concurrent sessions.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address of the SCPI server")
+    parser.add_argument("--port", type=int, default=8090,
+                        help="port of the SCPI server, 8091 for SSL")
+    parser.add_argument("--ssl", action="store_true",
+                        help="connect with SSL/TLS")
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--sessions", type=int, default=4,
+                        help="concurrent sessions")
+    parser.add_argument("--mix", default="fetc",
+                        help="comma separated mixes (%s) given to the sessions "
+                             "in turn" % ", ".join(sorted(MIXES)))
+    parser.add_argument("--mix-file", action="append", default=[],
+                        help="extra mix read from a file, named by the file")
+    parser.add_argument("--duration", type=float, default=30.0,
+                        help="seconds to run for, after the warm up")
+    parser.add_argument("--warmup", type=float, default=2.0,
+                        help="seconds left out of the summary")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="seconds between progress lines")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="commands a second per session, 0 for as fast "
+                             "as the server answers")
+    parser.add_argument("--no-lock", action="store_true",
+                        help="select the PP with INS_ so sessions don't "
+                             "take the lock from each other")
+    parser.add_argument("--per-command", action="store_true",
+                        help="also report the latency of each command")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="seconds to wait for a response")
+    parser.add_argument("--server-pid", type=int, action="append", default=[],
+                        help="process ID of the server, repeat for workers")
+    parser.add_argument("--simulator", action="store_true",
+                        help="start the server on the veexlib simulator")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="simulator round trip milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="simulator round trip jitter milliseconds")
+    parser.add_argument("--card", action="append",
+                        help="simulator card, repeat for more slots")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="simulator worker processes")
+    parser.add_argument("--json",
+                        help="write the summary to this file")
+    parser.add_argument("--max-p99", type=float, default=0.0,
+                        help="exit with 1 if the p99 latency in ms is higher")
+    args = parser.parse_args()
+
+    mixes = dict(MIXES)
+    for fileName in args.mix_file:
+        mixes[os.path.splitext(os.path.basename(fileName))[0]] = readMixFile(fileName)
+    mixNames = [name.strip() for name in args.mix.split(",") if name.strip()]
+    for name in mixNames:
+        if name not in mixes:
+            parser.error("unknown mix %s" % name)
+
+    simulator = None
+    if args.simulator:
+        simulator = startSimulator(args)
+        args.server_pid.append(simulator.pid)
+    usage = ServerUsage(args.server_pid) if args.server_pid else None
+
+    stopEvent = threading.Event()
+    sessions = [Session(num, mixNames[num % len(mixNames)], mixes, args, stopEvent)
+                for num in range(args.sessions)]
+    try:
+        for session in sessions:
+            session.start()
+
+        print("%8s %9s %9s %9s %9s %7s %7s %8s %8s" %
+              ("secs", "cmds/s", "p50 ms", "p99 ms", "p999 ms", "errors",
+               "active", "cpu %", "rss MB"))
+        # Results during the warm up are thrown away.
+        stopEvent.wait(args.warmup)
+        for session in sessions:
+            session.take()
+        if usage:
+            usage.sample()
+
+        start = time.monotonic()
+        end = start + args.duration
+        lastReport = start
+        summarySamples = array.array("q")
+        summaryErrors = 0
+        rows = []
+        while True:
+            now = time.monotonic()
+            wait = min(lastReport + args.interval, end) - now
+            if wait > 0:
+                time.sleep(wait)
+            now = time.monotonic()
+            samples = array.array("q")
+            errors = 0
+            for session in sessions:
+                sessionSamples, sessionErrors = session.take()
+                samples.extend(sessionSamples)
+                errors += sessionErrors
+            summarySamples.extend(samples)
+            summaryErrors += errors
+            ordered = sorted(samples)
+            cpu, rss = usage.sample() if usage else (float("nan"), float("nan"))
+            row = {"secs"   : round(now - start, 1),
+                   "rate"   : len(ordered) / max(now - lastReport, 1e-9),
+                   "p50"    : percentile(ordered, 50) / 1e6,
+                   "p99"    : percentile(ordered, 99) / 1e6,
+                   "p999"   : percentile(ordered, 99.9) / 1e6,
+                   "errors" : errors,
+                   "active" : sum(1 for session in sessions if session.is_alive()),
+                   "cpu"    : cpu,
+                   "rss"    : rss}
+            rows.append(row)
+            print("%8.1f %9.1f %9.3f %9.3f %9.3f %7d %7d %8.1f %8.1f" %
+                  (row["secs"], row["rate"], row["p50"], row["p99"],
+                   row["p999"], errors, row["active"], cpu, rss))
+            lastReport = now
+            if (now >= end) or (row["active"] == 0):
+                break
+    finally:
+        stopEvent.set()
+        for session in sessions:
+            session.join(args.timeout)
+        if simulator:
+            simulator.terminate()
+            simulator.wait()
+
+    for session in sessions:
+        if session.failure:
+            print("session %d (%s) failed, %s" %
+                  (session.sessionNum, session.mixName, session.failure))
+
+    ordered = sorted(summarySamples)
+    seconds = max(lastReport - start, 1e-9)
+    summary = {"sessions" : args.sessions,
+               "mix"      : mixNames,
+               "seconds"  : round(seconds, 1),
+               "commands" : len(ordered),
+               "rate"     : len(ordered) / seconds,
+               "p50"      : percentile(ordered, 50) / 1e6,
+               "p99"      : percentile(ordered, 99) / 1e6,
+               "p999"     : percentile(ordered, 99.9) / 1e6,
+               "max"      : (ordered[-1] / 1e6) if ordered else 0.0,
+               "errors"   : summaryErrors,
+               "failed"   : sum(1 for session in sessions if session.failure),
+               "intervals": rows}
+    print("\n%d sessions, %d commands in %.1f s: %.1f cmds/s, p50 %.3f ms, "
+          "p99 %.3f ms, p999 %.3f ms, max %.3f ms, %d errors" %
+          (summary["sessions"], summary["commands"], summary["seconds"],
+           summary["rate"], summary["p50"], summary["p99"], summary["p999"],
+           summary["max"], summary["errors"]))
+
+    if args.per_command:
+        commandNs = {}
+        commandErr = {}
+        for session in sessions:
+            for command, samples in session.commandNs.items():
+                commandNs.setdefault(command, array.array("q")).extend(samples)
+            for command, errors in session.commandErr.items():
+                commandErr[command] = commandErr.get(command, 0) + errors
+        print("\n%-60s %8s %9s %9s %7s" %
+              ("command", "count", "p50 ms", "p99 ms", "errors"))
+        summary["commands_detail"] = {}
+        for command, samples in sorted(commandNs.items(),
+                                       key = lambda item: -len(item[1])):
+            ordered = sorted(samples)
+            name = command.decode(errors = "replace")
+            print("%-60s %8d %9.3f %9.3f %7d" %
+                  (name[:60], len(ordered), percentile(ordered, 50) / 1e6,
+                   percentile(ordered, 99) / 1e6, commandErr.get(command, 0)))
+            summary["commands_detail"][name] = {
+                "count"  : len(ordered),
+                "p50"    : percentile(ordered, 50) / 1e6,
+                "p99"    : percentile(ordered, 99) / 1e6,
+                "errors" : commandErr.get(command, 0)}
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent = 1)
+
+    print("python %s, %s" % (sys.version.split()[0], sys.platform))
+    if (args.max_p99 > 0) and (summary["p99"] > args.max_p99):
+        print("p99 %.3f ms is over the limit of %.3f ms" %
+              (summary["p99"], args.max_p99))
+        return 1
+    if summary["failed"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
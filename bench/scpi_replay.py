@@ -0,0 +1,337 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   scpi_replay.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Replays command logs recorded by the SCPI server (SCPI.py --record DIR)
+#    against a server, each log on its own session, at the recorded speed or
+#    faster, and compares the responses with the recording:
+#
+#        python3 bench/scpi_replay.py --host 10.0.0.5 recordings/
+#        python3 bench/scpi_replay.py --simulator --speed 0 scpirec_*.bin
+#
+#    --speed 2 replays twice as fast as recorded, --speed 0 sends each
+#    command as soon as the last one is answered. Passwords aren't recorded,
+#    so LOGIN uses --user and --password, as does a session that was logged
+#    in by autologin. SYSTem:AUTOLOGIN:DETails isn't replayed.
+#
+#    The round trip times measured by the replay include the network and the
+#    client, while the recorded times are only the server's, from receiving
+#    a command to sending its response. They are reported side by side, not
+#    compared. To compare the server times, run the server being replayed
+#    against with --record and replay both recordings with --speed 0.
+#
+###############################################################################
+
+import argparse
+import array
+import json
+import os
+import socket
+import ssl
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from CommandLog import COMMAND_LOG_AUTOLOGIN
+from CommandLog import MASKED_LOGIN
+from CommandLog import maskedCommandType
+from CommandLog import readCommandLog
+from scpi_load import ResponseReader
+from scpi_load import isErrorResponse
+from scpi_load import percentile
+from scpi_load import startSimulator
+
+
+def commandName(command):
+    '''Returns the command without its parameters, in upper case, to group
+    the latencies by.
+    '''
+    return command.split(b" ", 1)[0].upper()
+
+
+class ReplaySession(threading.Thread):
+    '''This thread replays one command log on its own session.
+
+    Args:
+        logNum (int): Number of the log, for the report.
+        fileName (string): The log file.
+        header (CommandLogHeader): Header of the log.
+        records (list): CommandRecord of each command.
+        startDelay (float): Seconds from the start of the replay to the
+                            start of this log, at the recorded speed.
+        args (Namespace): Command line arguments.
+    '''
+
+    def __init__(self, logNum, fileName, header, records, startDelay, args):
+        threading.Thread.__init__(self)
+        self.logNum      = logNum
+        self.fileName    = fileName
+        self.header      = header
+        self.records     = records
+        self.startDelay  = startDelay
+        self.args        = args
+        self.startTime   = None
+        self.samples     = array.array("q")  # Round trip ns of each answered command
+        self.recorded    = array.array("q")  # Recorded server ns of the same
+        self.commandNs   = {}                # ([round trip], [recorded]) by name
+        self.sent        = 0
+        self.skipped     = 0
+        self.newErrors   = 0
+        self.changed     = 0
+        self.maxLag      = 0.0               # Most seconds behind the recording
+        self.failure     = None
+        self.daemon      = True
+
+    def _connect(self):
+        sock = socket.create_connection((self.args.host, self.args.port),
+                                        timeout = self.args.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.args.ssl:
+            # The controller has a self signed certificate.
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            sock = context.wrap_socket(sock)
+        return sock
+
+    def _waitUntil(self, offset):
+        # Sleep until offset seconds, at the recorded speed, after the start
+        # of the replay.
+        if self.args.speed <= 0:
+            return
+        due = self.startTime + offset / self.args.speed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            self.maxLag = max(self.maxLag, -delay)
+
+    def run(self):
+        login = b"LOGIN %s %s" % (self.args.user.encode(),
+                                  self.args.password.encode())
+        self._waitUntil(self.startDelay)
+        try:
+            sock = self._connect()
+        except OSError as error:
+            self.failure = "connect: %s" % error
+            return
+        reader = ResponseReader(sock)
+        try:
+            if self.header.flags & COMMAND_LOG_AUTOLOGIN:
+                sock.sendall(login + b"\n")
+                reader.read()
+
+            for record in self.records:
+                command = record.command
+                maskType, parameters = maskedCommandType(command)
+                if maskType is not None:
+                    if maskType != MASKED_LOGIN:
+                        self.skipped += 1
+                        continue
+                    command = login
+                self._waitUntil(self.startDelay + record.offset / 1e6)
+                start = time.perf_counter_ns()
+                sock.sendall(command + b"\n")
+                self.sent += 1
+                if record.response:
+                    # Only the commands that had a response are timed, as
+                    # there is nothing to wait for otherwise.
+                    response = reader.read()
+                    elapsed = time.perf_counter_ns() - start
+                    self.samples.append(elapsed)
+                    self.recorded.append(record.duration * 1000)
+                    if response != record.response:
+                        self.changed += 1
+                        if isErrorResponse(response) and \
+                           not isErrorResponse(record.response):
+                            self.newErrors += 1
+                    if self.args.per_command:
+                        replayed, recorded = self.commandNs.setdefault(
+                            commandName(command), (array.array("q"), array.array("q")))
+                        replayed.append(elapsed)
+                        recorded.append(record.duration * 1000)
+                if command.upper().startswith(b"CLOSE"):
+                    break
+        except (OSError, ConnectionError) as error:
+            self.failure = "session: %s" % error
+        finally:
+            sock.close()
+
+
+def findLogs(paths):
+    '''Returns the log files given, with the .bin files of any directories.
+    '''
+    fileNames = []
+    for path in paths:
+        if os.path.isdir(path):
+            fileNames += sorted(os.path.join(path, name)
+                                for name in os.listdir(path)
+                                if name.endswith(".bin"))
+        else:
+            fileNames.append(path)
+    return fileNames
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay recorded SCPI sessions against a server.")
+    parser.add_argument("logs", nargs="+",
+                        help="command log files, or directories of them")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address of the SCPI server")
+    parser.add_argument("--port", type=int, default=8090,
+                        help="port of the SCPI server, 8091 for SSL")
+    parser.add_argument("--ssl", action="store_true",
+                        help="connect with SSL/TLS")
+    parser.add_argument("--user", default="admin",
+                        help="user for the recorded LOGIN commands")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="times faster than recorded, 0 for as fast as "
+                             "the server answers")
+    parser.add_argument("--per-command", action="store_true",
+                        help="also report the latency of each command")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="seconds to wait for a response")
+    parser.add_argument("--simulator", action="store_true",
+                        help="start the server on the veexlib simulator")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="simulator round trip milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="simulator round trip jitter milliseconds")
+    parser.add_argument("--card", action="append",
+                        help="simulator card, repeat for more slots")
+    parser.add_argument("--json",
+                        help="write the summary to this file")
+    parser.add_argument("--max-p99", type=float, default=0.0,
+                        help="exit with 1 if the p99 round trip in ms is higher")
+    args = parser.parse_args()
+
+    logs = []
+    for fileName in findLogs(args.logs):
+        try:
+            header, records = readCommandLog(fileName)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        logs.append((fileName, header, records))
+    if not logs:
+        parser.error("no command logs found")
+
+    # The logs keep their recorded start times relative to the first one.
+    firstStart = min(header.startTime for fileName, header, records in logs)
+    sessions = [ReplaySession(num, fileName, header, records,
+                              header.startTime - firstStart, args)
+                for num, (fileName, header, records) in enumerate(logs)]
+
+    simulator = None
+    if args.simulator:
+        simulator = startSimulator(args)
+    try:
+        start = time.perf_counter()
+        for session in sessions:
+            session.startTime = start
+            session.start()
+        for session in sessions:
+            session.join()
+        seconds = max(time.perf_counter() - start, 1e-9)
+    finally:
+        if simulator:
+            simulator.terminate()
+            simulator.wait()
+
+    print("%-40s %7s %7s %9s %9s %9s %7s %7s" %
+          ("log", "sent", "timed", "rtt p50", "rtt p99", "srv p50", "changed",
+           "errors"))
+    samples = array.array("q")
+    recorded = array.array("q")
+    for session in sessions:
+        ordered = sorted(session.samples)
+        print("%-40s %7d %7d %9.3f %9.3f %9.3f %7d %7d" %
+              (os.path.basename(session.fileName)[-40:], session.sent,
+               len(ordered), percentile(ordered, 50) / 1e6,
+               percentile(ordered, 99) / 1e6,
+               percentile(sorted(session.recorded), 50) / 1e6,
+               session.changed, session.newErrors))
+        if session.failure:
+            print("    failed, %s" % session.failure)
+        samples.extend(session.samples)
+        recorded.extend(session.recorded)
+
+    ordered = sorted(samples)
+    orderedRecorded = sorted(recorded)
+    summary = {"logs"        : len(sessions),
+               "speed"       : args.speed,
+               "seconds"     : round(seconds, 3),
+               "sent"        : sum(session.sent for session in sessions),
+               "skipped"     : sum(session.skipped for session in sessions),
+               "timed"       : len(ordered),
+               "p50"         : percentile(ordered, 50) / 1e6,
+               "p99"         : percentile(ordered, 99) / 1e6,
+               "p999"        : percentile(ordered, 99.9) / 1e6,
+               "max"         : (ordered[-1] / 1e6) if ordered else 0.0,
+               "recorded_p50": percentile(orderedRecorded, 50) / 1e6,
+               "recorded_p99": percentile(orderedRecorded, 99) / 1e6,
+               "changed"     : sum(session.changed for session in sessions),
+               "new_errors"  : sum(session.newErrors for session in sessions),
+               "max_lag"     : max(session.maxLag for session in sessions),
+               "failed"      : sum(1 for session in sessions if session.failure)}
+    summary["rate"] = summary["sent"] / seconds
+    print("\n%d logs, %d commands in %.1f s: %.1f cmds/s, round trip p50 "
+          "%.3f ms, p99 %.3f ms, p999 %.3f ms, max %.3f ms" %
+          (summary["logs"], summary["sent"], summary["seconds"],
+           summary["rate"], summary["p50"], summary["p99"], summary["p999"],
+           summary["max"]))
+    print("recorded server p50 %.3f ms, p99 %.3f ms, %d changed responses, "
+          "%d new errors, %.3f s most behind the recording" %
+          (summary["recorded_p50"], summary["recorded_p99"],
+           summary["changed"], summary["new_errors"], summary["max_lag"]))
+
+    if args.per_command:
+        commandNs = {}
+        for session in sessions:
+            for name, (replayed, recorded) in session.commandNs.items():
+                total = commandNs.setdefault(name, (array.array("q"), array.array("q")))
+                total[0].extend(replayed)
+                total[1].extend(recorded)
+        print("\n%-40s %8s %9s %9s %9s %9s" %
+              ("command", "count", "rtt p50", "rtt p99", "srv p50", "srv p99"))
+        summary["commands_detail"] = {}
+        for name, (replayed, recorded) in sorted(commandNs.items(),
+                                                 key = lambda item: -len(item[1][0])):
+            replayed = sorted(replayed)
+            recorded = sorted(recorded)
+            detail = {"count"       : len(replayed),
+                      "p50"         : percentile(replayed, 50) / 1e6,
+                      "p99"         : percentile(replayed, 99) / 1e6,
+                      "recorded_p50": percentile(recorded, 50) / 1e6,
+                      "recorded_p99": percentile(recorded, 99) / 1e6}
+            summary["commands_detail"][name.decode(errors = "replace")] = detail
+            print("%-40s %8d %9.3f %9.3f %9.3f %9.3f" %
+                  (name.decode(errors = "replace")[:40], detail["count"],
+                   detail["p50"], detail["p99"], detail["recorded_p50"],
+                   detail["recorded_p99"]))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent = 1)
+
+    print("python %s, %s" % (sys.version.split()[0], sys.platform))
+    if (args.max_p99 > 0) and (summary["p99"] > args.max_p99):
+        print("p99 %.3f ms is over the limit of %.3f ms" %
+              (summary["p99"], args.max_p99))
+        return 1
+    if summary["failed"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   test_CommandLog.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Tests of the password masking and flushing of the command log.
+#
+#        python3 -m unittest discover tests
+#
+###############################################################################
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import veexlib
+except ImportError:
+    # ScpiSystem needs veexlib, the simulator will do for its command tree.
+    import veexsim
+    veexsim.install()
+from CommandLog import CommandRecorder
+from CommandLog import MASKED_AUTOLOGIN_DETAILS
+from CommandLog import MASKED_LOGIN
+from CommandLog import maskCommand
+from CommandLog import maskedCommandType
+from CommandLog import readCommandLog
+import ParseUtils
+import ScpiSystem
+
+
+class MaskCommandTest(unittest.TestCase):
+
+    def testLogin(self):
+        self.assertEqual(maskCommand(b"LOGIN admin secret"), b"LOGIN")
+        self.assertEqual(maskCommand(b"login admin secret"), b"login")
+
+    def testLoginTabs(self):
+        self.assertEqual(maskCommand(b"LOGIN\tadmin\tsecret"), b"LOGIN")
+        self.assertEqual(maskCommand(b"LOGIN \t admin  secret"), b"LOGIN")
+
+    def testAutoLoginForms(self):
+        for command in (b"SYSTem:AUTOLOGIN:DETails",
+                        b"SYST:AUTOLOGIN:DET",
+                        b"SYSTE:AUTOLOGIN:DET",
+                        b"SYSTEM:AUTOLOGIN:DETAIL",
+                        b"syst:autologin:details",
+                        b"SyStEm:AuToLoGiN:dEt"):
+            for separator in (b" ", b"\t", b" \t "):
+                masked = maskCommand(command + separator + b"user" +
+                                     separator + b"secret")
+                self.assertEqual(masked, command)
+
+    def testUnmasked(self):
+        for command in (b"*IDN?",
+                        b"SYST:AUTOLOGIN:USER?",
+                        b"SYST:AUTOLOGIN:VAL TRUE",
+                        b"SYS:AUTOLOGIN:DET user secret",
+                        b"INST TESTPORT1"):
+            self.assertEqual(maskCommand(command), command)
+
+    def testMaskedType(self):
+        self.assertEqual(maskedCommandType(b"LOGIN")[0], MASKED_LOGIN)
+        self.assertEqual(maskedCommandType(b"SYSTE:AUTOLOGIN:DET")[0],
+                         MASKED_AUTOLOGIN_DETAILS)
+        self.assertIsNone(maskedCommandType(b"*IDN?")[0])
+
+    def testSameHandlerAsScpiSystem(self):
+        # Every masked form must be the command SYSTem handles as the
+        # autologin details, and the other AUTOLOGIN commands must not be.
+        for command in (b"SYSTE:AUTOLOGIN:DET\tuser\tsecret",
+                        b"syst:autologin:details user secret"):
+            callback, parameters = ParseUtils.searchCommandTree(
+                ParseUtils.preParseCommand(command), ScpiSystem.commandTreeRoot)
+            self.assertIs(callback, ScpiSystem.ScpiSystem.setAutoLoginDetails)
+            self.assertEqual(maskedCommandType(command)[0], MASKED_AUTOLOGIN_DETAILS)
+
+
+class CommandRecorderTest(unittest.TestCase):
+
+    def testFlushedWhileOpen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = CommandRecorder(directory, b"TCP", 1)
+            recorder.record(recorder.startNs, b"*IDN?", b"VeEX\n")
+            recorder.record(recorder.startNs, b"LOGIN\tadmin\tsecret", b"")
+
+            # Read before close, as a killed server never closes it.
+            header, records = readCommandLog(recorder.fileName)
+            recorder.close()
+
+        self.assertEqual(header.sessionType, b"TCP")
+        self.assertEqual([record.command for record in records],
+                         [b"*IDN?", b"LOGIN"])
+        self.assertEqual(records[0].response, b"VeEX\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   test_EnumCodec.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Tests of the conversions between veexlib enums and SCPI text.
+#
+#        python3 -m unittest discover tests
+#
+###############################################################################
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import veexlib
+except ImportError:
+    # The codecs need the veexlib enums, the simulator has them.
+    import veexsim
+    veexsim.install()
+    import veexlib
+from EnumCodec import CardNameCodec
+from EnumCodec import ClockTypeCodec
+from EnumCodec import EnumCodec
+from EnumCodec import PpNameCodec
+
+
+class EnumCodecTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        for codec in (ClockTypeCodec, PpNameCodec, CardNameCodec):
+            for text in codec.fromText:
+                self.assertEqual(codec.encode(codec.decode(text)), text)
+
+    def testEnumRoundTrip(self):
+        for codec in (ClockTypeCodec, CardNameCodec):
+            for enum in codec.toText:
+                self.assertEqual(codec.decode(codec.encode(enum)), enum)
+
+    def testFirstPairUsed(self):
+        # Both MPM-100 cards are MPM100MLD, which decodes to the first.
+        self.assertEqual(PpNameCodec.encode((veexlib.PROTO_PHY, veexlib.CARD_MPM100AR)),
+                         b"MPM100MLD")
+        self.assertEqual(PpNameCodec.decode(b"MPM100MLD"),
+                         (veexlib.PROTO_PHY, veexlib.CARD_MPM100G))
+
+    def testLongestPrefix(self):
+        self.assertEqual(ClockTypeCodec.decode(b"BITS/SETS"), veexlib.CLOCK_BITS_SETS)
+        self.assertEqual(ClockTypeCodec.decode(b"BITS"), veexlib.CLOCK_BITS)
+        self.assertEqual(ClockTypeCodec.decode(b"bits"), veexlib.CLOCK_BITS)
+        self.assertEqual(ClockTypeCodec.decode(b"INTERNAL"), veexlib.CLOCK_INTERNAL)
+        self.assertEqual(ClockTypeCodec.decode(b"LOOPED"), veexlib.CLOCK_RECOVERED)
+
+    def testDefaults(self):
+        self.assertEqual(ClockTypeCodec.decode(b"IN"), None)
+        self.assertEqual(ClockTypeCodec.decode(b"XYZ", b"BAD"), b"BAD")
+        self.assertEqual(ClockTypeCodec.encode(-1), None)
+        self.assertEqual(ClockTypeCodec.encode(-1, b"UNKNOWN"), b"UNKNOWN")
+
+    def testDuplicates(self):
+        codec = EnumCodec([(1, b"ON"), (1, b"ENABLE"), (2, b"ON")])
+        self.assertEqual(codec.encode(1), b"ON")
+        self.assertEqual(codec.decode(b"ON"), 1)
+        self.assertEqual(codec.decode(b"ENABLED"), 1)
+        self.assertEqual(codec.encode(2), b"ON")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   test_EventLog.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Tests of the FETC:EVENTLOG? cursor, read from a simulated PP.
+#
+#        python3 -m unittest discover tests
+#
+###############################################################################
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import veexsim
+if "veexlib" not in sys.modules:
+    # The events are added to the log of a simulated PP.
+    veexsim.install()
+import veexlib
+from EventLog import EVENTLOG_MAX_KEPT
+from EventLog import EventLog
+from ScpiEngine import ScpiEngine
+from veexsim.chassis import EVENT_LOG_STORED
+
+
+def parseFetch(response):
+    '''Returns the last id and the (id, event, count) of each entry of a
+    FETC:EVENTLOG? response.
+    '''
+    rows = response.split(b";")
+    lastId, count = rows[0].split(b",")
+    entries = []
+    for row in rows[1:]:
+        fields = row.split(b",")
+        entries.append((int(fields[0]), fields[1], int(fields[2])))
+    assert len(entries) == int(count)
+    return int(lastId), entries
+
+
+@unittest.skipUnless(veexlib is veexsim, "needs the veexlib simulator")
+class EventLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = ScpiEngine(b"TCP", 1, "localhost")
+        self.engine.processCommand(b"LOGIN admin admin")
+        self.engine.processCommand(b"INST MPM100MLD")
+        self.pp = self.engine.globals.veexPhy
+        self.clearPpLog()
+        self.eventLog = EventLog()
+
+    def tearDown(self):
+        self.engine.processCommand(b"LOGOUT")
+
+    def clearPpLog(self):
+        state = self.pp._state
+        with state.eventsLock:
+            state.events.clear()
+            state.totalEvents = 0
+
+    def addEvents(self, first, count):
+        for eventId in range(first, first + count):
+            self.pp._state.addEvent(eventId)
+
+    def fetch(self, sinceId, maxEntries = 1024):
+        return parseFetch(self.eventLog.fetch(self.pp, sinceId, maxEntries))
+
+    def testEmpty(self):
+        self.assertEqual(self.fetch(0), (0, []))
+        self.assertEqual(self.fetch(5), (5, []))
+
+    def testConsecutiveIds(self):
+        self.addEvents(10, 3)
+        self.assertEqual(self.fetch(0), (3, [(1, b"10", 1), (2, b"11", 1), (3, b"12", 1)]))
+        self.assertEqual(self.fetch(3), (3, []))
+        self.addEvents(20, 1)
+        self.assertEqual(self.fetch(3), (4, [(4, b"20", 1)]))
+        self.assertEqual(self.fetch(2), (4, [(3, b"12", 1), (4, b"20", 1)]))
+
+    def testMaxEntries(self):
+        self.addEvents(10, 5)
+        self.assertEqual(self.fetch(0, 2), (2, [(1, b"10", 1), (2, b"11", 1)]))
+        self.assertEqual(self.fetch(2, 2), (4, [(3, b"12", 1), (4, b"13", 1)]))
+        self.assertEqual(self.fetch(4, 2), (5, [(5, b"14", 1)]))
+
+    def testPpLogCleared(self):
+        self.addEvents(10, 2)
+        self.assertEqual(self.fetch(0)[0], 2)
+        self.clearPpLog()
+        self.addEvents(30, 1)
+        self.assertEqual(self.fetch(2), (3, [(3, b"30", 1)]))
+
+    def testPpRecordsLost(self):
+        self.addEvents(100, EVENT_LOG_STORED + 10)
+        lastId, entries = self.fetch(0, 3)
+        self.assertEqual(entries, [(1, b"LOST", 10), (2, b"110", 1), (3, b"111", 1)])
+        lastId, entries = self.fetch(3)
+        self.assertEqual(lastId, EVENT_LOG_STORED + 1)
+        self.assertEqual(len(entries), EVENT_LOG_STORED - 2)
+
+    def testSessionEntriesDropped(self):
+        self.addEvents(100, 1)
+        self.assertEqual(self.fetch(0)[0], 1)
+        # Read more than twice the kept entries while the client stays at 1,
+        # a block at a time so the PP doesn't drop any.
+        while self.eventLog.firstSeq == 1:
+            self.addEvents(1000, EVENT_LOG_STORED)
+            self.fetch(1, 1)
+        firstSeq = self.eventLog.firstSeq
+        self.assertGreater(firstSeq, 2)
+        self.assertEqual(len(self.eventLog.entries), EVENTLOG_MAX_KEPT)
+
+        lastId, entries = self.fetch(1, 2)
+        self.assertEqual(entries[0], (firstSeq - 1, b"LOST", firstSeq - 2))
+        self.assertEqual(entries[1][0], firstSeq)
+        self.assertEqual(lastId, firstSeq)
+
+    def testFetchQuery(self):
+        self.addEvents(10, 2)
+        response = self.engine.processCommand(b"FETC:EVENTLOG? 0,10")
+        lastId, entries = parseFetch(response)
+        self.assertEqual(entries[-1][1], b"11")
+        self.assertEqual(parseFetch(self.engine.processCommand(
+            b"FETC:EVENTLOG? %d,10" % lastId)), (lastId, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   test_ParseUtils.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Tests of the <n> placeholder commands of the command tree.
+#
+#        python3 -m unittest discover tests
+#
+###############################################################################
+
+import functools
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import veexlib
+except ImportError:
+    # ScpiOtn needs veexlib, the simulator will do for its command tree.
+    import veexsim
+    veexsim.install()
+from ParseUtils import CommandTableEntry
+import ParseUtils
+import ScpiOtn
+
+
+def plainHandler(self, parameters):
+    return b"PLAIN"
+
+
+def indexHandler(self, parameters, index):
+    return b"INDEX %d" % index
+
+
+class MatchSubCommandTest(unittest.TestCase):
+
+    def testNoPlaceholder(self):
+        self.assertEqual(ParseUtils.matchSubCommand(b"RES", b"RES"), (True, None))
+        self.assertEqual(ParseUtils.matchSubCommand(b"RES", b"RESULTS"), (True, None))
+        self.assertEqual(ParseUtils.matchSubCommand(b"RES", b"RX"), (False, None))
+
+    def testPlaceholder(self):
+        self.assertEqual(ParseUtils.matchSubCommand(b"TCM<N>", b"TCM1"), (True, 1))
+        self.assertEqual(ParseUtils.matchSubCommand(b"TCM<N>", b"TCM12"), (True, 12))
+        self.assertEqual(ParseUtils.matchSubCommand(b"TCM<N>", b"TCM"), (False, None))
+        self.assertEqual(ParseUtils.matchSubCommand(b"TCM<N>", b"TCMX"), (False, None))
+        self.assertEqual(ParseUtils.matchSubCommand(b"TCM<N>", b"PM1"), (False, None))
+
+    def testTextAfterPlaceholder(self):
+        self.assertEqual(ParseUtils.matchSubCommand(b"LANE<N>BIP", b"LANE3BIP"), (True, 3))
+        self.assertEqual(ParseUtils.matchSubCommand(b"LANE<N>BIP", b"LANE3BIP8"), (True, 3))
+        self.assertEqual(ParseUtils.matchSubCommand(b"LANE<N>BIP", b"LANE3SKEW"), (False, None))
+
+
+class CommandTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = []
+        ParseUtils.processCommandTableIntoTree([
+            CommandTableEntry(b"RES:PLAIN?",          plainHandler),
+            CommandTableEntry(b"RES:TCM<n>:COUNt?",   indexHandler, range(1, 7)),
+            CommandTableEntry(b"RES:LANE<n>:COUNt?",  indexHandler),
+            ], self.root)
+
+    def search(self, command):
+        return ParseUtils.searchCommandTree(ParseUtils.preParseCommand(command),
+                                            self.root)
+
+    def testParseCommand(self):
+        self.assertEqual(ParseUtils.parseCommand(b"RES:TCM<n>:COUNt?"),
+                         [b"RES", b"TCM<N>", b"COUN?"])
+
+    def testPlainCallback(self):
+        callback, parameters = self.search(b"RES:PLAIN?")
+        self.assertIs(callback, plainHandler)
+        self.assertEqual(parameters, b"")
+
+    def testIndexBound(self):
+        callback, parameters = self.search(b"res:tcm4:count? 1,2")
+        self.assertIsInstance(callback, functools.partial)
+        self.assertIs(callback.func, indexHandler)
+        self.assertEqual(callback.keywords, {"index" : 4})
+        self.assertEqual(callback(None, parameters), b"INDEX 4")
+
+    def testIndexOutOfRange(self):
+        self.assertEqual(self.search(b"RES:TCM0:COUN?")[0], None)
+        self.assertEqual(self.search(b"RES:TCM7:COUN?")[0], None)
+        self.assertIsNotNone(self.search(b"RES:TCM6:COUN?")[0])
+
+    def testAnyIndex(self):
+        callback = self.search(b"RES:LANE19:COUN?")[0]
+        self.assertEqual(callback.keywords, {"index" : 19})
+
+    def testMissingIndex(self):
+        self.assertEqual(self.search(b"RES:TCM:COUN?")[0], None)
+
+    def testOtnTable(self):
+        callback = ParseUtils.searchCommandTree(
+            ParseUtils.preParseCommand(b"RES:TCM3:BEI:AVE?"),
+            ScpiOtn.commandTreeRoot)[0]
+        self.assertIs(callback.func, ScpiOtn.ScpiOtn.tcmBeiAvgErrRate)
+        self.assertEqual(callback.keywords, {"index" : 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
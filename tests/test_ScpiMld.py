@@ -0,0 +1,179 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   test_ScpiMld.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Tests of the MLD result queries that keep per session state, run on a
+#    simulated PP.
+#
+#        python3 -m unittest discover tests
+#
+###############################################################################
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import veexsim
+if "veexlib" not in sys.modules:
+    # The results are set on a simulated PP.
+    veexsim.install()
+import veexlib
+from ScpiEngine import ScpiEngine
+from ScpiMld import FECANALYSIS_BINS
+
+
+@unittest.skipUnless(veexlib is veexsim, "needs the veexlib simulator")
+class MldTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = ScpiEngine(b"TCP", 1, "localhost")
+        self.command(b"LOGIN admin admin")
+        self.command(b"INST MPM100MLD")
+        self.stats = self.engine.globals.veexPcs.stats
+
+    def tearDown(self):
+        self.command(b"LOGOUT")
+
+    def command(self, command):
+        return self.engine.processCommand(command)
+
+
+class LaneDeltaTest(MldTestCase):
+
+    def setUp(self):
+        MldTestCase.setUp(self)
+        self.lanes = self.stats.rxVirtLaneCount
+        self.setBip8({})
+
+    def tearDown(self):
+        self.setBip8({})
+        MldTestCase.tearDown(self)
+
+    def setBip8(self, counts):
+        for lane in range(self.lanes):
+            self.stats.bip8[lane].count = counts.get(lane, 0)
+
+    def testFirstQueryFromZero(self):
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"NONE")
+        self.setBip8({1 : 5, 3 : 2})
+        self.command(b"INST MPM100MLD")
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"1=5,3=2")
+
+    def testChangedLanesOnly(self):
+        self.setBip8({1 : 5, 3 : 2})
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"1=5,3=2")
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"NONE")
+        self.setBip8({1 : 5, 3 : 9})
+        self.assertEqual(self.command(b"res:lane:delta? bip8"), b"3=7")
+
+    def testFieldsKeptApart(self):
+        self.setBip8({0 : 4})
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"0=4")
+        self.assertEqual(self.command(b"RES:LANE:DELTA? SYNCHDR"), b"NONE")
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"NONE")
+
+    def testRestartReportsNewCount(self):
+        self.setBip8({2 : 100})
+        self.command(b"RES:LANE:DELTA? BIP8")
+        # The results were restarted, the count went down.
+        self.setBip8({2 : 30})
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"2=30")
+        self.setBip8({2 : 31})
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"2=1")
+
+    def testResetByInst(self):
+        self.setBip8({2 : 100})
+        self.command(b"RES:LANE:DELTA? BIP8")
+        self.command(b"INST MPM100MLD")
+        self.assertEqual(self.command(b"RES:LANE:DELTA? BIP8"), b"2=100")
+
+    def testBadField(self):
+        self.assertTrue(self.command(b"RES:LANE:DELTA?").startswith(b"-109"))
+        self.assertTrue(self.command(b"RES:LANE:DELTA? NOTAFIELD").startswith(b"-224"))
+
+
+class FecDistributionTest(MldTestCase):
+
+    def setUp(self):
+        MldTestCase.setUp(self)
+        self.setCounts([0] * FECANALYSIS_BINS)
+
+    def tearDown(self):
+        self.setCounts([0] * FECANALYSIS_BINS)
+        MldTestCase.tearDown(self)
+
+    def setCounts(self, counts):
+        self.stats.fecCorrectableSymbolN[:FECANALYSIS_BINS] = counts
+
+    def ageSnapshots(self, seconds):
+        snapshots = self.engine.scpiMld.fecSnapshots
+        for position, (snapshotTime, counts) in enumerate(snapshots):
+            snapshots[position] = (snapshotTime - seconds, counts)
+
+    def distribution(self, window = None):
+        command = b"RES:FECANALYSIS:DISTribution?"
+        if window is not None:
+            command += b" %d" % window
+        return self.command(command).split(b";")
+
+    def testWholeCount(self):
+        self.setCounts([6, 3, 1] + [0] * (FECANALYSIS_BINS - 3))
+        groups = self.distribution()
+        self.assertEqual(len(groups), 4)
+        self.assertEqual(groups[0].split(b",")[:4], [b"6", b"3", b"1", b"0"])
+        self.assertEqual(groups[1].split(b",")[:3], [b"60.000000", b"30.000000", b"10.000000"])
+        self.assertEqual(groups[2].split(b",")[:3], [b"60.000000", b"90.000000", b"100.000000"])
+        self.assertEqual(groups[3].split(b",")[:4],
+                         [b"1.000e+00", b"4.000e-01", b"1.000e-01", b"0.000e+00"])
+
+    def testNoBaseline(self):
+        self.setCounts([5] * FECANALYSIS_BINS)
+        groups = self.distribution(10)
+        self.assertEqual(groups[0], b",".join([b"5"] * FECANALYSIS_BINS))
+        self.assertEqual(groups[4], b"NOBASELINE")
+
+    def testWindowBaseline(self):
+        self.setCounts([5] * FECANALYSIS_BINS)
+        self.distribution()
+        self.ageSnapshots(20)
+        self.setCounts([7] * FECANALYSIS_BINS)
+        self.distribution()
+        self.ageSnapshots(5)
+
+        # The newest query at least 10 seconds ago is the first one.
+        self.setCounts([8] * FECANALYSIS_BINS)
+        groups = self.distribution(10)
+        self.assertEqual(groups[0], b",".join([b"3"] * FECANALYSIS_BINS))
+        self.assertAlmostEqual(float(groups[4]), 25.0, delta = 1.0)
+
+        # And at least 4 seconds ago the second one.
+        groups = self.distribution(4)
+        self.assertEqual(groups[0], b",".join([b"1"] * FECANALYSIS_BINS))
+        self.assertAlmostEqual(float(groups[4]), 5.0, delta = 1.0)
+
+        # Nothing is old enough.
+        self.assertEqual(self.distribution(60)[4], b"NOBASELINE")
+
+    def testRestartDropsBaseline(self):
+        self.setCounts([5] * FECANALYSIS_BINS)
+        self.distribution()
+        self.ageSnapshots(20)
+        self.setCounts([2] * FECANALYSIS_BINS)
+        groups = self.distribution(10)
+        self.assertEqual(groups[0], b",".join([b"2"] * FECANALYSIS_BINS))
+        self.assertEqual(groups[4], b"NOBASELINE")
+
+    def testBadWindow(self):
+        self.assertTrue(self.command(b"RES:FECANALYSIS:DIST? -1").startswith(b"-"))
+
+
+if __name__ == "__main__":
+    unittest.main()
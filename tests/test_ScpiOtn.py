@@ -0,0 +1,105 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   test_ScpiOtn.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Tests of the RES:OHCAPture:DATA? encodings, run on a simulated PP.
+#
+#        python3 -m unittest discover tests
+#
+###############################################################################
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import veexsim
+if "veexlib" not in sys.modules:
+    # The captured overhead is set on a simulated PP.
+    veexsim.install()
+import veexlib
+from ScpiEngine import ScpiEngine
+from ScpiOtn import OH_CAPTURE_DATA_SIZE
+from ScpiOtn import OH_CAPTURE_MAX_RUN
+
+
+def runLengthDecode(encoded):
+    '''Returns the bytes of (count, value) byte pairs.
+    '''
+    decoded = bytearray()
+    for position in range(0, len(encoded), 2):
+        decoded += bytes([encoded[position + 1]]) * encoded[position]
+    return bytes(decoded)
+
+
+def blockData(response):
+    '''Returns the data of an IEEE 488.2 definite length block.
+    '''
+    digits = int(response[1:2])
+    length = int(response[2:2 + digits])
+    data = response[2 + digits:]
+    assert len(data) == length
+    return data
+
+
+@unittest.skipUnless(veexlib is veexsim, "needs the veexlib simulator")
+class OhCaptureDataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = ScpiEngine(b"TCP", 1, "localhost")
+        self.command(b"LOGIN admin admin")
+        self.command(b"INST MPM100OTN")
+        self.stats = self.engine.globals.veexOtn.stats
+        self.encode = self.engine.scpiOtn._runLengthEncode
+
+    def tearDown(self):
+        self.stats.captureDataState = 0
+        self.command(b"LOGOUT")
+
+    def command(self, command):
+        return self.engine.processCommand(command)
+
+    def setCapture(self, data):
+        self.stats.captureData[:] = list(data)
+        self.stats.captureDataState = veexlib.OTN_OH_OH_CAPTURE_DONE
+
+    def testRuns(self):
+        self.assertEqual(self.encode(b""), b"")
+        self.assertEqual(self.encode(b"\x05"), b"\x01\x05")
+        self.assertEqual(self.encode(b"\x05\x05\x05\x00\x05"),
+                         b"\x03\x05\x01\x00\x01\x05")
+
+    def testLongRunSplit(self):
+        data = b"\xf6" * (OH_CAPTURE_MAX_RUN + 10)
+        encoded = self.encode(data)
+        self.assertEqual(encoded, bytes([OH_CAPTURE_MAX_RUN, 0xf6, 10, 0xf6]))
+        self.assertEqual(runLengthDecode(encoded), data)
+
+    def testRoundTrip(self):
+        data = bytes(((frame // 7) * 31) & 0xFF for frame in range(1000))
+        self.assertEqual(runLengthDecode(self.encode(data)), data)
+
+    def testQuery(self):
+        data = b"\x01" * 100 + b"\x02" * (OH_CAPTURE_DATA_SIZE - 100)
+        self.setCapture(data)
+        self.assertEqual(blockData(self.command(b"RES:OHCAPture:DATA?")), data)
+        self.assertEqual(blockData(self.command(b"RES:OHCAP:DATA? RAW")), data)
+        self.assertEqual(blockData(self.command(b"RES:OHCAP:DATA? rle")),
+                         bytes([100, 1, OH_CAPTURE_DATA_SIZE - 100, 2]))
+
+    def testQueryErrors(self):
+        self.stats.captureDataState = 0
+        self.assertTrue(self.command(b"RES:OHCAP:DATA? RLE").startswith(b"+931"))
+        self.setCapture(bytes(OH_CAPTURE_DATA_SIZE))
+        self.assertTrue(self.command(b"RES:OHCAP:DATA? XYZ").startswith(b"-224"))
+
+
+if __name__ == "__main__":
+    unittest.main()
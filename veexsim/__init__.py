@@ -0,0 +1,60 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   __init__.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Offline simulator of veexlib for benchmarking and CI. It has the chassis,
+#    cards, ports, PPs and the sets, stats and allowedSets objects with the
+#    field shapes the SCPI handlers use, and a configurable latency for each
+#    round trip to the simulated server.
+#
+#    The simulator is only used when asked for. install() makes it the
+#    veexlib module before the SCPI modules are imported, or run the SCPI
+#    server on it with:
+#
+#        python3 -m veexsim [--latency ms] [--jitter ms] [ipAddress]
+#
+###############################################################################
+
+import sys
+
+from veexsim import constants
+from veexsim.chassis import CARD_MODELS
+from veexsim.chassis import configure
+from veexsim.chassis import connect
+from veexsim.chassis import roundTrips
+from veexsim.errors import ConnectFailed
+from veexsim.errors import Exceptions
+from veexsim.errors import LoginFailed
+from veexsim.errors import PortNotFound
+from veexsim.errors import ProtocolNak
+from veexsim.errors import ProtocolNotLocked
+from veexsim.errors import ServerException
+
+
+def __getattr__(name):
+    # veexlib enum constants, ie. veexlib.PROTO_OTN, are made on first use.
+    if constants.isConstantName(name):
+        return constants.value(name)
+    raise AttributeError("module 'veexsim' has no attribute '%s'" % name)
+
+
+def install():
+    '''Makes the simulator the veexlib module, so import veexlib gives the
+    simulator. Must be called before the SCPI modules are imported.
+
+    Raises:
+        RuntimeError: The real veexlib has already been imported.
+    '''
+    module = sys.modules[__name__]
+    current = sys.modules.get("veexlib")
+    if (current is not None) and (current is not module):
+        raise RuntimeError("veexlib is already imported from %s" %
+                           getattr(current, "__file__", "?"))
+    sys.modules["veexlib"] = module
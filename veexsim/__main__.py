@@ -0,0 +1,100 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   __main__.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Runs the SCPI TCP/IP server on the veexlib simulator, ie.
+#
+#        python3 -m veexsim --latency 2 --jitter 0.5 --card MPM100G
+#
+#    Latency and jitter are milliseconds per round trip to the server. The
+#    SSL port is only opened when host.cert and host.key are present, as
+#    they aren't kept with the source. With --workers each worker process
+#    simulates its own chassis, so locks aren't seen across workers.
+#
+###############################################################################
+
+import argparse
+import os
+import sys
+import time
+
+import veexsim
+
+
+def main():
+    parser = argparse.ArgumentParser(prog = "python3 -m veexsim",
+                                     description = "Run SCPI on the veexlib simulator.")
+    parser.add_argument("--latency", type = float, default = 0.0,
+                        help = "milliseconds of each round trip to the server")
+    parser.add_argument("--jitter", type = float, default = 0.0,
+                        help = "standard deviation of the round trip in milliseconds")
+    parser.add_argument("--seed", type = int, default = None,
+                        help = "seed of the jitter")
+    parser.add_argument("--card", action = "append", default = None,
+                        choices = sorted(veexsim.CARD_MODELS),
+                        help = "card in the next slot, repeat for more slots")
+    parser.add_argument("--port", type = int, default = 8090,
+                        help = "TCP/IP port to listen on")
+    parser.add_argument("--ssl-port", type = int, default = 8091,
+                        help = "SSL port to listen on if host.cert is present")
+    parser.add_argument("--record", metavar = "DIR", default = None,
+                        help = "record the commands of each session to DIR")
+    parser.add_argument("--pool", metavar = "N", type = int, default = None,
+                        help = "idle chassis connections kept for each user")
+    parser.add_argument("--workers", metavar = "N", type = int, default = 1,
+                        help = "worker processes sharing the ports")
+    parser.add_argument("ipAddress", nargs = "?", default = "localhost",
+                        help = "address of the simulated protobufServer")
+    args = parser.parse_args()
+
+    veexsim.configure(latency = args.latency / 1000.0,
+                      jitter = args.jitter / 1000.0,
+                      seed = args.seed,
+                      cards = args.card)
+    veexsim.install()
+
+    # The SCPI modules and the autologin and certificate files are in the
+    # directory above the package.
+    scpiDir = os.path.dirname(os.path.dirname(os.path.abspath(veexsim.__file__)))
+    recordDir = os.path.abspath(args.record) if args.record else None
+    os.chdir(scpiDir)
+    sys.path.insert(0, scpiDir)
+    import ConnectionPool
+    import TcpipServer
+
+    TcpipServer.recordDir = recordDir
+    if args.pool is not None:
+        ConnectionPool.connectionPool.maxIdle = args.pool
+
+    def runServer(workerIndex):
+        reusePort = args.workers > 1
+        TcpipServer.tcpipPortListen(port = args.port, ipAddress = args.ipAddress,
+                                    reusePort = reusePort)
+        if os.path.exists("host.cert") and os.path.exists("host.key"):
+            TcpipServer.tcpipPortListen(port = args.ssl_port,
+                                        ipAddress = args.ipAddress, useSsl = True,
+                                        reusePort = reusePort)
+        ConnectionPool.warmForAutoLogin(args.ipAddress)
+
+        # Wait until program is forced to exit.
+        try:
+            while True:
+                time.sleep(2.0)
+        except (TcpipServer.TcpipServerExit, KeyboardInterrupt):
+            pass
+
+    if args.workers > 1:
+        TcpipServer.runWorkers(args.workers, runServer)
+    else:
+        runServer(0)
+
+
+if __name__ == "__main__":
+    main()
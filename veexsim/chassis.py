@@ -0,0 +1,739 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   chassis.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module with the simulated chassis. A Server holds the state of the
+#    chassis at one IP address, shared by every connection to it like the
+#    protobufServer. Each connect() gets its own Chassis object tree, with
+#    test unit locks owned by the connection.
+#
+###############################################################################
+
+import collections
+import datetime
+import threading
+import time
+
+from veexsim.constants import value
+from veexsim.errors import LoginFailed
+from veexsim.errors import PortNotFound
+from veexsim.errors import ProtocolNotLocked
+from veexsim.objects import AllowedSettings
+from veexsim.objects import CaptureSlice
+from veexsim.objects import EventLogBlock
+from veexsim.objects import EventRecord
+from veexsim.objects import Link
+from veexsim.objects import OtnSettings
+from veexsim.objects import Schema
+from veexsim.objects import Settings
+from veexsim.objects import Stats
+from veexsim.objects import Stream
+from veexsim.objects import StreamSets
+from veexsim.schema import ODTU_LEVELS
+from veexsim.schema import STREAM_COUNT
+from veexsim.schema import allowedSettingsSchema
+from veexsim.schema import settingsSchema
+from veexsim.schema import statsSchema
+
+# Event log records returned by one getEventLog().
+EVENT_LOG_BLOCK = 16
+
+# Event log records kept by each PP, older records are dropped.
+EVENT_LOG_STORED = 1024
+
+# Event IDs of the records the simulator adds. The SCPI modules report the
+# event IDs as numbers, so these aren't veexlib constants.
+EVENT_TEST_STARTED = 1
+EVENT_TEST_STOPPED = 2
+
+# SCPI monitor lines kept by the server for the GUI.
+MONITOR_LINES = 1000
+
+# Chassis clock the server starts with.
+DEFAULT_CHASSIS_CLOCK = "SYS_CLOCK_INTERNAL_NO_OUTPUT"
+
+# Cards in slots 1, 2, ... when configure() isn't given any.
+DEFAULT_CARDS = ("MPM100G", "MPM400G")
+
+
+class CardModel(object):
+    '''This class describes one type of card: its PPs, lanes and line rate.
+    '''
+
+    def __init__(self, cardType, partNumber, protocols, virtualLanes,
+                 opticalLanes, lineRate, wavelength, interface):
+        self.cardType     = cardType
+        self.partNumber   = partNumber
+        self.protocols    = protocols
+        self.virtualLanes = virtualLanes
+        self.opticalLanes = opticalLanes
+        self.lineRate     = lineRate        # Hz
+        self.wavelength   = wavelength      # nm
+        self.interface    = interface       # PHY_INTERFACE_ at power up
+
+
+_MLD_PROTOCOLS = ("PROTO_PHY", "PROTO_PCS", "PROTO_OTL", "PROTO_OTN",
+                  "PROTO_SONET_SDH", "PROTO_ETHERNET")
+
+CARD_MODELS = {
+    "MPM10G"    : CardModel("CARD_MPM10G", "MPM-10G-01",
+                            ("PROTO_OTN", "PROTO_SONET_SDH", "PROTO_ETHERNET"),
+                            1, 1, 10312500000, 1310,
+                            "PHY_INTERFACE_10G_ETHERNET"),
+    "MPM100G"   : CardModel("CARD_MPM100G", "MPM-100G-01", _MLD_PROTOCOLS,
+                            20, 4, 103125000000, 1310,
+                            "PHY_INTERFACE_103G_ETHERNET"),
+    "MPM100AR"  : CardModel("CARD_MPM100AR", "MPM-100AR-01", _MLD_PROTOCOLS,
+                            20, 4, 103125000000, 1310,
+                            "PHY_INTERFACE_103G_ETHERNET"),
+    "MPM400G"   : CardModel("CARD_MPM400G", "MPM-400G-01", _MLD_PROTOCOLS,
+                            16, 8, 425000000000, 1310,
+                            "PHY_INTERFACE_425G_RS_FEC_ETHERNET"),
+    "MPM400AR"  : CardModel("CARD_MPM400AR", "MPM-400AR-01", _MLD_PROTOCOLS,
+                            16, 8, 425000000000, 1310,
+                            "PHY_INTERFACE_425G_RS_FEC_ETHERNET"),
+    "MPM400DCO" : CardModel("CARD_MPM400DCO", "MPM-400DCO-01", _MLD_PROTOCOLS,
+                            16, 8, 425000000000, 1550,
+                            "PHY_INTERFACE_425G_RS_FEC_ETHERNET"),
+    "MPM600G"   : CardModel("CARD_MPM600G", "MPM-600G-01", _MLD_PROTOCOLS,
+                            32, 8, 637500000000, 1310,
+                            "PHY_INTERFACE_425G_RS_FEC_ETHERNET"),
+    }
+
+_config = {
+    "link"  : Link(),
+    "cards" : DEFAULT_CARDS,
+    }
+_servers = {}
+_serversLock = threading.Lock()
+
+
+def configure(latency = 0.0, jitter = 0.0, seed = None, cards = None):
+    '''Sets up the simulator for the following connect() calls. Chassis
+    already connected to keep their cards, but every round trip now has the
+    new latency.
+
+    Args:
+        latency (float): Seconds of each round trip to the server.
+        jitter (float): Standard deviation in seconds of the round trip.
+        seed (int): Seed of the jitter, None for a different run each time.
+        cards (list): Names of CARD_MODELS in slot order, starting at slot 1.
+    '''
+    if cards is not None:
+        for name in cards:
+            if name not in CARD_MODELS:
+                raise ValueError("Unknown card model %s" % name)
+    link = _config["link"]
+    link.latency = latency
+    link.jitter  = jitter
+    link.random.seed(seed)
+    with _serversLock:
+        if cards is not None:
+            _config["cards"] = tuple(cards)
+            _servers.clear()
+
+
+def roundTrips():
+    '''Returns the number of round trips made to all the servers.
+    '''
+    return _config["link"].trips
+
+
+def connect(ipAddress, userName, password):
+    '''Connects and logs in to the server at ipAddress.
+
+    Returns:
+        Chassis: The chassis object of the new connection.
+    '''
+    link = _config["link"]
+    link.roundTrip()
+    if not userName:
+        raise LoginFailed("No user name")
+    with _serversLock:
+        server = _servers.get(ipAddress)
+        if server is None:
+            server = Server(link, _config["cards"])
+            _servers[ipAddress] = server
+    link.roundTrip()
+    return Chassis(server, server.addUser(userName))
+
+
+class ProtocolState(object):
+    '''This class is the state of one PP on the server, shared by all the
+    connections.
+    '''
+
+    def __init__(self, link, model, protocolType, slotId, portId, testUnitId):
+        self.link         = link
+        self.model        = model
+        self.protocolType = value(protocolType)
+        self.cardType     = value(model.cardType)
+        self.slotId       = slotId
+        self.portId       = portId
+        self.testUnitId   = testUnitId
+        self.events       = collections.deque(maxlen = EVENT_LOG_STORED)
+        self.totalEvents  = 0
+        self.eventsLock   = threading.Lock()
+        self.setFactoryDefault()
+
+    def setFactoryDefault(self):
+        '''Puts the settings back to their defaults and restarts the test.
+        '''
+        model = self.model
+        started = time.monotonic()
+        self.stats = Stats(self.link,
+                           statsSchema(self.protocolType, model),
+                           started)
+        if self.protocolType == value("PROTO_OTN"):
+            self.sets = OtnSettings(self.link,
+                                    settingsSchema(self.protocolType, model),
+                                    self.stats)
+            self.odtuStats = [Stats(self.link,
+                                    statsSchema(self.protocolType, model),
+                                    started)
+                              for level in range(ODTU_LEVELS)]
+        else:
+            self.sets = Settings(self.link,
+                                 settingsSchema(self.protocolType, model))
+            self.odtuStats = []
+        self.allowedSets = AllowedSettings(self.link,
+                                           allowedSettingsSchema(self.protocolType, model))
+        self.streamSets = StreamSets(self.link,
+                                     Schema({"streamSet": _makeStreams},
+                                            {}, set(), int))
+
+    def restart(self, duration):
+        '''Starts the test again from zero.
+        '''
+        self.stats.restart(duration)
+        for stats in self.odtuStats:
+            stats.restart(duration)
+        self.addEvent(EVENT_TEST_STARTED)
+
+    def addEvent(self, eventId, count = 1):
+        '''Adds a record to the event log.
+        '''
+        with self.eventsLock:
+            self.events.append(EventRecord(eventId, count,
+                                           int(time.time()), 0))
+            self.totalEvents += 1
+
+
+def _makeStreams():
+    return [Stream(index) for index in range(STREAM_COUNT)]
+
+
+class Server(object):
+    '''This class is the state of the chassis at one IP address.
+    '''
+
+    def __init__(self, link, cardNames):
+        self.link          = link
+        self.lock          = threading.Lock()
+        self.cardNames     = cardNames
+        self.users         = {}
+        self.nextUserId    = 1
+        self.lockOwners    = {}                 # User ID by test unit ID
+        self.modes         = {}                 # Protocol modes by test unit ID
+        self.licenses      = {}                 # License by slot
+        self.respAlways    = False
+        self.lockForcedOn  = False
+        self.chassisClock  = value(DEFAULT_CHASSIS_CLOCK)
+        self.dateOffset    = datetime.timedelta()
+        self.tcpIpParams   = ("192.168.1.100", "255.255.255.0",
+                              "192.168.1.1", "8.8.8.8", "8.8.4.4")
+        self.monitorData   = collections.deque(maxlen = MONITOR_LINES)
+        self.started       = time.monotonic()
+        self.protocols     = []
+        for index, name in enumerate(cardNames):
+            model = CARD_MODELS[name]
+            slotId = index + 1
+            testUnitId = index
+            self.modes[testUnitId] = {"sonet": True, "e1": False, "e3": False}
+            for protocolType in model.protocols:
+                self.protocols.append(ProtocolState(link, model, protocolType,
+                                                    slotId, 0, testUnitId))
+
+    def addUser(self, userName):
+        '''Returns the user ID of a new connection.
+        '''
+        with self.lock:
+            userId = self.nextUserId
+            self.nextUserId += 1
+            self.users[userId] = userName
+        return userId
+
+    def removeUser(self, userId):
+        '''Drops a connection and the test unit locks it owns.
+        '''
+        with self.lock:
+            self.users.pop(userId, None)
+            for testUnitId, owner in list(self.lockOwners.items()):
+                if owner == userId:
+                    del self.lockOwners[testUnitId]
+
+
+class Chassis(object):
+    '''This class is the chassis of one connection, as returned by
+    veexlib.connect().
+    '''
+
+    def __init__(self, server, userId):
+        self._server             = server
+        self._link               = server.link
+        self.userId              = userId
+        self.companyName         = "VeEX Inc."
+        self.productName         = "MPA Simulator"
+        self.productSerialNumber = "SIM00001"
+        self.featureSetVersion   = "1.0"
+        self.osVersion           = "Linux"
+        self.scSoftwareVersion   = "1.0.0"
+        self.scSerialNumber      = "SC00001"
+        self.scPartNumber        = "SC-SIM-01"
+        self.scpiSoftwareVersion = "1.0.0"
+        self.mchType             = value("MCH_SCM")
+        self.mchIpAddress        = server.tcpIpParams[0]
+        self.clockStatus         = value("SYS_CLOCK_STATUS_MCH_LOCKED")
+
+        self.cards     = []
+        self.ports     = []
+        self.testUnits = []
+        self.protocols = []
+        for index, name in enumerate(server.cardNames):
+            card = Card(self, CARD_MODELS[name], index + 1)
+            port = Port(card, 0)
+            testUnit = TestUnit(self, index)
+            for state in server.protocols:
+                if state.testUnitId == index:
+                    if state.protocolType == value("PROTO_OTN"):
+                        pp = OtnProtocol(self, state, port, testUnit)
+                    elif state.protocolType == value("PROTO_ETHERNET"):
+                        pp = EthernetProtocol(self, state, port, testUnit)
+                    else:
+                        pp = Protocol(self, state, port, testUnit)
+                    port.protocols.append(pp)
+                    testUnit.protocols.append(pp)
+                    self.protocols.append(pp)
+            self.cards.append(card)
+            self.ports.append(port)
+            self.testUnits.append(testUnit)
+
+    @property
+    def chassisClock(self):
+        return self._server.chassisClock
+
+    @chassisClock.setter
+    def chassisClock(self, clock):
+        self._link.roundTrip()
+        self._server.chassisClock = clock
+
+    def addScpiMonitorData(self, data):
+        self._link.roundTrip()
+        self._server.monitorData.append(data)
+
+    def getScpiRespAlways(self):
+        self._link.roundTrip()
+        return self._server.respAlways
+
+    def setScpiRespAlways(self, respAlways):
+        self._link.roundTrip()
+        self._server.respAlways = respAlways
+
+    def getScpiLockForcedOn(self):
+        self._link.roundTrip()
+        return self._server.lockForcedOn
+
+    def setScpiLockForcedOn(self, lockForcedOn):
+        self._link.roundTrip()
+        self._server.lockForcedOn = lockForcedOn
+
+    def getTcpIpAddress(self):
+        self._link.roundTrip()
+        return self._server.tcpIpParams[0]
+
+    def getTcpIpSubnetMask(self):
+        self._link.roundTrip()
+        return self._server.tcpIpParams[1]
+
+    def getTcpIpDefRouter(self):
+        self._link.roundTrip()
+        return self._server.tcpIpParams[2]
+
+    def getTcpIpDnsAddress1(self):
+        self._link.roundTrip()
+        return self._server.tcpIpParams[3]
+
+    def getTcpIpDnsAddress2(self):
+        self._link.roundTrip()
+        return self._server.tcpIpParams[4]
+
+    def setTcpIpParams(self, address, subnetMask, defRouter, dns1, dns2):
+        self._link.roundTrip()
+        self._server.tcpIpParams = (address, subnetMask, defRouter, dns1, dns2)
+
+    def _now(self):
+        return datetime.datetime.now() + self._server.dateOffset
+
+    def getDate(self):
+        self._link.roundTrip()
+        now = self._now()
+        return (now.year, now.month, now.day)
+
+    def setDate(self, year, month, day):
+        self._link.roundTrip()
+        now = self._now()
+        wanted = now.replace(year = year, month = month, day = day)
+        self._server.dateOffset += wanted - now
+
+    def getTime(self):
+        self._link.roundTrip()
+        now = self._now()
+        return (now.hour, now.minute, now.second)
+
+    def setTime(self, hours, minutes, seconds):
+        self._link.roundTrip()
+        now = self._now()
+        wanted = now.replace(hour = hours, minute = minutes, second = seconds)
+        self._server.dateOffset += wanted - now
+
+    def getUsageTime(self):
+        self._link.roundTrip()
+        seconds = int(time.monotonic() - self._server.started)
+        return (seconds // 3600, (seconds // 60) % 60, seconds % 60)
+
+    def getUserName(self, userId):
+        self._link.roundTrip()
+        return self._server.users.get(userId, "")
+
+    def getPort(self, slotId, portId):
+        for port in self.ports:
+            if (port.slotId == slotId) and (port.portId == portId):
+                return port
+        raise PortNotFound("No port %d %d" % (slotId, portId))
+
+    def ReportPortRequest(self, port):
+        return port
+
+    def saveReport(self, fileName, portRequests):
+        self._link.roundTrip()
+        return value("REPORT_COMPLETE")
+
+    def reboot(self):
+        self._link.roundTrip()
+        return self.disconnect()
+
+    def shutdown(self):
+        self._link.roundTrip()
+        return self.disconnect()
+
+    def disconnect(self):
+        self._link.roundTrip()
+        self._server.removeUser(self.userId)
+        return None
+
+
+class Card(object):
+    '''This class is one card of the chassis.
+    '''
+
+    def __init__(self, chassis, model, slotId):
+        self._chassis        = chassis
+        self.model           = model
+        self.cardType        = value(model.cardType)
+        self.slotId          = slotId
+        self.partNumber      = model.partNumber
+        self.serialNumber    = "SIM%05d" % slotId
+        self.softwareVersion = "1.0.0"
+
+    def getLicense(self):
+        self._chassis._link.roundTrip()
+        return self._chassis._server.licenses.get(self.slotId, "")
+
+    def setLicense(self, license):
+        self._chassis._link.roundTrip()
+        if isinstance(license, (bytes, bytearray)):
+            license = license.decode("latin-1")
+        self._chassis._server.licenses[self.slotId] = license
+        return value("LICENSE_SUCCESS")
+
+    def getTimedLicense(self):
+        self._chassis._link.roundTrip()
+        return TimedLicense()
+
+
+class TimedLicense(object):
+    '''This class is the response to getTimedLicense(), no timed license.
+    '''
+
+    def __init__(self):
+        self.status      = value("TIMED_LICENSE_INVALID")
+        self.codedString = ""
+        self.startYear   = 2019
+        self.startMonth  = 1
+        self.startDay    = 1
+        self.stopMonth   = 1
+        self.stopDay     = 1
+
+
+class Port(object):
+    '''This class is one port of a card and the PPs on it.
+    '''
+
+    def __init__(self, card, portId):
+        self.card      = card
+        self.slotId    = card.slotId
+        self.portId    = portId
+        self.protocols = []
+
+
+class TestUnit(object):
+    '''This class is the test unit of a port, the unit a user locks.
+    '''
+
+    def __init__(self, chassis, testUnitId):
+        self._chassis    = chassis
+        self._server     = chassis._server
+        self._link       = chassis._link
+        self.testUnitId  = testUnitId
+        self.protocols   = []
+        self.lockOwnerId = 0
+
+    def updateTestUnit(self):
+        self._link.roundTrip()
+        self.lockOwnerId = self._server.lockOwners.get(self.testUnitId, 0)
+
+    def isLocked(self):
+        return self._server.lockOwners.get(self.testUnitId) == self._chassis.userId
+
+    def isNotLocked(self):
+        return self.testUnitId not in self._server.lockOwners
+
+    def lock(self, forced = False):
+        self._link.roundTrip()
+        with self._server.lock:
+            owner = self._server.lockOwners.get(self.testUnitId)
+            if (owner is None) or forced or (owner == self._chassis.userId):
+                self._server.lockOwners[self.testUnitId] = self._chassis.userId
+        self.lockOwnerId = self._server.lockOwners[self.testUnitId]
+        return self.isLocked()
+
+    def unlock(self):
+        self._link.roundTrip()
+        with self._server.lock:
+            if self.isLocked():
+                del self._server.lockOwners[self.testUnitId]
+        self.lockOwnerId = self._server.lockOwners.get(self.testUnitId, 0)
+
+    def _checkLock(self, requireLock):
+        if requireLock and not self.isLocked():
+            raise ProtocolNotLocked("Test unit %d not locked" % self.testUnitId)
+
+    def setFactoryDefault(self, requireLock = True):
+        self._checkLock(requireLock)
+        self._link.roundTrip()
+        for pp in self.protocols:
+            pp._state.setFactoryDefault()
+        self._server.modes[self.testUnitId] = {"sonet": True, "e1": False,
+                                               "e3": False}
+
+    def stop(self, requireLock = True, includeDelay = True):
+        self._checkLock(requireLock)
+        self._link.roundTrip()
+        for pp in self.protocols:
+            pp._state.addEvent(EVENT_TEST_STOPPED)
+
+    def restart(self, duration = -1, requireLock = True, includeDelay = True):
+        self._checkLock(requireLock)
+        self._link.roundTrip()
+        for pp in self.protocols:
+            pp._state.restart(duration)
+
+    def _mode(self):
+        return self._server.modes[self.testUnitId]
+
+    def protocolIsSonet(self):
+        return self._mode()["sonet"]
+
+    def protocolIsSdh(self):
+        return not self._mode()["sonet"]
+
+    def protocolIsE1(self):
+        return self._mode()["e1"]
+
+    def protocolIsDs1(self):
+        return not self._mode()["e1"]
+
+    def protocolIsE3(self):
+        return self._mode()["e3"]
+
+    def protocolIsDs3(self):
+        return not self._mode()["e3"]
+
+    def _setMode(self, name, state):
+        self._link.roundTrip()
+        self._mode()[name] = state
+
+    def setProtocolToSonet(self):
+        self._setMode("sonet", True)
+
+    def setProtocolToSdh(self):
+        self._setMode("sonet", False)
+
+    def setProtocolToE1(self):
+        self._setMode("e1", True)
+
+    def setProtocolToDs1(self):
+        self._setMode("e1", False)
+
+    def setProtocolToE3(self):
+        self._setMode("e3", True)
+
+    def setProtocolToDs3(self):
+        self._setMode("e3", False)
+
+
+class Protocol(object):
+    '''This class is one PP as seen by a connection. The settings and stats
+    are shared with the other connections to the same server.
+    '''
+
+    def __init__(self, chassis, state, port, testUnit):
+        self._chassis     = chassis
+        self._state       = state
+        self._port        = port
+        self._link        = chassis._link
+        self.protocolType = state.protocolType
+        self.cardType     = state.cardType
+        self.slotId       = state.slotId
+        self.portId       = state.portId
+        self.testUnitId   = state.testUnitId
+        self.testUnit     = testUnit
+
+    # The settings objects are made again by a factory default, so they are
+    # always read from the shared state.
+    @property
+    def sets(self):
+        return self._state.sets
+
+    @property
+    def stats(self):
+        return self._state.stats
+
+    @property
+    def allowedSets(self):
+        return self._state.allowedSets
+
+    def update(self):
+        self._link.roundTrip()
+
+    def getPort(self):
+        return self._port
+
+    def updateTestUnit(self):
+        self.testUnit.updateTestUnit()
+
+    def isLocked(self):
+        return self.testUnit.isLocked()
+
+    def isNotLocked(self):
+        return self.testUnit.isNotLocked()
+
+    def lock(self, forced = False):
+        return self.testUnit.lock(forced)
+
+    def unlock(self):
+        self.testUnit.unlock()
+
+    def setFactoryDefault(self, requireLock = True):
+        self.testUnit.setFactoryDefault(requireLock)
+
+    def stop(self, requireLock = True, includeDelay = True):
+        self.testUnit.stop(requireLock, includeDelay)
+
+    def restart(self, duration = -1, requireLock = True, includeDelay = True):
+        self.testUnit.restart(duration, requireLock, includeDelay)
+
+    def getEventLog(self, recNum):
+        '''Returns up to EVENT_LOG_BLOCK records from record number recNum.
+        '''
+        self._link.roundTrip()
+        state = self._state
+        with state.eventsLock:
+            totalRecs = state.totalEvents
+            storedCount = len(state.events)
+            first = max(recNum, totalRecs - storedCount)
+            start = first - (totalRecs - storedCount)
+            records = list(state.events)[start:start + EVENT_LOG_BLOCK]
+        return EventLogBlock(totalRecs, storedCount, records)
+
+
+class OtnProtocol(Protocol):
+    '''This class is an OTN PP with its ODTU stats and module registers.
+    '''
+
+    @property
+    def odtuStats(self):
+        return self._state.odtuStats
+
+    def insertSingleError(self, errorType):
+        self._link.roundTrip()
+        self._state.addEvent(errorType)
+
+    def singleJustify(self, direction):
+        self._link.roundTrip()
+
+    def readSfpIdRegister(self, address):
+        self._link.roundTrip()
+        return self.stats.sfpI2cInfo.idRegisters[address]
+
+    def writeSfpIdRegister(self, data, address):
+        self._link.roundTrip()
+        self.stats.sfpI2cInfo.idRegisters[address] = data
+        return True
+
+    def readSfpDiagRegister(self, address):
+        self._link.roundTrip()
+        return self.stats.sfpI2cInfo.diagRegisters[address]
+
+    def writeSfpDiagRegister(self, data, address):
+        self._link.roundTrip()
+        self.stats.sfpI2cInfo.diagRegisters[address] = data
+        return True
+
+
+class EthernetProtocol(Protocol):
+    '''This class is an Ethernet PP with its streams and capture buffer.
+    '''
+
+    @property
+    def streamSets(self):
+        return self._state.streamSets
+
+    def getStatistics(self):
+        self._link.roundTrip()
+        return self.stats
+
+    def readCaptureSlice(self, frame, sliceNumber):
+        '''Returns one slice of a captured frame, or None past the frames
+        in the buffer. Each frame is one slice of the capture size.
+        '''
+        self._link.roundTrip()
+        stats = self.stats
+        if (frame < stats.firstCapturedFrame) or \
+           (frame > stats.lastCapturedFrame) or (sliceNumber != 0):
+            return None
+        if self.sets.captureSize == value("PACKET_CAPTURE_SIZE_64_BYTES"):
+            captureSize = 64
+        else:
+            captureSize = 128
+        packetSlice = bytes((frame + index) & 0xFF
+                            for index in range(captureSize))
+        return CaptureSlice(frame * 1000, captureSize, captureSize, 1,
+                            captureSize, packetSlice)
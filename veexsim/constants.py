@@ -0,0 +1,113 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   constants.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module with the veexlib enum constants of the simulator. Constants used
+#    as list indexes, levels and bit masks have fixed values. Every other name
+#    in known.CONSTANTS is given a unique value the first time it is used, so
+#    no two enums of a family compare equal.
+#
+###############################################################################
+
+import re
+import threading
+
+from veexsim.known import CONSTANTS
+
+# Constants that index a settings or stats list, in list order. The lists
+# are made the length of their family.
+INDEX_FAMILIES = {
+    "OTN_INTRUDE_ON_": [
+        "OTU_FAS", "OTU_MFAS", "OTU_SM", "OTU_GCC0", "OTU_RES",
+        "ODU_RES1", "ODU_TCM_ACT", "ODU_TCM6", "ODU_TCM5", "ODU_TCM4",
+        "ODU_FTFL", "ODU_TCM3", "ODU_TCM2", "ODU_TCM1", "ODU_PM", "ODU_EXP",
+        "ODU_GCC1", "ODU_GCC2", "ODU_APS_PCC", "ODU_RES2", "OPU_JC_NJO",
+        "OPU_PSI", "OPU_RES"],
+    # OTU overhead of row 1, columns 1 to 14.
+    "OTN_OTU_OH_": [
+        "FAS_OA1_1", "FAS_OA1_2", "FAS_OA1_3", "FAS_OA2_1", "FAS_OA2_2",
+        "FAS_OA2_3", "MFAS", "SM_TTI", "SM_BIP", "SM_BEI", "GCC0_1", "GCC0_2",
+        "OSMC", "RES_2"],
+    # ODU overhead of rows 2 to 4, columns 1 to 14.
+    "OTN_ODU_OH_": [
+        "RES_1", "RES_2", "RES_3", "TCM_ACT", "TCM6_TTI", "TCM6_BIP",
+        "TCM6_BEI", "TCM5_TTI", "TCM5_BIP", "TCM5_BEI", "TCM4_TTI", "TCM4_BIP",
+        "TCM4_BEI", "FTFL", "TCM3_TTI", "TCM3_BIP", "TCM3_BEI", "TCM2_TTI",
+        "TCM2_BIP", "TCM2_BEI", "TCM1_TTI", "TCM1_BIP", "TCM1_BEI", "PM_TTI",
+        "PM_BIP", "PM_BEI", "EXP_1", "EXP_2", "GCC1_1", "GCC1_2", "GCC2_1",
+        "GCC2_2", "APS_PCC_1", "APS_PCC_2", "APS_PCC_3", "APS_PCC_4",
+        "RES_4", "RES_5", "RES_6", "RES_7", "RES_8", "RES_9"],
+    # OPU overhead of column 15, rows 1 to 4, and the PSI of row 4.
+    "OTN_OPU_OH_": [
+        "RES_1", "RES_2", "RES_3", "JC_1", "JC_2", "JC_3", "PSI", "NJO"],
+    }
+
+# ODU levels are compared, ie. muxLevel > OTN_ODTU_LEVEL_ODU_3, so they are
+# the ODU number.
+LEVEL_PATTERN = re.compile(r"_LEVEL_ODU_([0-4])$")
+
+# Bit masks are or'ed together so each is a bit of its own.
+MASK_SUFFIX = "_MASK"
+
+# First value given to the other constants, well clear of the list indexes
+# and levels.
+FIRST_ENUM_VALUE = 1000
+
+_lock = threading.Lock()
+_values = {}
+_nextValue = [FIRST_ENUM_VALUE]
+_nextBit = [0]
+
+for _prefix, _names in INDEX_FAMILIES.items():
+    for _index, _name in enumerate(_names):
+        _values[_prefix + _name] = _index
+
+
+def isConstantName(name):
+    '''Returns True if name is a veexlib constant the simulator knows, ie.
+    OTN_ODU_OH_PM_BEI.
+    '''
+    return (name in CONSTANTS) or (name in _values)
+
+
+def familyLength(prefix):
+    '''Returns the length of a list indexed by the constants starting with
+    prefix.
+    '''
+    return len(INDEX_FAMILIES[prefix])
+
+
+def value(name):
+    '''Returns the value of the veexlib constant name, giving it a new value
+    the first time it is used.
+
+    Raises:
+        AttributeError: name isn't a known veexlib constant.
+    '''
+    found = _values.get(name)
+    if found is not None:
+        return found
+    if name not in CONSTANTS:
+        raise AttributeError("veexlib has no constant '%s'" % name)
+    with _lock:
+        found = _values.get(name)
+        if found is not None:
+            return found
+        level = LEVEL_PATTERN.search(name)
+        if level is not None:
+            found = int(level.group(1))
+        elif name.endswith(MASK_SUFFIX):
+            found = 1 << _nextBit[0]
+            _nextBit[0] += 1
+        else:
+            found = _nextValue[0]
+            _nextValue[0] += 1
+        _values[name] = found
+        return found
@@ -0,0 +1,56 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   errors.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module with the veexlib exceptions raised by the simulator.
+#
+###############################################################################
+
+
+class ConnectFailed(Exception):
+    '''Raised by connect() when the server can't be reached.
+    '''
+
+
+class LoginFailed(Exception):
+    '''Raised by connect() when the user name or password is wrong.
+    '''
+
+
+class ServerException(Exception):
+    '''Raised when the server refuses a request, reason is an EXCEPT_
+    constant.
+    '''
+
+    def __init__(self, reason):
+        Exception.__init__(self, reason)
+        self.reason = reason
+
+
+class ProtocolNak(Exception):
+    '''Raised when a PP refuses a setting.
+    '''
+
+
+class ProtocolNotLocked(Exception):
+    '''Raised when a PP that this connection hasn't locked is changed.
+    '''
+
+
+class PortNotFound(Exception):
+    '''Raised by Chassis.getPort() for a slot and port with no port.
+    '''
+
+
+class Exceptions(object):
+    '''Namespace of the exceptions veexlib keeps in its Exceptions module,
+    ie. veexlib.Exceptions.PortNotFound.
+    '''
+    PortNotFound = PortNotFound
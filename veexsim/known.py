@@ -0,0 +1,736 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   known.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module with the veexlib names the simulator knows: the constants and the
+#    fields of the settings, allowed settings and stats objects. The names
+#    are the ones the SCPI modules use, as spelled in the PP IDL.
+#    Any other name is an AttributeError, the same as the real veexlib, so a
+#    handler can't pass on the simulator with a field veexlib doesn't have.
+#
+###############################################################################
+
+# veexlib enum constants.
+CONSTANTS = frozenset([
+    "CARD_IM_100", "CARD_MPM100AR", "CARD_MPM100G", "CARD_MPM10G",
+    "CARD_MPM400AR", "CARD_MPM400DCO", "CARD_MPM400G", "CARD_MPM600G",
+    "CARD_MPMP400AR", "CARD_OP_SWITCH", "CARD_OSA_PMD", "CARD_OTDR",
+    "CARD_SCM210", "CARD_SCM220",
+    "CLOCK_BITS", "CLOCK_BITS_SETS", "CLOCK_EXT_10MHZ", "CLOCK_EXT_8KHZ",
+    "CLOCK_EXT_BITS", "CLOCK_EXT_SETS", "CLOCK_INTERNAL", "CLOCK_RECOVERED",
+    "CLOCK_SETS", "CLOCK_SYNC",
+    "COUPLED_RX_INTO_TX", "COUPLED_TX_INTO_RX",
+    "EXCEPT_ADMIN_INVALID_LOGIN_NAME", "EXCEPT_ADMIN_INVALID_PASSWORD",
+    "EXCEPT_ADMIN_REACHED_MAX_LOGGEDIN_USERS",
+    "EXCEPT_ADMIN_USER_ALREADY_LOGGED_IN", "EXCEPT_ADMIN_USER_NOT_FOUND",
+    "EXCEPT_ADMIN_USER_NOT_LOGGED_IN", "EXCEPT_USER_UNAUTHORIZED",
+    "INDEPENDENT_TX_RX",
+    "LASER_POWERS_UP_LAST_SAVED_STATE", "LASER_POWERS_UP_OFF",
+    "LASER_POWERS_UP_ON",
+    "LICENSE_CHECKSUM_FAIL", "LICENSE_CP_SW_TYPE_FAIL", "LICENSE_DATE_FAIL",
+    "LICENSE_DECODE_FAIL", "LICENSE_EXPIRED_FAIL", "LICENSE_SEEPROM_FAIL",
+    "LICENSE_SERIAL_NUM_FAIL", "LICENSE_SUCCESS", "LICENSE_UNKNOWN_FAIL",
+    "LICENSE_UNSUPPORTED",
+    "MCH_NO_BITS_SETS", "MCH_SCM", "MCH_WITH_BITS_SETS",
+    "OTN_ALARM_CLOCK", "OTN_ALARM_CP_POWER_LOSS", "OTN_ALARM_FEC_STRESS",
+    "OTN_ALARM_LOF", "OTN_ALARM_LOM", "OTN_ALARM_LOOMFI", "OTN_ALARM_LOS",
+    "OTN_ALARM_ODTU_0_LOF", "OTN_ALARM_ODTU_0_LOM",
+    "OTN_ALARM_ODTU_0_ODU_AIS", "OTN_ALARM_ODTU_0_ODU_BDI",
+    "OTN_ALARM_ODTU_0_ODU_DAPI_TIM", "OTN_ALARM_ODTU_0_ODU_LCK",
+    "OTN_ALARM_ODTU_0_ODU_OCI", "OTN_ALARM_ODTU_0_ODU_SAPI_TIM",
+    "OTN_ALARM_ODTU_0_OOF", "OTN_ALARM_ODTU_0_OOM",
+    "OTN_ALARM_ODTU_0_OPU_C8_SYNC", "OTN_ALARM_ODTU_0_OPU_CSF",
+    "OTN_ALARM_ODTU_0_OPU_FREQ_WIDE", "OTN_ALARM_ODTU_0_OPU_PLM",
+    "OTN_ALARM_ODTU_0_TCM_1_BDI", "OTN_ALARM_ODTU_0_TCM_1_BIAE",
+    "OTN_ALARM_ODTU_0_TCM_1_DAPI_TIM", "OTN_ALARM_ODTU_0_TCM_1_SAPI_TIM",
+    "OTN_ALARM_ODTU_0_TCM_2_BDI", "OTN_ALARM_ODTU_0_TCM_2_BIAE",
+    "OTN_ALARM_ODTU_0_TCM_2_DAPI_TIM", "OTN_ALARM_ODTU_0_TCM_2_SAPI_TIM",
+    "OTN_ALARM_ODTU_0_TCM_3_BDI", "OTN_ALARM_ODTU_0_TCM_3_BIAE",
+    "OTN_ALARM_ODTU_0_TCM_3_DAPI_TIM", "OTN_ALARM_ODTU_0_TCM_3_SAPI_TIM",
+    "OTN_ALARM_ODTU_0_TCM_4_BDI", "OTN_ALARM_ODTU_0_TCM_4_BIAE",
+    "OTN_ALARM_ODTU_0_TCM_4_DAPI_TIM", "OTN_ALARM_ODTU_0_TCM_4_SAPI_TIM",
+    "OTN_ALARM_ODTU_0_TCM_5_BDI", "OTN_ALARM_ODTU_0_TCM_5_BIAE",
+    "OTN_ALARM_ODTU_0_TCM_5_DAPI_TIM", "OTN_ALARM_ODTU_0_TCM_5_SAPI_TIM",
+    "OTN_ALARM_ODTU_0_TCM_6_BDI", "OTN_ALARM_ODTU_0_TCM_6_BIAE",
+    "OTN_ALARM_ODTU_0_TCM_6_DAPI_TIM", "OTN_ALARM_ODTU_0_TCM_6_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_LOF", "OTN_ALARM_ODTU_1_LOM",
+    "OTN_ALARM_ODTU_1_ODU_AIS", "OTN_ALARM_ODTU_1_ODU_BDI",
+    "OTN_ALARM_ODTU_1_ODU_DAPI_TIM", "OTN_ALARM_ODTU_1_ODU_LCK",
+    "OTN_ALARM_ODTU_1_ODU_OCI", "OTN_ALARM_ODTU_1_ODU_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_OOF", "OTN_ALARM_ODTU_1_OOM",
+    "OTN_ALARM_ODTU_1_OPU_C8_SYNC", "OTN_ALARM_ODTU_1_OPU_CSF",
+    "OTN_ALARM_ODTU_1_OPU_FREQ_WIDE", "OTN_ALARM_ODTU_1_OPU_PLM",
+    "OTN_ALARM_ODTU_1_TCM_1_BDI", "OTN_ALARM_ODTU_1_TCM_1_BIAE",
+    "OTN_ALARM_ODTU_1_TCM_1_DAPI_TIM", "OTN_ALARM_ODTU_1_TCM_1_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_TCM_2_BDI", "OTN_ALARM_ODTU_1_TCM_2_BIAE",
+    "OTN_ALARM_ODTU_1_TCM_2_DAPI_TIM", "OTN_ALARM_ODTU_1_TCM_2_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_TCM_3_BDI", "OTN_ALARM_ODTU_1_TCM_3_BIAE",
+    "OTN_ALARM_ODTU_1_TCM_3_DAPI_TIM", "OTN_ALARM_ODTU_1_TCM_3_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_TCM_4_BDI", "OTN_ALARM_ODTU_1_TCM_4_BIAE",
+    "OTN_ALARM_ODTU_1_TCM_4_DAPI_TIM", "OTN_ALARM_ODTU_1_TCM_4_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_TCM_5_BDI", "OTN_ALARM_ODTU_1_TCM_5_BIAE",
+    "OTN_ALARM_ODTU_1_TCM_5_DAPI_TIM", "OTN_ALARM_ODTU_1_TCM_5_SAPI_TIM",
+    "OTN_ALARM_ODTU_1_TCM_6_BDI", "OTN_ALARM_ODTU_1_TCM_6_BIAE",
+    "OTN_ALARM_ODTU_1_TCM_6_DAPI_TIM", "OTN_ALARM_ODTU_1_TCM_6_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_LOF", "OTN_ALARM_ODTU_2_LOM",
+    "OTN_ALARM_ODTU_2_ODU_AIS", "OTN_ALARM_ODTU_2_ODU_BDI",
+    "OTN_ALARM_ODTU_2_ODU_DAPI_TIM", "OTN_ALARM_ODTU_2_ODU_LCK",
+    "OTN_ALARM_ODTU_2_ODU_OCI", "OTN_ALARM_ODTU_2_ODU_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_OOF", "OTN_ALARM_ODTU_2_OOM",
+    "OTN_ALARM_ODTU_2_OPU_C8_SYNC", "OTN_ALARM_ODTU_2_OPU_CSF",
+    "OTN_ALARM_ODTU_2_OPU_FREQ_WIDE", "OTN_ALARM_ODTU_2_OPU_PLM",
+    "OTN_ALARM_ODTU_2_TCM_1_BDI", "OTN_ALARM_ODTU_2_TCM_1_BIAE",
+    "OTN_ALARM_ODTU_2_TCM_1_DAPI_TIM", "OTN_ALARM_ODTU_2_TCM_1_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_TCM_2_BDI", "OTN_ALARM_ODTU_2_TCM_2_BIAE",
+    "OTN_ALARM_ODTU_2_TCM_2_DAPI_TIM", "OTN_ALARM_ODTU_2_TCM_2_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_TCM_3_BDI", "OTN_ALARM_ODTU_2_TCM_3_BIAE",
+    "OTN_ALARM_ODTU_2_TCM_3_DAPI_TIM", "OTN_ALARM_ODTU_2_TCM_3_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_TCM_4_BDI", "OTN_ALARM_ODTU_2_TCM_4_BIAE",
+    "OTN_ALARM_ODTU_2_TCM_4_DAPI_TIM", "OTN_ALARM_ODTU_2_TCM_4_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_TCM_5_BDI", "OTN_ALARM_ODTU_2_TCM_5_BIAE",
+    "OTN_ALARM_ODTU_2_TCM_5_DAPI_TIM", "OTN_ALARM_ODTU_2_TCM_5_SAPI_TIM",
+    "OTN_ALARM_ODTU_2_TCM_6_BDI", "OTN_ALARM_ODTU_2_TCM_6_BIAE",
+    "OTN_ALARM_ODTU_2_TCM_6_DAPI_TIM", "OTN_ALARM_ODTU_2_TCM_6_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_LOF", "OTN_ALARM_ODTU_3_LOM",
+    "OTN_ALARM_ODTU_3_ODU_AIS", "OTN_ALARM_ODTU_3_ODU_BDI",
+    "OTN_ALARM_ODTU_3_ODU_DAPI_TIM", "OTN_ALARM_ODTU_3_ODU_LCK",
+    "OTN_ALARM_ODTU_3_ODU_OCI", "OTN_ALARM_ODTU_3_ODU_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_OOF", "OTN_ALARM_ODTU_3_OOM",
+    "OTN_ALARM_ODTU_3_OPU_C8_SYNC", "OTN_ALARM_ODTU_3_OPU_CSF",
+    "OTN_ALARM_ODTU_3_OPU_FREQ_WIDE", "OTN_ALARM_ODTU_3_OPU_PLM",
+    "OTN_ALARM_ODTU_3_TCM_1_BDI", "OTN_ALARM_ODTU_3_TCM_1_BIAE",
+    "OTN_ALARM_ODTU_3_TCM_1_DAPI_TIM", "OTN_ALARM_ODTU_3_TCM_1_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_TCM_2_BDI", "OTN_ALARM_ODTU_3_TCM_2_BIAE",
+    "OTN_ALARM_ODTU_3_TCM_2_DAPI_TIM", "OTN_ALARM_ODTU_3_TCM_2_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_TCM_3_BDI", "OTN_ALARM_ODTU_3_TCM_3_BIAE",
+    "OTN_ALARM_ODTU_3_TCM_3_DAPI_TIM", "OTN_ALARM_ODTU_3_TCM_3_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_TCM_4_BDI", "OTN_ALARM_ODTU_3_TCM_4_BIAE",
+    "OTN_ALARM_ODTU_3_TCM_4_DAPI_TIM", "OTN_ALARM_ODTU_3_TCM_4_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_TCM_5_BDI", "OTN_ALARM_ODTU_3_TCM_5_BIAE",
+    "OTN_ALARM_ODTU_3_TCM_5_DAPI_TIM", "OTN_ALARM_ODTU_3_TCM_5_SAPI_TIM",
+    "OTN_ALARM_ODTU_3_TCM_6_BDI", "OTN_ALARM_ODTU_3_TCM_6_BIAE",
+    "OTN_ALARM_ODTU_3_TCM_6_DAPI_TIM", "OTN_ALARM_ODTU_3_TCM_6_SAPI_TIM",
+    "OTN_ALARM_ODTU_LOF", "OTN_ALARM_ODTU_LOM", "OTN_ALARM_ODTU_ODU_AIS",
+    "OTN_ALARM_ODTU_ODU_BDI", "OTN_ALARM_ODTU_ODU_DAPI_TIM",
+    "OTN_ALARM_ODTU_ODU_LCK", "OTN_ALARM_ODTU_ODU_OCI",
+    "OTN_ALARM_ODTU_ODU_SAPI_TIM", "OTN_ALARM_ODTU_OOF", "OTN_ALARM_ODTU_OOM",
+    "OTN_ALARM_ODTU_OPU_CSF", "OTN_ALARM_ODTU_OPU_FREQ_WIDE",
+    "OTN_ALARM_ODTU_OPU_PLM", "OTN_ALARM_ODTU_TCM_1_BDI",
+    "OTN_ALARM_ODTU_TCM_1_BIAE", "OTN_ALARM_ODTU_TCM_1_DAPI_TIM",
+    "OTN_ALARM_ODTU_TCM_1_SAPI_TIM", "OTN_ALARM_ODTU_TCM_2_BDI",
+    "OTN_ALARM_ODTU_TCM_2_BIAE", "OTN_ALARM_ODTU_TCM_2_DAPI_TIM",
+    "OTN_ALARM_ODTU_TCM_2_SAPI_TIM", "OTN_ALARM_ODTU_TCM_3_BDI",
+    "OTN_ALARM_ODTU_TCM_3_BIAE", "OTN_ALARM_ODTU_TCM_3_DAPI_TIM",
+    "OTN_ALARM_ODTU_TCM_3_SAPI_TIM", "OTN_ALARM_ODTU_TCM_4_BDI",
+    "OTN_ALARM_ODTU_TCM_4_BIAE", "OTN_ALARM_ODTU_TCM_4_DAPI_TIM",
+    "OTN_ALARM_ODTU_TCM_4_SAPI_TIM", "OTN_ALARM_ODTU_TCM_5_BDI",
+    "OTN_ALARM_ODTU_TCM_5_BIAE", "OTN_ALARM_ODTU_TCM_5_DAPI_TIM",
+    "OTN_ALARM_ODTU_TCM_5_SAPI_TIM", "OTN_ALARM_ODTU_TCM_6_BDI",
+    "OTN_ALARM_ODTU_TCM_6_BIAE", "OTN_ALARM_ODTU_TCM_6_DAPI_TIM",
+    "OTN_ALARM_ODTU_TCM_6_SAPI_TIM", "OTN_ALARM_ODU_AIS", "OTN_ALARM_ODU_BDI",
+    "OTN_ALARM_ODU_DAPI_TIM", "OTN_ALARM_ODU_LCK", "OTN_ALARM_ODU_OCI",
+    "OTN_ALARM_ODU_SAPI_TIM", "OTN_ALARM_ODU_SD_BW", "OTN_ALARM_ODU_SD_FW",
+    "OTN_ALARM_ODU_SF_BW", "OTN_ALARM_ODU_SF_FW", "OTN_ALARM_OFF",
+    "OTN_ALARM_OOF", "OTN_ALARM_OOM", "OTN_ALARM_OOOMFI", "OTN_ALARM_OPU_AIS",
+    "OTN_ALARM_OPU_C8_SYNC", "OTN_ALARM_OPU_CSF", "OTN_ALARM_OPU_FREQ_WIDE",
+    "OTN_ALARM_OPU_PLM", "OTN_ALARM_OTU_AIS", "OTN_ALARM_OTU_BDI",
+    "OTN_ALARM_OTU_BIAE", "OTN_ALARM_OTU_DAPI_TIM", "OTN_ALARM_OTU_IAE",
+    "OTN_ALARM_OTU_SAPI_TIM", "OTN_ALARM_PATTERN_SYNC",
+    "OTN_ALARM_RX_FREQ_WIDE", "OTN_ALARM_RX_POWER_HOT",
+    "OTN_ALARM_RX_POWER_LOW", "OTN_ALARM_RX_POWER_WARM",
+    "OTN_ALARM_TCM_1_BDI", "OTN_ALARM_TCM_1_BIAE", "OTN_ALARM_TCM_1_DAPI_TIM",
+    "OTN_ALARM_TCM_1_SAPI_TIM", "OTN_ALARM_TCM_2_BDI", "OTN_ALARM_TCM_2_BIAE",
+    "OTN_ALARM_TCM_2_DAPI_TIM", "OTN_ALARM_TCM_2_SAPI_TIM",
+    "OTN_ALARM_TCM_3_BDI", "OTN_ALARM_TCM_3_BIAE", "OTN_ALARM_TCM_3_DAPI_TIM",
+    "OTN_ALARM_TCM_3_SAPI_TIM", "OTN_ALARM_TCM_4_BDI", "OTN_ALARM_TCM_4_BIAE",
+    "OTN_ALARM_TCM_4_DAPI_TIM", "OTN_ALARM_TCM_4_SAPI_TIM",
+    "OTN_ALARM_TCM_5_BDI", "OTN_ALARM_TCM_5_BIAE", "OTN_ALARM_TCM_5_DAPI_TIM",
+    "OTN_ALARM_TCM_5_SAPI_TIM", "OTN_ALARM_TCM_6_BDI", "OTN_ALARM_TCM_6_BIAE",
+    "OTN_ALARM_TCM_6_DAPI_TIM", "OTN_ALARM_TCM_6_SAPI_TIM",
+    "OTN_ALARM_TEST_PAUSED", "OTN_ERR_ALARM_BURST_ODTU_OPU_C8_SYNC",
+    "OTN_ERR_ALARM_BURST_ODU_AIS", "OTN_ERR_ALARM_BURST_ODU_BDI",
+    "OTN_ERR_ALARM_BURST_ODU_LCK", "OTN_ERR_ALARM_BURST_ODU_OCI",
+    "OTN_ERR_ALARM_BURST_OMFI", "OTN_ERR_ALARM_BURST_OPU_AIS",
+    "OTN_ERR_ALARM_BURST_OPU_C8_SYNC", "OTN_ERR_ALARM_BURST_OPU_CSF",
+    "OTN_ERR_ALARM_BURST_OTU_BDI", "OTN_ERR_ALARM_BURST_OTU_BIAE",
+    "OTN_ERR_ALARM_BURST_OTU_IAE", "OTN_ERR_ALARM_BURST_TCM_1_BDI",
+    "OTN_ERR_ALARM_BURST_TCM_1_BIAE", "OTN_ERR_ALARM_BURST_TCM_2_BDI",
+    "OTN_ERR_ALARM_BURST_TCM_2_BIAE", "OTN_ERR_ALARM_BURST_TCM_3_BDI",
+    "OTN_ERR_ALARM_BURST_TCM_3_BIAE", "OTN_ERR_ALARM_BURST_TCM_4_BDI",
+    "OTN_ERR_ALARM_BURST_TCM_4_BIAE", "OTN_ERR_ALARM_BURST_TCM_5_BDI",
+    "OTN_ERR_ALARM_BURST_TCM_5_BIAE", "OTN_ERR_ALARM_BURST_TCM_6_BDI",
+    "OTN_ERR_ALARM_BURST_TCM_6_BIAE", "OTN_ERR_BIT", "OTN_ERR_BLOCK_1027B",
+    "OTN_ERR_FEC_COR", "OTN_ERR_FEC_UNCOR", "OTN_ERR_FRAME",
+    "OTN_ERR_FRAME_OTUCN_SYNC", "OTN_ERR_LAN_OTN_BIP8_LANE1",
+    "OTN_ERR_LAN_OTN_BIP8_LANE2", "OTN_ERR_LAN_OTN_BIP8_LANE3",
+    "OTN_ERR_LAN_OTN_BIP8_LANE4", "OTN_ERR_LAN_PCS_BIP8_LANE1",
+    "OTN_ERR_LAN_PCS_BIP8_LANE2", "OTN_ERR_LAN_PCS_BIP8_LANE3",
+    "OTN_ERR_LAN_PCS_BIP8_LANE4", "OTN_ERR_MFAS", "OTN_ERR_NONE",
+    "OTN_ERR_ODTU_0_ALARM_BURST_ODU_AIS",
+    "OTN_ERR_ODTU_0_ALARM_BURST_ODU_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_ODU_LCK",
+    "OTN_ERR_ODTU_0_ALARM_BURST_ODU_OCI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_OPU_C8_SYNC",
+    "OTN_ERR_ODTU_0_ALARM_BURST_OPU_CSF",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_1_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_1_BIAE",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_2_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_2_BIAE",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_3_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_3_BIAE",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_4_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_4_BIAE",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_5_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_5_BIAE",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_6_BDI",
+    "OTN_ERR_ODTU_0_ALARM_BURST_TCM_6_BIAE", "OTN_ERR_ODTU_0_FRAME",
+    "OTN_ERR_ODTU_0_MFAS", "OTN_ERR_ODTU_0_ODU_BEI",
+    "OTN_ERR_ODTU_0_ODU_BIP8", "OTN_ERR_ODTU_0_OPU_C8_CRC_8",
+    "OTN_ERR_ODTU_0_TCM_1_BEI", "OTN_ERR_ODTU_0_TCM_1_BIP8",
+    "OTN_ERR_ODTU_0_TCM_2_BEI", "OTN_ERR_ODTU_0_TCM_2_BIP8",
+    "OTN_ERR_ODTU_0_TCM_3_BEI", "OTN_ERR_ODTU_0_TCM_3_BIP8",
+    "OTN_ERR_ODTU_0_TCM_4_BEI", "OTN_ERR_ODTU_0_TCM_4_BIP8",
+    "OTN_ERR_ODTU_0_TCM_5_BEI", "OTN_ERR_ODTU_0_TCM_5_BIP8",
+    "OTN_ERR_ODTU_0_TCM_6_BEI", "OTN_ERR_ODTU_0_TCM_6_BIP8",
+    "OTN_ERR_ODTU_1_ALARM_BURST_ODU_AIS",
+    "OTN_ERR_ODTU_1_ALARM_BURST_ODU_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_ODU_LCK",
+    "OTN_ERR_ODTU_1_ALARM_BURST_ODU_OCI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_OPU_C8_SYNC",
+    "OTN_ERR_ODTU_1_ALARM_BURST_OPU_CSF",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_1_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_1_BIAE",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_2_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_2_BIAE",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_3_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_3_BIAE",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_4_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_4_BIAE",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_5_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_5_BIAE",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_6_BDI",
+    "OTN_ERR_ODTU_1_ALARM_BURST_TCM_6_BIAE", "OTN_ERR_ODTU_1_FRAME",
+    "OTN_ERR_ODTU_1_MFAS", "OTN_ERR_ODTU_1_ODU_BEI",
+    "OTN_ERR_ODTU_1_ODU_BIP8", "OTN_ERR_ODTU_1_OPU_C8_CRC_8",
+    "OTN_ERR_ODTU_1_TCM_1_BEI", "OTN_ERR_ODTU_1_TCM_1_BIP8",
+    "OTN_ERR_ODTU_1_TCM_2_BEI", "OTN_ERR_ODTU_1_TCM_2_BIP8",
+    "OTN_ERR_ODTU_1_TCM_3_BEI", "OTN_ERR_ODTU_1_TCM_3_BIP8",
+    "OTN_ERR_ODTU_1_TCM_4_BEI", "OTN_ERR_ODTU_1_TCM_4_BIP8",
+    "OTN_ERR_ODTU_1_TCM_5_BEI", "OTN_ERR_ODTU_1_TCM_5_BIP8",
+    "OTN_ERR_ODTU_1_TCM_6_BEI", "OTN_ERR_ODTU_1_TCM_6_BIP8",
+    "OTN_ERR_ODTU_2_ALARM_BURST_ODU_AIS",
+    "OTN_ERR_ODTU_2_ALARM_BURST_ODU_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_ODU_LCK",
+    "OTN_ERR_ODTU_2_ALARM_BURST_ODU_OCI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_OPU_C8_SYNC",
+    "OTN_ERR_ODTU_2_ALARM_BURST_OPU_CSF",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_1_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_1_BIAE",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_2_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_2_BIAE",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_3_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_3_BIAE",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_4_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_4_BIAE",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_5_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_5_BIAE",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_6_BDI",
+    "OTN_ERR_ODTU_2_ALARM_BURST_TCM_6_BIAE", "OTN_ERR_ODTU_2_FRAME",
+    "OTN_ERR_ODTU_2_MFAS", "OTN_ERR_ODTU_2_ODU_BEI",
+    "OTN_ERR_ODTU_2_ODU_BIP8", "OTN_ERR_ODTU_2_OPU_C8_CRC_8",
+    "OTN_ERR_ODTU_2_TCM_1_BEI", "OTN_ERR_ODTU_2_TCM_1_BIP8",
+    "OTN_ERR_ODTU_2_TCM_2_BEI", "OTN_ERR_ODTU_2_TCM_2_BIP8",
+    "OTN_ERR_ODTU_2_TCM_3_BEI", "OTN_ERR_ODTU_2_TCM_3_BIP8",
+    "OTN_ERR_ODTU_2_TCM_4_BEI", "OTN_ERR_ODTU_2_TCM_4_BIP8",
+    "OTN_ERR_ODTU_2_TCM_5_BEI", "OTN_ERR_ODTU_2_TCM_5_BIP8",
+    "OTN_ERR_ODTU_2_TCM_6_BEI", "OTN_ERR_ODTU_2_TCM_6_BIP8",
+    "OTN_ERR_ODTU_3_ALARM_BURST_ODU_AIS",
+    "OTN_ERR_ODTU_3_ALARM_BURST_ODU_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_ODU_LCK",
+    "OTN_ERR_ODTU_3_ALARM_BURST_ODU_OCI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_OPU_C8_SYNC",
+    "OTN_ERR_ODTU_3_ALARM_BURST_OPU_CSF",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_1_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_1_BIAE",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_2_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_2_BIAE",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_3_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_3_BIAE",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_4_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_4_BIAE",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_5_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_5_BIAE",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_6_BDI",
+    "OTN_ERR_ODTU_3_ALARM_BURST_TCM_6_BIAE", "OTN_ERR_ODTU_3_FRAME",
+    "OTN_ERR_ODTU_3_MFAS", "OTN_ERR_ODTU_3_ODU_BEI",
+    "OTN_ERR_ODTU_3_ODU_BIP8", "OTN_ERR_ODTU_3_OPU_C8_CRC_8",
+    "OTN_ERR_ODTU_3_TCM_1_BEI", "OTN_ERR_ODTU_3_TCM_1_BIP8",
+    "OTN_ERR_ODTU_3_TCM_2_BEI", "OTN_ERR_ODTU_3_TCM_2_BIP8",
+    "OTN_ERR_ODTU_3_TCM_3_BEI", "OTN_ERR_ODTU_3_TCM_3_BIP8",
+    "OTN_ERR_ODTU_3_TCM_4_BEI", "OTN_ERR_ODTU_3_TCM_4_BIP8",
+    "OTN_ERR_ODTU_3_TCM_5_BEI", "OTN_ERR_ODTU_3_TCM_5_BIP8",
+    "OTN_ERR_ODTU_3_TCM_6_BEI", "OTN_ERR_ODTU_3_TCM_6_BIP8",
+    "OTN_ERR_ODTU_ALARM_BURST_ODU_AIS", "OTN_ERR_ODTU_ALARM_BURST_ODU_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_ODU_LCK", "OTN_ERR_ODTU_ALARM_BURST_ODU_OCI",
+    "OTN_ERR_ODTU_ALARM_BURST_OPU_CSF", "OTN_ERR_ODTU_ALARM_BURST_TCM_1_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_1_BIAE",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_2_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_2_BIAE",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_3_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_3_BIAE",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_4_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_4_BIAE",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_5_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_5_BIAE",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_6_BDI",
+    "OTN_ERR_ODTU_ALARM_BURST_TCM_6_BIAE", "OTN_ERR_ODTU_FRAME",
+    "OTN_ERR_ODTU_MFAS", "OTN_ERR_ODTU_ODU_BEI", "OTN_ERR_ODTU_ODU_BIP8",
+    "OTN_ERR_ODTU_OPU_C8_CRC_8", "OTN_ERR_ODTU_TCM_1_BEI",
+    "OTN_ERR_ODTU_TCM_1_BIP8", "OTN_ERR_ODTU_TCM_2_BEI",
+    "OTN_ERR_ODTU_TCM_2_BIP8", "OTN_ERR_ODTU_TCM_3_BEI",
+    "OTN_ERR_ODTU_TCM_3_BIP8", "OTN_ERR_ODTU_TCM_4_BEI",
+    "OTN_ERR_ODTU_TCM_4_BIP8", "OTN_ERR_ODTU_TCM_5_BEI",
+    "OTN_ERR_ODTU_TCM_5_BIP8", "OTN_ERR_ODTU_TCM_6_BEI",
+    "OTN_ERR_ODTU_TCM_6_BIP8", "OTN_ERR_ODU_BEI", "OTN_ERR_ODU_BIP8",
+    "OTN_ERR_OMFI", "OTN_ERR_OPU_C8_CRC_8", "OTN_ERR_OTU_BEI",
+    "OTN_ERR_OTU_BIP8", "OTN_ERR_TCM_1_BEI", "OTN_ERR_TCM_1_BIP8",
+    "OTN_ERR_TCM_2_BEI", "OTN_ERR_TCM_2_BIP8", "OTN_ERR_TCM_3_BEI",
+    "OTN_ERR_TCM_3_BIP8", "OTN_ERR_TCM_4_BEI", "OTN_ERR_TCM_4_BIP8",
+    "OTN_ERR_TCM_5_BEI", "OTN_ERR_TCM_5_BIP8", "OTN_ERR_TCM_6_BEI",
+    "OTN_ERR_TCM_6_BIP8", "OTN_INTERFACE_10000T_ETHERNET",
+    "OTN_INTERFACE_1000T_ETHERNET", "OTN_INTERFACE_100M_ETHERNET",
+    "OTN_INTERFACE_100T_ETHERNET", "OTN_INTERFACE_10G_CPRI_8",
+    "OTN_INTERFACE_10G_ETHERNET", "OTN_INTERFACE_10G_FIBRECHAN",
+    "OTN_INTERFACE_10G_OTU_2", "OTN_INTERFACE_10M_ETHERNET",
+    "OTN_INTERFACE_10T_ETHERNET", "OTN_INTERFACE_112G_CFP_OTU_4",
+    "OTN_INTERFACE_112G_OTU_4", "OTN_INTERFACE_112G_OTU_4_CFP28",
+    "OTN_INTERFACE_112G_OTU_4_CFP4", "OTN_INTERFACE_112G_OTU_4_QSFP28",
+    "OTN_INTERFACE_112G_OTU_4_QSFP56", "OTN_INTERFACE_112G_OTU_4_QSFP_DD28",
+    "OTN_INTERFACE_112G_OTU_CN", "OTN_INTERFACE_112G_OTU_CN_QSFP56",
+    "OTN_INTERFACE_112G_QSFP56_OTU_4", "OTN_INTERFACE_11G_OTU_1E",
+    "OTN_INTERFACE_11G_OTU_1F", "OTN_INTERFACE_11G_OTU_2E",
+    "OTN_INTERFACE_11G_OTU_2F", "OTN_INTERFACE_12G_CPRI_9",
+    "OTN_INTERFACE_1G_ETHERNET", "OTN_INTERFACE_1G_FIBRECHAN",
+    "OTN_INTERFACE_1P2G_CPRI_2", "OTN_INTERFACE_24G_CPRI_10",
+    "OTN_INTERFACE_2500T_ETHERNET", "OTN_INTERFACE_2G_FIBRECHAN",
+    "OTN_INTERFACE_2P5G_CPRI_3", "OTN_INTERFACE_2P5G_ETHERNET",
+    "OTN_INTERFACE_2P5G_OTU_1", "OTN_INTERFACE_3G_CPRI_4",
+    "OTN_INTERFACE_43G_OTU_3", "OTN_INTERFACE_44G_OTU_3E1",
+    "OTN_INTERFACE_44G_OTU_3E2", "OTN_INTERFACE_4G_FIBRECHAN",
+    "OTN_INTERFACE_5000T_ETHERNET", "OTN_INTERFACE_5G_CPRI_5",
+    "OTN_INTERFACE_614M_CPRI_1", "OTN_INTERFACE_6G_CPRI_6",
+    "OTN_INTERFACE_8G_CPRI_7A", "OTN_INTERFACE_8G_FIBRECHAN",
+    "OTN_INTERFACE_9G_CPRI_7", "OTN_INTERFACE_OFF",
+    "OTN_INTRUDE_ON_ODU_APS_PCC", "OTN_INTRUDE_ON_ODU_EXP",
+    "OTN_INTRUDE_ON_ODU_FTFL", "OTN_INTRUDE_ON_ODU_GCC1",
+    "OTN_INTRUDE_ON_ODU_GCC2", "OTN_INTRUDE_ON_ODU_PM",
+    "OTN_INTRUDE_ON_ODU_RES1", "OTN_INTRUDE_ON_ODU_RES2",
+    "OTN_INTRUDE_ON_ODU_TCM1", "OTN_INTRUDE_ON_ODU_TCM2",
+    "OTN_INTRUDE_ON_ODU_TCM3", "OTN_INTRUDE_ON_ODU_TCM4",
+    "OTN_INTRUDE_ON_ODU_TCM5", "OTN_INTRUDE_ON_ODU_TCM6",
+    "OTN_INTRUDE_ON_ODU_TCM_ACT", "OTN_INTRUDE_ON_OPU_JC_NJO",
+    "OTN_INTRUDE_ON_OPU_PSI", "OTN_INTRUDE_ON_OPU_RES",
+    "OTN_INTRUDE_ON_OTU_FAS", "OTN_INTRUDE_ON_OTU_GCC0",
+    "OTN_INTRUDE_ON_OTU_MFAS", "OTN_INTRUDE_ON_OTU_RES",
+    "OTN_INTRUDE_ON_OTU_SM", "OTN_JUST_NEGATIVE", "OTN_JUST_POSITIVE",
+    "OTN_MAP_ETHERNET", "OTN_MAP_FIBRECHAN", "OTN_MAP_NONE",
+    "OTN_MAP_ODTU_01_PT_20", "OTN_MAP_ODTU_02_PT_21", "OTN_MAP_ODTU_03_PT_21",
+    "OTN_MAP_ODTU_04_PT_21", "OTN_MAP_ODTU_12_PT_20", "OTN_MAP_ODTU_12_PT_21",
+    "OTN_MAP_ODTU_13_PT_20", "OTN_MAP_ODTU_13_PT_21", "OTN_MAP_ODTU_14_PT_21",
+    "OTN_MAP_ODTU_23_PT_20", "OTN_MAP_ODTU_23_PT_21", "OTN_MAP_ODTU_24_PT_21",
+    "OTN_MAP_ODTU_2E3_PT_21", "OTN_MAP_ODTU_2E4_PT_21",
+    "OTN_MAP_ODTU_34_PT_21", "OTN_MAP_ODU2E_ETHERNET_ASYNC",
+    "OTN_MAP_ODU2E_ETHERNET_SYNC", "OTN_MAP_ODU2F_FIBRECHAN_ASYNC",
+    "OTN_MAP_ODU2F_FIBRECHAN_SYNC", "OTN_MAP_ODU3E_ETHERNET",
+    "OTN_MAP_ODU_FLEX", "OTN_MAP_ODU_FLEX_4G_FC", "OTN_MAP_ODU_FLEX_8G_FC",
+    "OTN_MAP_ODU_FLEX_PT_21", "OTN_MAP_OPU_100G_ETHERNET",
+    "OTN_MAP_OPU_40G_ETHERNET", "OTN_MAP_OPU_40G_ETHERNET_NULL",
+    "OTN_MAP_OPU_40G_ETHERNET_PRBS", "OTN_MAP_OPU_GFP",
+    "OTN_MAP_OPU_GFP_EXTENDED", "OTN_MAP_OPU_NULL", "OTN_MAP_OPU_PRBS",
+    "OTN_MAP_OPU_WAN", "OTN_MAP_SONET_SDH_ASYNC", "OTN_MAP_SONET_SDH_SYNC",
+    "OTN_MAP_UNFRAMED_BERT", "OTN_ODTU_LEVEL_ODU_3",
+    "OTN_ODU_OH_APS_PCC_1", "OTN_ODU_OH_APS_PCC_2", "OTN_ODU_OH_APS_PCC_3",
+    "OTN_ODU_OH_APS_PCC_4", "OTN_ODU_OH_CAPTURE_SELECT_APS_PCC_1",
+    "OTN_ODU_OH_CAPTURE_SELECT_APS_PCC_2",
+    "OTN_ODU_OH_CAPTURE_SELECT_APS_PCC_3",
+    "OTN_ODU_OH_CAPTURE_SELECT_APS_PCC_4", "OTN_ODU_OH_CAPTURE_SELECT_EXP_1",
+    "OTN_ODU_OH_CAPTURE_SELECT_EXP_2", "OTN_ODU_OH_CAPTURE_SELECT_FTFL",
+    "OTN_ODU_OH_CAPTURE_SELECT_GCC1_1", "OTN_ODU_OH_CAPTURE_SELECT_GCC1_2",
+    "OTN_ODU_OH_CAPTURE_SELECT_GCC2_1", "OTN_ODU_OH_CAPTURE_SELECT_GCC2_2",
+    "OTN_ODU_OH_CAPTURE_SELECT_PM_BEI", "OTN_ODU_OH_CAPTURE_SELECT_PM_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_PM_TTI", "OTN_ODU_OH_CAPTURE_SELECT_RES_1",
+    "OTN_ODU_OH_CAPTURE_SELECT_RES_2", "OTN_ODU_OH_CAPTURE_SELECT_RES_3",
+    "OTN_ODU_OH_CAPTURE_SELECT_RES_4", "OTN_ODU_OH_CAPTURE_SELECT_RES_5",
+    "OTN_ODU_OH_CAPTURE_SELECT_RES_6", "OTN_ODU_OH_CAPTURE_SELECT_RES_7",
+    "OTN_ODU_OH_CAPTURE_SELECT_RES_8", "OTN_ODU_OH_CAPTURE_SELECT_RES_9",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM1_BEI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM1_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM1_TTI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM2_BEI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM2_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM2_TTI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM3_BEI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM3_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM3_TTI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM4_BEI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM4_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM4_TTI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM5_BEI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM5_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM5_TTI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM6_BEI",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM6_BIP",
+    "OTN_ODU_OH_CAPTURE_SELECT_TCM6_TTI", "OTN_ODU_OH_CAPTURE_SELECT_TCM_ACT",
+    "OTN_ODU_OH_EXP_1", "OTN_ODU_OH_EXP_2", "OTN_ODU_OH_GCC1_1",
+    "OTN_ODU_OH_GCC1_2", "OTN_ODU_OH_GCC2_1", "OTN_ODU_OH_GCC2_2",
+    "OTN_ODU_OH_PM_BEI", "OTN_ODU_OH_RES_1", "OTN_ODU_OH_RES_2",
+    "OTN_ODU_OH_RES_3", "OTN_ODU_OH_RES_4", "OTN_ODU_OH_RES_5",
+    "OTN_ODU_OH_RES_6", "OTN_ODU_OH_RES_7", "OTN_ODU_OH_RES_8",
+    "OTN_ODU_OH_RES_9", "OTN_ODU_OH_TCM1_BEI", "OTN_ODU_OH_TCM1_BIP",
+    "OTN_ODU_OH_TCM1_TTI", "OTN_ODU_OH_TCM2_BEI", "OTN_ODU_OH_TCM2_BIP",
+    "OTN_ODU_OH_TCM2_TTI", "OTN_ODU_OH_TCM3_BEI", "OTN_ODU_OH_TCM3_BIP",
+    "OTN_ODU_OH_TCM3_TTI", "OTN_ODU_OH_TCM4_BEI", "OTN_ODU_OH_TCM4_BIP",
+    "OTN_ODU_OH_TCM4_TTI", "OTN_ODU_OH_TCM5_BEI", "OTN_ODU_OH_TCM5_BIP",
+    "OTN_ODU_OH_TCM5_TTI", "OTN_ODU_OH_TCM6_BEI", "OTN_ODU_OH_TCM6_BIP",
+    "OTN_ODU_OH_TCM6_TTI", "OTN_ODU_OH_TCM_ACT", "OTN_ODU_TCM_ALARM_DISABLE",
+    "OTN_ODU_TCM_ALARM_ENABLE_NO_TIM", "OTN_ODU_TCM_ALARM_ENABLE_WITH_TIM",
+    "OTN_OH_CAPTURE_RUNNING", "OTN_OH_CAPTURE_WAIT_FOR_TRIG",
+    "OTN_OH_OH_CAPTURE_DONE", "OTN_OH_TRIG_BIT_ERROR",
+    "OTN_OH_TRIG_BYTE_EQUAL", "OTN_OH_TRIG_BYTE_NOT_EQUAL",
+    "OTN_OH_TRIG_FEC_CORR_ERROR", "OTN_OH_TRIG_FEC_UNCORR_ERROR",
+    "OTN_OH_TRIG_FRAME_ERROR", "OTN_OH_TRIG_MANUAL", "OTN_OH_TRIG_MFAS_ERROR",
+    "OTN_OH_TRIG_NEG_JUSTIFY", "OTN_OH_TRIG_ODU_AIS_ERROR",
+    "OTN_OH_TRIG_ODU_BDI_ERROR", "OTN_OH_TRIG_ODU_BEI_ERROR",
+    "OTN_OH_TRIG_ODU_BIP8_ERROR", "OTN_OH_TRIG_ODU_LCK_ERROR",
+    "OTN_OH_TRIG_ODU_OCI_ERROR", "OTN_OH_TRIG_OTU_AIS_ERROR",
+    "OTN_OH_TRIG_OTU_BDI_ERROR", "OTN_OH_TRIG_OTU_BEI_ERROR",
+    "OTN_OH_TRIG_OTU_BIP8_ERROR", "OTN_OH_TRIG_OTU_IAE_ERROR",
+    "OTN_OH_TRIG_OTU_LOM_ERROR", "OTN_OH_TRIG_OTU_OOM_ERROR",
+    "OTN_OH_TRIG_POS_JUSTIFY", "OTN_OPU_OH_CAPTURE_SELECT_JC_1",
+    "OTN_OPU_OH_CAPTURE_SELECT_JC_2", "OTN_OPU_OH_CAPTURE_SELECT_JC_3",
+    "OTN_OPU_OH_CAPTURE_SELECT_NJO", "OTN_OPU_OH_CAPTURE_SELECT_PSI",
+    "OTN_OPU_OH_CAPTURE_SELECT_RES_1", "OTN_OPU_OH_CAPTURE_SELECT_RES_2",
+    "OTN_OPU_OH_CAPTURE_SELECT_RES_3", "OTN_OPU_OH_JC_1", "OTN_OPU_OH_JC_2",
+    "OTN_OPU_OH_JC_3", "OTN_OPU_OH_NJO", "OTN_OPU_OH_PSI", "OTN_OPU_OH_RES_1",
+    "OTN_OPU_OH_RES_2", "OTN_OPU_OH_RES_3",
+    "OTN_OTU_OH_CAPTURE_SELECT_FAS_OA1_1",
+    "OTN_OTU_OH_CAPTURE_SELECT_FAS_OA1_2",
+    "OTN_OTU_OH_CAPTURE_SELECT_FAS_OA1_3",
+    "OTN_OTU_OH_CAPTURE_SELECT_FAS_OA2_1",
+    "OTN_OTU_OH_CAPTURE_SELECT_FAS_OA2_2",
+    "OTN_OTU_OH_CAPTURE_SELECT_FAS_OA2_3", "OTN_OTU_OH_CAPTURE_SELECT_GCC0_1",
+    "OTN_OTU_OH_CAPTURE_SELECT_GCC0_2", "OTN_OTU_OH_CAPTURE_SELECT_MFAS",
+    "OTN_OTU_OH_CAPTURE_SELECT_OSMC", "OTN_OTU_OH_CAPTURE_SELECT_RES_2",
+    "OTN_OTU_OH_CAPTURE_SELECT_SM_BEI", "OTN_OTU_OH_CAPTURE_SELECT_SM_BIP",
+    "OTN_OTU_OH_CAPTURE_SELECT_SM_TTI", "OTN_OTU_OH_FAS_OA1_1",
+    "OTN_OTU_OH_FAS_OA1_2", "OTN_OTU_OH_FAS_OA1_3", "OTN_OTU_OH_FAS_OA2_1",
+    "OTN_OTU_OH_FAS_OA2_2", "OTN_OTU_OH_FAS_OA2_3", "OTN_OTU_OH_GCC0_1",
+    "OTN_OTU_OH_GCC0_2", "OTN_OTU_OH_OSMC", "OTN_OTU_OH_RES_2",
+    "OTN_OTU_OH_SM_BEI", "OTN_OTU_OH_SM_BIP", "OTN_OTU_OH_SM_TTI",
+    "OTN_PATTERN_BACKGROUND", "OTN_PATTERN_LIVE", "OTN_PATTERN_PRBS_11",
+    "OTN_PATTERN_PRBS_11_INV", "OTN_PATTERN_PRBS_15",
+    "OTN_PATTERN_PRBS_15_INV", "OTN_PATTERN_PRBS_20",
+    "OTN_PATTERN_PRBS_20_INV", "OTN_PATTERN_PRBS_23",
+    "OTN_PATTERN_PRBS_23_INV", "OTN_PATTERN_PRBS_31",
+    "OTN_PATTERN_PRBS_31_INV", "OTN_PATTERN_PRBS_9", "OTN_PATTERN_PRBS_9_INV",
+    "OTN_PATTERN_USER", "OTN_RTD_ARMED", "OTN_RTD_CONT_ARM",
+    "OTN_RTD_CONT_RUN", "OTN_RTD_DM_SELECT_PM", "OTN_RTD_DM_SELECT_TCM1",
+    "OTN_RTD_DM_SELECT_TCM2", "OTN_RTD_DM_SELECT_TCM3",
+    "OTN_RTD_DM_SELECT_TCM4", "OTN_RTD_DM_SELECT_TCM5",
+    "OTN_RTD_DM_SELECT_TCM6", "OTN_RTD_RUNNING", "OTN_RTD_STOPPED",
+    "OTN_SDT_ARM_CONTINUOUS", "OTN_SDT_ARM_SINGLE",
+    "OTN_SDT_ODTU_LEVEL_ODU_0", "OTN_SDT_ODTU_LEVEL_ODU_1",
+    "OTN_SDT_ODTU_LEVEL_ODU_2", "OTN_SDT_ODTU_LEVEL_ODU_3",
+    "OTN_SDT_ODTU_LEVEL_ODU_4", "OTN_SDT_RTD_STOP", "OTN_SDT_ST_ARMED",
+    "OTN_SDT_ST_CONT_ARM", "OTN_SDT_ST_CONT_RUN", "OTN_SDT_ST_RUNNING",
+    "OTN_SDT_ST_STOPPED", "OTN_SDT_ST_TRIG_BIT_MASK",
+    "OTN_SDT_ST_TRIG_ODU_AIS_MASK", "OTN_SDT_ST_TRIG_ODU_BIP8_MASK",
+    "OTN_SDT_ST_TRIG_OOF_MASK", "OTN_SDT_ST_TRIG_OTU_AIS_MASK",
+    "OTN_SDT_ST_TRIG_OTU_BIP8_MASK",
+    "PACKET_CAPTURE_ARMED", "PACKET_CAPTURE_COMPLETE",
+    "PACKET_CAPTURE_SIZE_128_BYTES", "PACKET_CAPTURE_SIZE_64_BYTES",
+    "PACKET_CAPTURE_SIZE_FULL_FRAME", "PACKET_CAPTURE_STOPPED",
+    "PACKET_LATENCY_VALID_100_NANOSEC", "PACKET_LATENCY_VALID_10_NANOSEC",
+    "PACKET_LATENCY_VALID_1_NANOSEC", "PACKET_PING_REPLY_LIFETIME",
+    "PACKET_PING_REPLY_NOFRAG", "PACKET_PING_REPLY_NONE",
+    "PACKET_PING_REPLY_QUENCH", "PACKET_PING_REPLY_SUCCESS",
+    "PACKET_PING_REPLY_TIMEOUT", "PACKET_PING_REPLY_UNKNOWN",
+    "PACKET_PING_REPLY_UNREACHABLE", "PACKET_RFC_BACK_TO_BACK_ACTIVE",
+    "PACKET_RFC_FRAME_LOSS_ACTIVE", "PACKET_RFC_LATENCY_ACTIVE",
+    "PACKET_RFC_STOPPED", "PACKET_RFC_THROUGHPUT_ACTIVE",
+    "PACKET_STREAM_REF_ALL",
+    "PB_PHY_INTERFACE_103G_RS_FEC_ETHERNET",
+    "PCS_OTL_ALARM_ALIGNMENT_MARKER_LOSS", "PCS_OTL_ALARM_BLOCK_LOCK_LOSS",
+    "PCS_OTL_ALARM_HI_BER", "PCS_OTL_ALARM_HI_SER", "PCS_OTL_ALARM_LOA",
+    "PCS_OTL_ALARM_OFF", "PCS_OTL_ALARM_RS_FEC_ALIGN_MARK_LOSS",
+    "PCS_OTL_ALARM_RS_FEC_ALIGN_MARK_LOSS_LANE", "PCS_OTL_ALARM_RS_FEC_LOA",
+    "PCS_OTL_ALARM_RS_FEC_LOCAL_SER_DEGRADED",
+    "PCS_OTL_ALARM_RS_FEC_REM_SER_DEGRADED", "PCS_OTL_ALARM_RS_FEC_STRESS",
+    "PCS_OTL_ALARM_RS_FEC_STRESS_CHANNEL_A",
+    "PCS_OTL_ALARM_RS_FEC_STRESS_CHANNEL_B", "PCS_OTL_ERR_BIP_8",
+    "PCS_OTL_ERR_BLOCK", "PCS_OTL_ERR_INVALID_ALIGNMENT_MARKER",
+    "PCS_OTL_ERR_INVALID_SYNC_HEADER", "PCS_OTL_ERR_NONE",
+    "PCS_OTL_ERR_RS_FEC_ALIGN_MARKER_PAD",
+    "PCS_OTL_ERR_RS_FEC_CHAN_A_CORRECTABLE_SYMBOL",
+    "PCS_OTL_ERR_RS_FEC_CHAN_A_UNCORRECTABLE",
+    "PCS_OTL_ERR_RS_FEC_CHAN_B_CORRECTABLE_SYMBOL",
+    "PCS_OTL_ERR_RS_FEC_CHAN_B_UNCORRECTABLE",
+    "PCS_OTL_ERR_RS_FEC_CORRECTABLE", "PCS_OTL_ERR_RS_FEC_CORRECTABLE_A_LANE",
+    "PCS_OTL_ERR_RS_FEC_CORRECTABLE_B_LANE", "PCS_OTL_ERR_RS_FEC_TRANSCODE",
+    "PCS_OTL_ERR_RS_FEC_UNCORRECTABLE",
+    "PHY_ALARM_LOS", "PHY_ALARM_OFF", "PHY_EYE_CLOCK_SOURCE_DISABLED",
+    "PHY_EYE_CLOCK_SOURCE_PORT_1", "PHY_EYE_CLOCK_SOURCE_PORT_10",
+    "PHY_EYE_CLOCK_SOURCE_PORT_11", "PHY_EYE_CLOCK_SOURCE_PORT_12",
+    "PHY_EYE_CLOCK_SOURCE_PORT_2", "PHY_EYE_CLOCK_SOURCE_PORT_3",
+    "PHY_EYE_CLOCK_SOURCE_PORT_4", "PHY_EYE_CLOCK_SOURCE_PORT_5",
+    "PHY_EYE_CLOCK_SOURCE_PORT_6", "PHY_EYE_CLOCK_SOURCE_PORT_7",
+    "PHY_EYE_CLOCK_SOURCE_PORT_8", "PHY_EYE_CLOCK_SOURCE_PORT_9",
+    "PHY_INTERFACE_10000T_ETHERNET", "PHY_INTERFACE_1000T_ETHERNET",
+    "PHY_INTERFACE_100T_ETHERNET", "PHY_INTERFACE_103G_ETHERNET",
+    "PHY_INTERFACE_103G_ETHERNET_FLEXE",
+    "PHY_INTERFACE_103G_ETHERNET_UNFRAMED",
+    "PHY_INTERFACE_103G_FRAMED_PCS_BERT", "PHY_INTERFACE_10G_ETHERNET",
+    "PHY_INTERFACE_10G_ETHERNET_UNFRAMED", "PHY_INTERFACE_10G_FIBRE_CHANNEL",
+    "PHY_INTERFACE_10G_FIBRE_UNFRAMED", "PHY_INTERFACE_10G_OTU_2",
+    "PHY_INTERFACE_10G_OTU_2_UNFRAMED", "PHY_INTERFACE_10T_ETHERNET",
+    "PHY_INTERFACE_112G_FIBRE_CHANNEL", "PHY_INTERFACE_112G_FIBRE_UNFRAMED",
+    "PHY_INTERFACE_112G_FRAMED_OTU_BERT", "PHY_INTERFACE_112G_OTU_4",
+    "PHY_INTERFACE_112G_OTU_4_UNFRAMED", "PHY_INTERFACE_112G_OTU_CN",
+    "PHY_INTERFACE_112G_OTU_CN_UNFRAMED", "PHY_INTERFACE_11G_OTU_1E",
+    "PHY_INTERFACE_11G_OTU_1E_UNFRAMED", "PHY_INTERFACE_11G_OTU_2E",
+    "PHY_INTERFACE_11G_OTU_2E_UNFRAMED", "PHY_INTERFACE_16G_FIBRE_CHANNEL",
+    "PHY_INTERFACE_16G_FIBRE_UNFRAMED", "PHY_INTERFACE_16G_RS_FEC_FIBRE",
+    "PHY_INTERFACE_212G_ETHERNET_UNFRAMED",
+    "PHY_INTERFACE_212G_FRAMED_PCS_BERT",
+    "PHY_INTERFACE_212G_RS_FEC_ETHERNET", "PHY_INTERFACE_24G_CPRI_10",
+    "PHY_INTERFACE_24G_CPRI_10_UNFRAMED", "PHY_INTERFACE_2500T_ETHERNET",
+    "PHY_INTERFACE_25G_ETHERNET", "PHY_INTERFACE_25G_ETHERNET_UNFRAMED",
+    "PHY_INTERFACE_25G_RS_FEC_ETHERNET", "PHY_INTERFACE_32G_FIBRE_CHANNEL",
+    "PHY_INTERFACE_32G_FIBRE_UNFRAMED",
+    "PHY_INTERFACE_40G_FRAMED_OC_STM_BERT",
+    "PHY_INTERFACE_40G_OC_768_STM_256",
+    "PHY_INTERFACE_40G_OC_768_STM_256_UNFRAMED",
+    "PHY_INTERFACE_412G_ETHERNET_UNFRAMED", "PHY_INTERFACE_41G_ETHERNET",
+    "PHY_INTERFACE_41G_ETHERNET_UNFRAMED",
+    "PHY_INTERFACE_41G_FRAMED_PCS_BERT",
+    "PHY_INTERFACE_425G_ETHERNET_UNFRAMED",
+    "PHY_INTERFACE_425G_FRAMED_PCS_BERT",
+    "PHY_INTERFACE_425G_RS_FEC_ETHERNET", "PHY_INTERFACE_43G_FRAMED_OTU_BERT",
+    "PHY_INTERFACE_43G_OTU_3", "PHY_INTERFACE_43G_OTU_3_UNFRAMED",
+    "PHY_INTERFACE_44G_OTU_3E1", "PHY_INTERFACE_44G_OTU_3E1_UNFRAMED",
+    "PHY_INTERFACE_44G_OTU_3E2", "PHY_INTERFACE_44G_OTU_3E2_UNFRAMED",
+    "PHY_INTERFACE_5000T_ETHERNET", "PHY_INTERFACE_8G_FIBRE_CHANNEL",
+    "PHY_INTERFACE_8G_FIBRE_UNFRAMED", "PHY_INTERFACE_OFF",
+    "PHY_INTERFACE_TYPE_CFP", "PHY_INTERFACE_TYPE_CFP4",
+    "PHY_INTERFACE_TYPE_CFP8", "PHY_INTERFACE_TYPE_QSFP",
+    "PHY_INTERFACE_TYPE_QSFP10", "PHY_INTERFACE_TYPE_QSFP28",
+    "PHY_INTERFACE_TYPE_QSFP56", "PHY_INTERFACE_TYPE_QSFP_DD10",
+    "PHY_INTERFACE_TYPE_QSFP_DD28", "PHY_INTERFACE_TYPE_QSFP_DD56",
+    "PHY_INTERFACE_TYPE_SFP", "PHY_INTERFACE_TYPE_SFP10",
+    "PHY_INTERFACE_TYPE_SFP28", "PHY_INTERFACE_TYPE_SFP56",
+    "PHY_INTERFACE_TYPE_SINGLE", "PHY_PATTERN_LIVE", "PHY_PATTERN_PRBS_11",
+    "PHY_PATTERN_PRBS_11_INV", "PHY_PATTERN_PRBS_13",
+    "PHY_PATTERN_PRBS_13_INV", "PHY_PATTERN_PRBS_15",
+    "PHY_PATTERN_PRBS_15_INV", "PHY_PATTERN_PRBS_20",
+    "PHY_PATTERN_PRBS_20_INV", "PHY_PATTERN_PRBS_23",
+    "PHY_PATTERN_PRBS_23_INV", "PHY_PATTERN_PRBS_31",
+    "PHY_PATTERN_PRBS_31_INV", "PHY_PATTERN_PRBS_9", "PHY_PATTERN_PRBS_9_INV",
+    "PHY_PATTERN_SQUARE_WAVE", "PHY_PATTERN_USER", "PHY_TX_POST_EMPH_0_00",
+    "PHY_TX_POST_EMPH_0_22", "PHY_TX_POST_EMPH_0_45", "PHY_TX_POST_EMPH_0_68",
+    "PHY_TX_POST_EMPH_0_92", "PHY_TX_POST_EMPH_1_16", "PHY_TX_POST_EMPH_1_41",
+    "PHY_TX_POST_EMPH_1_67", "PHY_TX_POST_EMPH_1_94", "PHY_TX_POST_EMPH_2_21",
+    "PHY_TX_POST_EMPH_2_50", "PHY_TX_POST_EMPH_2_79", "PHY_TX_POST_EMPH_3_10",
+    "PHY_TX_POST_EMPH_3_41", "PHY_TX_POST_EMPH_3_74", "PHY_TX_POST_EMPH_4_08",
+    "PHY_TX_POST_EMPH_4_44", "PHY_TX_POST_EMPH_4_81", "PHY_TX_POST_EMPH_5_19",
+    "PHY_TX_POST_EMPH_5_60", "PHY_TX_POST_EMPH_6_02",
+    "PHY_TX_POST_EMPH_DEFAULT", "PHY_TX_PRE_EMPH_0_00",
+    "PHY_TX_PRE_EMPH_0_22", "PHY_TX_PRE_EMPH_0_45", "PHY_TX_PRE_EMPH_0_68",
+    "PHY_TX_PRE_EMPH_0_92", "PHY_TX_PRE_EMPH_10_46", "PHY_TX_PRE_EMPH_11_21",
+    "PHY_TX_PRE_EMPH_12_04", "PHY_TX_PRE_EMPH_12_96", "PHY_TX_PRE_EMPH_1_16",
+    "PHY_TX_PRE_EMPH_1_41", "PHY_TX_PRE_EMPH_1_67", "PHY_TX_PRE_EMPH_1_94",
+    "PHY_TX_PRE_EMPH_2_21", "PHY_TX_PRE_EMPH_2_50", "PHY_TX_PRE_EMPH_2_79",
+    "PHY_TX_PRE_EMPH_3_10", "PHY_TX_PRE_EMPH_3_41", "PHY_TX_PRE_EMPH_3_74",
+    "PHY_TX_PRE_EMPH_4_08", "PHY_TX_PRE_EMPH_4_44", "PHY_TX_PRE_EMPH_4_81",
+    "PHY_TX_PRE_EMPH_5_19", "PHY_TX_PRE_EMPH_5_60", "PHY_TX_PRE_EMPH_6_02",
+    "PHY_TX_PRE_EMPH_6_47", "PHY_TX_PRE_EMPH_6_94", "PHY_TX_PRE_EMPH_7_43",
+    "PHY_TX_PRE_EMPH_7_96", "PHY_TX_PRE_EMPH_8_52", "PHY_TX_PRE_EMPH_9_12",
+    "PHY_TX_PRE_EMPH_9_76", "PHY_TX_PRE_EMPH_DEFAULT", "PHY_TX_SWING_1027",
+    "PHY_TX_SWING_1057", "PHY_TX_SWING_1087", "PHY_TX_SWING_285",
+    "PHY_TX_SWING_315", "PHY_TX_SWING_344", "PHY_TX_SWING_374",
+    "PHY_TX_SWING_404", "PHY_TX_SWING_433", "PHY_TX_SWING_443",
+    "PHY_TX_SWING_463", "PHY_TX_SWING_493", "PHY_TX_SWING_523",
+    "PHY_TX_SWING_552", "PHY_TX_SWING_582", "PHY_TX_SWING_612",
+    "PHY_TX_SWING_641", "PHY_TX_SWING_671", "PHY_TX_SWING_701",
+    "PHY_TX_SWING_730", "PHY_TX_SWING_760", "PHY_TX_SWING_790",
+    "PHY_TX_SWING_819", "PHY_TX_SWING_849", "PHY_TX_SWING_879",
+    "PHY_TX_SWING_908", "PHY_TX_SWING_938", "PHY_TX_SWING_968",
+    "PHY_TX_SWING_998", "PHY_TX_SWING_DEFAULT",
+    "PROTO_ETHERNET", "PROTO_FIBRECHAN", "PROTO_GFP", "PROTO_OTL",
+    "PROTO_OTN", "PROTO_PCS", "PROTO_PHY", "PROTO_SONET_SDH", "PROTO_T1E1",
+    "PROTO_T3E3E4", "PROTO_ZERO",
+    "REASON_CONNECTION_FAILURE", "REASON_CONNPARAM_NOT_AVAIL",
+    "REASON_CORBA_SYS_EXCEPTION", "REASON_EXPIRED_CP_LICENSE",
+    "REASON_INVALID_CP_LICENSE", "REASON_INVALID_MSG_ACTION",
+    "REASON_INVALID_MSG_PAYLOAD", "REASON_INVALID_MSG_PP_TYPE",
+    "REASON_INVALID_MSG_RES_ID", "REASON_INVALID_MSG_TYPE",
+    "REASON_INVALID_SETTING", "REASON_INVALID_TEST_ID",
+    "REASON_OUT_OF_SERVICE", "REASON_REGISTER_READ_FAIL",
+    "REASON_RESOURCE_NOTAVAIL", "REASON_SEEPROM_ACCESS_FAIL",
+    "REASON_SIGNALLING_ERROR", "REASON_TIMEOUT", "REASON_UNKNOWN_EXCEPTION",
+    "REASON_UNKNOWN_NAK",
+    "REPORT_BAD_FILENAME", "REPORT_COMPLETE", "REPORT_FAILED",
+    "REPORT_IN_PROGRESS",
+    "SYS_CLOCK_1544_SINE", "SYS_CLOCK_2048_SINE", "SYS_CLOCK_BITS",
+    "SYS_CLOCK_GPS_IN_10M_OUT", "SYS_CLOCK_GPS_IN_1544_OUT",
+    "SYS_CLOCK_GPS_IN_1PPS_OUT", "SYS_CLOCK_GPS_IN_2048_OUT",
+    "SYS_CLOCK_GPS_NO_OUTPUT", "SYS_CLOCK_INTERNAL_10M_OUT",
+    "SYS_CLOCK_INTERNAL_1544_SINE", "SYS_CLOCK_INTERNAL_1PPS_OUT",
+    "SYS_CLOCK_INTERNAL_2048_SINE", "SYS_CLOCK_INTERNAL_BITS",
+    "SYS_CLOCK_INTERNAL_NO_OUTPUT", "SYS_CLOCK_INTERNAL_SETS",
+    "SYS_CLOCK_SETS", "SYS_CLOCK_SMA_10M_IN_1PPS_OUT",
+    "SYS_CLOCK_SMA_10M_IN_OUT", "SYS_CLOCK_SMA_1544_IN_OUT",
+    "SYS_CLOCK_SMA_1544_NO_OUTPUT", "SYS_CLOCK_SMA_1PPS_IN_10M_OUT",
+    "SYS_CLOCK_SMA_1PPS_IN_OUT", "SYS_CLOCK_SMA_2048_IN_OUT",
+    "SYS_CLOCK_SMA_2048_NO_OUTPUT", "SYS_CLOCK_STATUS_MCH_FREE_RUN",
+    "SYS_CLOCK_STATUS_MCH_HOLDOVER", "SYS_CLOCK_STATUS_MCH_INTERNAL",
+    "SYS_CLOCK_STATUS_MCH_LOCKED", "SYS_CLOCK_STATUS_MCH_LOSS_OF_LOCK",
+    "SYS_CLOCK_STATUS_MCH_NA", "SYS_CLOCK_STATUS_MCH_NOT_CONNECTED",
+    "SYS_CLOCK_STATUS_MCH_NO_BITS_SETS", "SYS_CLOCK_STATUS_MCH_NO_RESPONSE",
+    "SYS_CLOCK_STATUS_MCH_PRE_LOCKED", "SYS_CLOCK_STATUS_MCH_PRE_LOCKED_2",
+    "SYS_CLOCK_STATUS_MCH_RLOS",
+    "TIMED_LICENSE_INVALID", "TIMED_LICENSE_IN_FUTURE",
+    "TIMED_LICENSE_IN_USE", "TIMED_LICENSE_ON_REBOOT",
+    ])
+
+# Stats fields. A field the schema of the PP has no default for is a
+# result, ie. stats.otuBip8.
+STATS_FIELDS = frozenset([
+    "ais", "alignMark", "alignMarkLoss", "avgSdtSwitchTime", "bip8", "bit",
+    "block", "block1027b", "blockLockLoss", "captureData", "captureDataState",
+    "captureState", "captureTimestampOffset", "clock", "cpPowerLoss",
+    "elapsedTime", "fecAlignMarkLoss", "fecAlignMarkLossLane",
+    "fecAlignMarkPad", "fecChanABCorrectableBit", "fecChanABCorrectableCw",
+    "fecChanABCorrectableOnes", "fecChanABCorrectableSymbol",
+    "fecChanABCorrectableZeros", "fecChanABUncorrectable",
+    "fecChanACorrectableBit", "fecChanACorrectableCw",
+    "fecChanACorrectableOnes", "fecChanACorrectableSymbol",
+    "fecChanACorrectableZeros", "fecChanAUncorrectable",
+    "fecChanBCorrectableBit", "fecChanBCorrectableCw",
+    "fecChanBCorrectableOnes", "fecChanBCorrectableSymbol",
+    "fecChanBCorrectableZeros", "fecChanBUncorrectable", "fecCorrectable",
+    "fecCorrectableBitLane", "fecCorrectableCw", "fecCorrectableSymbol",
+    "fecCorrectableSymbolLane", "fecCorrectableSymbolN", "fecCorrected",
+    "fecLoa", "fecTranscode", "fecUncorrectable", "fecUncorrected",
+    "firstCapturedFrame", "frame", "freqOffsetRxHz", "freqOffsetRxHzMax",
+    "freqOffsetRxHzMin", "freqOffsetRxPpm", "freqOffsetRxPpmMax",
+    "freqOffsetRxPpmMin", "freqOffsetTxHz", "freqOffsetTxPpm", "freqRx",
+    "freqRxMax", "freqRxMin", "freqTx", "hiBer", "hiSer", "justFreqOffset",
+    "justifySecs", "lanOtnBip8", "lanPcsBip8", "laneSkew",
+    "lastCapturedFrame", "loa", "localSerDegraded", "lof", "lom", "loomfi",
+    "lor", "los", "maxSdtSwitchTime", "mfas", "minSdtSwitchTime",
+    "negJustify", "odtuFrame", "odtuLof", "odtuLom", "odtuMfas", "odtuOduAis",
+    "odtuOduBdi", "odtuOduBei", "odtuOduBip8", "odtuOduDapiTim", "odtuOduLck",
+    "odtuOduOci", "odtuOduSapiTim", "odtuOof", "odtuOom", "odtuOpuC8Crc8",
+    "odtuOpuC8Sync", "odtuOpuCsf", "odtuOpuFreqWide", "odtuOpuPlm",
+    "odtuStatsLevel", "odtuTcmBdi", "odtuTcmBei", "odtuTcmBiae",
+    "odtuTcmBip8", "odtuTcmDapiTim", "odtuTcmSapiTim", "oduAis",
+    "oduBackwardFtflFault", "oduBackwardFtflOI", "oduBackwardFtflOS",
+    "oduBdi", "oduBei", "oduBip8", "oduDapiTim", "oduForwardFtflFault",
+    "oduForwardFtflOI", "oduForwardFtflOS", "oduLck", "oduOci", "oduOh",
+    "oduPmTtiDapi", "oduPmTtiSapi", "oduPmTtiSpecific", "oduSapiTim",
+    "oduTcmTtiDapi", "oduTcmTtiSapi", "oduTcmTtiSpecific", "omfi", "oof",
+    "oom", "ooomfi", "oor", "opuAis", "opuC8Crc8", "opuC8Sync", "opuCsf",
+    "opuFreqWide", "opuMsi", "opuOh", "opuPlm", "otuAis", "otuBdi", "otuBei",
+    "otuBiae", "otuBip8", "otuDapiTim", "otuIae", "otuOh", "otuSapiTim",
+    "otuSmTtiDapi", "otuSmTtiSapi", "otuSmTtiSpecific", "patternSync",
+    "pingBytesReceived", "pingNumberPacketsReceived",
+    "pingNumberPacketsTransmitted", "pingPercentPacketLoss", "pingResponse",
+    "pingResponseTime", "pingRoundTripDelayAvg", "pingRoundTripDelayMax",
+    "pingRoundTripDelayMin", "pingSeqNumber", "pingTTL", "posJustify",
+    "ppPaused", "recentSdtSwitchTimes", "remoteSerDegraded",
+    "rfcB2BAvgMeasured", "rfcB2BMaxPossible", "rfcLatencyAvg",
+    "rfcLossRxCount", "rfcLossTxCount", "rfcLossTxRate", "rfcState",
+    "rfcThroughputPassingRate", "rfcThroughputRxCount",
+    "rfcThroughputTxCount", "runTimeLeft", "rxFecLaneCount", "rxFlexDataRate",
+    "rxFreqWide", "rxGmpC8Gtr2", "rxGmpC8GtrItu", "rxGmpC8Largest",
+    "rxGmpC8Lt2", "rxGmpC8LtItu", "rxGmpC8Minus1", "rxGmpC8Minus2",
+    "rxGmpC8Plus1", "rxGmpC8Plus2", "rxGmpC8Smallest", "rxHostLaneCount",
+    "rxLaneMap", "rxLanePower", "rxLaneSkew", "rxNetLaneCount",
+    "rxPowerHighAlarmThreshold", "rxPowerHighWarningThreshold", "rxPowerHot",
+    "rxPowerLow", "rxPowerLowAlarmThreshold", "rxPowerLowWarningThreshold",
+    "rxPowerWarm", "rxVirtLaneCount", "sdtSwitchFrameRate", "sdtSwitchState",
+    "sdtSwitchTime", "serDegraded", "sfpI2cInfo", "signalStrength",
+    "signalStrengthMax", "signalStrengthMin", "summaryAlignMarkLed",
+    "summaryAlignMarkLossLed", "summaryBip8Led", "summaryBitLed",
+    "summaryBlockLockLossLed", "summaryLaneLed", "summaryLaneSkewLed",
+    "summaryLed", "summaryModuleLed", "summaryPatternSyncLed",
+    "summarySyncHdrLed", "syncHdr", "tcmBdi", "tcmBei", "tcmBiae", "tcmBip8",
+    "tcmDapiTim", "tcmSapiTim", "tempHighAlarmThreshold",
+    "tempHighWarningThreshold", "tempLowAlarmThreshold",
+    "tempLowWarningThreshold", "testPaused", "totalAlignMark", "totalBip8",
+    "totalBit", "totalSyncHdr", "txBiasHighAlarmThreshold",
+    "txBiasHighWarningThreshold", "txBiasLowAlarmThreshold",
+    "txBiasLowWarningThreshold", "txGmpC8Gtr2", "txGmpC8Largest",
+    "txGmpC8Lt2", "txGmpC8Minus1", "txGmpC8Minus2", "txGmpC8Plus1",
+    "txGmpC8Plus2", "txGmpC8Smallest", "txPowerHighAlarmThreshold",
+    "txPowerHighWarningThreshold", "txPowerLowAlarmThreshold",
+    "txPowerLowWarningThreshold", "txWavelength", "vccHighAlarmThreshold",
+    "vccHighWarningThreshold", "vccLowAlarmThreshold",
+    "vccLowWarningThreshold",
+    ])
+
+# Settings fields. A field the schema of the PP has no default for is 0.
+SETTINGS_FIELDS = frozenset([
+    "alarmGenType", "captureSize", "captureTrigger", "clockType",
+    "disableLofReset", "errorGenBurstPeriod", "errorGenBurstSize",
+    "errorGenRate", "errorGenType", "eyeClockSource", "hiSerDisable",
+    "hiSerPeriod", "inTriggerAction", "isRxMultiChanMapping",
+    "isTxMultiChanMapping", "laneAlarmGenType", "laneErrorGenRate",
+    "laneErrorGenType", "laserOn", "lineFreqOffset", "lineFreqRampStart",
+    "lineFreqRampStepDuration", "lineFreqRampStepSize", "odtu1RxMapping",
+    "odtu1TxMapping", "odtu2RxMapping", "odtu2TxMapping", "odtu3RxMapping",
+    "odtu3TxMapping", "oduBackwardFtflFault", "oduBackwardFtflOI",
+    "oduBackwardFtflOS", "oduForwardFtflFault", "oduForwardFtflOI",
+    "oduForwardFtflOS", "oduOh", "oduPmTimAlarmEnable", "oduPmTtiDapi",
+    "oduPmTtiExpectedDapi", "oduPmTtiExpectedSapi", "oduPmTtiSapi",
+    "oduPmTtiSpecific", "oduTcmAlarmEnable", "oduTcmTtiDapi",
+    "oduTcmTtiExpectedDapi", "oduTcmTtiExpectedSapi", "oduTcmTtiSapi",
+    "oduTcmTtiSpecific", "ohCaptureByteSelect", "ohCaptureMatchValue",
+    "ohCapturePosition", "opticalAlarmGenType", "opuFreqOffset",
+    "opuFreqTolerance", "opuMsi", "opuOh", "opuPlmAlarmEnable",
+    "opuPtExpected", "otuOh", "otuSmTimAlarmEnable", "otuSmTtiDapi",
+    "otuSmTtiExpectedDapi", "otuSmTtiExpectedSapi", "otuSmTtiSapi",
+    "otuSmTtiSpecific", "outTriggerSrc", "passthruMode", "powerUpLaserState",
+    "rfcPacketSize", "rfcRateCeiling", "rtdDmSelect", "rxDataInvert",
+    "rxFecDisable", "rxFlexDataRateExpected", "rxFreqTolerance",
+    "rxInterface", "rxLaneSkewThreshold", "rxMapping", "rxMultiChanPattern",
+    "rxPattern", "rxPowerMinimum", "rxScrambleDisable", "rxUserPattern",
+    "sdtCriteriaMask", "sdtDrop", "sdtOdtuLevel", "sdtSwitchFrameRate",
+    "sdtSwitchState", "sdtSwitchStopCount", "serDegradedActivateThreshold",
+    "serDegradedDeactivateThreshold", "serDegradedEnable",
+    "serDegradedIntervalThreshold", "settingsControl", "txDataInvert",
+    "txFecDisable", "txFlexDataRate", "txFreqTolerance", "txHostLaneCount",
+    "txInterface", "txIntrudeOn", "txLaneMap", "txLanePostEmph",
+    "txLanePreEmph", "txLaneSkew", "txLaneSwing", "txMapping",
+    "txNetLaneCount", "txPattern", "txRxInterface", "txRxInterfaceType",
+    "txScrambleDisable", "txUserPattern", "txVirtLaneCount",
+    ])
+
+# Allowed settings fields. A field the schema has no default for is 0.
+ALLOWED_SETTINGS_FIELDS = frozenset([
+    "rfcLatencyValid", "rxOpticalLaneCount", "rxVirtLaneCount",
+    "rxVirtualLaneCount", "txOpticalLaneCount", "txPhysicalLaneCount",
+    "txVirtLaneCount", "txVirtualLaneCount",
+    ])
+
+# Settings commands the simulator only counts as a round trip.
+SETTINGS_COMMANDS = frozenset([
+    "armSdtSwitch", "insertSingleError",
+    ])
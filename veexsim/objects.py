@@ -0,0 +1,464 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   objects.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module with the simulated round trip to the chassis and the settings,
+#    stats and result objects of the simulated PPs.
+#
+###############################################################################
+
+import random
+import time
+
+from veexsim.constants import value
+from veexsim.known import SETTINGS_COMMANDS
+
+# Method names of settings objects that are commands to the PP, ie.
+# setTxMapping() or insertSingleError(), and aren't fields.
+class Link(object):
+    '''This class is the simulated connection to the protobufServer. Each
+    round trip sleeps for latency seconds plus a normally distributed jitter
+    with a standard deviation of jitter seconds, never less than zero.
+    '''
+
+    def __init__(self, latency = 0.0, jitter = 0.0, seed = None):
+        self.latency = latency
+        self.jitter  = jitter
+        self.random  = random.Random(seed)
+        self.trips   = 0    # Round trips made, for checking a benchmark
+
+    def roundTrip(self):
+        '''Waits for one request and response to the server.
+        '''
+        self.trips += 1
+        delay = self.latency
+        if self.jitter > 0:
+            delay = self.random.gauss(self.latency, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Led(object):
+    '''This class is the LED state of a result, as the GUI shows it.
+    '''
+    __slots__ = ("isRed", "wasRed", "isYellow")
+
+    def __init__(self):
+        self.isRed    = False
+        self.wasRed   = False
+        self.isYellow = False
+
+
+class Result(object):
+    '''This class is one alarm or error result, ie. stats.otuBip8 or one lane
+    of stats.bip8. Alarms use secs and the LED, errors use the count and
+    rates.
+    '''
+    __slots__ = ("count", "currRate", "avgRate", "secs", "alarmSecs", "led")
+
+    def __init__(self):
+        self.count     = 0
+        self.currRate  = 0.0
+        self.avgRate   = 0.0
+        self.secs      = 0
+        self.alarmSecs = 0
+        self.led       = Led()
+
+
+class StreamResult(object):
+    '''This class is the results of one Ethernet stream.
+    '''
+    __slots__ = ("txFrames", "rxFrames", "txBytes", "rxBytes", "lostFrames",
+                 "outOfSequence", "latencyMin", "latencyMax", "latencyAvg")
+
+    def __init__(self):
+        self.txFrames      = 0
+        self.rxFrames      = 0
+        self.txBytes       = 0
+        self.rxBytes       = 0
+        self.lostFrames    = 0
+        self.outOfSequence = 0
+        self.latencyMin    = 0.0    # Microseconds
+        self.latencyMax    = 0.0
+        self.latencyAvg    = 0.0
+
+
+class SfpInfo(object):
+    '''This class is stats.sfpI2cInfo, the static EEPROM fields of the
+    plugged in module. Text fields are bytes as in the EEPROM.
+    '''
+
+    def __init__(self, wavelength):
+        self.modulePresent    = 1
+        self.moduleId         = 0x11            # QSFP28
+        self.connectorType    = 0x07            # LC
+        self.transceiverCodes = [0x80, 0, 0, 0, 0, 0, 0, 0]
+        self.encoding         = 0x07
+        self.brNominal        = 0xFF
+        self.brMin            = 0
+        self.brMax            = 0
+        self.rateIdentifier   = 0
+        self.lengthSMF1       = 10
+        self.lengthSMF2       = 0
+        self.lengthOM1        = 0
+        self.lengthOM2        = 0
+        self.lengthOM3        = 0
+        self.lengthOM4        = 0
+        self.vendorName       = b"VEEX SIM        "
+        self.vendorOui        = [0x00, 0x1B, 0x21]
+        self.vendorPartNum    = b"SIM-QSFP28-LR4  "
+        self.vendorRev        = b"A0"
+        self.vendorSerialNum  = b"SIM0000001      "
+        self.dateCode         = b"190101  "
+        self.wavelength       = wavelength
+        self.options0         = 0
+        self.rxPowerHighAlarm = 450     # Hundredths of a dBm
+        self.rxPowerLowAlarm  = -1400
+        self.txPowerHighAlarm = 450
+        self.txPowerLowAlarm  = -800
+        # Page 0 and the diagnostics page as the PP reads them.
+        self.idRegisters      = bytearray(256)
+        self.diagRegisters    = bytearray(256)
+
+
+class Schema(object):
+    '''This class gives the default value of each field of a settings or
+    stats object. A field is made the first time it is read, so only the
+    fields a handler uses are made.
+
+    Args:
+        fields (dict): Default value by field name. A callable is called to
+                       make the value so each PP has its own.
+        arrays (dict): (length, default) by name of the list fields. The
+                       default is called with the index if callable.
+        text (set): Names of the text fields, bytes written to them are
+                    kept as str as the protobuf strings are.
+        fallback (callable): Makes the fields named in known.
+        known (set): Names of all of the fields of the object, from
+                     veexsim.known. Those without a default above are made
+                     by fallback, any other name is an AttributeError.
+    '''
+
+    def __init__(self, fields, arrays, text, fallback, known = frozenset()):
+        self.fields   = fields
+        self.arrays   = arrays
+        self.text     = text
+        self.fallback = fallback
+        self.known    = known
+
+    def isField(self, name):
+        '''Returns True if name is a field of the object.
+        '''
+        return (name in self.fields) or (name in self.arrays) or \
+               (name in self.text) or (name in self.known)
+
+    def default(self, name):
+        '''Returns a new default value for field name.
+
+        Raises:
+            AttributeError: name isn't a field of the object.
+        '''
+        array = self.arrays.get(name)
+        if array is not None:
+            length, default = array
+            if callable(default):
+                return [default(index) for index in range(length)]
+            return [default] * length
+        if name in self.fields:
+            value = self.fields[name]
+            return value() if callable(value) else value
+        if name in self.text:
+            return ""
+        if name in self.known:
+            return self.fallback()
+        raise AttributeError("veexlib object has no field '%s'" % name)
+
+
+class Record(object):
+    '''This class is the base of the settings and stats objects of a PP.
+    Fields read before they are written get their schema default. update()
+    is one round trip, the values are kept in the object itself since the
+    simulated PP has no other copy.
+    '''
+
+    def __init__(self, link, schema):
+        object.__setattr__(self, "_link", link)
+        object.__setattr__(self, "_schema", schema)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = self._schema.default(name)
+        object.__setattr__(self, name, value)
+        return value
+
+    def update(self):
+        '''Reads the object from the PP.
+        '''
+        self._link.roundTrip()
+
+    def _store(self, name, value):
+        if not self._schema.isField(name):
+            raise AttributeError("veexlib object has no field '%s'" % name)
+        if (name in self._schema.text) and isinstance(value, (bytes, bytearray)):
+            value = value.decode("latin-1")
+        object.__setattr__(self, name, value)
+
+
+class Settings(Record):
+    '''This class is the sets or allowedSets object of a PP. Each field
+    written is sent to the PP, one round trip each. Each set method is one
+    round trip that changes several fields together.
+    '''
+
+    def __getattr__(self, name):
+        if name in SETTINGS_COMMANDS:
+            # A command this simulator doesn't model, still a round trip.
+            return self._command
+        return Record.__getattr__(self, name)
+
+    def __setattr__(self, name, value):
+        self._link.roundTrip()
+        self._store(name, value)
+
+    def _command(self, *args, **kwargs):
+        self._link.roundTrip()
+
+    def _apply(self, **fields):
+        self._link.roundTrip()
+        for name, value in fields.items():
+            self._store(name, value)
+
+    def _applyTcm(self, tcm, **fields):
+        # TCM lists are indexed from 0 for TCM1.
+        self._link.roundTrip()
+        for name, value in fields.items():
+            if isinstance(value, (bytes, bytearray)):
+                value = value.decode("latin-1")
+            getattr(self, name)[tcm - 1] = value
+
+    def setErrorGenBurst(self, errorType, burstSize, burstPeriod):
+        self._apply(errorGenType = errorType,
+                    errorGenBurstSize = burstSize,
+                    errorGenBurstPeriod = burstPeriod)
+
+    def setLineFreqRamp(self, offset, start, stepSize, stepDuration):
+        self._apply(lineFreqOffset = offset,
+                    lineFreqRampStart = start,
+                    lineFreqRampStepSize = stepSize,
+                    lineFreqRampStepDuration = stepDuration)
+
+    def setSerDegraded(self, enable, interval, activate, deactivate):
+        self._apply(serDegradedEnable = enable,
+                    serDegradedIntervalThreshold = interval,
+                    serDegradedActivateThreshold = activate,
+                    serDegradedDeactivateThreshold = deactivate)
+
+    def setTxRxInterface(self, interface, interfaceType):
+        self._apply(txRxInterface = interface,
+                    txRxInterfaceType = interfaceType)
+
+    def setTxPattern(self, pattern, lane = -1):
+        self._setPattern("txPattern", pattern, lane)
+
+    def setRxPattern(self, pattern, lane = -1):
+        self._setPattern("rxPattern", pattern, lane)
+
+    def _setPattern(self, name, pattern, lane):
+        self._link.roundTrip()
+        current = getattr(self, name)
+        if not isinstance(current, list):
+            self._store(name, pattern)
+        elif lane < 0:
+            current[:] = [pattern] * len(current)
+        else:
+            current[lane] = pattern
+
+    def setTxMapping(self, mapping, odtu3, odtu2, odtu1):
+        self._apply(txMapping = mapping, odtu3TxMapping = odtu3,
+                    odtu2TxMapping = odtu2, odtu1TxMapping = odtu1,
+                    isTxMultiChanMapping = False)
+
+    def setRxMapping(self, mapping, odtu3, odtu2, odtu1):
+        self._apply(rxMapping = mapping, odtu3RxMapping = odtu3,
+                    odtu2RxMapping = odtu2, odtu1RxMapping = odtu1,
+                    isRxMultiChanMapping = False)
+
+    def setTxMultiChanMapping(self, mapping):
+        self._apply(txMapping = mapping, isTxMultiChanMapping = True)
+
+    def setRxMultiChanMapping(self, mapping):
+        self._apply(rxMapping = mapping, isRxMultiChanMapping = True)
+
+    def setOtuSmTtiExpected(self, sapi, dapi):
+        self._apply(otuSmTtiExpectedSapi = sapi, otuSmTtiExpectedDapi = dapi)
+
+    def setOduPmTtiExpected(self, sapi, dapi):
+        self._apply(oduPmTtiExpectedSapi = sapi, oduPmTtiExpectedDapi = dapi)
+
+    def setOduTcmTtiExpected(self, tcm, sapi, dapi):
+        self._applyTcm(tcm, oduTcmTtiExpectedSapi = sapi,
+                       oduTcmTtiExpectedDapi = dapi)
+
+    def setOduTcmTtiSapi(self, tcm, sapi):
+        self._applyTcm(tcm, oduTcmTtiSapi = sapi)
+
+    def setOduTcmTtiDapi(self, tcm, dapi):
+        self._applyTcm(tcm, oduTcmTtiDapi = dapi)
+
+    def setOduTcmTtiSpecific(self, tcm, specific):
+        self._applyTcm(tcm, oduTcmTtiSpecific = specific)
+
+    def setOduTcmAlarmEnable(self, tcm, enable):
+        self._applyTcm(tcm, oduTcmAlarmEnable = enable)
+
+
+class AllowedSettings(Settings):
+    '''This class is the allowedSets object of a PP. Some handlers call it,
+    ie. allowedSets().update(), so calling it returns the object itself.
+    '''
+
+    def __call__(self):
+        return self
+
+
+class OtnSettings(Settings):
+    '''This class is the sets object of an OTN PP. An overhead capture
+    completes as soon as it is armed, filling the stats with a ramp.
+
+    Args:
+        stats (Stats): Stats object of the same PP.
+    '''
+
+    def __init__(self, link, schema, stats):
+        Settings.__init__(self, link, schema)
+        object.__setattr__(self, "_stats", stats)
+
+    def setOhCaptureSettings(self, trigger, matchValue, position, byteSelect):
+        self._apply(captureTrigger = trigger,
+                    ohCaptureMatchValue = matchValue,
+                    ohCapturePosition = position,
+                    ohCaptureByteSelect = byteSelect)
+        captureData = self._stats.captureData
+        captureData[:] = [index & 0xFF for index in range(len(captureData))]
+        self._stats.captureDataState = value("OTN_OH_OH_CAPTURE_DONE")
+
+
+class Stats(Record):
+    '''This class is the stats object of a PP, or of one ODTU level. Fields
+    that aren't in the schema are results. update() moves the elapsed time
+    of the test on, the results stay as the simulator sets them.
+
+    Args:
+        started (float): time.monotonic() of the test start.
+    '''
+
+    def __init__(self, link, schema, started):
+        Record.__init__(self, link, schema)
+        object.__setattr__(self, "_started", started)
+        object.__setattr__(self, "_duration", -1)
+
+    def __setattr__(self, name, value):
+        self._store(name, value)
+
+    def restart(self, duration):
+        '''Starts the test again, all the results go back to zero.
+
+        Args:
+            duration (int): Seconds the test runs for, -1 for continuous.
+        '''
+        for name in [name for name in self.__dict__ if not name.startswith("_")]:
+            del self.__dict__[name]
+        object.__setattr__(self, "_started", time.monotonic())
+        object.__setattr__(self, "_duration", duration)
+
+    def update(self):
+        '''Reads the object from the PP.
+        '''
+        self._link.roundTrip()
+        elapsed = int(time.monotonic() - self._started)
+        self._store("elapsedTime", elapsed)
+        if self._duration < 0:
+            self._store("runTimeLeft", -1)
+        else:
+            self._store("runTimeLeft", max(self._duration - elapsed, 0))
+
+
+class Stream(object):
+    '''This class is the settings of one Ethernet stream.
+    '''
+
+    def __init__(self, index):
+        self.length        = 64
+        self.traffic       = 10.0   # Percent of the line rate
+        self.srcMacAddress = [0x00, 0x1B, 0x21, 0x00, 0x00, index + 1]
+        self.dstMacAddress = [0x00, 0x1B, 0x21, 0x00, 0x01, index + 1]
+        self.srcIpAddress  = [192, 168, 1, index + 1]
+        self.dstIpAddress  = [192, 168, 2, index + 1]
+        self.srcUdpPort    = 49152 + index
+        self.dstUdpPort    = 49152 + index
+        self.vlanId        = 0
+        self.vlan2Id       = 0
+        self.vlan3Id       = 0
+        self.vlan4Id       = 0
+        self.vlanQos       = 0
+        self.vlan2Qos      = 0
+        self.ipTos         = 0
+        self.ipTtl         = 64
+        self.reference     = 0      # What the last write changed
+
+
+class StreamSets(Record):
+    '''This class is the streamSets object of an Ethernet PP. streamSet is
+    the list of streams, written back as a whole.
+    '''
+
+    def __setattr__(self, name, value):
+        self._link.roundTrip()
+        self._store(name, value)
+
+
+class EventRecord(object):
+    '''This class is one record of a PP event log.
+    '''
+    __slots__ = ("eventId", "count", "timeStamp", "duration")
+
+    def __init__(self, eventId, count, timeStamp, duration):
+        self.eventId   = eventId
+        self.count     = count
+        self.timeStamp = timeStamp
+        self.duration  = duration
+
+
+class EventLogBlock(object):
+    '''This class is the response to getEventLog(), up to a block of records
+    from a record number.
+    '''
+
+    def __init__(self, totalRecs, storedCount, records):
+        self.totalRecs   = totalRecs
+        self.storedCount = storedCount
+        self.recCount    = len(records)
+        self.records     = records
+
+
+class CaptureSlice(object):
+    '''This class is the response to readCaptureSlice(), one slice of a
+    captured frame.
+    '''
+
+    def __init__(self, timestamp, packetSize, captureSize, sliceCount,
+                 sliceSize, packetSlice):
+        self.timestamp   = timestamp
+        self.packetSize  = packetSize
+        self.captureSize = captureSize
+        self.sliceCount  = sliceCount
+        self.sliceSize   = sliceSize
+        self.packetSlice = packetSlice
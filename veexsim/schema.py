@@ -0,0 +1,302 @@
+###############################################################################
+#
+# Copyright 2018-2019, VeEX, Inc.
+# All Rights Reserved.
+#
+# $Workfile:   schema.py  $
+# $Revision: $
+# $Author: $
+# $Date: $
+#
+# DESCRIPTION:
+#    Module with the field shapes of the simulated settings and stats of each
+#    PP type: which fields are lane or TCM lists, text, numbers or results.
+#
+###############################################################################
+
+from veexsim.constants import familyLength
+from veexsim.constants import value
+from veexsim.known import ALLOWED_SETTINGS_FIELDS
+from veexsim.known import SETTINGS_FIELDS
+from veexsim.known import STATS_FIELDS
+from veexsim.objects import Result
+from veexsim.objects import Schema
+from veexsim.objects import SfpInfo
+from veexsim.objects import StreamResult
+
+# Tandem connection monitoring levels, TCM1 to TCM6.
+TCM_COUNT = 6
+
+# Tributary slots of an OPU4, the most of any OPU.
+TRIB_SLOTS = 80
+
+# ODU levels with ODTU stats, ODU0 to ODU4.
+ODTU_LEVELS = 5
+
+# Bytes kept by an overhead capture.
+OH_CAPTURE_BYTES = 256
+
+# SD/switch times kept for RES:SDT:RECent?.
+SDT_RECENT_TIMES = 10
+
+# FEC symbol error bins of the FEC analysis.
+FEC_SYMBOL_BINS = 16
+
+# Streams of an Ethernet PP.
+STREAM_COUNT = 16
+
+# Replies kept by the ping of an Ethernet PP.
+PING_REPLIES = 10
+
+# OTU4 frames a second, the rate the SD/switch times are counted in.
+OTU4_FRAME_RATE = 856388.0
+
+# Frames held in the capture buffer of an Ethernet PP.
+CAPTURED_FRAMES = 64
+
+# Frame sizes tested by the RFC 2544 test of an Ethernet PP.
+RFC_FRAME_SIZES = (64, 128, 256, 512, 1024, 1280, 1518)
+
+# Rates stepped through by each frame size of the RFC 2544 frame loss test.
+RFC_LOSS_RATES = 10
+
+# Text fields of the OTN settings and stats.
+OTN_TEXT = {"otuSmTtiSapi", "otuSmTtiDapi", "otuSmTtiSpecific",
+            "otuSmTtiExpectedSapi", "otuSmTtiExpectedDapi",
+            "oduPmTtiSapi", "oduPmTtiDapi", "oduPmTtiSpecific",
+            "oduPmTtiExpectedSapi", "oduPmTtiExpectedDapi",
+            "oduForwardFtflOI", "oduForwardFtflOS",
+            "oduBackwardFtflOI", "oduBackwardFtflOS"}
+
+# Settings of the MLD PPs (PHY, PCS and OTL) kept for each lane.
+MLD_LANE_SETTINGS = {
+    "laneAlarmGenType"    : 0,
+    "laneErrorGenRate"    : 0.0,
+    "laneErrorGenType"    : 0,
+    "opticalAlarmGenType" : 0,
+    "rxPattern"           : 0,
+    "rxUserPattern"       : 0,
+    "txLaneMap"           : lambda lane: lane,
+    "txLanePostEmph"      : 0,
+    "txLanePreEmph"       : 0,
+    "txLaneSkew"          : 0,
+    "txLaneSwing"         : 0,
+    "txPattern"           : 0,
+    "txUserPattern"       : 0,
+    }
+
+# Stats of the MLD PPs kept for each lane that aren't results.
+MLD_LANE_STATS = {
+    "freqOffsetRxHz"     : 0,
+    "freqOffsetRxHzMax"  : 0,
+    "freqOffsetRxHzMin"  : 0,
+    "freqOffsetRxPpm"    : 0.0,
+    "freqOffsetRxPpmMax" : 0.0,
+    "freqOffsetRxPpmMin" : 0.0,
+    "freqRx"             : 0,
+    "freqRxMax"          : 0,
+    "freqRxMin"          : 0,
+    "rxLaneMap"          : lambda lane: lane,
+    "rxLanePower"        : -2.5,
+    "rxLaneSkew"         : 0,
+    }
+
+# Results of the MLD PPs kept for each lane.
+MLD_LANE_RESULTS = [
+    "ais", "alignMark", "alignMarkLoss", "bip8", "bit", "blockLockLoss",
+    "fecAlignMarkLoss", "fecAlignMarkLossLane", "fecCorrectableBitLane",
+    "fecCorrectableSymbolLane", "laneSkew", "los", "patternSync",
+    "rxFreqWide", "rxPowerHighAlarmThreshold", "rxPowerHighWarningThreshold",
+    "rxPowerHot", "rxPowerLow", "rxPowerLowAlarmThreshold",
+    "rxPowerLowWarningThreshold", "rxPowerWarm", "summaryLaneLed", "syncHdr",
+    "txBiasHighAlarmThreshold", "txBiasHighWarningThreshold",
+    "txBiasLowAlarmThreshold", "txBiasLowWarningThreshold",
+    "txPowerHighAlarmThreshold", "txPowerHighWarningThreshold",
+    "txPowerLowAlarmThreshold", "txPowerLowWarningThreshold",
+    ]
+
+# Results of the OTN PP and of each ODTU level kept for each TCM.
+OTN_TCM_RESULTS = [
+    "tcmBdi", "tcmBei", "tcmBiae", "tcmBip8", "tcmDapiTim", "tcmSapiTim",
+    "odtuTcmBdi", "odtuTcmBei", "odtuTcmBiae", "odtuTcmBip8",
+    "odtuTcmDapiTim", "odtuTcmSapiTim",
+    ]
+
+
+def settingsSchema(protocolType, card):
+    '''Returns the Schema of the sets object of a PP.
+
+    Args:
+        protocolType (int): PROTO_ constant of the PP.
+        card (CardModel): Model of the card the PP is on.
+    '''
+    fields = {
+        "clockType"          : value("CLOCK_INTERNAL"),
+        "errorGenRate"       : 0.0,
+        "laserOn"            : True,
+        "lineFreqOffset"     : 0.0,
+        "rxPowerMinimum"     : -10.0,
+        "sdtSwitchFrameRate" : OTU4_FRAME_RATE,
+        "txHostLaneCount"    : card.opticalLanes,
+        "txNetLaneCount"     : card.opticalLanes,
+        "txRxInterface"      : value(card.interface),
+        "txVirtLaneCount"    : card.virtualLanes,
+        }
+    arrays = {}
+    text = set()
+    if protocolType in mldProtocols():
+        for name, default in MLD_LANE_SETTINGS.items():
+            arrays[name] = (card.virtualLanes, default)
+    elif protocolType == value("PROTO_OTN"):
+        text = OTN_TEXT | {"oduTcmTtiSapi", "oduTcmTtiDapi",
+                           "oduTcmTtiSpecific", "oduTcmTtiExpectedSapi",
+                           "oduTcmTtiExpectedDapi"}
+        for name in ("oduTcmTtiSapi", "oduTcmTtiDapi", "oduTcmTtiSpecific",
+                     "oduTcmTtiExpectedSapi", "oduTcmTtiExpectedDapi"):
+            arrays[name] = (TCM_COUNT, "")
+        arrays["oduTcmAlarmEnable"]  = (TCM_COUNT, value("OTN_ODU_TCM_ALARM_DISABLE"))
+        arrays["otuOh"]              = (familyLength("OTN_OTU_OH_"), 0)
+        arrays["oduOh"]              = (familyLength("OTN_ODU_OH_"), 0)
+        arrays["opuOh"]              = (familyLength("OTN_OPU_OH_"), 0)
+        arrays["txIntrudeOn"]        = (familyLength("OTN_INTRUDE_ON_"), False)
+        arrays["opuMsi"]             = (TRIB_SLOTS, 0)
+        arrays["rxMultiChanPattern"] = (TRIB_SLOTS, value("OTN_PATTERN_PRBS_31"))
+        arrays["sdtCriteriaMask"]    = (TRIB_SLOTS, 0)
+        arrays["sdtSwitchStopCount"] = (TRIB_SLOTS, 0)
+        for direction in ("Rx", "Tx"):
+            fields[direction.lower() + "Mapping"] = value("OTN_MAP_OPU_PRBS")
+            for level in (1, 2, 3):
+                fields["odtu%d%sMapping" % (level, direction)] = value("OTN_MAP_NONE")
+        fields["isRxMultiChanMapping"]   = False
+        fields["isTxMultiChanMapping"]   = False
+        fields["rxFlexDataRateExpected"] = 0.0
+        fields["txFlexDataRate"]         = 0.0
+    elif protocolType == value("PROTO_ETHERNET"):
+        fields["captureSize"] = value("PACKET_CAPTURE_SIZE_128_BYTES")
+        arrays["rfcPacketSize"] = (len(RFC_FRAME_SIZES),
+                                   lambda index: RFC_FRAME_SIZES[index])
+    return Schema(fields, arrays, text, int, SETTINGS_FIELDS)
+
+
+def allowedSettingsSchema(protocolType, card):
+    '''Returns the Schema of the allowedSets object of a PP.
+    '''
+    fields = {
+        "rxOpticalLaneCount"  : card.opticalLanes,
+        "rxVirtLaneCount"     : card.virtualLanes,
+        "rxVirtualLaneCount"  : card.virtualLanes,
+        "txOpticalLaneCount"  : card.opticalLanes,
+        "txPhysicalLaneCount" : card.opticalLanes,
+        "txVirtLaneCount"     : card.virtualLanes,
+        "txVirtualLaneCount"  : card.virtualLanes,
+        "rfcLatencyValid"     : True,
+        }
+    return Schema(fields, {}, set(), int, ALLOWED_SETTINGS_FIELDS)
+
+
+def statsSchema(protocolType, card):
+    '''Returns the Schema of the stats object of a PP, or of an ODTU level
+    of an OTN PP. The other fields in STATS_FIELDS are results.
+    '''
+    fields = {
+        "elapsedTime"          : 0,
+        "runTimeLeft"          : -1,
+        "signalStrength"       : -2.5,
+        "signalStrengthMax"    : -2.4,
+        "signalStrengthMin"    : -2.6,
+        "freqRx"               : card.lineRate,
+        "freqTx"               : card.lineRate,
+        "freqOffsetRxHz"       : 0,
+        "freqOffsetRxPpm"      : 0.0,
+        "freqOffsetTxHz"       : 0,
+        "freqOffsetTxPpm"      : 0.0,
+        "txWavelength"         : float(card.wavelength),
+        "rxFecLaneCount"       : card.opticalLanes,
+        "rxHostLaneCount"      : card.opticalLanes,
+        "rxNetLaneCount"       : card.opticalLanes,
+        "rxVirtLaneCount"      : card.virtualLanes,
+        "sfpI2cInfo"           : lambda: SfpInfo(card.wavelength),
+        "captureDataState"     : 0,     # None of the OTN_OH_ capture states
+        "captureState"         : value("PACKET_CAPTURE_STOPPED"),
+        "sdtSwitchState"       : value("OTN_SDT_ST_STOPPED"),
+        "sdtSwitchFrameRate"   : OTU4_FRAME_RATE,
+        "sdtSwitchTime"        : 0.0,
+        "avgSdtSwitchTime"     : 0.0,
+        "maxSdtSwitchTime"     : 0.0,
+        "minSdtSwitchTime"     : 0.0,
+        "justFreqOffset"       : 0.0,
+        "justifySecs"          : 0,
+        "rxFlexDataRate"       : 0.0,
+        "rxGmpC8Largest"       : 0,
+        "rxGmpC8Smallest"      : 0,
+        "txGmpC8Largest"       : 0,
+        "txGmpC8Smallest"      : 0,
+        "odtuStatsLevel"       : 0,
+        "oduForwardFtflFault"  : 0,
+        "oduBackwardFtflFault" : 0,
+        }
+    arrays = {
+        "fecCorrectableSymbolN" : (FEC_SYMBOL_BINS, 0),
+        }
+    text = set()
+    if protocolType in mldProtocols():
+        for name, default in MLD_LANE_STATS.items():
+            arrays[name] = (card.virtualLanes, default)
+        for name in MLD_LANE_RESULTS:
+            arrays[name] = (card.virtualLanes, _result)
+    elif protocolType == value("PROTO_OTN"):
+        text = OTN_TEXT | {"oduTcmTtiSapi", "oduTcmTtiDapi",
+                           "oduTcmTtiSpecific"}
+        for name in ("oduTcmTtiSapi", "oduTcmTtiDapi", "oduTcmTtiSpecific"):
+            arrays[name] = (TCM_COUNT, "")
+        for name in OTN_TCM_RESULTS:
+            arrays[name] = (TCM_COUNT, _result)
+        arrays["lanOtnBip8"]           = (card.virtualLanes, _result)
+        arrays["lanPcsBip8"]           = (card.virtualLanes, _result)
+        arrays["otuOh"]                = (familyLength("OTN_OTU_OH_"), 0)
+        arrays["oduOh"]                = (familyLength("OTN_ODU_OH_"), 0)
+        arrays["opuOh"]                = (familyLength("OTN_OPU_OH_"), 0)
+        arrays["opuMsi"]               = (TRIB_SLOTS, 0)
+        arrays["captureData"]          = (OH_CAPTURE_BYTES, 0)
+        arrays["recentSdtSwitchTimes"] = (SDT_RECENT_TIMES, 0.0)
+    elif protocolType == value("PROTO_ETHERNET"):
+        arrays["streamStats"] = (STREAM_COUNT, _streamResult)
+        arrays["pingSeqNumber"]     = (PING_REPLIES, 0)
+        arrays["pingResponse"]      = (PING_REPLIES, value("PACKET_PING_REPLY_NONE"))
+        arrays["pingResponseTime"]  = (PING_REPLIES, 0)
+        arrays["pingBytesReceived"] = (PING_REPLIES, 0)
+        arrays["pingTTL"]           = (PING_REPLIES, 0)
+        for name in ("pingNumberPacketsTransmitted",
+                     "pingNumberPacketsReceived", "pingPercentPacketLoss",
+                     "pingRoundTripDelayMin", "pingRoundTripDelayAvg",
+                     "pingRoundTripDelayMax"):
+            fields[name] = 0
+        fields["captureState"]           = value("PACKET_CAPTURE_COMPLETE")
+        fields["firstCapturedFrame"]     = 0
+        fields["lastCapturedFrame"]      = CAPTURED_FRAMES - 1
+        fields["captureTimestampOffset"] = 0
+        fields["rfcState"]               = value("PACKET_RFC_STOPPED")
+        for name in ("rfcThroughputTxCount", "rfcThroughputRxCount",
+                     "rfcThroughputPassingRate", "rfcLatencyAvg",
+                     "rfcB2BAvgMeasured", "rfcB2BMaxPossible"):
+            arrays[name] = (len(RFC_FRAME_SIZES), 0)
+        for name in ("rfcLossTxCount", "rfcLossRxCount"):
+            arrays[name] = (len(RFC_FRAME_SIZES),
+                            lambda index: [0] * RFC_LOSS_RATES)
+        arrays["rfcLossTxRate"] = (RFC_LOSS_RATES,
+                                   lambda index: 10000 - index * 1000)
+    return Schema(fields, arrays, text, Result, STATS_FIELDS)
+
+
+def _result(index):
+    return Result()
+
+
+def _streamResult(index):
+    return StreamResult()
+
+
+def mldProtocols():
+    '''Returns the PROTO_ constants of the PPs that make up an MLD.
+    '''
+    return (value("PROTO_PHY"), value("PROTO_PCS"), value("PROTO_OTL"))